@@ -1,14 +1,20 @@
 import os
 import sys
+import time
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
+from starlette.concurrency import run_in_threadpool
 
 # Add project root to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 app = FastAPI(title="PlanifyAI Core")
 
+from backend.api.utils import metrics  # noqa: E402
+from backend.api.utils.lazy_routers import LazyRouters  # noqa: E402
+
 # --- 1. CORS AYARI (Frontend ile konuşması için şart) ---
 app.add_middleware(
     CORSMiddleware,
@@ -18,64 +24,94 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# --- 2. ROUTER IMPORTS (with fallback for broken legacy routers) ---
-
-# Critical: Context router (for OSM data fetching)
-try:
-    from backend.api.routers import context
+# --- 2. ROUTERS (imported on first request under their prefix) ---
+# Router modules pull in osmnx/geopandas, pymoo, scipy and matplotlib; loading
+# them on demand keeps cold start (and /health) fast. GET /warmup loads all.
+ROUTERS = {
+    "/api/context": "backend.api.routers.context",  # OSM data fetching
+    "/api/optimize": "backend.api.routers.optimize",  # H-SAGA simulation
+    "/api/constraints": "backend.api.routers.constraints",
+    "/api/campus": "backend.api.routers.campus",  # Campus auto-detection
+    "/api/nsga3": "backend.api.routers.nsga3",  # Multi-objective optimization
+    "/api/visualize": "backend.api.routers.visualization",  # Result visualization
+}
+
+# Heavy modules imported inside request handlers, preloaded by /warmup
+WARMUP_MODULES = (
+    "matplotlib.pyplot",
+    "src.visualization.pareto_visualization",
+    "backend.core.domain.geometry.osm_service",
+)
 
-    app.include_router(context.router)
-    print("✅ Context router loaded")
-except ImportError as e:
-    print(f"❌ Context router failed: {e}")
+routers = LazyRouters(app, ROUTERS)
 
-# Critical: Optimize router (for H-SAGA simulation)
-try:
-    from backend.api.routers import optimize
 
-    app.include_router(optimize.router)
-    print("✅ Optimize router loaded")
-except ImportError as e:
-    print(f"❌ Optimize router failed: {e}")
+@app.middleware("http")
+async def load_routers_on_demand(request: Request, call_next):
+    """Import the router of the requested path before routing."""
+    path = request.url.path
+    module = routers.module_for(path)
+    if module is not None:
+        await run_in_threadpool(routers.load, module)
+    elif routers.pending and path in (app.openapi_url, app.docs_url, app.redoc_url):
+        await run_in_threadpool(routers.load_all)
+    return await call_next(request)
 
-# Critical: Constraints router
-try:
-    from backend.api.routers import constraints
 
-    app.include_router(constraints.router)
-    print("✅ Constraints router loaded")
-except ImportError as e:
-    print(f"❌ Constraints router failed: {e}")
+@app.get("/warmup")
+async def warmup():
+    """
+    Load all routers and heavy handler dependencies.
 
-# New: Campus router (for auto-detection)
-try:
-    from backend.api.routers import campus
+    Call once after start (e.g. from a readiness or post-start hook) so the
+    first real requests do not pay the import cost.
 
-    app.include_router(campus.router)
-    print("✅ Campus router loaded")
-except ImportError as e:
-    print(f"❌ Campus router failed: {e}")
+    Returns:
+        loaded: router modules loaded
+        failed: modules that could not be imported, with the error
+        seconds: time spent in this call
+    """
+    return await run_in_threadpool(routers.load_all, WARMUP_MODULES)
 
-# New: NSGA-III router (for multi-objective optimization)
-try:
-    from backend.api.routers import nsga3
 
-    app.include_router(nsga3.router)
-    print("✅ NSGA-III router loaded")
-except ImportError as e:
-    print(f"❌ NSGA-III router failed: {e}")
+def stop_plot_renderer():
+    """Stop the plot render processes, if the visualization router was loaded."""
+    visualization = sys.modules.get(ROUTERS["/api/visualize"])
+    if visualization is not None:
+        visualization.renderer.shutdown()
 
-# New: Visualization router (for result visualization)
-try:
-    from backend.api.routers import visualization
 
-    app.include_router(visualization.router)
-    print("✅ Visualization router loaded")
-except ImportError as e:
-    print(f"❌ Visualization router failed: {e}")
+app.add_event_handler("shutdown", stop_plot_renderer)
 
 
-# --- 3. HEALTH CHECK (Load balancer / monitoring) ---
+# --- 3. METRICS (Prometheus scrape target) ---
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """Latency per router and in-flight request count."""
+    metrics.HTTP_REQUESTS_IN_FLIGHT.inc()
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        metrics.HTTP_REQUESTS_IN_FLIGHT.dec()
+        metrics.HTTP_REQUEST_DURATION.observe(
+            time.perf_counter() - start,
+            router=metrics.route_label(request.scope),
+            method=request.method,
+            status=status,
+        )
+
+
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics():
+    """Prometheus text exposition of API and optimizer metrics."""
+    return Response(metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
+
+
+# --- 4. HEALTH CHECK (Load balancer / monitoring) ---
 @app.get("/health")
 async def health_check():
     """
@@ -6,17 +6,23 @@ REST API endpoints for NSGA-III optimization.
 
 Endpoints:
     - POST /api/nsga3/optimize - Run NSGA-III optimization
+    - GET /api/nsga3/results/{result_id} - Page through a columnar Pareto front
     - GET /api/nsga3/profiles - List available objective profiles
 
+``layout=columnar`` returns the Pareto front as arrays (positions, objectives)
+with one shared building table, as compact JSON, NumPy or Arrow IPC
+(backend.api.utils.pareto_format), paginated with ``offset``/``limit`` and
+restricted with ``fields=``.
+
 Created: 2026-01-03
 """
 
 import logging
 import traceback
-from typing import Dict
+from typing import Dict, Literal, Optional
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import JSONResponse, Response
 
 from backend.api.schemas.nsga3_schemas import (
     CustomObjectiveProfile,
@@ -25,6 +31,13 @@ from backend.api.schemas.nsga3_schemas import (
     ObjectiveProfileType,
     SolutionResponse,
 )
+from backend.api.utils.pareto_format import (
+    ARROW_MEDIA_TYPE,
+    PYARROW_AVAILABLE,
+    ParetoColumns,
+    ParetoResultCache,
+    parse_fields,
+)
 from backend.core.optimization.nsga3_runner import NSGA3Runner, NSGA3RunnerConfig
 from src.algorithms import (
     Building,
@@ -39,6 +52,11 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/nsga3", tags=["nsga3"])
 
+# Recent columnar fronts for GET /results/{result_id}
+result_cache = ParetoResultCache()
+
+ColumnarFormat = Literal["json", "npy", "arrow"]
+
 
 # =============================================================================
 # HELPER FUNCTIONS
@@ -163,29 +181,96 @@ def format_solution_response(solution_data: Dict, buildings: list) -> SolutionRe
     )
 
 
+def columnar_response(
+    columns: ParetoColumns,
+    fields: tuple,
+    offset: int,
+    limit: Optional[int],
+    response_format: str,
+) -> Response:
+    """
+    Encode a page of a columnar Pareto front.
+
+    Args:
+        columns: Full Pareto front
+        fields: Parsed ``fields=`` selection
+        offset: First solution of the page
+        limit: Maximum solutions in the page (None = rest of the front)
+        response_format: "json", "npy" (.npy or .npz) or "arrow"
+
+    Returns:
+        JSON or binary response with result ID and paging headers
+
+    Raises:
+        HTTPException: If the format cannot encode the selection
+    """
+    page = columns.page(offset, limit)
+    headers = {
+        "X-Result-Id": columns.result_id or "",
+        "X-Offset": str(page.offset),
+        "X-Count": str(len(page.positions)),
+        "X-Total": str(page.total),
+    }
+    if response_format == "json":
+        return JSONResponse(content=page.to_json(fields), headers=headers)
+
+    if response_format == "arrow":
+        if not PYARROW_AVAILABLE:
+            raise HTTPException(status_code=501, detail="Arrow output requires pyarrow")
+        return Response(content=page.to_arrow(fields), media_type=ARROW_MEDIA_TYPE, headers=headers)
+
+    try:
+        payload, media_type = page.to_numpy(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return Response(content=payload, media_type=media_type, headers=headers)
+
+
 # =============================================================================
 # ENDPOINTS
 # =============================================================================
 
 
 @router.post("/optimize", response_model=NSGA3Response)
-async def run_optimization(request: NSGA3Request):
+async def run_optimization(
+    request: NSGA3Request,
+    layout: Literal["nested", "columnar"] = Query(
+        "nested", description="Per-solution dicts or columnar arrays"
+    ),
+    format: ColumnarFormat = Query("json", description="Columnar encoding"),
+    fields: Optional[str] = Query(
+        None, description="Columnar fields: summary,best_compromise,buildings,positions,objectives"
+    ),
+    offset: int = Query(0, ge=0, description="First Pareto solution (columnar)"),
+    limit: Optional[int] = Query(None, ge=1, description="Pareto solutions per page (columnar)"),
+):
     """
     Run NSGA-III multi-objective optimization.
 
     This endpoint runs a pure NSGA-III optimization on the provided buildings
     and returns the Pareto front of non-dominated solutions.
 
+    With ``layout=columnar`` the front is kept server-side and the first page
+    is returned in columnar form; ``result_id`` (or the X-Result-Id
+    header) fetches further pages from GET /results/{result_id}.
+
     Args:
         request: NSGA3Request with buildings, bounds, and configuration
+        layout: "nested" (NSGA3Response) or "columnar"
+        format: Columnar encoding: "json", "npy" or "arrow"
+        fields: Comma-separated columnar fields (default: all)
+        offset: First Pareto solution of the columnar page
+        limit: Maximum Pareto solutions in the columnar page
 
     Returns:
-        NSGA3Response with Pareto front and statistics
+        NSGA3Response with Pareto front and statistics, or a columnar page
 
     Raises:
         HTTPException: If validation or optimization fails
     """
     try:
+        selected_fields = parse_fields(fields)
+
         # Validate and convert buildings
         buildings = convert_request_to_buildings(request)
 
@@ -216,6 +301,21 @@ async def run_optimization(request: NSGA3Request):
         runner = NSGA3Runner(buildings, bounds, config)
         result = runner.run()
 
+        if layout == "columnar":
+            columns = ParetoColumns.from_result(
+                result,
+                buildings,
+                summary={
+                    "success": True,
+                    "message": "Optimization completed successfully",
+                    "evaluations": result["statistics"]["evaluations"],
+                    "generations": config.n_generations,
+                    "runtime": runner.stats["runtime"],
+                },
+            )
+            columns.result_id = result_cache.put(columns)
+            return columnar_response(columns, selected_fields, offset, limit, format)
+
         # Format best compromise solution
         best_compromise = None
         if result["best_compromise"] is not None:
@@ -253,6 +353,9 @@ async def run_optimization(request: NSGA3Request):
 
         return response
 
+    except HTTPException:
+        raise
+
     except ValueError as e:
         # Validation error
         logger.error(f"Validation error: {str(e)}")
@@ -265,6 +368,42 @@ async def run_optimization(request: NSGA3Request):
         raise HTTPException(status_code=500, detail=f"Optimization failed: {str(e)}")
 
 
+@router.get("/results/{result_id}")
+async def get_result_page(
+    result_id: str,
+    format: ColumnarFormat = Query("json", description="Columnar encoding"),
+    fields: Optional[str] = Query(
+        None, description="Columnar fields: summary,best_compromise,buildings,positions,objectives"
+    ),
+    offset: int = Query(0, ge=0, description="First Pareto solution"),
+    limit: Optional[int] = Query(None, ge=1, description="Pareto solutions per page"),
+):
+    """
+    Page of a columnar Pareto front from a previous optimization.
+
+    Recent fronts are kept in memory (LRU); evicted or unknown IDs return 404.
+
+    Args:
+        result_id: ``result_id`` of a columnar optimization response
+        format: "json", "npy" or "arrow"
+        fields: Comma-separated fields (default: all)
+        offset: First Pareto solution of the page
+        limit: Maximum Pareto solutions in the page
+
+    Returns:
+        Columnar page
+    """
+    try:
+        selected_fields = parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    columns = result_cache.get(result_id)
+    if columns is None:
+        raise HTTPException(status_code=404, detail=f"Result {result_id} not found or expired")
+    return columnar_response(columns, selected_fields, offset, limit, format)
+
+
 @router.get("/profiles")
 async def get_available_profiles():
     """
@@ -4,12 +4,22 @@ API endpoints for optimization pipeline.
 Sprint 2, Faz 2.1.3 - SQLiteJobStore Migration
 """
 
+import threading
 import uuid
 from typing import Optional
 
 from fastapi import APIRouter, BackgroundTasks, HTTPException
 from pydantic import BaseModel
 
+from backend.api.utils.metrics import (
+    JOBS_FINISHED,
+    JOBS_IN_FLIGHT,
+    JOBS_QUEUED,
+    TimedJobStore,
+    record_cache,
+    record_pipeline_result,
+)
+from backend.core.optimization.instrumentation import ComponentTimers
 from backend.core.pipeline.orchestrator import OptimizationPipeline, PipelineConfig
 from backend.core.schemas.input import OptimizationRequest
 from backend.core.storage import JobData, SQLiteJobStore
@@ -17,7 +27,13 @@ from backend.core.storage import JobData, SQLiteJobStore
 router = APIRouter(prefix="/api/optimize", tags=["optimize"])
 
 # Persistent job store (SQLite-based, survives restarts)
-job_store = SQLiteJobStore("data/jobs.db")
+job_store = TimedJobStore(SQLiteJobStore("data/jobs.db"))
+
+# Component timings summed over instrumented jobs in this process; background
+# jobs run in the thread pool, so merges and reads hold component_lock
+component_timers = ComponentTimers(enabled=True)
+instrumented_jobs = 0
+component_lock = threading.Lock()
 
 
 class JobStatus(BaseModel):
@@ -37,6 +53,10 @@ def update_callback(job_id: str, stage: str, progress: int):
 
 def run_pipeline_background(job_id: str, request: OptimizationRequest):
     """Wrapper to run pipeline in background."""
+    global instrumented_jobs
+    JOBS_QUEUED.dec()
+    JOBS_IN_FLIGHT.inc()
+    status = "failed"
     try:
         job_store.update(job_id, {"status": "running"})
 
@@ -45,7 +65,10 @@ def run_pipeline_background(job_id: str, request: OptimizationRequest):
             update_callback(job_id, stage, progress)
 
         config = PipelineConfig(
-            enable_solar=request.enable_solar, enable_wind=request.enable_wind, verbose=True
+            enable_solar=request.enable_solar,
+            enable_wind=request.enable_wind,
+            verbose=True,
+            instrument=request.instrument,
         )
 
         pipeline = OptimizationPipeline(config)
@@ -61,10 +84,22 @@ def run_pipeline_background(job_id: str, request: OptimizationRequest):
             callback=callback,
         )
 
+        record_pipeline_result(result)
+        if pipeline.road_network is not None:
+            road_stats = pipeline.road_network.stats
+            record_cache(
+                "road_geometry", road_stats["geometries_reused"], road_stats["geometries_built"]
+            )
+        if result.instrumentation:
+            with component_lock:
+                component_timers.merge(result.instrumentation)
+                instrumented_jobs += 1
+
+        status = "completed" if result.success else "failed"
         job_store.update(
             job_id,
             {
-                "status": "completed" if result.success else "failed",
+                "status": status,
                 "progress": 100,
                 "result": result.to_dict(),
                 "geojson": result.geojson,
@@ -74,7 +109,11 @@ def run_pipeline_background(job_id: str, request: OptimizationRequest):
 
     except Exception as e:
         print(f"Job {job_id} failed: {e}")
+        status = "failed"
         job_store.update(job_id, {"status": "failed", "message": str(e)})
+    finally:
+        JOBS_IN_FLIGHT.dec()
+        JOBS_FINISHED.inc(status=status)
 
 
 @router.post("/start")
@@ -97,6 +136,7 @@ async def start_optimization(request: OptimizationRequest, background_tasks: Bac
         ),
     )
 
+    JOBS_QUEUED.inc()
     background_tasks.add_task(run_pipeline_background, job_id, request)
 
     return {"job_id": job_id, "status": "queued"}
@@ -144,6 +184,21 @@ async def get_job_geojson(job_id: str):
     return job.get("geojson", {})
 
 
+@router.get("/metrics")
+async def get_component_metrics():
+    """
+    Per-component evaluation timings summed over instrumented jobs.
+
+    Jobs started with ``instrument: true`` contribute; each job's own
+    breakdown is in its result under ``instrumentation``.
+    """
+    with component_lock:
+        return {
+            "instrumented_jobs": instrumented_jobs,
+            "components": component_timers.summary(),
+        }
+
+
 @router.post("/quick")
 async def quick_optimization(
     latitude: float = 41.3833, longitude: float = 33.7833, num_buildings: int = 5
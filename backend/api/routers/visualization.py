@@ -9,24 +9,44 @@ Endpoints:
     - POST /api/visualize/pareto-3d - Generate 3D Pareto front plot
     - POST /api/visualize/parallel-coordinates - Generate parallel coordinates plot
     - POST /api/visualize/objective-matrix - Generate objective trade-off matrix
+    - POST /api/visualize/plot-data - Compact objective data for client-side plotting
     - POST /api/visualize/statistics - Compute objective statistics
 
+Plots are rendered in a process pool (backend.api.utils.rendering) and cached
+by a hash of (objectives, options). ``?format=png`` returns raw PNG bytes
+instead of the base64 JSON response.
+
 Created: 2026-01-03
 """
 
 import base64
 import io
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Literal, Optional, Union
 
 import numpy as np
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
 
+from backend.api.utils.rendering import PlotRenderer, image_size
+
+try:
+    import pyarrow as pa
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/visualize", tags=["visualization"])
 
+# Render processes and figure cache shared by all plot endpoints
+renderer = PlotRenderer()
+
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
 
 # =============================================================================
 # REQUEST/RESPONSE SCHEMAS
@@ -53,6 +73,17 @@ class ImageResponse(BaseModel):
     height: int = Field(..., description="Image height in pixels")
 
 
+class PlotDataResponse(BaseModel):
+    """Columnar objective data for client-side plotting."""
+
+    success: bool
+    objective_names: List[str]
+    columns: List[List[float]] = Field(..., description="Values per objective (column-major)")
+    minimums: List[float] = Field(..., description="Minimum of each objective")
+    maximums: List[float] = Field(..., description="Maximum of each objective")
+    best_index: Optional[int] = None
+
+
 class StatisticsResponse(BaseModel):
     """Response with objective statistics."""
 
@@ -80,16 +111,67 @@ def objectives_to_numpy(objectives: List[List[float]]) -> np.ndarray:
     return np.array(objectives)
 
 
-def fig_to_base64(fig) -> str:
-    """Convert matplotlib figure to base64-encoded PNG."""
-    import matplotlib.pyplot as plt
+def objective_names(request: VisualizationRequest, n_objectives: int) -> List[str]:
+    """Requested objective names or defaults."""
+    return request.objective_names or [f"Objective {i+1}" for i in range(n_objectives)]
+
+
+async def render_plot(
+    kind: str,
+    request: VisualizationRequest,
+    response_format: str,
+    n_objectives: Optional[int] = None,
+) -> Union[ImageResponse, Response]:
+    """
+    Render a plot in the render pool and wrap it for the response.
+
+    Args:
+        kind: Plot kind (see backend.api.utils.rendering.PLOT_KINDS)
+        request: Visualization request
+        response_format: "base64" (ImageResponse JSON) or "png" (raw bytes)
+        n_objectives: Required number of objectives (None = any)
+
+    Returns:
+        ImageResponse or PNG response
+
+    Raises:
+        HTTPException: 400 for invalid objectives, 500 if rendering fails
+    """
+    objectives = objectives_to_numpy(request.objectives)
+    if objectives.ndim != 2 or objectives.size == 0:
+        raise HTTPException(
+            status_code=400, detail="Objectives must be a non-empty n_solutions x n_objectives list"
+        )
+    n = objectives.shape[1]
+    if n_objectives is not None and n != n_objectives:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Expected {n_objectives} objectives for {n_objectives}D plot, got {n}",
+        )
+
+    options = {
+        "objective_names": request.objective_names,
+        "best_index": request.best_index,
+        "title": request.title,
+    }
+    try:
+        png = await renderer.render(kind, objectives, options)
+    except ImportError as e:
+        logger.error(f"Visualization module import failed: {e}")
+        raise HTTPException(status_code=500, detail="Visualization module not available")
+    except Exception as e:
+        logger.error(f"Visualization failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Visualization failed: {str(e)}")
 
-    buf = io.BytesIO()
-    fig.savefig(buf, format="png", dpi=100, bbox_inches="tight")
-    buf.seek(0)
-    img_base64 = base64.b64encode(buf.read()).decode("utf-8")
-    plt.close(fig)
-    return img_base64
+    width, height = image_size(kind, n)
+    if response_format == "png":
+        return Response(
+            content=png,
+            media_type="image/png",
+            headers={"X-Image-Width": str(width), "X-Image-Height": str(height)},
+        )
+    img_base64 = base64.b64encode(png).decode("utf-8")
+    return ImageResponse(success=True, image_base64=img_base64, width=width, height=height)
 
 
 # =============================================================================
@@ -97,8 +179,14 @@ def fig_to_base64(fig) -> str:
 # =============================================================================
 
 
+ImageFormat = Literal["base64", "png"]
+
+
 @router.post("/pareto-2d", response_model=ImageResponse)
-async def visualize_pareto_2d(request: VisualizationRequest):
+async def visualize_pareto_2d(
+    request: VisualizationRequest,
+    format: ImageFormat = Query("base64", description="base64 JSON or raw PNG bytes"),
+):
     """
     Generate 2D Pareto front visualization.
 
@@ -106,6 +194,7 @@ async def visualize_pareto_2d(request: VisualizationRequest):
 
     Args:
         request: Visualization request with objectives and parameters
+        format: "base64" (JSON) or "png" (raw image)
 
     Returns:
         Base64-encoded PNG image
@@ -113,44 +202,14 @@ async def visualize_pareto_2d(request: VisualizationRequest):
     Raises:
         HTTPException: If objectives is not 2D or visualization fails
     """
-    try:
-        from src.visualization.pareto_visualization import ParetoVisualizer
-
-        objectives = objectives_to_numpy(request.objectives)
-
-        if objectives.shape[1] != 2:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Expected 2 objectives for 2D plot, got {objectives.shape[1]}",
-            )
-
-        visualizer = ParetoVisualizer(figsize=(10, 8), dpi=100)
-
-        obj_names = request.objective_names or [f"Objective {i+1}" for i in range(2)]
-        title = request.title or "Pareto Front (2D)"
-
-        fig = visualizer.plot_pareto_front_2d(
-            objectives,
-            obj_names=obj_names,
-            best_idx=request.best_index,
-            title=title,
-            show=False,
-        )
-
-        img_base64 = fig_to_base64(fig)
-
-        return ImageResponse(success=True, image_base64=img_base64, width=1000, height=800)
-
-    except ImportError as e:
-        logger.error(f"Visualization module import failed: {e}")
-        raise HTTPException(status_code=500, detail="Visualization module not available")
-    except Exception as e:
-        logger.error(f"Visualization failed: {e}")
-        raise HTTPException(status_code=500, detail=f"Visualization failed: {str(e)}")
+    return await render_plot("pareto-2d", request, format, n_objectives=2)
 
 
 @router.post("/pareto-3d", response_model=ImageResponse)
-async def visualize_pareto_3d(request: VisualizationRequest):
+async def visualize_pareto_3d(
+    request: VisualizationRequest,
+    format: ImageFormat = Query("base64", description="base64 JSON or raw PNG bytes"),
+):
     """
     Generate 3D Pareto front visualization.
 
@@ -158,47 +217,19 @@ async def visualize_pareto_3d(request: VisualizationRequest):
 
     Args:
         request: Visualization request
+        format: "base64" (JSON) or "png" (raw image)
 
     Returns:
         Base64-encoded PNG image
     """
-    try:
-        from src.visualization.pareto_visualization import ParetoVisualizer
-
-        objectives = objectives_to_numpy(request.objectives)
-
-        if objectives.shape[1] != 3:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Expected 3 objectives for 3D plot, got {objectives.shape[1]}",
-            )
-
-        visualizer = ParetoVisualizer(figsize=(10, 8), dpi=100)
-
-        obj_names = request.objective_names or [f"Objective {i+1}" for i in range(3)]
-        title = request.title or "Pareto Front (3D)"
-
-        fig = visualizer.plot_pareto_front_3d(
-            objectives,
-            obj_names=obj_names,
-            best_idx=request.best_index,
-            title=title,
-            show=False,
-        )
-
-        img_base64 = fig_to_base64(fig)
-
-        return ImageResponse(success=True, image_base64=img_base64, width=1000, height=800)
-
-    except ImportError:
-        raise HTTPException(status_code=500, detail="Visualization module not available")
-    except Exception as e:
-        logger.error(f"Visualization failed: {e}")
-        raise HTTPException(status_code=500, detail=f"Visualization failed: {str(e)}")
+    return await render_plot("pareto-3d", request, format, n_objectives=3)
 
 
 @router.post("/parallel-coordinates", response_model=ImageResponse)
-async def visualize_parallel_coordinates(request: VisualizationRequest):
+async def visualize_parallel_coordinates(
+    request: VisualizationRequest,
+    format: ImageFormat = Query("base64", description="base64 JSON or raw PNG bytes"),
+):
     """
     Generate parallel coordinates plot for N objectives.
 
@@ -206,44 +237,19 @@ async def visualize_parallel_coordinates(request: VisualizationRequest):
 
     Args:
         request: Visualization request
+        format: "base64" (JSON) or "png" (raw image)
 
     Returns:
         Base64-encoded PNG image
     """
-    try:
-        from src.visualization.pareto_visualization import ParetoVisualizer
-
-        objectives = objectives_to_numpy(request.objectives)
-        n_objectives = objectives.shape[1]
-
-        visualizer = ParetoVisualizer(figsize=(max(10, n_objectives * 2), 8), dpi=100)
-
-        obj_names = request.objective_names or [f"Objective {i+1}" for i in range(n_objectives)]
-        title = request.title or "Parallel Coordinates Plot"
-
-        fig = visualizer.plot_parallel_coordinates(
-            objectives,
-            obj_names=obj_names,
-            best_idx=request.best_index,
-            normalize=True,
-            title=title,
-            show=False,
-        )
-
-        img_base64 = fig_to_base64(fig)
-
-        width = max(1000, n_objectives * 200)
-        return ImageResponse(success=True, image_base64=img_base64, width=width, height=800)
-
-    except ImportError:
-        raise HTTPException(status_code=500, detail="Visualization module not available")
-    except Exception as e:
-        logger.error(f"Visualization failed: {e}")
-        raise HTTPException(status_code=500, detail=f"Visualization failed: {str(e)}")
+    return await render_plot("parallel-coordinates", request, format)
 
 
 @router.post("/objective-matrix", response_model=ImageResponse)
-async def visualize_objective_matrix(request: VisualizationRequest):
+async def visualize_objective_matrix(
+    request: VisualizationRequest,
+    format: ImageFormat = Query("base64", description="base64 JSON or raw PNG bytes"),
+):
     """
     Generate objective trade-off matrix.
 
@@ -251,39 +257,61 @@ async def visualize_objective_matrix(request: VisualizationRequest):
 
     Args:
         request: Visualization request
+        format: "base64" (JSON) or "png" (raw image)
 
     Returns:
         Base64-encoded PNG image
     """
-    try:
-        from src.visualization.pareto_visualization import ParetoVisualizer
-
-        objectives = objectives_to_numpy(request.objectives)
-        n_objectives = objectives.shape[1]
+    return await render_plot("objective-matrix", request, format)
 
-        visualizer = ParetoVisualizer(figsize=(3 * n_objectives, 3 * n_objectives), dpi=100)
 
-        obj_names = request.objective_names or [f"Objective {i+1}" for i in range(n_objectives)]
-        title = request.title or "Objective Trade-off Matrix"
-
-        fig = visualizer.plot_objective_matrix(
-            objectives,
-            obj_names=obj_names,
-            best_idx=request.best_index,
-            title=title,
-            show=False,
-        )
+@router.post("/plot-data", response_model=PlotDataResponse)
+async def plot_data(
+    request: VisualizationRequest,
+    format: Literal["json", "arrow"] = Query("json", description="Columnar JSON or Arrow IPC"),
+):
+    """
+    Objective data for client-side plotting (no rendering).
 
-        img_base64 = fig_to_base64(fig)
+    Values are column-major (one list per objective), with per-objective
+    ranges for axis scaling. ``format=arrow`` returns an Arrow IPC stream
+    with one float64 column per objective (requires pyarrow).
 
-        size = 300 * n_objectives
-        return ImageResponse(success=True, image_base64=img_base64, width=size, height=size)
+    Args:
+        request: Visualization request
+        format: "json" or "arrow"
 
-    except ImportError:
-        raise HTTPException(status_code=500, detail="Visualization module not available")
-    except Exception as e:
-        logger.error(f"Visualization failed: {e}")
-        raise HTTPException(status_code=500, detail=f"Visualization failed: {str(e)}")
+    Returns:
+        Columnar objective data
+    """
+    objectives = objectives_to_numpy(request.objectives)
+    if objectives.ndim != 2 or objectives.size == 0:
+        raise HTTPException(
+            status_code=400, detail="Objectives must be a non-empty n_solutions x n_objectives list"
+        )
+    names = objective_names(request, objectives.shape[1])
+
+    if format == "arrow":
+        if not PYARROW_AVAILABLE:
+            raise HTTPException(status_code=501, detail="Arrow output requires pyarrow")
+        metadata = {"best_index": "" if request.best_index is None else str(request.best_index)}
+        table = pa.table(
+            {name: objectives[:, i].astype(np.float64) for i, name in enumerate(names)},
+            metadata=metadata,
+        )
+        sink = io.BytesIO()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return Response(content=sink.getvalue(), media_type=ARROW_MEDIA_TYPE)
+
+    return PlotDataResponse(
+        success=True,
+        objective_names=names,
+        columns=objectives.T.tolist(),
+        minimums=objectives.min(axis=0).tolist(),
+        maximums=objectives.max(axis=0).tolist(),
+        best_index=request.best_index,
+    )
 
 
 @router.post("/statistics", response_model=StatisticsResponse)
@@ -0,0 +1,123 @@
+"""
+On-demand router loading for the API process.
+
+Importing every router at startup pulls in osmnx/geopandas, pymoo, scipy and
+matplotlib before ``/health`` can answer. ``LazyRouters`` maps URL prefixes to
+router modules instead; a router module is imported and included into the app
+the first time a request arrives under its prefix (or when ``load_all`` is
+called, e.g. by a warm-up endpoint). Imports run under one lock, so concurrent
+first requests import a router once. A router that fails to load (any exception
+while importing or including it) is recorded in ``failed`` and not retried;
+its paths answer 404 as if it had never been registered.
+"""
+
+import importlib
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+
+
+class LazyRouters:
+    """
+    Routers of an app, imported on first use.
+
+    Attributes:
+        loaded: Module names of the routers included so far
+        failed: Module name -> import error of routers that could not load
+
+    Example:
+        >>> routers = LazyRouters(app, {"/api/context": "backend.api.routers.context"})
+        >>> routers.module_for("/api/context/fetch")
+        'backend.api.routers.context'
+    """
+
+    def __init__(self, app, routers: Dict[str, str]):
+        """
+        Initialize registry.
+
+        Args:
+            app: FastAPI application the routers are included into
+            routers: URL prefix -> module exposing ``router`` (APIRouter)
+        """
+        self.app = app
+        self._pending: Dict[str, str] = {
+            prefix.rstrip("/"): module for prefix, module in routers.items()
+        }
+        self._lock = threading.Lock()
+        self.loaded: List[str] = []
+        self.failed: Dict[str, str] = {}
+
+    @property
+    def pending(self) -> List[str]:
+        """Module names of routers not imported yet."""
+        return list(self._pending.values())
+
+    def module_for(self, path: str) -> Optional[str]:
+        """Pending router module serving ``path`` (None if loaded or unknown)."""
+        for prefix, module in list(self._pending.items()):
+            if path == prefix or path.startswith(prefix + "/"):
+                return module
+        return None
+
+    def load(self, module_name: str) -> bool:
+        """
+        Import a router module and include its router (once).
+
+        Args:
+            module_name: Module registered in the prefix map
+
+        Returns:
+            True if the router is included (now or earlier)
+        """
+        with self._lock:
+            if module_name in self.loaded:
+                return True
+            if module_name in self.failed:
+                return False
+
+            prefixes = [p for p, m in self._pending.items() if m == module_name]
+            for prefix in prefixes:
+                del self._pending[prefix]
+
+            label = module_name.rsplit(".", 1)[-1].capitalize()
+            start = time.perf_counter()
+            try:
+                module = importlib.import_module(module_name)
+                self.app.include_router(module.router)
+            except Exception as e:  # Record any failure: the prefix has left pending
+                self.failed[module_name] = f"{type(e).__name__}: {e}"
+                print(f"❌ {label} router failed: {e}")
+                return False
+
+            # Regenerate the OpenAPI schema with the new routes on next request
+            self.app.openapi_schema = None
+            self.loaded.append(module_name)
+            print(f"✅ {label} router loaded ({time.perf_counter() - start:.2f}s)")
+            return True
+
+    def load_all(self, modules: Sequence[str] = ()) -> Dict:
+        """
+        Load every pending router and import extra (lazily used) modules.
+
+        Args:
+            modules: Additional modules to import, e.g. heavy handler dependencies
+
+        Returns:
+            Dict with loaded routers, failed imports and elapsed seconds
+        """
+        start = time.perf_counter()
+        for module_name in self.pending:
+            self.load(module_name)
+
+        failed = dict(self.failed)
+        for module_name in modules:
+            try:
+                importlib.import_module(module_name)
+            except Exception as e:
+                failed[module_name] = f"{type(e).__name__}: {e}"
+
+        return {
+            "loaded": list(self.loaded),
+            "failed": failed,
+            "seconds": round(time.perf_counter() - start, 3),
+        }
@@ -0,0 +1,362 @@
+"""
+Prometheus-style metrics for the API process.
+
+Counters and histograms are sharded per thread: each thread only writes its
+own shard, so the request and job paths never take a lock (one short lock
+when a thread records its first sample). A scrape sums the shards. Gauges
+change a few times per request or job and use a plain lock.
+
+``render()`` produces the Prometheus text exposition format (0.0.4), so no
+client library is needed. Every instance behind a load balancer exports its
+own values; the scraper adds the instance label.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Request / stage latency buckets (seconds)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+STAGE_BUCKETS = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+WRITE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+LabelKey = Tuple[str, ...]
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    value = float(value)
+    if value != value:
+        return "NaN"
+    if value in (float("inf"), float("-inf")):
+        return "+Inf" if value > 0 else "-Inf"
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+class _Metric:
+    """Name, help text and label names shared by all metric types."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels: Dict[str, Any]) -> LabelKey:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {sorted(labels)}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class _Sharded(_Metric):
+    """Per-thread shards: writers touch only their own dict, scrapes sum them."""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._shards: Dict[int, Dict[LabelKey, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _shard(self) -> Dict[LabelKey, Any]:
+        tid = threading.get_ident()
+        shard = self._shards.get(tid)
+        if shard is None:
+            with self._lock:
+                shard = self._shards.setdefault(tid, {})
+        return shard
+
+    def _all_shards(self) -> List[List[Tuple[LabelKey, Any]]]:
+        # list(dict.items()) is atomic under the GIL
+        return [list(shard.items()) for shard in list(self._shards.values())]
+
+
+class Counter(_Sharded):
+    """Monotonic counter."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        shard = self._shard()
+        key = self._key(labels)
+        shard[key] = shard.get(key, 0.0) + amount
+
+    def values(self) -> Dict[LabelKey, float]:
+        totals: Dict[LabelKey, float] = {}
+        for items in self._all_shards():
+            for key, value in items:
+                totals[key] = totals.get(key, 0.0) + value
+        if not totals and not self.labelnames:
+            totals[()] = 0.0
+        return totals
+
+    def samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in sorted(self.values().items())
+        ]
+
+
+class Histogram(_Sharded):
+    """Cumulative-bucket histogram with sum and count."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        shard = self._shard()
+        key = self._key(labels)
+        state = shard.get(key)
+        if state is None:
+            # [per-bucket counts (+Inf last), sum]
+            state = shard[key] = [[0] * (len(self.buckets) + 1), 0.0]
+        state[0][bisect_left(self.buckets, value)] += 1
+        state[1] += value
+
+    def time(self, **labels) -> "_Timer":
+        """Context manager observing the elapsed wall time."""
+        return _Timer(self, labels)
+
+    def values(self) -> Dict[LabelKey, Tuple[List[int], float]]:
+        totals: Dict[LabelKey, Tuple[List[int], float]] = {}
+        for items in self._all_shards():
+            for key, (counts, total) in items:
+                merged = totals.get(key)
+                if merged is None:
+                    totals[key] = (list(counts), total)
+                else:
+                    totals[key] = ([a + b for a, b in zip(merged[0], counts)], merged[1] + total)
+        return totals
+
+    def samples(self) -> List[str]:
+        lines = []
+        for key, (counts, total) in sorted(self.values().items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}"
+                )
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class _Timer:
+    def __init__(self, histogram: Histogram, labels: Dict[str, Any]):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start, **self.labels)
+        return False
+
+
+class Gauge(_Metric):
+    """Value that goes up and down."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def values(self) -> Dict[LabelKey, float]:
+        with self._lock:
+            values = dict(self._values)
+        if not values and not self.labelnames:
+            values[()] = 0.0
+        return values
+
+    def samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in sorted(self.values().items())
+        ]
+
+
+class MetricsRegistry:
+    """Ordered collection of metrics rendered together."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Prometheus text exposition of every registered metric."""
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.header())
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+# =============================================================================
+# API METRICS
+# =============================================================================
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "planify_http_request_duration_seconds",
+    "HTTP request latency by router.",
+    ["router", "method", "status"],
+)
+HTTP_REQUESTS_IN_FLIGHT = REGISTRY.gauge(
+    "planify_http_requests_in_flight", "HTTP requests currently being served."
+)
+
+JOBS_QUEUED = REGISTRY.gauge(
+    "planify_jobs_queued", "Optimization jobs accepted but not started (queue depth)."
+)
+JOBS_IN_FLIGHT = REGISTRY.gauge("planify_jobs_in_flight", "Optimization jobs running.")
+JOBS_FINISHED = REGISTRY.counter(
+    "planify_jobs_finished_total", "Optimization jobs finished by outcome.", ["status"]
+)
+PIPELINE_STAGE_DURATION = REGISTRY.histogram(
+    "planify_pipeline_stage_duration_seconds",
+    "Pipeline stage duration.",
+    ["stage"],
+    buckets=STAGE_BUCKETS,
+)
+
+OPTIMIZER_EVALUATIONS = REGISTRY.counter(
+    "planify_optimizer_evaluations_total", "Objective evaluations performed by the optimizer."
+)
+OPTIMIZER_SECONDS = REGISTRY.counter(
+    "planify_optimizer_seconds_total", "Wall time spent in the optimizer."
+)
+OPTIMIZER_THROUGHPUT = REGISTRY.gauge(
+    "planify_optimizer_evaluations_per_second", "Evaluations per second of the last job."
+)
+
+CACHE_REQUESTS = REGISTRY.counter(
+    "planify_cache_requests_total", "Cache lookups by cache and result.", ["cache", "result"]
+)
+
+JOB_STORE_WRITE_DURATION = REGISTRY.histogram(
+    "planify_job_store_write_seconds",
+    "Job store write latency.",
+    ["operation"],
+    buckets=WRITE_BUCKETS,
+)
+
+
+def record_cache(cache: str, hits: int, misses: int) -> None:
+    """Add lookups of a cache (hit rate = hits / (hits + misses))."""
+    if hits:
+        CACHE_REQUESTS.inc(hits, cache=cache, result="hit")
+    if misses:
+        CACHE_REQUESTS.inc(misses, cache=cache, result="miss")
+
+
+def record_pipeline_result(result) -> None:
+    """Record stage durations and optimizer throughput of a PipelineResult."""
+    for stage in result.stages:
+        PIPELINE_STAGE_DURATION.observe(stage.duration_seconds, stage=stage.stage.value)
+
+    stats = result.optimizer_stats or {}
+    evaluations = stats.get("sa_evaluations", 0) + stats.get("ga_evaluations", 0)
+    seconds = stats.get("total_time", 0.0)
+    if evaluations and seconds > 0:
+        OPTIMIZER_EVALUATIONS.inc(evaluations)
+        OPTIMIZER_SECONDS.inc(seconds)
+        OPTIMIZER_THROUGHPUT.set(evaluations / seconds)
+
+
+def route_label(scope: Dict[str, Any]) -> str:
+    """Router of a served request: first tag of the matched route."""
+    route = scope.get("route")
+    if route is None:
+        return "unmatched"
+    tags = getattr(route, "tags", None)
+    return str(tags[0]) if tags else getattr(route, "path", "unmatched")
+
+
+class TimedJobStore:
+    """JobStore wrapper that records write latency (reads pass through)."""
+
+    def __init__(self, store):
+        self._store = store
+
+    def create(self, job_id, data):
+        with JOB_STORE_WRITE_DURATION.time(operation="create"):
+            return self._store.create(job_id, data)
+
+    def update(self, job_id, data):
+        with JOB_STORE_WRITE_DURATION.time(operation="update"):
+            return self._store.update(job_id, data)
+
+    def delete(self, job_id):
+        with JOB_STORE_WRITE_DURATION.time(operation="delete"):
+            return self._store.delete(job_id)
+
+    def __getattr__(self, name):
+        return getattr(self._store, name)
@@ -0,0 +1,313 @@
+"""
+Columnar Pareto-front payloads.
+
+The nested ``pareto_front`` response repeats every building's metadata for
+every solution and is built from per-solution dicts, so for large fronts
+encoding takes longer than the optimization. ``ParetoColumns`` stores a front
+as arrays instead:
+
+- ``positions``: (n_solutions, n_buildings, 2), NaN for unplaced buildings
+- ``objectives``: (n_solutions, n_objectives)
+- one shared building table (name, type, area, floors)
+
+Pages of it (``page``) are encoded as compact JSON, NumPy ``.npy``/``.npz`` or
+an Arrow IPC stream, restricted to the requested fields. ``ParetoResultCache``
+keeps recent fronts so clients can page through them without re-running the
+optimization.
+"""
+
+import io
+import json
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.algorithms.solution import positions_array
+
+try:
+    import pyarrow as pa
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Selectable parts of a columnar response
+FIELDS = ("summary", "best_compromise", "buildings", "positions", "objectives")
+ARRAY_FIELDS = ("positions", "objectives")
+
+NPY_MEDIA_TYPE = "application/x-npy"
+NPZ_MEDIA_TYPE = "application/x-npz"
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
+def parse_fields(fields: Optional[str]) -> Tuple[str, ...]:
+    """
+    Parse a ``fields=`` query value.
+
+    Args:
+        fields: Comma-separated field names (None or empty = all fields)
+
+    Returns:
+        Requested fields in FIELDS order
+
+    Raises:
+        ValueError: If a field name is unknown
+    """
+    if not fields:
+        return FIELDS
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - set(FIELDS)
+    if unknown:
+        raise ValueError(
+            f"Unknown fields: {', '.join(sorted(unknown))}. Valid fields: {', '.join(FIELDS)}"
+        )
+    return tuple(name for name in FIELDS if name in requested)
+
+
+@dataclass
+class ParetoColumns:
+    """
+    Pareto front in columnar form.
+
+    Attributes:
+        building_names: Building IDs (column order of positions)
+        building_types: Building type names
+        areas: Floor areas (m²)
+        floors: Floor counts
+        positions: Coordinates, shape (n_solutions, n_buildings, 2)
+        objectives: Objective values, shape (n_solutions, n_objectives)
+        best: Best compromise solution (index, positions, objectives,
+            normalized_objectives) taken from the full front; None if empty
+        summary: Run metadata (pareto size, evaluations, runtime, ...)
+        offset: Index of the first solution within the full front
+        total: Number of solutions of the full front
+        result_id: ParetoResultCache ID of the full front (None if not cached)
+    """
+
+    building_names: List[str]
+    building_types: List[str]
+    areas: List[float]
+    floors: List[int]
+    positions: np.ndarray
+    objectives: np.ndarray
+    best: Optional[Dict[str, Any]] = None
+    summary: Dict[str, Any] = field(default_factory=dict)
+    offset: int = 0
+    total: int = 0
+    result_id: Optional[str] = None
+
+    @classmethod
+    def from_result(
+        cls, result: Dict[str, Any], buildings: Sequence, summary: Optional[Dict] = None
+    ) -> "ParetoColumns":
+        """
+        Build from an NSGA3Runner result.
+
+        Args:
+            result: Dict with pareto_front, pareto_objectives and best_compromise
+            buildings: Building objects (id, type, area, floors)
+            summary: Run metadata included in the summary field
+
+        Returns:
+            ParetoColumns of the whole front
+        """
+        ids = [b.id for b in buildings]
+        front = result["pareto_front"]
+        positions = np.full((len(front), len(ids), 2), np.nan)
+        for row, solution in enumerate(front):
+            if all(bid in solution.positions for bid in ids):
+                positions[row] = positions_array(solution, ids)
+            else:
+                for col, bid in enumerate(ids):
+                    pos = solution.positions.get(bid)
+                    if pos:
+                        positions[row, col] = pos
+
+        objectives = np.asarray(result["pareto_objectives"], dtype=float)
+        if objectives.ndim != 2:
+            objectives = objectives.reshape(len(front), -1 if len(front) else 0)
+        best = result.get("best_compromise")
+        if best is not None:
+            best = {
+                "index": int(best["index"]),
+                "positions": _nan_to_none(positions[best["index"]]),
+                "objectives": np.asarray(best["objectives"], dtype=float).tolist(),
+                "normalized_objectives": np.asarray(
+                    best["normalized_objectives"], dtype=float
+                ).tolist(),
+            }
+        return cls(
+            building_names=ids,
+            building_types=[b.type.name for b in buildings],
+            areas=[float(b.area) for b in buildings],
+            floors=[int(b.floors) for b in buildings],
+            positions=positions,
+            objectives=objectives,
+            best=best,
+            summary=dict(summary or {}),
+            offset=0,
+            total=len(front),
+        )
+
+    def page(self, offset: int = 0, limit: Optional[int] = None) -> "ParetoColumns":
+        """Solutions [offset, offset + limit) of the front (views, no copy)."""
+        stop = len(self.positions) if limit is None else offset + limit
+        return ParetoColumns(
+            building_names=self.building_names,
+            building_types=self.building_types,
+            areas=self.areas,
+            floors=self.floors,
+            positions=self.positions[offset:stop],
+            objectives=self.objectives[offset:stop],
+            best=self.best,
+            summary=self.summary,
+            offset=self.offset + offset,
+            total=self.total,
+            result_id=self.result_id,
+        )
+
+    def to_json(self, fields: Sequence[str] = FIELDS) -> Dict[str, Any]:
+        """
+        Compact JSON payload of the requested fields.
+
+        Args:
+            fields: Subset of FIELDS
+
+        Returns:
+            Dict with result_id, offset, count and total plus the requested fields
+        """
+        payload: Dict[str, Any] = {
+            "result_id": self.result_id,
+            "offset": self.offset,
+            "count": len(self.positions),
+            "total": self.total,
+        }
+        if "summary" in fields:
+            payload["summary"] = {
+                **self.summary,
+                "pareto_size": self.total,
+                "n_buildings": len(self.building_names),
+                "n_objectives": int(self.objectives.shape[1]),
+            }
+        if "best_compromise" in fields:
+            payload["best_compromise"] = self.best
+        if "buildings" in fields:
+            payload["buildings"] = {
+                "name": self.building_names,
+                "building_type": self.building_types,
+                "area": self.areas,
+                "floors": self.floors,
+            }
+        if "positions" in fields:
+            payload["positions"] = _nan_to_none(self.positions)
+        if "objectives" in fields:
+            payload["objectives"] = self.objectives.tolist()
+        return payload
+
+    def to_numpy(self, fields: Sequence[str] = ARRAY_FIELDS) -> Tuple[bytes, str]:
+        """
+        NumPy payload of the requested array fields.
+
+        One field is sent as ``.npy``; several as ``.npz`` with one entry each.
+
+        Args:
+            fields: Requested fields (non-array fields are ignored)
+
+        Returns:
+            Tuple of (payload bytes, media type)
+
+        Raises:
+            ValueError: If no array field is requested
+        """
+        arrays = {name: getattr(self, name) for name in ARRAY_FIELDS if name in fields}
+        if not arrays:
+            raise ValueError(f"Binary formats need one of the fields: {', '.join(ARRAY_FIELDS)}")
+
+        buf = io.BytesIO()
+        if len(arrays) == 1:
+            np.save(buf, np.ascontiguousarray(next(iter(arrays.values()))), allow_pickle=False)
+            return buf.getvalue(), NPY_MEDIA_TYPE
+        np.savez(buf, **arrays)
+        return buf.getvalue(), NPZ_MEDIA_TYPE
+
+    def to_arrow(self, fields: Sequence[str] = FIELDS) -> bytes:
+        """
+        Arrow IPC stream with one row per solution.
+
+        Columns: ``objective_<k>`` (float64) and ``positions`` (fixed-size
+        list of n_buildings * 2 float64, x/y interleaved). The JSON payload
+        of the non-array fields is stored in the schema metadata.
+
+        Args:
+            fields: Requested fields
+
+        Returns:
+            Arrow IPC stream bytes
+
+        Raises:
+            RuntimeError: If pyarrow is not installed
+        """
+        if not PYARROW_AVAILABLE:
+            raise RuntimeError("Arrow output requires pyarrow")
+
+        columns: Dict[str, Any] = {}
+        if "objectives" in fields:
+            for k in range(self.objectives.shape[1]):
+                columns[f"objective_{k}"] = pa.array(self.objectives[:, k])
+        if "positions" in fields:
+            width = 2 * len(self.building_names)
+            flat = pa.array(np.ascontiguousarray(self.positions).reshape(-1))
+            columns["positions"] = pa.FixedSizeListArray.from_arrays(flat, width)
+
+        meta_fields = [name for name in fields if name not in ARRAY_FIELDS]
+        metadata = {"planifyai": json.dumps(self.to_json(meta_fields))}
+        table = pa.table(columns, metadata=metadata)
+
+        sink = io.BytesIO()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue()
+
+
+def _nan_to_none(values: np.ndarray) -> List:
+    """Nested lists with NaN (unplaced building) as None."""
+    if not np.isnan(values).any():
+        return values.tolist()
+    return np.where(np.isnan(values), None, values.astype(object)).tolist()
+
+
+class ParetoResultCache:
+    """
+    Thread-safe LRU of recent Pareto fronts by result ID.
+
+    Attributes:
+        max_entries: Maximum number of kept fronts
+    """
+
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max_entries
+        self._results: "OrderedDict[str, ParetoColumns]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, columns: ParetoColumns) -> str:
+        """Store a front and return its new result ID."""
+        result_id = uuid.uuid4().hex
+        with self._lock:
+            self._results[result_id] = columns
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+        return result_id
+
+    def get(self, result_id: str) -> Optional[ParetoColumns]:
+        with self._lock:
+            columns = self._results.get(result_id)
+            if columns is not None:
+                self._results.move_to_end(result_id)
+            return columns
+
+    def __len__(self) -> int:
+        return len(self._results)
@@ -0,0 +1,294 @@
+"""
+Figure rendering off the event loop.
+
+Matplotlib rendering is CPU bound and holds the GIL, so rendering inside an
+``async`` handler freezes every other request. ``PlotRenderer`` renders plots
+in a dedicated process pool instead. Workers use the Agg backend and warm
+matplotlib's font cache once at start-up, so a plot only pays for drawing.
+
+Rendered PNGs are kept in an LRU ``FigureCache``. Entries are keyed by a hash
+of the plot kind, the objective values and the plot options, and are evicted
+by entry count and total bytes. Identical requests that arrive while a render
+is in progress share that render.
+"""
+
+import asyncio
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+# Plot kind -> (ParetoVisualizer method, default title, extra keyword arguments)
+PLOT_KINDS: Dict[str, Tuple[str, str, Dict[str, Any]]] = {
+    "pareto-2d": ("plot_pareto_front_2d", "Pareto Front (2D)", {}),
+    "pareto-3d": ("plot_pareto_front_3d", "Pareto Front (3D)", {}),
+    "parallel-coordinates": (
+        "plot_parallel_coordinates",
+        "Parallel Coordinates Plot",
+        {"normalize": True},
+    ),
+    "objective-matrix": ("plot_objective_matrix", "Objective Trade-off Matrix", {}),
+}
+
+PNG_DPI = 100
+
+
+def figure_size(kind: str, n_objectives: int) -> Tuple[int, int]:
+    """Figure size in inches of a plot kind."""
+    if kind == "parallel-coordinates":
+        return (max(10, n_objectives * 2), 8)
+    if kind == "objective-matrix":
+        return (3 * n_objectives, 3 * n_objectives)
+    return (10, 8)
+
+
+def image_size(kind: str, n_objectives: int) -> Tuple[int, int]:
+    """Nominal image size in pixels reported to clients (width, height)."""
+    if kind == "parallel-coordinates":
+        return (max(1000, n_objectives * 200), 800)
+    if kind == "objective-matrix":
+        return (300 * n_objectives, 300 * n_objectives)
+    return (1000, 800)
+
+
+def _init_worker() -> None:
+    """Select the Agg backend and warm the font cache of a render process."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    import src.visualization.pareto_visualization  # noqa: F401
+
+    fig = plt.figure(figsize=(1, 1))
+    fig.suptitle("warm-up", fontweight="bold")
+    fig.canvas.draw()
+    plt.close(fig)
+
+
+def render_png(kind: str, objectives: np.ndarray, options: Dict[str, Any]) -> bytes:
+    """
+    Render one plot to PNG bytes.
+
+    Args:
+        kind: Key of PLOT_KINDS
+        objectives: Objective values (n_solutions x n_objectives)
+        options: objective_names, best_index and title (None = defaults)
+
+    Returns:
+        PNG image bytes
+    """
+    import matplotlib.pyplot as plt
+
+    from src.visualization.pareto_visualization import ParetoVisualizer
+
+    method, default_title, extra = PLOT_KINDS[kind]
+    n_objectives = objectives.shape[1]
+    visualizer = ParetoVisualizer(figsize=figure_size(kind, n_objectives), dpi=PNG_DPI)
+
+    fig = getattr(visualizer, method)(
+        objectives,
+        obj_names=options.get("objective_names")
+        or [f"Objective {i+1}" for i in range(n_objectives)],
+        best_idx=options.get("best_index"),
+        title=options.get("title") or default_title,
+        show=False,
+        **extra,
+    )
+    try:
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png", dpi=PNG_DPI, bbox_inches="tight")
+        return buf.getvalue()
+    finally:
+        plt.close(fig)
+
+
+class FigureCache:
+    """
+    Thread-safe LRU cache of rendered images.
+
+    Attributes:
+        max_entries: Maximum number of cached images
+        max_bytes: Maximum total size of cached images
+        hits: Cache hits so far
+        misses: Cache misses so far
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._images: "OrderedDict[str, bytes]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(kind: str, objectives: np.ndarray, options: Dict[str, Any]) -> str:
+        """Hash of (kind, objective values, options)."""
+        values = np.ascontiguousarray(objectives, dtype=np.float64)
+        digest = hashlib.sha256()
+        digest.update(kind.encode())
+        digest.update(str(values.shape).encode())
+        digest.update(values.tobytes())
+        digest.update(json.dumps(options, sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            image = self._images.get(key)
+            if image is None:
+                self.misses += 1
+                return None
+            self._images.move_to_end(key)
+            self.hits += 1
+            return image
+
+    def put(self, key: str, image: bytes) -> None:
+        if len(image) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._images.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._images[key] = image
+            self._bytes += len(image)
+            while len(self._images) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._images.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._images.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+
+class PlotRenderer:
+    """
+    Renders plots in a process pool with an LRU image cache.
+
+    The pool is created on the first render. ``max_workers=0`` renders in the
+    default thread pool of the event loop instead (one render at a time, since
+    pyplot is not thread-safe), which keeps the event loop free without extra
+    processes.
+
+    Example:
+        >>> renderer = PlotRenderer(max_workers=2)
+        >>> png = await renderer.render("pareto-2d", objectives, {"title": "Front"})
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, cache: Optional[FigureCache] = None):
+        """
+        Initialize renderer.
+
+        Args:
+            max_workers: Render processes (default: PLANIFYAI_RENDER_WORKERS or
+                min(2, cpu_count)); 0 renders in a thread of this process
+            cache: Image cache (default: new FigureCache)
+        """
+        if max_workers is None:
+            max_workers = int(
+                os.environ.get("PLANIFYAI_RENDER_WORKERS", min(2, os.cpu_count() or 1))
+            )
+        self.max_workers = max_workers
+        self.cache = cache if cache is not None else FigureCache()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._inline_lock = threading.Lock()
+        self._inflight: Dict[str, "asyncio.Future[bytes]"] = {}
+
+    async def render(self, kind: str, objectives: np.ndarray, options: Dict[str, Any]) -> bytes:
+        """
+        PNG of a plot, from the cache or rendered off the event loop.
+
+        Args:
+            kind: Key of PLOT_KINDS
+            objectives: Objective values (n_solutions x n_objectives)
+            options: objective_names, best_index and title
+
+        Returns:
+            PNG image bytes
+        """
+        if kind not in PLOT_KINDS:
+            raise ValueError(f"Unknown plot kind '{kind}'")
+
+        key = FigureCache.key(kind, objectives, options)
+        image = self.cache.get(key)
+        if image is not None:
+            return image
+
+        # Share a render in progress (futures belong to one event loop)
+        future = self._inflight.get(key)
+        if future is None or future.get_loop() is not asyncio.get_running_loop():
+            future = asyncio.ensure_future(self._render_uncached(kind, objectives, options))
+            future.add_done_callback(lambda done: self._finish(key, done))
+            self._inflight[key] = future
+
+        # Shielded: a disconnecting client does not cancel a shared render
+        return await asyncio.shield(future)
+
+    def _finish(self, key: str, future: "asyncio.Future[bytes]") -> None:
+        """Cache a completed render and drop it from the in-progress map."""
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled() and future.exception() is None:
+            self.cache.put(key, future.result())
+
+    async def _render_uncached(
+        self, kind: str, objectives: np.ndarray, options: Dict[str, Any]
+    ) -> bytes:
+        loop = asyncio.get_running_loop()
+        if self.max_workers == 0:
+            return await loop.run_in_executor(None, self._render_inline, kind, objectives, options)
+
+        executor = self._get_executor()
+        try:
+            return await asyncio.wrap_future(executor.submit(render_png, kind, objectives, options))
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM); start a fresh pool on the next render
+            with self._executor_lock:
+                if self._executor is executor:
+                    self._executor = None
+            executor.shutdown(wait=False)
+            raise
+
+    def _render_inline(self, kind: str, objectives: np.ndarray, options: Dict[str, Any]) -> bytes:
+        with self._inline_lock:
+            import matplotlib
+
+            matplotlib.use("Agg")
+            return render_png(kind, objectives, options)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                # Spawn, not fork: the server process runs threads (event loop,
+                # thread pool) whose locks a forked child would inherit held
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                )
+            return self._executor
+
+    def shutdown(self) -> None:
+        """Stop the render processes (a later render starts a new pool)."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
@@ -5,13 +5,14 @@ Delaunay triangulation + Minimum Spanning Tree approach for simple,
 guaranteed connectivity between gateways and buildings.
 """
 
-from typing import List, Tuple, Set
+from typing import List, Set, Tuple
+
 import numpy as np
-from shapely.geometry import Point, Polygon, LineString
-from scipy.spatial import Delaunay
-import networkx as nx
+from scipy.spatial import cKDTree
+from shapely.geometry import LineString, Point, Polygon
 
 from backend.core.domain.models.campus import Gateway
+from src.algorithms.graph_core import EdgeGraph, delaunay_edges
 
 
 class GatewayRoadNetwork:
@@ -53,7 +54,7 @@ class GatewayRoadNetwork:
         self,
         buildings: List[Polygon],
         use_mst: bool = True,
-        avoid_building_intersections: bool = False
+        avoid_building_intersections: bool = False,
     ) -> List[LineString]:
         """
         Generate road network connecting gateways to buildings.
@@ -72,7 +73,7 @@ class GatewayRoadNetwork:
         Algorithm:
             1. Extract nodes (gateway locations + building centroids)
             2. Compute Delaunay triangulation
-            3. Convert Delaunay edges to NetworkX graph with distances
+            3. Convert Delaunay edges to an edge-array graph with distances
             4. Apply MST to minimize total road length
             5. Filter roads that intersect buildings (optional)
             6. Convert edges back to LineString geometries
@@ -96,35 +97,22 @@ class GatewayRoadNetwork:
             # Need at least 3 points for Delaunay
             return self._connect_linear(nodes)
 
-        # Step 2: Delaunay triangulation
-        try:
-            tri = Delaunay(nodes)
-        except Exception as e:
-            # Fallback 1: Try with QJ (joggle) for nearly-colinear points
-            try:
-                tri = Delaunay(nodes, qhull_options='QJ')
-            except Exception:
-                # Fallback 2: Linear connection
-                return self._connect_linear(nodes)
-
-        # Step 3: Extract edges from Delaunay with distances
-        edges = self._extract_delaunay_edges(tri, nodes)
-
-        # Step 4: Build NetworkX graph
-        G = nx.Graph()
-        for i in range(len(nodes)):
-            G.add_node(i, pos=nodes[i], type=node_types[i])
+        # Step 2: Delaunay triangulation (unique edges, QJ fallback for
+        # nearly-colinear points)
+        edges = delaunay_edges(nodes)
+        if edges is None:
+            return self._connect_linear(nodes)
 
-        for (i, j), dist in edges.items():
-            G.add_edge(i, j, weight=dist)
+        # Step 3-4: Edge-array graph weighted by Euclidean distance
+        graph = EdgeGraph(len(nodes), edges, nodes=nodes)
 
         # Step 5: Apply MST if requested
         if use_mst:
-            G = nx.minimum_spanning_tree(G, weight='weight')
+            graph = graph.minimum_spanning_tree()
 
         # Step 6: Convert edges to LineStrings
         roads = []
-        for i, j in G.edges():
+        for i, j in graph.edges:
             p1 = Point(nodes[i])
             p2 = Point(nodes[j])
             road = LineString([p1, p2])
@@ -142,10 +130,7 @@ class GatewayRoadNetwork:
 
         return roads
 
-    def _extract_nodes(
-        self,
-        buildings: List[Polygon]
-    ) -> Tuple[np.ndarray, List[str]]:
+    def _extract_nodes(self, buildings: List[Polygon]) -> Tuple[np.ndarray, List[str]]:
         """
         Extract nodes from gateways and buildings.
 
@@ -163,55 +148,16 @@ class GatewayRoadNetwork:
         # Add gateway locations
         for gateway in self.gateways:
             nodes.append([gateway.location.x, gateway.location.y])
-            node_types.append('gateway')
+            node_types.append("gateway")
 
         # Add building centroids
         for building in buildings:
             centroid = building.centroid
             nodes.append([centroid.x, centroid.y])
-            node_types.append('building')
+            node_types.append("building")
 
         return np.array(nodes), node_types
 
-    def _extract_delaunay_edges(
-        self,
-        tri: Delaunay,
-        nodes: np.ndarray
-    ) -> dict:
-        """
-        Extract edges from Delaunay triangulation.
-
-        Delaunay returns simplices (triangles). We need to extract
-        unique edges with their Euclidean distances.
-
-        Args:
-            tri: Delaunay triangulation
-            nodes: (N, 2) node coordinates
-
-        Returns:
-            Dictionary {(i, j): distance} for each edge
-        """
-        edges = {}
-
-        for simplex in tri.simplices:
-            # Each simplex is a triangle with 3 vertices
-            # Extract 3 edges: (0,1), (1,2), (2,0)
-            for i in range(3):
-                v1 = simplex[i]
-                v2 = simplex[(i + 1) % 3]
-
-                # Normalize edge (ensure i < j to avoid duplicates)
-                edge = tuple(sorted([v1, v2]))
-
-                if edge not in edges:
-                    # Calculate Euclidean distance
-                    p1 = nodes[edge[0]]
-                    p2 = nodes[edge[1]]
-                    dist = np.linalg.norm(p1 - p2)
-                    edges[edge] = dist
-
-        return edges
-
     def _connect_linear(self, nodes: np.ndarray) -> List[LineString]:
         """
         Fallback for <3 nodes: create linear connection.
@@ -234,11 +180,7 @@ class GatewayRoadNetwork:
 
         return roads
 
-    def _road_intersects_buildings(
-        self,
-        road: LineString,
-        buildings: List[Polygon]
-    ) -> bool:
+    def _road_intersects_buildings(self, road: LineString, buildings: List[Polygon]) -> bool:
         """
         Check if road passes through any building.
 
@@ -259,17 +201,14 @@ class GatewayRoadNetwork:
                 intersection = road.intersection(building)
                 # If intersection is a LineString (not just a Point),
                 # the road passes through the building
-                if intersection.geom_type == 'LineString':
+                if intersection.geom_type == "LineString":
                     return True
-                elif intersection.geom_type == 'MultiLineString':
+                elif intersection.geom_type == "MultiLineString":
                     return True
 
         return False
 
-    def get_gateway_connections(
-        self,
-        roads: List[LineString]
-    ) -> dict:
+    def get_gateway_connections(self, roads: List[LineString]) -> dict:
         """
         Get which buildings are connected to which gateways.
 
@@ -279,21 +218,8 @@ class GatewayRoadNetwork:
         Returns:
             Dictionary {gateway_id: [building_indices]} showing road connectivity
         """
-        # Build connectivity graph from roads
-        G = nx.Graph()
-
-        # Add gateway nodes
-        gateway_nodes = {}
-        for idx, gateway in enumerate(self.gateways):
-            node_id = f"gateway_{idx}"
-            gateway_nodes[gateway.id] = node_id
-            G.add_node(node_id, type='gateway', gateway_id=gateway.id)
-
-        # Add roads as edges
-        # (This is simplified - in reality we'd need to match road endpoints to nodes)
-        # For now, return empty dict - full implementation would require tracking
-        # which roads connect which nodes during generation
-
+        # Full implementation would require tracking which roads connect
+        # which nodes during generation (road endpoints matched to gateways)
         return {}
 
     def verify_connectivity(self, roads: List[LineString]) -> bool:
@@ -309,40 +235,32 @@ class GatewayRoadNetwork:
         if not roads:
             return False
 
-        # Build graph from roads
-        G = nx.Graph()
-
-        # Add edges from roads
-        for road in roads:
-            coords = list(road.coords)
-            if len(coords) >= 2:
-                # Use coordinate tuples as node IDs
-                start = coords[0]
-                end = coords[-1]
-                G.add_edge(start, end)
+        # Build graph from roads (coordinate tuples as node IDs)
+        endpoints = np.array(
+            [[road.coords[0], road.coords[-1]] for road in roads if len(road.coords) >= 2],
+            dtype=float,
+        ).reshape(-1, 2)
+        if len(endpoints) == 0:
+            return False
+        node_xy, node_of = np.unique(endpoints, axis=0, return_inverse=True)
+        graph = EdgeGraph(len(node_xy), node_of.reshape(-1, 2), nodes=node_xy)
 
         # Check if graph is connected
-        if not nx.is_connected(G):
+        if not graph.is_connected():
             return False
 
-        # Check if all gateways are in the graph
-        for gateway in self.gateways:
-            gateway_coord = (gateway.location.x, gateway.location.y)
-            # Find closest node in graph (allowing small tolerance)
-            found = False
-            for node in G.nodes():
-                dist = np.sqrt((node[0] - gateway_coord[0])**2 +
-                             (node[1] - gateway_coord[1])**2)
-                if dist < 1.0:  # 1m tolerance
-                    found = True
-                    break
-
-            if not found:
+        # Check if all gateways are in the graph (1m tolerance)
+        if self.gateways:
+            gateway_xy = np.array([[g.location.x, g.location.y] for g in self.gateways])
+            dist, _ = cKDTree(node_xy).query(gateway_xy)
+            if np.any(dist >= 1.0):
                 return False
 
         return True
 
     def __repr__(self):
-        return (f"GatewayRoadNetwork("
-                f"gateways={len(self.gateways)}, "
-                f"min_road_length={self.min_road_length}m)")
+        return (
+            f"GatewayRoadNetwork("
+            f"gateways={len(self.gateways)}, "
+            f"min_road_length={self.min_road_length}m)"
+        )
@@ -14,17 +14,20 @@ from .road_agents import (
     AgentState,
     RoadAgent,
     RoadAgentSystem,
+    RoadPointIndex,
     create_agents_from_buildings,
 )
 from .road_network import RoadNetworkConfig, RoadNetworkGenerator
 from .streamline_tracer import (
     StopReason,
     StreamlineConfig,
+    StreamlineOccupancy,
     StreamlineResult,
     resample_path,
     smooth_path,
     trace_bidirectional_streamline,
     trace_streamline_rk45,
+    trace_streamlines_batched,
 )
 from .tensor_field import TensorField, create_campus_tensor_field
 
@@ -37,13 +40,16 @@ __all__ = [
     # Road generation
     "trace_streamline_rk45",
     "trace_bidirectional_streamline",
+    "trace_streamlines_batched",
     "resample_path",
     "smooth_path",
     "StreamlineConfig",
+    "StreamlineOccupancy",
     "StreamlineResult",
     "StopReason",
     "RoadAgent",
     "RoadAgentSystem",
+    "RoadPointIndex",
     "AgentConfig",
     "AgentState",
     "create_agents_from_buildings",
@@ -9,6 +9,7 @@ Key Features:
 - Tensor field guidance (soft constraint)
 - Planning rules (hard constraints): spacing, intersection detection
 - Priority queue for agent management
+- Uniform-grid spatial hash for O(1) average spacing queries
 
 References:
 - Parish & Müller (2001): L-system-inspired road generation
@@ -19,7 +20,7 @@ import heapq
 from dataclasses import dataclass
 from dataclasses import field as dataclass_field
 from enum import Enum
-from typing import List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -95,6 +96,62 @@ class RoadAgent:
         return self.priority > other.priority
 
 
+class RoadPointIndex:
+    """
+    Uniform-grid spatial hash of road points and their owning agents.
+
+    With the cell size equal to the query radius, a radius query only needs
+    the 3x3 block of cells around the query point, so spacing checks cost
+    O(points per cell) instead of O(all points).
+    """
+
+    def __init__(self, cell_size: float):
+        """
+        Args:
+            cell_size: Grid cell size in meters (use the query radius)
+        """
+        self.cell_size = max(float(cell_size), 1e-6)
+        self.cells: Dict[Tuple[int, int], List[Tuple[float, float, Optional[str]]]] = {}
+        self.n_points = 0
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return (int(np.floor(x / self.cell_size)), int(np.floor(y / self.cell_size)))
+
+    def insert(self, point: np.ndarray, owner: Optional[str] = None) -> None:
+        """Add a point owned by ``owner`` (agent id, None = unowned)."""
+        x, y = float(point[0]), float(point[1])
+        self.cells.setdefault(self._cell(x, y), []).append((x, y, owner))
+        self.n_points += 1
+
+    def any_within(
+        self, point: np.ndarray, radius: float, exclude_owner: Optional[str] = None
+    ) -> bool:
+        """
+        Check whether any point not owned by ``exclude_owner`` lies closer than ``radius``.
+
+        Args:
+            point: [x, y] query position
+            radius: Query radius (meters, at most the cell size)
+            exclude_owner: Agent id whose own points are ignored
+
+        Returns:
+            True if a foreign point is strictly closer than radius
+        """
+        x, y = float(point[0]), float(point[1])
+        cx, cy = self._cell(x, y)
+        r2 = radius * radius
+
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for px, py, owner in self.cells.get((cx + dx, cy + dy), ()):
+                    if exclude_owner is not None and owner == exclude_owner:
+                        continue
+                    if (px - x) ** 2 + (py - y) ** 2 < r2:
+                        return True
+
+        return False
+
+
 class RoadAgentSystem:
     """
     Manager for multiple road agents.
@@ -119,12 +176,31 @@ class RoadAgentSystem:
         # Completed roads (list of paths)
         self.completed_roads: List[np.ndarray] = []
 
-        # All generated points (for spatial queries)
-        self.all_points: List[np.ndarray] = []
+        # All generated points, hashed by owning agent for spacing queries
+        self._points: List[np.ndarray] = []
+        self._point_index = RoadPointIndex(cell_size=self.config.min_road_spacing)
 
         # Agent ID counter
         self.next_agent_id = 0
 
+    @property
+    def all_points(self) -> List[np.ndarray]:
+        """All generated road points (for spatial queries)."""
+        return self._points
+
+    @all_points.setter
+    def all_points(self, points: List[np.ndarray]) -> None:
+        """Replace the point set (points without an owning agent)."""
+        self._points = []
+        self._point_index = RoadPointIndex(cell_size=self.config.min_road_spacing)
+        for point in points:
+            self._add_point(np.asarray(point, dtype=float))
+
+    def _add_point(self, point: np.ndarray, owner: Optional[str] = None) -> None:
+        """Store a road point and index it under its owning agent."""
+        self._points.append(point)
+        self._point_index.insert(point, owner)
+
     def create_agent(
         self,
         position: np.ndarray,
@@ -226,7 +302,7 @@ class RoadAgentSystem:
 
         # Check minimum road spacing (exclude agent's own path)
         # Only check against other agents' paths, not the current agent's path
-        if self._violates_spacing(new_position, exclude_path=agent.path):
+        if self._violates_spacing(new_position, exclude_agent_id=agent.agent_id):
             agent.state = AgentState.TERMINATED
             return False
 
@@ -237,47 +313,29 @@ class RoadAgentSystem:
         agent.n_steps += 1
 
         # Store point
-        self.all_points.append(new_position.copy())
+        self._add_point(new_position.copy(), owner=agent.agent_id)
 
         return True
 
     def _violates_spacing(
-        self, position: np.ndarray, exclude_path: Optional[List[np.ndarray]] = None
+        self, position: np.ndarray, exclude_agent_id: Optional[str] = None
     ) -> bool:
         """
         Check if position is too close to existing roads.
 
         Args:
             position: [x, y] position to check
-            exclude_path: Optional path to exclude from spacing check (agent's own path)
+            exclude_agent_id: Optional agent whose own path is excluded from the check
 
         Returns:
             True if violates minimum spacing
         """
-        if len(self.all_points) == 0:
+        if self._point_index.n_points == 0 or self.config.min_road_spacing <= 0:
             return False
 
-        # Compute distances to all existing points
-        points_array = np.array(self.all_points)
-
-        # Exclude points from the agent's own path if provided
-        if exclude_path is not None and len(exclude_path) > 0:
-            exclude_array = np.array(exclude_path)
-            # Remove points that are in the exclude_path
-            # Use a small tolerance for comparison
-            distances_to_exclude = np.linalg.norm(
-                points_array[:, None, :] - exclude_array[None, :, :], axis=2
-            )
-            mask = np.all(distances_to_exclude > 1e-6, axis=1)  # Points not in exclude_path
-            points_array = points_array[mask]
-
-            if len(points_array) == 0:
-                return False
-
-        distances = np.linalg.norm(points_array - position, axis=1)
-        min_distance = np.min(distances)
-
-        return min_distance < self.config.min_road_spacing
+        return self._point_index.any_within(
+            position, self.config.min_road_spacing, exclude_owner=exclude_agent_id
+        )
 
     def run_simulation(
         self,
@@ -21,6 +21,7 @@ from src.spatial.streamline_tracer import (
     StreamlineConfig,
     trace_bidirectional_streamline,
     trace_streamline_rk45,
+    trace_streamlines_batched,
 )
 from src.spatial.tensor_field import TensorField, create_campus_tensor_field
 
@@ -36,6 +37,7 @@ class RoadNetworkConfig:
     n_major_roads: int = 4
     major_road_max_length: float = 500.0
     use_bidirectional: bool = True
+    batched_tracing: bool = False  # Trace all seeds together (fixed-step RK4)
 
     # Minor roads (agents)
     n_agents_per_building: int = 2
@@ -144,22 +146,26 @@ class RoadNetworkGenerator:
         # Streamline config
         streamline_config = StreamlineConfig(max_length=self.config.major_road_max_length)
 
-        for seed in seeds:
-            if self.config.use_bidirectional:
-                result = trace_bidirectional_streamline(
-                    self.tensor_field,
-                    seed,
-                    streamline_config,
-                    field_type="major",
-                )
-            else:
-                result = trace_streamline_rk45(
-                    self.tensor_field,
-                    seed,
-                    streamline_config,
-                    field_type="major",
-                )
-
+        if self.config.batched_tracing:
+            results = trace_streamlines_batched(
+                self.tensor_field,
+                np.asarray(seeds, dtype=float).reshape(-1, 2),
+                streamline_config,
+                field_type="major",
+                bidirectional=self.config.use_bidirectional,
+            )
+        else:
+            trace = (
+                trace_bidirectional_streamline
+                if self.config.use_bidirectional
+                else trace_streamline_rk45
+            )
+            results = [
+                trace(self.tensor_field, seed, streamline_config, field_type="major")
+                for seed in seeds
+            ]
+
+        for result in results:
             if result.success and len(result.path) > 5:
                 roads.append(result.path)
 
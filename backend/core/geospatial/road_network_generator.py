@@ -26,8 +26,11 @@ import numpy as np
 
 from .streamline_tracer import (
     StreamlineConfig,
+    StreamlineOccupancy,
+    StreamlineResult,
     trace_bidirectional_streamline,
     trace_streamline_rk45,
+    trace_streamlines_batched,
 )
 from .tensor_field import TensorField, create_campus_tensor_field
 
@@ -52,6 +55,15 @@ class RoadNetworkConfig:
     resample_spacing: float = 10.0  # Resample roads to uniform spacing (meters)
     min_road_length: float = 20.0  # Filter out very short roads (meters)
 
+    # Tracing
+    batched_tracing: bool = False  # Trace all seeds together (fixed-step RK4)
+
+    # Evenly spaced placement (Jobard & Lefer d_sep / d_test)
+    even_spacing: bool = False  # Occupancy-grid seeding and early termination
+    separation_distance: float = 40.0  # d_sep: min seed distance to placed roads (meters)
+    test_ratio: float = 0.5  # d_test / d_sep: traces stop this close to placed roads
+    placement_batch_size: int = 256  # Seeds traced per wave between occupancy updates
+
 
 class RoadNetworkGenerator:
     """
@@ -80,6 +92,7 @@ class RoadNetworkGenerator:
 
         # Will be set during generation
         self.tensor_field: Optional[TensorField] = None
+        self.occupancy: Optional[StreamlineOccupancy] = None
         self.major_roads: List[np.ndarray] = []
         self.minor_roads: List[np.ndarray] = []
 
@@ -115,6 +128,15 @@ class RoadNetworkGenerator:
 
         print("🏗️  Building tensor field...")
         self.tensor_field = self._build_tensor_field(buildings)
+        self.occupancy = (
+            StreamlineOccupancy(
+                self.bounds,
+                separation=self.config.separation_distance,
+                test_ratio=self.config.test_ratio,
+            )
+            if self.config.even_spacing
+            else None
+        )
 
         print("🛣️  Tracing major roads...")
         self.major_roads = self._generate_major_roads()
@@ -149,65 +171,116 @@ class RoadNetworkGenerator:
         if self.tensor_field is None:
             raise ValueError("Tensor field not built yet")
 
-        roads = []
-
         # Create seed points (strategic locations across campus)
         seeds = self._get_major_road_seeds()
 
         # Streamline config
         streamline_config = StreamlineConfig(max_length=self.config.major_road_max_length)
 
-        for seed in seeds:
-            if self.config.use_bidirectional:
-                result = trace_bidirectional_streamline(
-                    self.tensor_field,
-                    seed,
-                    config=streamline_config,
-                    field_type="major",
-                )
-            else:
-                result = trace_streamline_rk45(
-                    self.tensor_field,
-                    seed,
-                    config=streamline_config,
-                    field_type="major",
-                )
-
-            if result.success and len(result.path) > 1:
-                roads.append(result.path)
-
-        return roads
+        return self._trace_roads(
+            seeds, streamline_config, "major", bidirectional=self.config.use_bidirectional
+        )
 
     def _generate_minor_roads(self, buildings: List) -> List[np.ndarray]:
         """Generate minor roads connecting buildings."""
         if self.tensor_field is None:
             raise ValueError("Tensor field not built yet")
 
-        roads = []
-
         # For each building, generate connecting roads using minor eigenvector field
         streamline_config = StreamlineConfig(max_length=self.config.minor_road_max_length)
 
+        # Create seed points around every building perimeter
+        seeds = []
         for building in buildings:
             if not hasattr(building, "position") or building.position is None:
                 continue
+            seeds.extend(self._get_building_connection_seeds(building))
 
-            # Create seed points around building perimeter
-            seeds = self._get_building_connection_seeds(building)
+        # Use minor field for cross streets
+        return self._trace_roads(
+            seeds, streamline_config, "minor", min_length=self.config.min_road_length
+        )
 
-            for seed in seeds:
-                result = trace_streamline_rk45(
-                    self.tensor_field,
-                    seed,
-                    config=streamline_config,
-                    field_type="minor",  # Use minor field for cross streets
-                )
+    def _trace_roads(
+        self,
+        seeds: List[np.ndarray],
+        streamline_config: StreamlineConfig,
+        field_type: str,
+        bidirectional: bool = False,
+        min_length: Optional[float] = None,
+    ) -> List[np.ndarray]:
+        """
+        Trace seeds and keep the successful roads longer than min_length.
 
-                if result.success and result.total_length > self.config.min_road_length:
-                    roads.append(result.path)
+        With even_spacing, seeds are traced in waves of placement_batch_size:
+        seeds within d_sep of placed roads are dropped before tracing, traces
+        stop within d_test of placed roads, and each accepted road is stamped
+        into the occupancy grid before the next one is considered.
+        """
+        roads = []
+        wave_size = len(seeds) if self.occupancy is None else self.config.placement_batch_size
+
+        for start in range(0, len(seeds), max(1, wave_size)):
+            wave = seeds[start : start + wave_size]
+            if self.occupancy is not None:
+                free = self.occupancy.can_seed(np.asarray(wave, dtype=float).reshape(-1, 2))
+                wave = [seed for seed, ok in zip(wave, free) if ok]
+
+            results = self._trace(wave, streamline_config, field_type, bidirectional)
+            for seed, result in zip(wave, results):
+                if not result.success:
+                    continue
+
+                path = result.path
+                if self.occupancy is not None:
+                    # Earlier roads of this wave may have claimed the seed
+                    if not self.occupancy.can_seed(seed)[0]:
+                        continue
+                    seed_index = int(np.argmin(np.linalg.norm(path - seed, axis=1)))
+                    path = self.occupancy.clip_path(path, seed_index)
+
+                if len(path) < 2:
+                    continue
+                if min_length is not None:
+                    length = float(np.sum(np.linalg.norm(np.diff(path, axis=0), axis=1)))
+                    if length <= min_length:
+                        continue
+
+                roads.append(path)
+                if self.occupancy is not None:
+                    self.occupancy.add_path(path)
 
         return roads
 
+    def _trace(
+        self,
+        seeds: List[np.ndarray],
+        streamline_config: StreamlineConfig,
+        field_type: str,
+        bidirectional: bool = False,
+    ) -> List[StreamlineResult]:
+        """
+        Trace streamlines from all seeds, batched or one RK45 trace per seed.
+
+        Returns:
+            List of StreamlineResult in seed order
+        """
+        if self.config.batched_tracing:
+            return trace_streamlines_batched(
+                self.tensor_field,
+                np.asarray(seeds, dtype=float).reshape(-1, 2),
+                config=streamline_config,
+                field_type=field_type,
+                bidirectional=bidirectional,
+                occupancy=self.occupancy,
+            )
+
+        trace = trace_bidirectional_streamline if bidirectional else trace_streamline_rk45
+        return [
+            trace(self.tensor_field, seed, config=streamline_config, field_type=field_type)
+            for seed in seeds
+        ]
+
     def _get_major_road_seeds(self) -> List[np.ndarray]:
         """
         Generate seed points for major roads.
@@ -371,6 +444,7 @@ class RoadNetworkGenerator:
                 "tensor_resolution": self.config.tensor_resolution,
                 "n_major_roads_target": self.config.n_major_roads,
                 "use_bidirectional": self.config.use_bidirectional,
+                "even_spacing": self.config.even_spacing,
             },
         }
 
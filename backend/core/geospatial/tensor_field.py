@@ -9,6 +9,7 @@ Key Capabilities:
 2. Blend fields smoothly using addition
 3. Compute eigenvector fields for streamline tracing
 4. Interpolate tensors at arbitrary points (not just grid)
+5. Optional precomputed major/minor direction grids for fast lookups
 
 Usage:
     >>> field = TensorField(bounds=(0, 0, 1000, 1000), resolution=100)
@@ -17,11 +18,12 @@ Usage:
     >>> major_vecs = field.get_eigenvectors(points, field_type='major')
 """
 
+import math
 from dataclasses import dataclass
 from typing import List, Literal, Optional, Tuple
 
 import numpy as np
-from scipy.interpolate import RegularGridInterpolator
+from scipy.interpolate import RectBivariateSpline
 
 from .basis_fields import GridField, RadialField
 
@@ -35,6 +37,144 @@ class TensorFieldConfig:
     min_eigenvalue: float = 1e-6  # Numerical stability threshold
 
 
+def _eigenvectors_2x2_scalar(
+    a: float, b: float, c: float
+) -> Tuple[Tuple[float, float], Tuple[float, float]]:
+    """Scalar version of symmetric_eigenvectors_2x2 (single-point queries)."""
+    if abs(b) <= math.sqrt(abs(a)) * math.sqrt(abs(c)) * (np.finfo(float).eps * 0.5):
+        # Already diagonal
+        return ((1.0, 0.0), (0.0, 1.0)) if a > c else ((0.0, 1.0), (1.0, 0.0))
+
+    sm = a + c
+    df = a - c
+    adf = abs(df)
+    tb = 2.0 * b
+    ab = abs(tb)
+    acmx, acmn = (a, c) if abs(a) > abs(c) else (c, a)
+
+    if adf > ab:
+        rt = adf * math.sqrt(1.0 + (ab / adf) ** 2)
+    elif adf < ab:
+        rt = ab * math.sqrt(1.0 + (adf / ab) ** 2)
+    else:
+        rt = ab * math.sqrt(2.0)
+
+    if sm < 0:
+        rt1 = 0.5 * (sm - rt)
+        rt2 = (acmx / rt1) * acmn - (b / rt1) * b
+        sgn1 = -1
+    elif sm > 0:
+        rt1 = 0.5 * (sm + rt)
+        rt2 = (acmx / rt1) * acmn - (b / rt1) * b
+        sgn1 = 1
+    else:
+        rt1 = 0.5 * rt
+        rt2 = -0.5 * rt
+        sgn1 = 1
+
+    if df >= 0:
+        cs = df + rt
+        sgn2 = 1
+    else:
+        cs = df - rt
+        sgn2 = -1
+
+    if abs(cs) > ab:
+        ct = -tb / cs
+        sn1 = 1.0 / math.sqrt(1.0 + ct * ct)
+        cs1 = ct * sn1
+    else:
+        tn = -cs / tb
+        cs1 = 1.0 / math.sqrt(1.0 + tn * tn)
+        sn1 = tn * cs1
+
+    if sgn1 == sgn2:
+        cs1, sn1 = -sn1, cs1
+
+    v1 = (cs1, sn1)
+    v2 = (-sn1, cs1)
+    return (v1, v2) if rt1 > rt2 else (v2, v1)
+
+
+def symmetric_eigenvectors_2x2(
+    t_xx: np.ndarray,
+    t_xy: np.ndarray,
+    t_yy: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Closed-form eigenvectors of symmetric 2x2 tensors (vectorized).
+
+    Follows LAPACK's 2x2 symmetric eigen-decomposition (dlaev2 rotation,
+    ascending eigenvalue order), so results - including the sign of each
+    vector - match ``np.linalg.eigh`` exactly without a per-point call.
+
+    Args:
+        t_xx: T[0,0] components (any shape)
+        t_xy: T[0,1] = T[1,0] components
+        t_yy: T[1,1] components
+
+    Returns:
+        (major, minor): unit eigenvectors of the larger and smaller
+        eigenvalue, each with shape (..., 2)
+    """
+    a, b, c = np.broadcast_arrays(
+        np.asarray(t_xx, dtype=float), np.asarray(t_xy, dtype=float), np.asarray(t_yy, dtype=float)
+    )
+
+    sm = a + c
+    df = a - c
+    adf = np.abs(df)
+    tb = 2.0 * b
+    ab = np.abs(tb)
+    a_dominant = np.abs(a) > np.abs(c)
+    acmx = np.where(a_dominant, a, c)
+    acmn = np.where(a_dominant, c, a)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # rt = sqrt(df² + tb²) without overflow
+        rt_df = adf * np.sqrt(1.0 + (ab / np.where(adf > 0, adf, 1.0)) ** 2)
+        rt_tb = ab * np.sqrt(1.0 + (adf / np.where(ab > 0, ab, 1.0)) ** 2)
+        rt = np.where(adf > ab, rt_df, np.where(adf < ab, rt_tb, ab * np.sqrt(2.0)))
+
+        # Eigenvalues: rt1 has the larger absolute value
+        rt1 = np.where(sm < 0, 0.5 * (sm - rt), np.where(sm > 0, 0.5 * (sm + rt), 0.5 * rt))
+        safe_rt1 = np.where(rt1 != 0, rt1, 1.0)
+        rt2 = np.where(sm != 0, (acmx / safe_rt1) * acmn - (b / safe_rt1) * b, -0.5 * rt)
+        sgn1 = np.where(sm < 0, -1, 1)
+
+        # Eigenvector (cs1, sn1) of rt1
+        sgn2 = np.where(df >= 0, 1, -1)
+        cs = np.where(df >= 0, df + rt, df - rt)
+        ct = -tb / np.where(cs != 0, cs, 1.0)
+        sn_ct = 1.0 / np.sqrt(1.0 + ct * ct)
+        tn = -cs / np.where(tb != 0, tb, 1.0)
+        cs_tn = 1.0 / np.sqrt(1.0 + tn * tn)
+
+        use_ct = np.abs(cs) > ab
+        cs1 = np.where(use_ct, ct * sn_ct, np.where(ab == 0, 1.0, cs_tn))
+        sn1 = np.where(use_ct, sn_ct, np.where(ab == 0, 0.0, tn * cs_tn))
+
+    swap = sgn1 == sgn2
+    cs1, sn1 = np.where(swap, -sn1, cs1), np.where(swap, cs1, sn1)
+
+    # Negligible off-diagonal: tensor is already diagonal
+    eps = np.finfo(float).eps * 0.5
+    diagonal = np.abs(b) <= np.sqrt(np.abs(a)) * np.sqrt(np.abs(c)) * eps
+    cs1 = np.where(diagonal, 1.0, cs1)
+    sn1 = np.where(diagonal, 0.0, sn1)
+    rt1 = np.where(diagonal, a, rt1)
+    rt2 = np.where(diagonal, c, rt2)
+
+    # Rotation columns: (cs1, sn1) for rt1, (-sn1, cs1) for rt2
+    v1 = np.stack([cs1, sn1], axis=-1)
+    v2 = np.stack([-sn1, cs1], axis=-1)
+    rt1_is_major = (rt1 > rt2)[..., None]
+
+    major = np.where(rt1_is_major, v1, v2)
+    minor = np.where(rt1_is_major, v2, v1)
+    return major, minor
+
+
 class TensorField:
     """
     Continuous 2D tensor field for semantic road network generation.
@@ -52,6 +192,8 @@ class TensorField:
          [T_xy[i,j], T_yy[i,j]]]
 
     For querying at non-grid points, we use cubic interpolation.
+    With enable_direction_grids(), eigenvectors are instead precomputed
+    on a grid once and looked up with bilinear interpolation.
     """
 
     def __init__(
@@ -90,6 +232,11 @@ class TensorField:
         # Interpolators (lazy initialization)
         self._interpolators: Optional[Tuple] = None
 
+        # Precomputed direction grids (opt-in, lazy initialization)
+        self.use_direction_grids = False
+        self.direction_grid_resolution: Optional[int] = None
+        self._direction_grids: Optional[dict] = None
+
     def add_grid_field(
         self,
         angle_degrees: float,
@@ -119,6 +266,7 @@ class TensorField:
 
         # Invalidate interpolators (need recompute)
         self._interpolators = None
+        self._direction_grids = None
 
     def add_radial_field(
         self,
@@ -151,42 +299,57 @@ class TensorField:
 
         # Invalidate interpolators
         self._interpolators = None
+        self._direction_grids = None
 
     def _build_interpolators(self) -> Tuple:
         """
         Build cubic interpolators for tensor components.
 
         Allows querying tensors at arbitrary (non-grid) points.
-        Uses scipy's RegularGridInterpolator with cubic method.
+        Uses scipy's RectBivariateSpline (interpolating bicubic spline),
+        which fits the spline coefficients once instead of on every query.
 
         Returns:
             (interp_xx, interp_xy, interp_yy): Interpolator functions
         """
-        interp_xx = RegularGridInterpolator(
-            (self.grid_x, self.grid_y),
-            self.T_xx.T,  # Transpose for correct axis order
-            method="cubic",
-            bounds_error=False,
-            fill_value=0.0,
-        )
+        kx = min(3, len(self.grid_x) - 1)
+        ky = min(3, len(self.grid_y) - 1)
 
-        interp_xy = RegularGridInterpolator(
-            (self.grid_x, self.grid_y),
-            self.T_xy.T,
-            method="cubic",
-            bounds_error=False,
-            fill_value=0.0,
+        # Transpose for axis order
+        return tuple(
+            RectBivariateSpline(self.grid_x, self.grid_y, component.T, kx=kx, ky=ky)
+            for component in (self.T_xx, self.T_xy, self.T_yy)
         )
 
-        interp_yy = RegularGridInterpolator(
-            (self.grid_x, self.grid_y),
-            self.T_yy.T,
-            method="cubic",
-            bounds_error=False,
-            fill_value=0.0,
+    def _inside_mask(self, points: np.ndarray) -> np.ndarray:
+        """Boolean mask of points inside the field bounds."""
+        xmin, ymin, xmax, ymax = self.config.bounds
+        return (
+            (points[:, 0] >= xmin)
+            & (points[:, 0] <= xmax)
+            & (points[:, 1] >= ymin)
+            & (points[:, 1] <= ymax)
         )
 
-        return (interp_xx, interp_xy, interp_yy)
+    def _interpolate_components(
+        self, points: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Interpolate (T_xx, T_xy, T_yy) at points; zero outside bounds."""
+        # Lazy build interpolators
+        if self._interpolators is None:
+            self._interpolators = self._build_interpolators()
+
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        inside = self._inside_mask(points)
+        components = []
+
+        for interp in self._interpolators:
+            values = np.zeros(len(points))
+            if np.any(inside):
+                values[inside] = interp.ev(points[inside, 0], points[inside, 1])
+            components.append(values)
+
+        return tuple(components)
 
     def get_tensor_at_points(self, points: np.ndarray) -> np.ndarray:
         """
@@ -198,19 +361,10 @@ class TensorField:
         Returns:
             tensors: (N, 2, 2) array of symmetric 2x2 tensors
         """
-        # Lazy build interpolators
-        if self._interpolators is None:
-            self._interpolators = self._build_interpolators()
-
-        interp_xx, interp_xy, interp_yy = self._interpolators
-
-        # Interpolate each component
-        T_xx_vals = interp_xx(points)
-        T_xy_vals = interp_xy(points)
-        T_yy_vals = interp_yy(points)
+        T_xx_vals, T_xy_vals, T_yy_vals = self._interpolate_components(points)
 
         # Reconstruct tensors
-        n_points = points.shape[0]
+        n_points = len(T_xx_vals)
         tensors = np.zeros((n_points, 2, 2))
 
         tensors[:, 0, 0] = T_xx_vals
@@ -220,6 +374,129 @@ class TensorField:
 
         return tensors
 
+    def enable_direction_grids(self, resolution: Optional[int] = None) -> None:
+        """
+        Precompute major/minor direction grids for fast eigenvector lookups.
+
+        After this call, get_eigenvectors() interpolates precomputed unit
+        vectors bilinearly instead of interpolating the tensor and solving
+        the eigenproblem per query. Grids are rebuilt lazily when basis
+        fields are added.
+
+        Args:
+            resolution: Direction grid points per dimension (default: the
+                tensor field resolution). A finer grid samples the cubic
+                tensor interpolation between tensor grid nodes.
+        """
+        self.use_direction_grids = True
+        self.direction_grid_resolution = resolution
+        self._direction_grids = None
+
+    def _build_direction_grids(self) -> dict:
+        """Eigenvector grids sampled from the (cubic) tensor field."""
+        resolution = self.direction_grid_resolution or self.config.resolution
+        xmin, ymin, xmax, ymax = self.config.bounds
+        gx = np.linspace(xmin, xmax, resolution)
+        gy = np.linspace(ymin, ymax, resolution)
+
+        if resolution == self.config.resolution:
+            # Tensor grid nodes: exact values, no interpolation needed
+            t_xx, t_xy, t_yy = self.T_xx, self.T_xy, self.T_yy
+        else:
+            X, Y = np.meshgrid(gx, gy)
+            points = np.column_stack([X.ravel(), Y.ravel()])
+            t_xx, t_xy, t_yy = (c.reshape(X.shape) for c in self._interpolate_components(points))
+
+        major, minor = symmetric_eigenvectors_2x2(t_xx, t_xy, t_yy)  # (ny, nx, 2)
+        return {"x": gx, "y": gy, "major": major, "minor": minor}
+
+    def _lookup_direction_grid(self, points: np.ndarray, field_type: str) -> np.ndarray:
+        """
+        Bilinear lookup in a precomputed direction grid.
+
+        Eigenvectors are only defined up to sign, so the four corner vectors
+        are first flipped to agree with the lower-left corner; otherwise
+        opposite-signed neighbours would cancel out in the blend.
+        """
+        if self._direction_grids is None:
+            self._direction_grids = self._build_direction_grids()
+
+        grids = self._direction_grids
+        gx, gy, V = grids["x"], grids["y"], grids[field_type]
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+
+        if len(points) == 1:
+            return np.array([self._lookup_direction_point(points[0], gx, gy, V, field_type)])
+
+        # Cell indices and fractional offsets
+        fx = np.clip((points[:, 0] - gx[0]) / (gx[1] - gx[0]), 0, len(gx) - 1)
+        fy = np.clip((points[:, 1] - gy[0]) / (gy[1] - gy[0]), 0, len(gy) - 1)
+        ix = np.minimum(fx.astype(int), len(gx) - 2)
+        iy = np.minimum(fy.astype(int), len(gy) - 2)
+        tx = (fx - ix)[:, None]
+        ty = (fy - iy)[:, None]
+
+        v00 = V[iy, ix]
+        corners = [V[iy, ix + 1], V[iy + 1, ix], V[iy + 1, ix + 1]]
+        v10, v01, v11 = (
+            np.where(np.sum(v * v00, axis=1, keepdims=True) < 0, -v, v) for v in corners
+        )
+
+        vectors = (
+            (1 - tx) * (1 - ty) * v00 + tx * (1 - ty) * v10 + (1 - tx) * ty * v01 + tx * ty * v11
+        )
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = np.where(norms > 1e-10, vectors / np.where(norms > 1e-10, norms, 1.0), v00)
+
+        # Outside the field the tensor is zero (same as the exact path)
+        outside = ~self._inside_mask(points)
+        if np.any(outside):
+            zero_major, zero_minor = symmetric_eigenvectors_2x2(0.0, 0.0, 0.0)
+            vectors[outside] = zero_major if field_type == "major" else zero_minor
+
+        return vectors
+
+    def _lookup_direction_point(
+        self,
+        point: np.ndarray,
+        gx: np.ndarray,
+        gy: np.ndarray,
+        V: np.ndarray,
+        field_type: str,
+    ) -> Tuple[float, float]:
+        """Scalar version of _lookup_direction_grid for a single point."""
+        x, y = float(point[0]), float(point[1])
+        xmin, ymin, xmax, ymax = self.config.bounds
+        if not (xmin <= x <= xmax and ymin <= y <= ymax):
+            zero_major, zero_minor = _eigenvectors_2x2_scalar(0.0, 0.0, 0.0)
+            return zero_major if field_type == "major" else zero_minor
+
+        fx = min(max((x - gx[0]) / (gx[1] - gx[0]), 0.0), len(gx) - 1)
+        fy = min(max((y - gy[0]) / (gy[1] - gy[0]), 0.0), len(gy) - 1)
+        ix = min(int(fx), len(gx) - 2)
+        iy = min(int(fy), len(gy) - 2)
+        tx = fx - ix
+        ty = fy - iy
+
+        x00, y00 = V[iy, ix]
+        vx, vy = 0.0, 0.0
+        for (jy, jx), w in (
+            ((iy, ix), (1 - tx) * (1 - ty)),
+            ((iy, ix + 1), tx * (1 - ty)),
+            ((iy + 1, ix), (1 - tx) * ty),
+            ((iy + 1, ix + 1), tx * ty),
+        ):
+            cx, cy = V[jy, jx]
+            if cx * x00 + cy * y00 < 0:
+                w = -w
+            vx += w * cx
+            vy += w * cy
+
+        norm = math.hypot(vx, vy)
+        if norm <= 1e-10:
+            return (float(x00), float(y00))
+        return (vx / norm, vy / norm)
+
     def get_eigenvectors(
         self,
         points: np.ndarray,
@@ -242,35 +519,29 @@ class TensorField:
             - Major eigenvector: direction of maximum anisotropy (main roads)
             - Minor eigenvector: perpendicular direction (cross streets)
             - For a radial field, major points outward, minor is tangential
+            - Solved in closed form for all points at once; with
+              enable_direction_grids() a bilinear grid lookup is used instead
         """
-        tensors = self.get_tensor_at_points(points)
+        if self.use_direction_grids:
+            return self._lookup_direction_grid(points, field_type)
 
-        n_points = points.shape[0]
-        vectors = np.zeros((n_points, 2))
+        t_xx, t_xy, t_yy = self._interpolate_components(points)
 
-        for i in range(n_points):
-            T = tensors[i]
-
-            # Compute eigenvalues and eigenvectors
-            # np.linalg.eigh returns sorted eigenvalues (smallest first)
-            eigenvalues, eigenvectors = np.linalg.eigh(T)
-
-            # Add small epsilon to avoid zero eigenvalues
-            eigenvalues = np.maximum(eigenvalues, self.config.min_eigenvalue)
-
-            if field_type == "major":
-                # Largest eigenvalue (index 1)
-                vectors[i] = eigenvectors[:, 1]
-            else:
-                # Smallest eigenvalue (index 0)
-                vectors[i] = eigenvectors[:, 0]
-
-            # Ensure unit length
-            norm = np.linalg.norm(vectors[i])
+        if len(t_xx) == 1:
+            # Single-point queries (streamline/agent steps): skip array overhead
+            major, minor = _eigenvectors_2x2_scalar(float(t_xx[0]), float(t_xy[0]), float(t_yy[0]))
+            vector = major if field_type == "major" else minor
+            norm = math.hypot(vector[0], vector[1])
             if norm > 1e-10:
-                vectors[i] /= norm
+                vector = (vector[0] / norm, vector[1] / norm)
+            return np.array([vector])
 
-        return vectors
+        major, minor = symmetric_eigenvectors_2x2(t_xx, t_xy, t_yy)
+        vectors = major if field_type == "major" else minor
+
+        # Ensure unit length
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return np.where(norms > 1e-10, vectors / np.where(norms > 1e-10, norms, 1.0), vectors)
 
     def in_bounds(self, point: np.ndarray) -> bool:
         """
@@ -22,14 +22,25 @@ Algorithm:
     Step 2: For each demand point, sum accessibility ratios from all reachable
             services
 
+Both steps run on sparse catchment pairs (KD-tree radius query) as sparse
+matrix-vector products, see src/algorithms/catchment.py.
+
 Created: 2026-01-01
 """
 
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
+from src.algorithms.catchment import (
+    CatchmentPairs,
+    build_catchment_pairs,
+    decay_weights,
+    sparse_two_step_fca,
+)
+from src.algorithms.network_distance import RoadNetworkDistances
+
 
 @dataclass
 class ServicePoint:
@@ -84,6 +95,7 @@ class TwoStepFCA:
         catchment_radius: float = 400.0,
         distance_decay_function: str = "gaussian",
         decay_beta: float = 1.0,
+        network: Optional[RoadNetworkDistances] = None,
     ):
         """
         Initialize 2SFCA calculator.
@@ -92,10 +104,13 @@ class TwoStepFCA:
             catchment_radius: Maximum distance to consider (meters, default: 400m = 5min walk)
             distance_decay_function: 'gaussian' or 'linear' or 'step'
             decay_beta: Decay rate for gaussian function (default: 1.0)
+            network: Road-network distances; when given, the catchment and decay
+                use shortest walking paths on the roads instead of straight lines
         """
         self.catchment_radius = catchment_radius
         self.distance_decay_function = distance_decay_function
         self.decay_beta = decay_beta
+        self.network = network
 
     def calculate(
         self,
@@ -120,18 +135,71 @@ class TwoStepFCA:
             >>> scores = fca.calculate(services, demands)
             >>> scores['DORM']  # ~0.5 (capacity/population ratio)
         """
+        # Catchment pairs are found once and shared by both steps
+        pairs = self._catchment_pairs(services, demands)
+
         # Step 1: Calculate service-to-population ratios (R_j)
-        service_ratios = self._step1_service_ratios(services, demands)
+        service_ratios = self._step1_service_ratios(services, demands, pairs)
 
         # Step 2: Calculate accessibility for each demand point (A_i)
-        accessibility_scores = self._step2_accessibility(services, demands, service_ratios)
+        accessibility_scores = self._step2_accessibility(services, demands, service_ratios, pairs)
 
         return accessibility_scores
 
+    def calculate_arrays(
+        self,
+        service_positions: np.ndarray,
+        service_capacity: np.ndarray,
+        demand_positions: np.ndarray,
+        demand_population: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Array interface for large demand grids (no per-point objects).
+
+        Args:
+            service_positions: Service locations (M, 2)
+            service_capacity: Service capacities (M,)
+            demand_positions: Demand locations (N, 2), e.g. a fine grid
+            demand_population: Population at each demand location (N,)
+
+        Returns:
+            Tuple of (service_ratios (M,), accessibility_scores (N,))
+        """
+        pairs = self._pairs_within_catchment(demand_positions, service_positions)
+        return sparse_two_step_fca(
+            pairs, self._distance_weights(pairs.distance), demand_population, service_capacity
+        )
+
+    def _catchment_pairs(
+        self,
+        services: List[ServicePoint],
+        demands: List[DemandPoint],
+    ) -> CatchmentPairs:
+        """Demand/service pairs within the catchment radius."""
+        return self._pairs_within_catchment(
+            [d.position for d in demands],
+            [s.position for s in services],
+        )
+
+    def _pairs_within_catchment(
+        self,
+        demand_positions: np.ndarray,
+        service_positions: np.ndarray,
+    ) -> CatchmentPairs:
+        """Catchment pairs on network distance if a road network is set."""
+        if self.network is not None:
+            return self.network.catchment_pairs(
+                demand_positions, service_positions, catchment_distance=self.catchment_radius
+            )
+        return build_catchment_pairs(
+            demand_positions, service_positions, catchment_distance=self.catchment_radius
+        )
+
     def _step1_service_ratios(
         self,
         services: List[ServicePoint],
         demands: List[DemandPoint],
+        pairs: Optional[CatchmentPairs] = None,
     ) -> Dict[str, float]:
         """
         Step 1: For each service j, compute R_j = S_j / sum(P_k * W_kj)
@@ -144,41 +212,24 @@ class TwoStepFCA:
         Returns:
             Dictionary mapping service_id -> ratio
         """
-        ratios = {}
+        if pairs is None:
+            pairs = self._catchment_pairs(services, demands)
 
-        for service in services:
-            sx, sy = service.position
+        ratios, _ = sparse_two_step_fca(
+            pairs,
+            self._distance_weights(pairs.distance),
+            np.array([d.population for d in demands], dtype=float),
+            np.array([s.capacity for s in services], dtype=float),
+        )
 
-            # Sum demand within catchment
-            weighted_demand = 0.0
-
-            for demand in demands:
-                dx, dy = demand.position
-
-                # Calculate distance
-                distance = np.sqrt((dx - sx) ** 2 + (dy - sy) ** 2)
-
-                # Check if within catchment
-                if distance <= self.catchment_radius:
-                    # Apply distance decay weight
-                    weight = self._distance_weight(distance)
-
-                    # Add weighted demand
-                    weighted_demand += demand.population * weight
-
-            # Calculate ratio (avoid division by zero)
-            if weighted_demand > 0:
-                ratios[service.id] = service.capacity / weighted_demand
-            else:
-                ratios[service.id] = 0.0
-
-        return ratios
+        return {service.id: float(r) for service, r in zip(services, ratios)}
 
     def _step2_accessibility(
         self,
         services: List[ServicePoint],
         demands: List[DemandPoint],
         service_ratios: Dict[str, float],
+        pairs: Optional[CatchmentPairs] = None,
     ) -> Dict[str, float]:
         """
         Step 2: For each demand point i, compute A_i = sum(R_j * W_ij)
@@ -190,31 +241,31 @@ class TwoStepFCA:
         Returns:
             Dictionary mapping demand_id -> accessibility score
         """
-        scores = {}
-
-        for demand in demands:
-            dx, dy = demand.position
+        if pairs is None:
+            pairs = self._catchment_pairs(services, demands)
 
-            # Sum accessibility from all reachable services
-            accessibility = 0.0
+        ratios = np.array([service_ratios[s.id] for s in services], dtype=float)
+        W = pairs.weight_matrix(self._distance_weights(pairs.distance))
+        accessibility = W @ ratios
 
-            for service in services:
-                sx, sy = service.position
+        return {demand.id: float(a) for demand, a in zip(demands, accessibility)}
 
-                # Calculate distance
-                distance = np.sqrt((dx - sx) ** 2 + (dy - sy) ** 2)
-
-                # Check if within catchment
-                if distance <= self.catchment_radius:
-                    # Apply distance decay weight
-                    weight = self._distance_weight(distance)
-
-                    # Add weighted service ratio
-                    accessibility += service_ratios[service.id] * weight
-
-            scores[demand.id] = accessibility
+    def _distance_weights(self, distances: np.ndarray) -> np.ndarray:
+        """
+        Vectorized distance decay weights for distances within the catchment.
 
-        return scores
+        Same decay as ``_distance_weight``; the Gaussian exp(-β(d/d0)²) is
+        the bandwidth σ = d0 / sqrt(β) form.
+        """
+        if self.distance_decay_function == "gaussian":
+            return decay_weights(
+                distances, "gaussian", sigma=self.catchment_radius / np.sqrt(self.decay_beta)
+            )
+        if self.distance_decay_function not in ("linear", "step"):
+            raise ValueError(f"Unknown decay function: {self.distance_decay_function}")
+        return decay_weights(
+            distances, self.distance_decay_function, catchment_distance=self.catchment_radius
+        )
 
     def _distance_weight(self, distance: float) -> float:
         """
@@ -253,6 +304,7 @@ def calculate_accessibility_scores(
     service_types: List[str] = None,
     demand_types: List[str] = None,
     catchment_radius: float = 400.0,
+    network: Optional[RoadNetworkDistances] = None,
 ) -> Dict[str, float]:
     """
     High-level function to calculate 2SFCA accessibility for campus buildings.
@@ -264,6 +316,7 @@ def calculate_accessibility_scores(
         service_types: Building types considered as services (default: library, dining, health)
         demand_types: Building types considered as demand (default: residential, academic)
         catchment_radius: Maximum walkable distance (default: 400m)
+        network: Road-network distances (default: Euclidean distance)
 
     Returns:
         Dictionary mapping building_id -> accessibility score
@@ -330,7 +383,7 @@ def calculate_accessibility_scores(
         # No services or no demand - return zero scores
         return {b.id: 0.0 for b in buildings}
 
-    fca = TwoStepFCA(catchment_radius=catchment_radius)
+    fca = TwoStepFCA(catchment_radius=catchment_radius, network=network)
     scores = fca.calculate(services, demands)
 
     # Fill in scores for all buildings (services get 0)
@@ -19,11 +19,20 @@ References:
 Created: 2026-01-01
 """
 
+import hashlib
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import List, Tuple
 
 import numpy as np
 
+from src.algorithms.graph_core import EdgeGraph, merge_points
+from src.algorithms.network_distance import RoadNetworkDistances
+
+# Shortest-path caches per road network (keyed by road geometry)
+_NETWORK_DISTANCE_CACHE: "OrderedDict[str, RoadNetworkDistances]" = OrderedDict()
+_NETWORK_DISTANCE_CACHE_SIZE = 8
+
 
 @dataclass
 class KanskyIndices:
@@ -124,16 +133,14 @@ def calculate_kansky_indices(
     # η = sum(L_i) / e
     # Lower is better (shorter average road length)
     if edge_lengths is None:
-        # Compute from node coordinates
-        edge_lengths = []
-        for i, j in edges:
-            if i < len(nodes) and j < len(nodes):
-                x1, y1 = nodes[i]
-                x2, y2 = nodes[j]
-                length = np.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
-                edge_lengths.append(length)
-
-    if edge_lengths:
+        # Compute from node coordinates (edges with unknown nodes are skipped)
+        node_xy = np.asarray(nodes, dtype=float).reshape(-1, 2)
+        edge_idx = np.asarray(edges, dtype=np.intp).reshape(-1, 2)
+        edge_idx = edge_idx[np.all(edge_idx < n_nodes, axis=1)]
+        diff = node_xy[edge_idx[:, 1]] - node_xy[edge_idx[:, 0]]
+        edge_lengths = np.hypot(diff[:, 0], diff[:, 1])
+
+    if len(edge_lengths) > 0:
         eta = float(np.mean(edge_lengths))
     else:
         eta = 0.0
@@ -149,6 +156,57 @@ def calculate_kansky_indices(
     )
 
 
+def road_network_graph(
+    major_roads: List[np.ndarray],
+    minor_roads: List[np.ndarray],
+    intersection_threshold: float = 10.0,
+) -> EdgeGraph:
+    """
+    Convert road network (list of polylines) to an array graph.
+
+    Road points closer than the threshold are merged into shared nodes
+    (intersections); consecutive points along each road become edges.
+    Repeated edges keep their first occurrence and its segment length.
+
+    Args:
+        major_roads: List of (N, 2) arrays (road polylines)
+        minor_roads: List of (M, 2) arrays
+        intersection_threshold: Max distance to consider points as same node (meters)
+
+    Returns:
+        EdgeGraph with node coordinates and edge lengths (meters)
+    """
+    roads = [
+        np.asarray(road, dtype=float).reshape(-1, 2)
+        for road in list(major_roads) + list(minor_roads)
+        if len(road) >= 2
+    ]
+    if not roads:
+        return EdgeGraph(0, np.zeros((0, 2), dtype=np.intp), np.zeros(0), nodes=np.zeros((0, 2)))
+
+    # Each road contributes its start and end point, then all of its points;
+    # endpoints go first so they claim node ids ahead of interior points
+    sizes = np.array([len(road) for road in roads])
+    points = np.concatenate([np.vstack([road[[0, -1]], road]) for road in roads])
+    nodes, node_of = merge_points(points, intersection_threshold)
+
+    # Consecutive point pairs along each road (skipping the two endpoint copies)
+    offsets = np.concatenate([[0], np.cumsum(sizes + 2)[:-1]]) + 2
+    starts = np.concatenate([offset + np.arange(size - 1) for offset, size in zip(offsets, sizes)])
+    node_i, node_j = node_of[starts], node_of[starts + 1]
+    segment = points[starts + 1] - points[starts]
+    lengths = np.hypot(segment[:, 0], segment[:, 1])
+
+    # Undirected, distinct nodes, first occurrence of each edge
+    keep = node_i != node_j
+    edges = np.sort(np.column_stack([node_i[keep], node_j[keep]]), axis=1)
+    lengths = lengths[keep]
+    _, first = np.unique(edges, axis=0, return_index=True)
+    first = np.sort(first)
+
+    return EdgeGraph(len(nodes), edges[first], lengths[first], nodes=nodes)
+
+
 def road_network_to_graph(
     major_roads: List[np.ndarray],
     minor_roads: List[np.ndarray],
@@ -158,6 +216,7 @@ def road_network_to_graph(
     Convert road network (list of polylines) to graph representation.
 
     Identifies intersections and creates node-edge graph structure.
+    List-based view of road_network_graph().
 
     Args:
         major_roads: List of (N, 2) arrays (road polylines)
@@ -176,86 +235,13 @@ def road_network_to_graph(
         >>> nodes, edges, lengths = road_network_to_graph(major, minor)
         >>> # Detects intersection at (50, 0)
     """
-    # Collect all road segments
-    all_roads = major_roads + minor_roads
-
-    if not all_roads:
+    graph = road_network_graph(major_roads, minor_roads, intersection_threshold)
+    if graph.n_nodes == 0:
         return [], [], []
 
-    # Extract all road endpoints and segment points
-    potential_nodes = []
-
-    for road in all_roads:
-        if len(road) < 2:
-            continue
-
-        # Add start and end points
-        potential_nodes.append(tuple(road[0]))
-        potential_nodes.append(tuple(road[-1]))
-
-        # Also add intermediate points that might be intersections
-        # (simplified: just use all points)
-        for point in road:
-            potential_nodes.append(tuple(point))
-
-    # Cluster nearby points into single nodes
-    nodes = []
-    node_mapping = {}  # Maps original point index to clustered node index
-
-    for i, point in enumerate(potential_nodes):
-        # Check if point is close to existing node
-        found_existing = False
-
-        for j, existing_node in enumerate(nodes):
-            distance = np.sqrt(
-                (point[0] - existing_node[0]) ** 2 + (point[1] - existing_node[1]) ** 2
-            )
-
-            if distance < intersection_threshold:
-                # Merge with existing node
-                node_mapping[i] = j
-                found_existing = True
-                break
-
-        if not found_existing:
-            # Create new node
-            node_mapping[i] = len(nodes)
-            nodes.append(point)
-
-    # Build edges from road segments
-    edges = []
-    edge_lengths = []
-    edge_set = set()  # Avoid duplicates
-
-    point_index = 0
-
-    for road in all_roads:
-        if len(road) < 2:
-            continue
-
-        # For each consecutive pair of points in road
-        for k in range(len(road) - 1):
-            # Map to clustered nodes
-            node_i = node_mapping.get(point_index + k)
-            node_j = node_mapping.get(point_index + k + 1)
-
-            if node_i is not None and node_j is not None and node_i != node_j:
-                # Add edge (undirected - store in sorted order)
-                edge_tuple = tuple(sorted([node_i, node_j]))
-
-                if edge_tuple not in edge_set:
-                    edge_set.add(edge_tuple)
-                    edges.append(edge_tuple)
-
-                    # Compute edge length
-                    p1 = road[k]
-                    p2 = road[k + 1]
-                    length = float(np.sqrt((p2[0] - p1[0]) ** 2 + (p2[1] - p1[1]) ** 2))
-                    edge_lengths.append(length)
-
-        point_index += len(road)
-
-    return nodes, edges, edge_lengths
+    nodes = [tuple(node) for node in graph.nodes.tolist()]
+    edges = [tuple(edge) for edge in graph.edges.tolist()]
+    return nodes, edges, graph.weights.tolist()
 
 
 def calculate_network_connectivity(
@@ -280,14 +266,74 @@ def calculate_network_connectivity(
         >>> print(f"Network connectivity (gamma): {indices.gamma:.2f}")
     """
     # Convert road network to graph
-    nodes, edges, edge_lengths = road_network_to_graph(major_roads, minor_roads)
+    graph = road_network_graph(major_roads, minor_roads)
 
     # Calculate Kansky indices
-    indices = calculate_kansky_indices(nodes, edges, edge_lengths)
+    indices = calculate_kansky_indices(graph.nodes, graph.edges, graph.weights)
 
     return indices
 
 
+def _road_network_key(
+    major_roads: List[np.ndarray],
+    minor_roads: List[np.ndarray],
+    intersection_threshold: float,
+) -> str:
+    """Content hash identifying a road network."""
+    digest = hashlib.sha1(repr(intersection_threshold).encode())
+    for group in (major_roads, minor_roads):
+        digest.update(b"|")
+        for road in group:
+            road = np.ascontiguousarray(road, dtype=float)
+            digest.update(str(road.shape).encode())
+            digest.update(road.tobytes())
+    return digest.hexdigest()
+
+
+def road_network_distances(
+    major_roads: List[np.ndarray],
+    minor_roads: List[np.ndarray],
+    intersection_threshold: float = 10.0,
+) -> RoadNetworkDistances:
+    """
+    Shortest-path distance provider for a road network (cached per network).
+
+    The road graph from road_network_graph() is built once per distinct
+    network; Dijkstra rows computed during optimization are kept on the
+    returned instance, so repeated accessibility evaluations on the same
+    roads only do array lookups.
+
+    Args:
+        major_roads: List of (N, 2) road polylines
+        minor_roads: List of (M, 2) road polylines
+        intersection_threshold: Node merge distance (meters)
+
+    Returns:
+        RoadNetworkDistances for the network
+
+    Raises:
+        ValueError: If the network has no roads
+
+    Example:
+        >>> network = road_network_distances(major, minor)
+        >>> score = maximize_accessibility(solution, buildings, network=network)
+    """
+    key = _road_network_key(major_roads, minor_roads, intersection_threshold)
+
+    if key in _NETWORK_DISTANCE_CACHE:
+        _NETWORK_DISTANCE_CACHE.move_to_end(key)
+        return _NETWORK_DISTANCE_CACHE[key]
+
+    graph = road_network_graph(major_roads, minor_roads, intersection_threshold)
+    network = RoadNetworkDistances(graph.nodes, graph.edges, graph.weights)
+
+    _NETWORK_DISTANCE_CACHE[key] = network
+    if len(_NETWORK_DISTANCE_CACHE) > _NETWORK_DISTANCE_CACHE_SIZE:
+        _NETWORK_DISTANCE_CACHE.popitem(last=False)
+
+    return network
+
+
 def connectivity_quality_score(indices: KanskyIndices) -> float:
     """
     Aggregate connectivity indices into single quality score.
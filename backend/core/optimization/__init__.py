@@ -8,23 +8,24 @@ Note: Legacy files (problem.py, objectives.py, constraints.py, hsaga.py)
 were deleted in Phase 10 cleanup - replaced by spatial_problem.py and hsaga_runner.py.
 """
 
-from backend.core.optimization.spatial_problem import (
-    SpatialOptimizationProblem,
-    ConstraintCalculator,
-    ObjectiveCalculator
-)
-
-from backend.core.optimization.hsaga_runner import (
-    HSAGARunner,
-    HSAGARunnerConfig,
-    run_hsaga
-)
-
+from backend.core.optimization.async_nsga3 import AsyncNSGA3Config, AsyncSteadyStateNSGA3
 from backend.core.optimization.encoding import (
     BuildingGene,
     SmartInitializer,
+    array_to_genome,
     decode_all_to_polygons,
-    array_to_genome
+)
+from backend.core.optimization.hsaga_runner import HSAGARunner, HSAGARunnerConfig, run_hsaga
+from backend.core.optimization.instrumentation import ComponentTimers
+from backend.core.optimization.island_runner import (
+    IslandConfig,
+    IslandHSAGARunner,
+    IslandModelConfig,
+)
+from backend.core.optimization.spatial_problem import (
+    ConstraintCalculator,
+    ObjectiveCalculator,
+    SpatialOptimizationProblem,
 )
 
 __all__ = [
@@ -36,9 +37,18 @@ __all__ = [
     "HSAGARunner",
     "HSAGARunnerConfig",
     "run_hsaga",
+    # Steady-state NSGA-III
+    "AsyncSteadyStateNSGA3",
+    "AsyncNSGA3Config",
+    # Island model
+    "IslandHSAGARunner",
+    "IslandModelConfig",
+    "IslandConfig",
+    # Instrumentation
+    "ComponentTimers",
     # Encoding
     "BuildingGene",
     "SmartInitializer",
     "decode_all_to_polygons",
-    "array_to_genome"
+    "array_to_genome",
 ]
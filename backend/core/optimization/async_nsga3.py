@@ -0,0 +1,319 @@
+"""
+Asynchronous Steady-State NSGA-III.
+
+Generational NSGA-III waits for every individual of a generation before
+selecting parents. When evaluation time varies a lot between layouts, most
+workers idle at the end of each generation. This module removes that
+barrier:
+
+1. A pool of K evaluation workers is kept busy at all times
+2. Each finished evaluation is inserted into the population immediately
+   ((mu + 1) NSGA-III reference-direction survival)
+3. The freed worker immediately receives a new offspring bred from the
+   current population
+
+Works with any pymoo problem that implements ``_evaluate(x, out)``, e.g.
+SpatialOptimizationProblem. Mating (tournament + SBX + PM) and survival are
+borrowed from pymoo's NSGA3 so the search operators match the generational
+runner exactly.
+"""
+
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from pymoo.algorithms.moo.nsga3 import NSGA3
+from pymoo.core.population import Population
+from pymoo.core.problem import Problem
+from pymoo.operators.crossover.sbx import SBX
+from pymoo.operators.mutation.pm import PM
+from pymoo.operators.sampling.rnd import FloatRandomSampling
+from pymoo.util.nds.non_dominated_sorting import NonDominatedSorting
+
+from src.algorithms.nsga3.reference_points import generate_reference_points
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+
+@dataclass
+class AsyncNSGA3Config:
+    """Configuration for the asynchronous steady-state NSGA-III."""
+
+    pop_size: int = 100
+    max_evaluations: int = 5000
+
+    # Evaluation workers (0 = one per CPU core, 1 = in-process/serial)
+    n_workers: int = 0
+
+    # NSGA-III specific
+    n_partitions: int = 12
+
+    # Genetic operators
+    crossover_prob: float = 0.9
+    crossover_eta: float = 15.0
+    mutation_prob: float = 0.2
+    mutation_eta: float = 20.0
+
+    # Performance
+    seed: Optional[int] = 42
+    verbose: bool = True
+
+
+@dataclass
+class AsyncNSGA3Result:
+    """Result of an asynchronous run (mirrors pymoo's Result fields we use)."""
+
+    X: Optional[np.ndarray]
+    F: Optional[np.ndarray]
+    G: Optional[np.ndarray]
+    pop_X: np.ndarray
+    pop_F: np.ndarray
+    n_eval: int
+    stats: Dict[str, Any]
+
+
+# =============================================================================
+# WORKER FUNCTIONS (Top-Level for Multiprocessing Pickling)
+# =============================================================================
+
+_WORKER_PROBLEM: Optional[Problem] = None
+
+
+def _init_worker(problem: Problem) -> None:
+    """Ship the problem once per worker process instead of once per task."""
+    global _WORKER_PROBLEM
+    _WORKER_PROBLEM = problem
+
+
+def _evaluate_in_worker(
+    x: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, float, Optional[Dict[str, Any]]]:
+    """Evaluate one decision vector with the process-local problem."""
+    F, G, eval_time = _evaluate_with(_WORKER_PROBLEM, x)
+    return F, G, eval_time, _drain_timers(_WORKER_PROBLEM)
+
+
+def _drain_timers(problem: Problem) -> Optional[Dict[str, Any]]:
+    """Component timings recorded since the last call (problems with ``timers`` only)."""
+    timers = getattr(problem, "timers", None)
+    return timers.drain() if timers is not None and timers.enabled else None
+
+
+def _evaluate_with(problem: Problem, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray, float]:
+    start = time.perf_counter()
+    out = {}
+    problem._evaluate(x, out)
+    F = np.asarray(out["F"], dtype=float)
+    G = np.asarray(out.get("G", np.zeros(0)), dtype=float)
+    return F, G, time.perf_counter() - start
+
+
+# =============================================================================
+# ASYNC STEADY-STATE NSGA-III
+# =============================================================================
+
+
+class AsyncSteadyStateNSGA3:
+    """
+    Steady-state NSGA-III driven by evaluation completion events.
+
+    The population grows to ``pop_size`` from the initial samples; after that
+    every completed evaluation triggers one (mu + 1) survival step and one new
+    offspring submission, so no worker waits for a generation to finish.
+    """
+
+    def __init__(
+        self,
+        problem: Problem,
+        config: AsyncNSGA3Config = None,
+        ref_dirs: Optional[np.ndarray] = None,
+    ):
+        self.problem = problem
+        self.config = config or AsyncNSGA3Config()
+
+        if ref_dirs is None:
+            ref_dirs = generate_reference_points(problem.n_obj, self.config.n_partitions)
+        self.ref_dirs = ref_dirs
+
+        # Borrow mating and survival from pymoo's NSGA3 so the operators are
+        # identical to the generational runner.
+        self._template = NSGA3(
+            ref_dirs=ref_dirs,
+            pop_size=self.config.pop_size,
+            crossover=SBX(prob=self.config.crossover_prob, eta=self.config.crossover_eta),
+            mutation=PM(prob=self.config.mutation_prob, eta=self.config.mutation_eta),
+        )
+        self.mating = self._template.mating
+        self.survival = self._template.survival
+
+        n_workers = self.config.n_workers or os.cpu_count() or 1
+        self.n_workers = max(1, n_workers)
+
+        # State
+        self.pop = Population.create()
+        self.n_eval = 0
+        self.stats = {
+            "n_workers": self.n_workers,
+            "evaluations": 0,
+            "insertions": 0,
+            "busy_time": 0.0,
+            "wall_time": 0.0,
+            "worker_utilisation": 0.0,
+        }
+
+    # -------------------------------------------------------------------------
+    # Candidate generation
+    # -------------------------------------------------------------------------
+
+    def _initial_samples(self, initial_X: Optional[np.ndarray]) -> List[np.ndarray]:
+        """Initial decision vectors (given population or random sampling)."""
+        if initial_X is not None:
+            X = np.atleast_2d(np.asarray(initial_X, dtype=float))
+        else:
+            X = FloatRandomSampling().do(self.problem, self.config.pop_size).get("X")
+        return [x for x in X]
+
+    def _breed(self, n: int) -> List[np.ndarray]:
+        """Breed ``n`` offspring from the current population."""
+        off = self.mating.do(self.problem, self.pop, n, algorithm=self._template)
+        if len(off) == 0:
+            # Mating could not produce new (non-duplicate) offspring
+            return [x for x in FloatRandomSampling().do(self.problem, n).get("X")]
+        return [x for x in off.get("X")]
+
+    # -------------------------------------------------------------------------
+    # Population update
+    # -------------------------------------------------------------------------
+
+    def _insert(self, x: np.ndarray, F: np.ndarray, G: np.ndarray) -> None:
+        """Insert one evaluated individual and truncate back to pop_size."""
+        ind = Population.new("X", [x], "F", [F], "G", [G])
+        self.pop = Population.merge(self.pop, ind)
+
+        if len(self.pop) > self.config.pop_size:
+            self.pop = self.survival.do(self.problem, self.pop, n_survive=self.config.pop_size)
+        self.stats["insertions"] += 1
+
+    def _non_dominated(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Feasible non-dominated set (least infeasible if nothing is feasible)."""
+        X, F, G = self.pop.get("X", "F", "G")
+        cv = self.pop.get("CV").reshape(-1)
+
+        feasible = cv <= 0
+        candidates = np.where(feasible)[0] if np.any(feasible) else np.where(cv <= cv.min())[0]
+        front = NonDominatedSorting().do(F[candidates], only_non_dominated_front=True)
+        keep = candidates[front]
+        return X[keep], F[keep], G[keep]
+
+    # -------------------------------------------------------------------------
+    # Main loop
+    # -------------------------------------------------------------------------
+
+    def run(self, initial_X: Optional[np.ndarray] = None) -> AsyncNSGA3Result:
+        """
+        Run until ``max_evaluations`` evaluations have completed.
+
+        Args:
+            initial_X: Optional initial population (e.g. SA survivors)
+
+        Returns:
+            AsyncNSGA3Result with the non-dominated set and run statistics
+        """
+        start_time = time.time()
+        if self.config.seed is not None:
+            # pymoo operators draw from the global numpy RNG
+            np.random.seed(self.config.seed)
+
+        budget = self.config.max_evaluations
+        init_queue = self._initial_samples(initial_X)[:budget]
+        init_queue.reverse()  # pop() from the end keeps the original order
+        offspring_buffer: List[np.ndarray] = []
+        n_submitted = 0
+
+        if self.config.verbose:
+            print(
+                f"[Async NSGA-III] {self.n_workers} workers, pop={self.config.pop_size}, "
+                f"budget={budget} evaluations"
+            )
+
+        def next_candidate() -> np.ndarray:
+            if init_queue:
+                return init_queue.pop()
+            if len(self.pop) < 2:
+                return FloatRandomSampling().do(self.problem, 1).get("X")[0]
+            if not offspring_buffer:
+                offspring_buffer.extend(self._breed(2))
+            return offspring_buffer.pop()
+
+        executor = None
+        if self.n_workers > 1:
+            executor = ProcessPoolExecutor(
+                max_workers=self.n_workers, initializer=_init_worker, initargs=(self.problem,)
+            )
+
+        def submit(x: np.ndarray) -> Future:
+            if executor is not None:
+                return executor.submit(_evaluate_in_worker, x)
+            future = Future()
+            future.set_result((*_evaluate_with(self.problem, x), None))
+            return future
+
+        pending: Dict[Future, np.ndarray] = {}
+        try:
+            while n_submitted < budget and len(pending) < self.n_workers:
+                x = next_candidate()
+                pending[submit(x)] = x
+                n_submitted += 1
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    x = pending.pop(future)
+                    F, G, eval_time, timings = future.result()
+                    if timings:
+                        self.problem.timers.merge(timings)
+                    self.n_eval += 1
+                    self.stats["busy_time"] += eval_time
+                    self._insert(x, F, G)
+
+                    # Refill the freed worker right away
+                    if n_submitted < budget:
+                        x_new = next_candidate()
+                        pending[submit(x_new)] = x_new
+                        n_submitted += 1
+
+                if self.config.verbose and self.n_eval % max(1, budget // 10) == 0:
+                    print(f"  {self.n_eval}/{budget} evaluations")
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+        wall_time = time.time() - start_time
+        self.stats["evaluations"] = self.n_eval
+        self.stats["wall_time"] = wall_time
+        if wall_time > 0:
+            capacity = self.n_workers * wall_time
+            self.stats["worker_utilisation"] = self.stats["busy_time"] / capacity
+
+        X, F, G = self._non_dominated()
+
+        if self.config.verbose:
+            print(
+                f"[Async NSGA-III] Done: {self.n_eval} evaluations in {wall_time:.2f}s, "
+                f"utilisation {self.stats['worker_utilisation']*100:.0f}%, front={len(X)}"
+            )
+
+        return AsyncNSGA3Result(
+            X=X,
+            F=F,
+            G=G,
+            pop_X=self.pop.get("X"),
+            pop_F=self.pop.get("F"),
+            n_eval=self.n_eval,
+            stats=dict(self.stats),
+        )
@@ -22,9 +22,12 @@ from pymoo.operators.crossover.sbx import SBX
 from pymoo.operators.mutation.pm import PM
 from pymoo.termination import get_termination
 from pymoo.optimize import minimize
-from pymoo.util.ref_dirs import get_reference_directions
 
+from src.algorithms.nsga3.reference_points import generate_reference_points
+
+from backend.core.optimization.sa_kernels import get_sa_kernels, metropolis_accept
 from backend.core.optimization.spatial_problem import SpatialOptimizationProblem
+from backend.core.optimization.async_nsga3 import AsyncNSGA3Config, AsyncSteadyStateNSGA3
 from backend.core.optimization.encoding import (
     SmartInitializer, GENES_PER_BUILDING, array_to_genome, decode_all_to_polygons
 )
@@ -34,6 +37,10 @@ from backend.core.optimization.encoding import (
 # CONFIGURATION
 # =============================================================================
 
+# Accepted values of HSAGARunnerConfig.ga_mode
+GA_MODES = ("generational", "async")
+
+
 @dataclass
 class HSAGARunnerConfig:
     """Configuration for the H-SAGA runner."""
@@ -57,6 +64,8 @@ class HSAGARunnerConfig:
     
     # NSGA-III specific
     n_partitions: int = 12
+    ga_mode: str = "generational"     # 'generational' or 'async' (steady-state)
+    async_workers: int = 0            # Evaluation workers for 'async' (0 = all cores)
     
     # Constraint handling
     constraint_penalty: float = 1e6
@@ -65,6 +74,8 @@ class HSAGARunnerConfig:
     seed: Optional[int] = 42
     verbose: bool = True
     parallel_sa: bool = True  # Enable parallel SA chains (ProcessPoolExecutor)
+    sa_kernel: str = "auto"   # SA hot-loop kernels: 'auto', 'numba' or 'numpy' (same results)
+    instrument: bool = False  # Per-component evaluation timers in stats["components"]
 
 
 # =============================================================================
@@ -90,6 +101,12 @@ def run_sa_chain_worker(
     # Initialize random solution within bounds
     x = local_rng.uniform(problem.xl, problem.xu)
     
+    # Proposal/scalarization kernels (Numba-compiled if available; identical results)
+    kernels = get_sa_kernels(config.sa_kernel)
+    xl = np.ascontiguousarray(np.broadcast_to(problem.xl, x.shape), dtype=float)
+    xu = np.ascontiguousarray(np.broadcast_to(problem.xu, x.shape), dtype=float)
+    penalty_weight = config.constraint_penalty
+
     # Evaluate initial solution
     # Note: We must replicate the _evaluate and _scalarize logic here 
     # since we don't have access to the SAExplorer instance methods easily
@@ -98,11 +115,8 @@ def run_sa_chain_worker(
     problem._evaluate(x, out)
     F, G = out["F"], out["G"]
     
-    # Scalarize
-    obj_sum = np.sum(F)
-    constraint_violation = np.sum(np.maximum(0, G))
-    penalty = config.constraint_penalty * constraint_violation
-    cost = obj_sum + penalty
+    # Scalarize: objective sum + constraint penalty
+    cost = kernels.scalarize(F, G, penalty_weight)
     
     best_x = x.copy()
     best_F = F.copy()
@@ -117,10 +131,9 @@ def run_sa_chain_worker(
         t_ratio = temperature / config.initial_temperature
         step_params = 0.1 * t_ratio + 0.01
         
-        # Random perturbation
+        # Random perturbation, clipped to bounds
         delta = local_rng.normal(0, step_params, size=x.shape)
-        y = x + delta
-        y = np.clip(y, problem.xl, problem.xu)
+        y = kernels.propose(x, delta, xl, xu)
         
         # Evaluate neighbor
         out_new = {}
@@ -128,19 +141,10 @@ def run_sa_chain_worker(
         F_new, G_new = out_new["F"], out_new["G"]
         
         # Scalarize neighbor
-        obj_sum_new = np.sum(F_new)
-        viol_new = np.sum(np.maximum(0, G_new))
-        penalty_new = config.constraint_penalty * viol_new
-        cost_new = obj_sum_new + penalty_new
+        cost_new = kernels.scalarize(F_new, G_new, penalty_weight)
         
         # Metropolis acceptance
-        if cost_new < cost:
-            accepted = True
-        else:
-            delta_cost = cost_new - cost
-            # Avoid overflow in exp
-            prob = np.exp(-delta_cost / max(temperature, 1e-10))
-            accepted = local_rng.random() < prob
+        accepted = metropolis_accept(cost, cost_new, temperature, local_rng)
             
         if accepted:
             x = y
@@ -165,6 +169,21 @@ def run_sa_chain_worker(
     return (best_x, best_F, best_G, best_cost)
 
 
+def run_sa_chain_worker_timed(
+    problem: SpatialOptimizationProblem,
+    config: HSAGARunnerConfig,
+    chain_idx: int,
+    iterations: int,
+    seed_offset: int
+) -> Tuple[Tuple[np.ndarray, np.ndarray, np.ndarray, float], Dict[str, Any]]:
+    """
+    run_sa_chain_worker for process pools: also returns the worker's
+    evaluation timers, which would otherwise be lost with the process.
+    """
+    result = run_sa_chain_worker(problem, config, chain_idx, iterations, seed_offset)
+    return result, problem.timers.drain()
+
+
 # =============================================================================
 # SIMULATED ANNEALING ENGINE
 # =============================================================================
@@ -282,7 +301,7 @@ class SAExplorer:
             with ProcessPoolExecutor(max_workers=n_chains) as executor:
                 futures = {
                     executor.submit(
-                        run_sa_chain_worker, 
+                        run_sa_chain_worker_timed, 
                         self.problem, 
                         self.config, 
                         i, 
@@ -295,7 +314,8 @@ class SAExplorer:
                 for future in as_completed(futures):
                     chain_idx = futures[future]
                     try:
-                        best_x, best_F, best_G, best_cost = future.result()
+                        (best_x, best_F, best_G, best_cost), timings = future.result()
+                        self.problem.timers.merge(timings)
                         chain_results.append((best_x, best_F, best_G, best_cost, chain_idx))
                     except Exception as e:
                         print(f"[SA] ❌ Chain {chain_idx} failed: {e}")
@@ -361,6 +381,10 @@ class HSAGARunner:
     ):
         self.problem = problem
         self.config = config or HSAGARunnerConfig()
+        if self.config.ga_mode not in GA_MODES:
+            raise ValueError(
+                f"Unknown ga_mode: {self.config.ga_mode!r} (expected one of {GA_MODES})"
+            )
         self.rng = np.random.default_rng(self.config.seed)
         
         # State
@@ -382,6 +406,9 @@ class HSAGARunner:
             Dict containing best solution, Pareto front, and statistics
         """
         start_time = time.time()
+        if self.config.instrument:
+            self.problem.timers.enabled = True
+            self.problem.timers.reset()
         
         # Calculate evaluation budget
         sa_budget = int(self.config.total_evaluations * self.config.sa_fraction)
@@ -390,7 +417,7 @@ class HSAGARunner:
         
         if self.config.verbose:
             print(f"\n{'='*60}")
-            print(f"H-SAGA OPTIMIZATION")
+            print("H-SAGA OPTIMIZATION")
             print(f"{'='*60}")
             print(f"Total Budget: {self.config.total_evaluations} evaluations")
             print(f"SA Phase: {sa_budget} ({self.config.sa_fraction*100:.0f}%)")
@@ -410,7 +437,7 @@ class HSAGARunner:
         
         # Phase 2: NSGA-III
         if self.config.verbose:
-            print(f"\n[PHASE 2] NSGA-III (Refinement)")
+            print("\n[PHASE 2] NSGA-III (Refinement)")
         
         ga_start = time.time()
         
@@ -418,47 +445,68 @@ class HSAGARunner:
         initial_pop = self._create_initial_population()
         
         # Setup NSGA-III
-        ref_dirs = get_reference_directions(
-            "das-dennis",
-            self.problem.n_obj,
-            n_partitions=self.config.n_partitions
-        )
-        
-        algorithm = NSGA3(
-            ref_dirs=ref_dirs,
-            pop_size=self.config.population_size,
-            sampling=initial_pop,
-            crossover=SBX(
-                prob=self.config.crossover_prob,
-                eta=self.config.crossover_eta
-            ),
-            mutation=PM(
-                prob=self.config.mutation_prob,
-                eta=self.config.mutation_eta
+        ref_dirs = generate_reference_points(self.problem.n_obj, self.config.n_partitions)
+        
+        if self.config.ga_mode == "async":
+            # Steady-state NSGA-III: no generation barrier between workers
+            engine = AsyncSteadyStateNSGA3(
+                self.problem,
+                AsyncNSGA3Config(
+                    pop_size=self.config.population_size,
+                    max_evaluations=ga_budget,
+                    n_workers=self.config.async_workers,
+                    crossover_prob=self.config.crossover_prob,
+                    crossover_eta=self.config.crossover_eta,
+                    mutation_prob=self.config.mutation_prob,
+                    mutation_eta=self.config.mutation_eta,
+                    seed=self.config.seed,
+                    verbose=self.config.verbose
+                ),
+                ref_dirs=ref_dirs
+            )
+            self.ga_result = engine.run(initial_pop)
+            self.stats["ga_evaluations"] = self.ga_result.n_eval
+            self.stats["ga_workers"] = self.ga_result.stats["n_workers"]
+            self.stats["ga_worker_utilisation"] = self.ga_result.stats["worker_utilisation"]
+        else:
+            algorithm = NSGA3(
+                ref_dirs=ref_dirs,
+                pop_size=self.config.population_size,
+                sampling=initial_pop,
+                crossover=SBX(
+                    prob=self.config.crossover_prob,
+                    eta=self.config.crossover_eta
+                ),
+                mutation=PM(
+                    prob=self.config.mutation_prob,
+                    eta=self.config.mutation_eta
+                )
             )
-        )
         
-        if ga_generations < 1:
-             ga_generations = 1
+            if ga_generations < 1:
+                ga_generations = 1
         
-        termination = get_termination("n_gen", ga_generations)
+            termination = get_termination("n_gen", ga_generations)
         
-        # Run optimization
-        self.ga_result = minimize(
-            self.problem,
-            algorithm,
-            termination,
-            seed=self.config.seed,
-            verbose=self.config.verbose
-        )
+            # Run optimization
+            self.ga_result = minimize(
+                self.problem,
+                algorithm,
+                termination,
+                seed=self.config.seed,
+                verbose=self.config.verbose
+            )
         
-        self.stats["ga_evaluations"] = self.ga_result.algorithm.evaluator.n_eval
+            self.stats["ga_evaluations"] = self.ga_result.algorithm.evaluator.n_eval
+
         self.stats["ga_time"] = time.time() - ga_start
         self.stats["total_time"] = time.time() - start_time
+        if self.problem.timers.enabled:
+            self.stats["components"] = self.problem.timers.summary()
         
         if self.config.verbose:
             print(f"\n{'='*60}")
-            print(f"OPTIMIZATION COMPLETE")
+            print("OPTIMIZATION COMPLETE")
             print(f"{'='*60}")
             print(f"Total Evaluations: {self.stats['sa_evaluations'] + self.stats['ga_evaluations']}")
             print(f"Total Time: {self.stats['total_time']:.2f}s")
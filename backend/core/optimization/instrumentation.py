@@ -0,0 +1,117 @@
+"""
+Per-Component Evaluation Instrumentation.
+
+Opt-in cumulative timers and call counters for the components of
+``SpatialOptimizationProblem._evaluate`` (decode, each constraint, each
+objective).
+
+Timing is a lap pattern: ``clock()`` starts a lap and ``lap(name, t)`` books
+the time since ``t`` to ``name`` and starts the next lap. When disabled,
+``clock()`` returns None and ``lap`` returns immediately, so an uninstrumented
+evaluation pays a few no-op method calls.
+
+Counts are process-local. Copies shipped to worker processes start empty
+(see ``__getstate__``); workers send back ``drain()`` snapshots, which the
+parent folds in with ``merge()``.
+
+Example:
+    >>> timers = ComponentTimers(enabled=True)
+    >>> t = timers.clock()
+    >>> polygons = decode(x)
+    >>> t = timers.lap("decode", t)
+    >>> timers.summary()["decode"]["calls"]
+    1
+"""
+
+import time
+from typing import Any, Dict, Optional
+
+
+class ComponentTimers:
+    """Cumulative wall time and call count per named component."""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.totals: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+
+    def __getstate__(self):
+        """Ship the enabled flag only; worker copies count from zero."""
+        return {"enabled": self.enabled}
+
+    def __setstate__(self, state):
+        self.__init__(enabled=state["enabled"])
+
+    # -------------------------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------------------------
+
+    def clock(self) -> Optional[float]:
+        """Start a lap (None when disabled)."""
+        return time.perf_counter() if self.enabled else None
+
+    def lap(self, name: str, start: Optional[float]) -> Optional[float]:
+        """
+        Book the time since ``start`` to ``name``.
+
+        Returns:
+            Start of the next lap (None when disabled)
+        """
+        if start is None:
+            return None
+        now = time.perf_counter()
+        self.totals[name] = self.totals.get(name, 0.0) + (now - start)
+        self.calls[name] = self.calls.get(name, 0) + 1
+        return now
+
+    def record(self, name: str, seconds: float, calls: int = 1) -> None:
+        """Book an externally measured duration (no-op when disabled)."""
+        if self.enabled:
+            self.totals[name] = self.totals.get(name, 0.0) + seconds
+            self.calls[name] = self.calls.get(name, 0) + calls
+
+    # -------------------------------------------------------------------------
+    # Aggregation
+    # -------------------------------------------------------------------------
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Raw counters: {name: {"calls": int, "total_s": float}}."""
+        return {
+            name: {"calls": self.calls[name], "total_s": total}
+            for name, total in self.totals.items()
+        }
+
+    def drain(self) -> Dict[str, Dict[str, float]]:
+        """Snapshot and reset (used to ship worker counts to the parent)."""
+        snapshot = self.snapshot()
+        self.reset()
+        return snapshot
+
+    def merge(self, snapshot: Optional[Dict[str, Dict[str, float]]]) -> None:
+        """Add counters from another snapshot (e.g. a worker's ``drain()``)."""
+        for name, entry in (snapshot or {}).items():
+            self.totals[name] = self.totals.get(name, 0.0) + entry["total_s"]
+            self.calls[name] = self.calls.get(name, 0) + int(entry["calls"])
+
+    def reset(self) -> None:
+        self.totals.clear()
+        self.calls.clear()
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-component report, slowest first.
+
+        Returns:
+            {name: {"calls", "total_s", "mean_ms", "share"}} where ``share``
+            is the fraction of all instrumented time
+        """
+        grand_total = sum(self.totals.values())
+        return {
+            name: {
+                "calls": self.calls[name],
+                "total_s": round(total, 6),
+                "mean_ms": round(total / self.calls[name] * 1000.0, 4),
+                "share": round(total / grand_total, 4) if grand_total > 0 else 0.0,
+            }
+            for name, total in sorted(self.totals.items(), key=lambda kv: -kv[1])
+        }
@@ -0,0 +1,602 @@
+"""
+Island-Model H-SAGA Runner - Distributed Hybrid Optimization.
+
+This module runs K independent H-SAGA islands and lets them cooperate:
+1. Each island runs its own SA exploration and NSGA-III population
+2. Islands differ in seed, operator settings and objective weights
+3. Every M generations each island publishes elite migrants and
+   absorbs the latest migrants of its neighbour (ring topology)
+4. At the end all island fronts are merged into one Pareto archive
+
+Migration goes through a shared directory, so islands can run as local
+processes or as separate hosts mounting the same directory. Migrant
+exchange never blocks by default: an island takes whatever its neighbour
+has published so far and keeps evolving, so no generation barrier is
+shared between islands.
+
+Designed to work with the SpatialOptimizationProblem / HSAGARunner stack.
+"""
+
+import copy
+import glob
+import logging
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from pymoo.algorithms.moo.nsga3 import NSGA3
+from pymoo.core.population import Population
+from pymoo.operators.crossover.sbx import SBX
+from pymoo.operators.mutation.pm import PM
+from pymoo.termination import get_termination
+from pymoo.util.nds.non_dominated_sorting import NonDominatedSorting
+
+from backend.core.optimization.hsaga_runner import HSAGARunner, HSAGARunnerConfig, SAExplorer
+from backend.core.optimization.instrumentation import ComponentTimers
+from backend.core.optimization.spatial_problem import SpatialOptimizationProblem
+from backend.core.schemas.input import OptimizationGoal
+from src.algorithms.nsga3.reference_points import generate_reference_points
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+
+@dataclass
+class IslandConfig:
+    """Per-island settings that make each island search differently."""
+
+    island_id: int
+    seed: int
+    crossover_eta: float = 15.0
+    mutation_eta: float = 20.0
+    mutation_prob: float = 0.2
+    # None keeps the problem's own optimization goals
+    objective_weights: Optional[Dict[OptimizationGoal, float]] = None
+
+
+@dataclass
+class IslandModelConfig:
+    """Configuration for the island-model runner."""
+
+    # Island layout
+    n_islands: int = 4
+    islands: Optional[List[IslandConfig]] = None  # Auto-generated if None
+    weight_jitter: float = 0.25  # Relative objective weight spread
+
+    # Migration
+    migration_interval: int = 5  # Generations between exchanges (M)
+    n_migrants: int = 4  # Elites sent per exchange
+    migration_dir: Optional[str] = None  # Shared directory (temp if None)
+    migration_timeout: float = 0.0  # Seconds to wait for migrants (0 = never block)
+
+    # Per-island H-SAGA budget and operators
+    hsaga: HSAGARunnerConfig = field(
+        default_factory=lambda: HSAGARunnerConfig(verbose=False, parallel_sa=False)
+    )
+
+    # Execution
+    parallel: bool = True  # One process per island
+    max_workers: Optional[int] = None
+    verbose: bool = True
+
+
+def make_island_configs(
+    n_islands: int,
+    base_config: HSAGARunnerConfig,
+    base_goals: Dict[OptimizationGoal, float],
+    weight_jitter: float = 0.25,
+    seed: Optional[int] = 42,
+) -> List[IslandConfig]:
+    """
+    Generate diverse island settings around a base configuration.
+
+    Island 0 keeps the base operators and goals; the other islands get
+    distinct seeds, SBX/PM distribution indices and jittered objective
+    weights so that the archipelago covers different regions of the front.
+    """
+    base_seed = seed if seed is not None else int(time.time())
+    rng = np.random.default_rng(base_seed)
+
+    eta_scales = [1.0, 0.5, 2.0, 0.75, 1.5]
+    islands = []
+    for i in range(n_islands):
+        scale = eta_scales[i % len(eta_scales)]
+
+        weights = None
+        if i > 0 and weight_jitter > 0 and base_goals:
+            weights = {
+                goal: float(w * rng.uniform(1 - weight_jitter, 1 + weight_jitter))
+                for goal, w in base_goals.items()
+            }
+
+        islands.append(
+            IslandConfig(
+                island_id=i,
+                seed=base_seed + 1000 * i,
+                crossover_eta=base_config.crossover_eta * scale,
+                mutation_eta=base_config.mutation_eta * scale,
+                mutation_prob=base_config.mutation_prob,
+                objective_weights=weights,
+            )
+        )
+
+    return islands
+
+
+# =============================================================================
+# MIGRATION TRANSPORT
+# =============================================================================
+
+
+class DirectoryMigrationTransport:
+    """
+    Exchanges migrants and final fronts through files in a shared directory.
+
+    Every message is a single ``.npz`` file written atomically (temp file +
+    rename), so readers never observe partial writes. Works for processes on
+    one machine and for hosts sharing a network filesystem.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        # Last epoch consumed per source island (reader-side state)
+        self._consumed: Dict[int, int] = {}
+
+    def _write(self, filename: str, **arrays: np.ndarray) -> str:
+        path = os.path.join(self.directory, filename)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as fh:
+            np.savez(fh, **arrays)
+        os.replace(tmp_path, path)
+        return path
+
+    def publish(self, island_id: int, epoch: int, X: np.ndarray) -> str:
+        """Publish elite migrants (decision vectors) of an island for an epoch."""
+        return self._write(
+            f"migrants_island{island_id:03d}_epoch{epoch:05d}.npz", X=np.asarray(X, dtype=float)
+        )
+
+    def collect(self, source_id: int, epoch: int, timeout: float = 0.0) -> Optional[np.ndarray]:
+        """
+        Collect the newest unseen migrants of ``source_id`` up to ``epoch``.
+
+        Returns None when nothing new is available. With ``timeout > 0`` the
+        call waits for the source to reach ``epoch`` before giving up.
+        """
+        deadline = time.time() + timeout
+        last_seen = self._consumed.get(source_id, -1)
+
+        while True:
+            newest_epoch, newest_path = -1, None
+            pattern = os.path.join(self.directory, f"migrants_island{source_id:03d}_epoch*.npz")
+            for path in glob.glob(pattern):
+                file_epoch = int(path[-9:-4])
+                if last_seen < file_epoch <= epoch and file_epoch > newest_epoch:
+                    newest_epoch, newest_path = file_epoch, path
+
+            if newest_path is not None and (newest_epoch == epoch or time.time() >= deadline):
+                self._consumed[source_id] = newest_epoch
+                with np.load(newest_path) as data:
+                    return data["X"]
+
+            if time.time() >= deadline:
+                return None
+            time.sleep(0.05)
+
+    def publish_front(self, island_id: int, X: np.ndarray, F: np.ndarray, G: np.ndarray) -> str:
+        """Publish the final non-dominated front of an island."""
+        return self._write(
+            f"front_island{island_id:03d}.npz",
+            X=np.asarray(X, dtype=float),
+            F=np.asarray(F, dtype=float),
+            G=np.asarray(G, dtype=float),
+        )
+
+    def clear(self) -> None:
+        """Remove migrant and front files left over from a previous run."""
+        for pattern in ("migrants_island*.npz", "front_island*.npz"):
+            for path in glob.glob(os.path.join(self.directory, pattern)):
+                os.remove(path)
+
+    def load_fronts(self) -> Dict[int, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Load every published island front keyed by island id."""
+        fronts = {}
+        for path in sorted(glob.glob(os.path.join(self.directory, "front_island*.npz"))):
+            island_id = int(os.path.basename(path)[len("front_island") : -4])
+            with np.load(path) as data:
+                fronts[island_id] = (data["X"], data["F"], data["G"])
+        return fronts
+
+
+# =============================================================================
+# ISLAND WORKER (Top-Level for Multiprocessing Pickling)
+# =============================================================================
+
+
+def apply_objective_weights(
+    problem: SpatialOptimizationProblem, weights: Optional[Dict[OptimizationGoal, float]]
+) -> SpatialOptimizationProblem:
+    """Return a copy of the problem that uses the given objective weights."""
+    if not weights:
+        return problem
+
+    island_problem = copy.deepcopy(problem)
+    goals = dict(island_problem.goals)
+    goals.update(weights)
+    island_problem.goals = goals
+    island_problem.objective_calc.goals = goals
+    return island_problem
+
+
+def _select_elites(algorithm: NSGA3, n_migrants: int, rng: np.random.Generator) -> np.ndarray:
+    """Pick up to n_migrants individuals from the current non-dominated set."""
+    has_opt = algorithm.opt is not None and len(algorithm.opt) > 0
+    elites = algorithm.opt if has_opt else algorithm.pop
+    X = elites.get("X")
+    if len(X) > n_migrants:
+        X = X[rng.choice(len(X), size=n_migrants, replace=False)]
+    return X
+
+
+def _inject_migrants(algorithm: NSGA3, X_migrants: np.ndarray) -> int:
+    """
+    Replace the worst individuals of the population with migrants.
+
+    Migrants are re-evaluated on the receiving island because its objective
+    weights may differ from the sender's.
+    """
+    if X_migrants is None or len(X_migrants) == 0:
+        return 0
+
+    migrants = Population.new("X", X_migrants)
+    algorithm.evaluator.eval(algorithm.problem, migrants, algorithm=algorithm)
+
+    pop = algorithm.pop
+    F = pop.get("F")
+    CV = pop.get("CV").reshape(-1)
+    # Worst = most infeasible, then largest objective sum
+    order = np.lexsort((np.sum(F, axis=1), CV))[::-1]
+    n_replace = min(len(migrants), len(pop))
+    replace_idx = order[:n_replace]
+
+    survivors = np.setdiff1d(np.arange(len(pop)), replace_idx)
+    algorithm.pop = Population.merge(pop[survivors], migrants[:n_replace])
+    return n_replace
+
+
+def run_island_worker(
+    problem: SpatialOptimizationProblem,
+    island: IslandConfig,
+    model_config: IslandModelConfig,
+    migration_dir: str,
+) -> Dict[str, Any]:
+    """
+    Run one H-SAGA island with periodic migration.
+
+    Must be top-level to be pickleable for ProcessPoolExecutor. Can also be
+    called directly on a remote host that mounts ``migration_dir``.
+    """
+    start_time = time.time()
+    n_islands = len(model_config.islands) if model_config.islands else model_config.n_islands
+    transport = DirectoryMigrationTransport(migration_dir)
+    rng = np.random.default_rng(island.seed)
+
+    island_problem = apply_objective_weights(problem, island.objective_weights)
+    config = replace(
+        model_config.hsaga,
+        seed=island.seed,
+        crossover_eta=island.crossover_eta,
+        mutation_eta=island.mutation_eta,
+        mutation_prob=island.mutation_prob,
+        verbose=False,
+        parallel_sa=False,  # Each island already owns a process
+    )
+    if config.instrument:
+        island_problem.timers.enabled = True
+
+    # Phase 1: SA exploration (island-local)
+    sa_budget = int(config.total_evaluations * config.sa_fraction)
+    ga_budget = config.total_evaluations - sa_budget
+    ga_generations = max(1, ga_budget // config.population_size)
+
+    sa_explorer = SAExplorer(island_problem, config)
+    runner = HSAGARunner(island_problem, config)
+    runner.sa_results = sa_explorer.run(sa_budget)
+    initial_pop = runner._create_initial_population()
+
+    # Phase 2: NSGA-III stepped generation by generation so we can migrate
+    ref_dirs = generate_reference_points(island_problem.n_obj, config.n_partitions)
+    algorithm = NSGA3(
+        ref_dirs=ref_dirs,
+        pop_size=config.population_size,
+        sampling=initial_pop,
+        crossover=SBX(prob=config.crossover_prob, eta=config.crossover_eta),
+        mutation=PM(prob=config.mutation_prob, eta=config.mutation_eta),
+    )
+    algorithm.setup(
+        island_problem,
+        termination=get_termination("n_gen", ga_generations),
+        seed=config.seed,
+        verbose=False,
+    )
+
+    source_id = (island.island_id - 1) % n_islands
+    epoch = 0
+    migrants_received = 0
+    while algorithm.has_next():
+        algorithm.next()
+
+        if n_islands > 1 and algorithm.n_gen % model_config.migration_interval == 0:
+            epoch += 1
+            elites = _select_elites(algorithm, model_config.n_migrants, rng)
+            transport.publish(island.island_id, epoch, elites)
+            incoming = transport.collect(source_id, epoch, model_config.migration_timeout)
+            migrants_received += _inject_migrants(algorithm, incoming)
+
+    opt = algorithm.opt
+    X, F, G = opt.get("X", "F", "G")
+    transport.publish_front(island.island_id, X, F, G)
+
+    return {
+        "island_id": island.island_id,
+        "seed": island.seed,
+        "front_size": len(X),
+        "sa_evaluations": sa_explorer.n_evals,
+        "ga_evaluations": algorithm.evaluator.n_eval,
+        "generations": algorithm.n_gen,
+        "migration_epochs": epoch,
+        "migrants_received": migrants_received,
+        "time": time.time() - start_time,
+        "components": island_problem.timers.drain(),
+    }
+
+
+# =============================================================================
+# ARCHIVE MERGING
+# =============================================================================
+
+
+def merge_island_fronts(
+    problem: SpatialOptimizationProblem,
+    fronts: Dict[int, Tuple[np.ndarray, np.ndarray, np.ndarray]],
+) -> Dict[str, np.ndarray]:
+    """
+    Merge island fronts into one non-dominated archive.
+
+    Islands may optimise different objective weights, so every candidate is
+    re-evaluated on the reference problem before non-dominated sorting.
+    Feasible solutions are preferred; if none exist the least infeasible
+    solutions are kept.
+    """
+    X_parts, origin_parts = [], []
+    for island_id, (X, _, _) in sorted(fronts.items()):
+        X = np.atleast_2d(X)
+        X_parts.append(X)
+        origin_parts.append(np.full(len(X), island_id, dtype=int))
+
+    if not X_parts:
+        empty = np.zeros((0, problem.n_var))
+        return {
+            "X": empty,
+            "F": np.zeros((0, problem.n_obj)),
+            "G": np.zeros((0, problem.n_ieq_constr)),
+            "island": np.zeros(0, dtype=int),
+        }
+
+    X_all = np.vstack(X_parts)
+    origin = np.concatenate(origin_parts)
+
+    F_all, G_all = [], []
+    for x in X_all:
+        out = {}
+        problem._evaluate(x, out)
+        F_all.append(out["F"])
+        G_all.append(out["G"])
+    F_all = np.array(F_all)
+    G_all = np.array(G_all)
+
+    cv = np.sum(np.maximum(0, G_all), axis=1)
+    feasible = cv <= 0
+    if np.any(feasible):
+        candidates = np.where(feasible)[0]
+    else:
+        candidates = np.where(cv <= cv.min())[0]
+
+    front = NonDominatedSorting().do(F_all[candidates], only_non_dominated_front=True)
+    keep = candidates[front]
+
+    # Drop exact duplicates that several islands may have converged to
+    _, unique_idx = np.unique(np.round(X_all[keep], 9), axis=0, return_index=True)
+    keep = keep[np.sort(unique_idx)]
+
+    return {"X": X_all[keep], "F": F_all[keep], "G": G_all[keep], "island": origin[keep]}
+
+
+# =============================================================================
+# ISLAND-MODEL RUNNER
+# =============================================================================
+
+
+class IslandHSAGARunner:
+    """
+    Island-model H-SAGA runner.
+
+    Runs ``n_islands`` H-SAGA instances in separate processes, exchanges
+    elite migrants through a shared directory and merges the island fronts
+    into a single archive evaluated on the reference problem.
+    """
+
+    def __init__(self, problem: SpatialOptimizationProblem, config: IslandModelConfig = None):
+        self.problem = problem
+        # Copy: islands and n_islands are filled in below
+        self.config = replace(config or IslandModelConfig())
+
+        if self.config.islands is None:
+            self.config.islands = make_island_configs(
+                self.config.n_islands,
+                self.config.hsaga,
+                dict(problem.goals),
+                weight_jitter=self.config.weight_jitter,
+                seed=self.config.hsaga.seed,
+            )
+        self.config.n_islands = len(self.config.islands)
+
+        # State
+        self.archive = None
+        self.island_stats: List[Dict[str, Any]] = []
+        self.stats = {
+            "n_islands": self.config.n_islands,
+            "total_evaluations": 0,
+            "total_time": 0,
+            "archive_size": 0,
+            "failed_islands": [],
+        }
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Run all islands and merge their fronts.
+
+        An island that raises is logged and listed in ``stats["failed_islands"]``;
+        the archive is merged from the remaining islands.
+
+        Returns:
+            Dict containing best solution, merged Pareto front and statistics
+        """
+        start_time = time.time()
+
+        if self.config.migration_dir is not None:
+            return self._run_islands(self.config.migration_dir, start_time)
+
+        migration_dir = tempfile.mkdtemp(prefix="hsaga_islands_")
+        try:
+            return self._run_islands(migration_dir, start_time)
+        finally:
+            shutil.rmtree(migration_dir, ignore_errors=True)
+
+    def _run_islands(self, migration_dir: str, start_time: float) -> Dict[str, Any]:
+        """Run the islands with migration through migration_dir and merge the fronts."""
+        self.stats["failed_islands"] = []
+        transport = DirectoryMigrationTransport(migration_dir)
+        transport.clear()
+
+        if self.config.verbose:
+            mode = "parallel (ProcessPool)" if self.config.parallel else "sequential"
+            print(f"\n{'='*60}")
+            print("ISLAND-MODEL H-SAGA")
+            print(f"{'='*60}")
+            print(f"Islands: {self.config.n_islands} ({mode})")
+            print(
+                f"Migration: {self.config.n_migrants} elites every "
+                f"{self.config.migration_interval} generations"
+            )
+            print(f"Migration dir: {migration_dir}")
+            print(f"{'='*60}\n")
+
+        results = []
+        if self.config.parallel and self.config.n_islands > 1:
+            max_workers = self.config.max_workers or self.config.n_islands
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        run_island_worker, self.problem, island, self.config, migration_dir
+                    ): island.island_id
+                    for island in self.config.islands
+                }
+
+                for future in as_completed(futures):
+                    island_id = futures[future]
+                    try:
+                        results.append(future.result())
+                    except Exception as e:
+                        self._record_failure(island_id, e)
+        else:
+            for island in self.config.islands:
+                try:
+                    results.append(
+                        run_island_worker(self.problem, island, self.config, migration_dir)
+                    )
+                except Exception as e:
+                    self._record_failure(island.island_id, e)
+
+        results.sort(key=lambda r: r["island_id"])
+        self.island_stats = results
+
+        if self.config.verbose:
+            for r in results:
+                print(
+                    f"  Island {r['island_id']}: front={r['front_size']} "
+                    f"migrants={r['migrants_received']} time={r['time']:.2f}s"
+                )
+
+        self.archive = merge_island_fronts(self.problem, transport.load_fronts())
+
+        self.stats["total_evaluations"] = sum(
+            r["sa_evaluations"] + r["ga_evaluations"] for r in results
+        )
+        self.stats["archive_size"] = len(self.archive["X"])
+        self.stats["total_time"] = time.time() - start_time
+        if self.config.hsaga.instrument:
+            timers = ComponentTimers(enabled=True)
+            for r in results:
+                timers.merge(r["components"])
+            self.stats["components"] = timers.summary()
+
+        if self.config.verbose:
+            print(
+                f"\nMerged archive: {self.stats['archive_size']} solutions "
+                f"in {self.stats['total_time']:.2f}s\n"
+            )
+
+        return self._build_result()
+
+    def _record_failure(self, island_id: int, error: Exception) -> None:
+        """Log a failed island; the run continues without it."""
+        logger.warning(f"Island {island_id} failed: {error}")
+        self.stats["failed_islands"].append(
+            {"island_id": island_id, "error": f"{type(error).__name__}: {error}"}
+        )
+
+    def _build_result(self) -> Dict[str, Any]:
+        """Build the final result dictionary (same shape as HSAGARunner)."""
+        result = {
+            "success": len(self.archive["X"]) > 0,
+            "stats": self.stats,
+            "islands": self.island_stats,
+        }
+
+        if result["success"]:
+            best = self.get_best_solution()
+            result["best_solution"] = best
+            result["pareto_front"] = {
+                "X": self.archive["X"],
+                "F": self.archive["F"],
+                "island": self.archive["island"],
+            }
+
+        return result
+
+    def get_best_solution(self) -> Optional[Dict[str, Any]]:
+        """Get the best compromise solution of the merged archive."""
+        if self.archive is None or len(self.archive["X"]) == 0:
+            return None
+
+        best_idx = np.argmin(np.sum(self.archive["F"], axis=1))
+        best_x = self.archive["X"][best_idx]
+        genes, polygons = self.problem.decode_solution(best_x)
+
+        return {
+            "x": best_x,
+            "F": self.archive["F"][best_idx],
+            "genes": genes,
+            "polygons": polygons,
+            "island": int(self.archive["island"][best_idx]),
+        }
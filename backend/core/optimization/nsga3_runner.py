@@ -14,9 +14,12 @@ from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
+from pymoo.core.problem import ElementwiseProblem
 
+from backend.core.optimization.async_nsga3 import AsyncNSGA3Config, AsyncSteadyStateNSGA3
 from src.algorithms import Building, ObjectiveProfile, ProfileType, get_profile
 from src.algorithms.nsga3 import NSGA3
+from src.algorithms.solution import Solution
 
 logger = logging.getLogger(__name__)
 
@@ -47,11 +50,57 @@ class NSGA3RunnerConfig:
     # Objective configuration
     objective_profile: Optional[Union[ObjectiveProfile, ProfileType, str]] = None
 
+    # Steady-state mode (asynchronous evaluation, no generation barrier)
+    steady_state: bool = False
+    n_workers: int = 0  # 0 = one evaluation worker per CPU core
+
     # Performance
     seed: Optional[int] = 42
     verbose: bool = True
 
 
+# =============================================================================
+# PROBLEM ADAPTER (for the steady-state engine)
+# =============================================================================
+
+
+class FitnessEvaluatorProblem(ElementwiseProblem):
+    """
+    Expose a src FitnessEvaluator as a pymoo problem.
+
+    Decision vector: [x_0, y_0, x_1, y_1, ...] in building order. The
+    evaluator's objectives are maximized, so they are negated for pymoo.
+    """
+
+    def __init__(
+        self, evaluator, buildings: List[Building], bounds: Tuple[float, float, float, float]
+    ):
+        self.evaluator = evaluator
+        self.building_ids = [b.id for b in buildings]
+        self.objective_names = evaluator.get_objective_names()
+
+        x_min, y_min, x_max, y_max = bounds
+        n = len(buildings)
+        super().__init__(
+            n_var=2 * n,
+            n_obj=len(self.objective_names),
+            xl=np.tile([x_min, y_min], n),
+            xu=np.tile([x_max, y_max], n),
+        )
+
+    def to_solution(self, x: np.ndarray) -> Solution:
+        """Convert a decision vector into a Solution."""
+        coords = np.asarray(x, dtype=float).reshape(-1, 2)
+        positions = {
+            bid: (float(cx), float(cy)) for bid, (cx, cy) in zip(self.building_ids, coords)
+        }
+        return Solution(positions=positions)
+
+    def _evaluate(self, x, out, *args, **kwargs):
+        detailed = self.evaluator.evaluate_detailed(self.to_solution(x))
+        out["F"] = -np.array([detailed[name] for name in self.objective_names])
+
+
 # =============================================================================
 # NSGA-III RUNNER
 # =============================================================================
@@ -188,7 +237,10 @@ class NSGA3Runner:
         start_time = time.time()
 
         # Run optimization
-        result = self.optimizer.optimize()
+        if self.config.steady_state:
+            result = self._run_steady_state()
+        else:
+            result = self.optimizer.optimize()
 
         runtime = time.time() - start_time
 
@@ -206,6 +258,52 @@ class NSGA3Runner:
 
         return result
 
+    def _run_steady_state(self) -> Dict[str, Any]:
+        """
+        Run the asynchronous steady-state NSGA-III.
+
+        Uses the same reference points and evaluator as the generational
+        optimizer and returns a result dict with the same keys.
+        """
+        problem = FitnessEvaluatorProblem(self.optimizer.evaluator, self.buildings, self.bounds)
+        engine = AsyncSteadyStateNSGA3(
+            problem,
+            AsyncNSGA3Config(
+                pop_size=self.config.population_size,
+                max_evaluations=self.config.population_size * (self.config.n_generations + 1),
+                n_workers=self.config.n_workers,
+                crossover_prob=self.config.crossover_rate,
+                mutation_prob=self.config.mutation_rate,
+                seed=self.config.seed,
+                verbose=self.config.verbose,
+            ),
+            ref_dirs=self.optimizer.reference_points,
+        )
+        async_result = engine.run()
+
+        def to_solutions(X: np.ndarray, F: np.ndarray) -> List[Solution]:
+            solutions = []
+            for x, f in zip(X, F):
+                solution = problem.to_solution(x)
+                solution.fitness = self.optimizer.evaluator.evaluate(solution)
+                # evaluate() stores a dict; NSGA-III results carry the array
+                solution.objectives = -f
+                solutions.append(solution)
+            return solutions
+
+        return {
+            "pareto_front": to_solutions(async_result.X, async_result.F),
+            "population": to_solutions(async_result.pop_X, async_result.pop_F),
+            "pareto_objectives": -async_result.F,
+            "reference_points": self.optimizer.reference_points,
+            "statistics": {
+                "evaluations": async_result.n_eval,
+                "generations": self.config.n_generations,
+                "worker_utilisation": async_result.stats["worker_utilisation"],
+            },
+            "convergence": {},
+        }
+
     def _find_best_compromise(self, result: Dict[str, Any]) -> Dict[str, Any]:
         """
         Find best compromise solution from Pareto front.
@@ -7,7 +7,7 @@ Multi-objective optimization objectives for campus spatial planning.
 Modules:
     - accessibility: 2SFCA spatial accessibility
     - adjacency_qap: QAP-based building adjacency with explainability
-    - connectivity: Kansky network connectivity
+    - connectivity: Kansky network connectivity, in-loop road access
     - gateway_connectivity: Gateway access optimization
 """
 
@@ -18,7 +18,7 @@ from .adjacency_qap import (
     get_adjacency_weight,
     maximize_adjacency_satisfaction,
 )
-from .connectivity import maximize_network_connectivity
+from .connectivity import RoadAccessObjective, maximize_network_connectivity
 
 __all__ = [
     # Accessibility
@@ -30,4 +30,5 @@ __all__ = [
     "get_adjacency_report",
     # Connectivity
     "maximize_network_connectivity",
+    "RoadAccessObjective",
 ]
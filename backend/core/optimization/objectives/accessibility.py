@@ -14,19 +14,21 @@ References:
 Created: 2026-01-01
 """
 
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
 
 from backend.core.metrics.accessibility import calculate_accessibility_scores
 
 if TYPE_CHECKING:
     from backend.core.optimization.building import Building
     from backend.core.optimization.solution import Solution
+    from src.algorithms.network_distance import RoadNetworkDistances
 
 
 def maximize_accessibility(
     solution: "Solution",
     buildings: List["Building"],
     catchment_radius: float = 400.0,
+    network: Optional["RoadNetworkDistances"] = None,
 ) -> float:
     """
     Maximize campus-wide spatial accessibility using 2SFCA.
@@ -37,6 +39,8 @@ def maximize_accessibility(
         solution: Solution with building positions
         buildings: List of Building objects
         catchment_radius: Maximum walkable distance (meters, default: 400m)
+        network: Road-network distances (see road_network_distances()); when
+            given, walking distance follows the roads instead of straight lines
 
     Returns:
         Accessibility score [0, 1] where 1 = perfect accessibility
@@ -60,6 +64,7 @@ def maximize_accessibility(
     scores = calculate_accessibility_scores(
         positioned_buildings,
         catchment_radius=catchment_radius,
+        network=network,
     )
 
     if not scores:
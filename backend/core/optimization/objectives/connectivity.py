@@ -9,6 +9,9 @@ This objective ensures the generated road network has good topology:
 - Efficient average road length
 - High connectivity ratio
 
+RoadAccessObjective is the in-loop counterpart: vectorized point-to-segment
+distances from buildings to a fixed road-segment array, cached per building.
+
 References:
     - Kansky, K. J. (1963): Structure of transportation networks
     - Research: "Campus Planning Standards"
@@ -19,6 +22,8 @@ Created: 2026-01-01
 from typing import TYPE_CHECKING, Dict, List
 
 import numpy as np
+import shapely
+from shapely.geometry import Polygon
 
 from backend.core.metrics.connectivity import (
     calculate_network_connectivity,
@@ -109,77 +114,233 @@ def penalize_disconnected_buildings(
     if not all_roads:
         return 1.0
 
-    # Check each building's distance to nearest road
-    disconnected_count = 0
+    if len(buildings) == 0:
+        return 0.0
 
-    for building in buildings:
-        if building.id not in solution.positions:
-            continue
+    # Distance from each placed building to its nearest road segment
+    positions = [
+        solution.positions[building.id]
+        for building in buildings
+        if building.id in solution.positions
+    ]
+    distances = nearest_road_distances(positions, road_segment_array(all_roads))
 
-        bx, by = solution.positions[building.id]
+    # Calculate penalty ratio
+    disconnected_count = int(np.count_nonzero(distances > max_distance_to_road))
+    penalty = disconnected_count / len(buildings)
 
-        # Find minimum distance to any road
-        min_distance = float("inf")
+    return float(penalty)
 
-        for road in all_roads:
-            if len(road) < 2:
-                continue
 
-            # Calculate distance to road polyline
-            for i in range(len(road) - 1):
-                p1 = road[i]
-                p2 = road[i + 1]
+def road_segment_array(roads: List) -> np.ndarray:
+    """
+    Flatten road polylines into a segment array.
 
-                # Distance from point to line segment
-                distance = _point_to_segment_distance((bx, by), p1, p2)
-                min_distance = min(min_distance, distance)
+    Args:
+        roads: Road polylines as (N, 2) arrays or LineStrings
 
-        # Check if building is disconnected
-        if min_distance > max_distance_to_road:
-            disconnected_count += 1
+    Returns:
+        Segment endpoints (S, 4) as [x1, y1, x2, y2]
+    """
+    segments = []
+    for road in roads:
+        coords = np.asarray(road.coords if hasattr(road, "coords") else road, dtype=float)
+        if coords.ndim != 2 or len(coords) < 2:
+            continue
+        coords = coords[:, :2]
+        segments.append(np.hstack([coords[:-1], coords[1:]]))
 
-    # Calculate penalty ratio
-    if len(buildings) == 0:
-        return 0.0
+    if not segments:
+        return np.zeros((0, 4))
+    return np.vstack(segments)
 
-    penalty = disconnected_count / len(buildings)
 
-    return float(penalty)
+def point_to_segment_distances(points: np.ndarray, segments: np.ndarray) -> np.ndarray:
+    """
+    Distance from every point to every segment.
 
+    Args:
+        points: (N, 2) query points
+        segments: (S, 4) segment endpoints from road_segment_array()
 
-def _point_to_segment_distance(point, seg_start, seg_end) -> float:
+    Returns:
+        Distance matrix (N, S) in coordinate units
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    start = segments[:, :2]
+    delta = segments[:, 2:] - start
+    length_sq = np.einsum("ij,ij->i", delta, delta)
+
+    # Projection parameter t clamped to the segment; zero-length segments use t = 0
+    rel = points[:, None, :] - start[None, :, :]
+    t = np.divide(
+        np.einsum("nsk,sk->ns", rel, delta),
+        length_sq,
+        out=np.zeros((len(points), len(segments))),
+        where=length_sq >= 1e-10,
+    )
+    np.clip(t, 0.0, 1.0, out=t)
+
+    offset = rel - t[:, :, None] * delta[None, :, :]
+    return np.hypot(offset[..., 0], offset[..., 1])
+
+
+def nearest_road_distances(
+    points: np.ndarray,
+    segments: np.ndarray,
+    max_pairs: int = 1_000_000,
+) -> np.ndarray:
     """
-    Calculate minimum distance from point to line segment.
+    Distance from each point to its nearest road segment.
+
+    Points are processed in blocks so the (block, S) distance matrix stays
+    small for large segment arrays.
 
     Args:
-        point: (x, y) tuple
-        seg_start: (x, y) tuple
-        seg_end: (x, y) tuple
+        points: (N, 2) query points
+        segments: (S, 4) segment endpoints from road_segment_array()
+        max_pairs: Maximum point-segment pairs per block
 
     Returns:
-        Minimum distance in same units as coordinates
+        Distances (N,), inf if there are no segments
     """
-    px, py = point
-    x1, y1 = seg_start
-    x2, y2 = seg_end
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    if len(segments) == 0:
+        return np.full(len(points), np.inf)
+
+    distances = np.empty(len(points))
+    rows = max(1, max_pairs // len(segments))
+    for i in range(0, len(points), rows):
+        block = point_to_segment_distances(points[i : i + rows], segments)
+        distances[i : i + rows] = block.min(axis=1)
+    return distances
 
-    # Vector from seg_start to seg_end
-    dx = x2 - x1
-    dy = y2 - y1
 
-    # If segment has zero length, return distance to point
-    seg_length_sq = dx * dx + dy * dy
-    if seg_length_sq < 1e-10:
-        return np.sqrt((px - x1) ** 2 + (py - y1) ** 2)
+class RoadAccessObjective:
+    """
+    In-loop road connectivity objective against a fixed road network.
+
+    Scores how close buildings sit to the (existing) road network so that
+    layouts are optimized for road access instead of being connected only
+    after optimization.
 
-    # Calculate projection parameter t
-    t = max(0, min(1, ((px - x1) * dx + (py - y1) * dy) / seg_length_sq))
+    Formula:
+        score = 1 / (1 + mean_distance_to_road / max_distance_to_road)
 
-    # Find closest point on segment
-    closest_x = x1 + t * dx
-    closest_y = y1 + t * dy
+    Score range: (0, 1], higher is better.
 
-    # Distance to closest point
-    distance = np.sqrt((px - closest_x) ** 2 + (py - closest_y) ** 2)
+    Road segments are stacked into one array once. Nearest-road distances
+    are cached per building slot and recomputed only for buildings whose
+    centroid moved since the previous call, which is the common case for
+    SA perturbations and GA mutations.
+
+    Example:
+        >>> objective = RoadAccessObjective(existing_road_lines, max_distance_to_road=80.0)
+        >>> score = objective.calculate(polygons)
+        >>> share_far = objective.disconnected_fraction(polygons)
+    """
 
-    return float(distance)
+    def __init__(
+        self,
+        roads: List,
+        max_distance_to_road: float = 100.0,
+        position_tolerance: float = 1e-6,
+    ):
+        """
+        Initialize road access objective.
+
+        Args:
+            roads: Road polylines as (N, 2) arrays or LineStrings
+            max_distance_to_road: Distance (meters) at which a building counts
+                as disconnected; also the normalization scale
+            position_tolerance: Centroid movement below which the cached
+                distance is reused
+
+        Raises:
+            ValueError: If there are no road segments or the scale is not positive
+        """
+        if max_distance_to_road <= 0:
+            raise ValueError("max_distance_to_road must be positive")
+
+        self.segments = road_segment_array(roads)
+        if len(self.segments) == 0:
+            raise ValueError("Road network has no segments")
+
+        self.max_distance_to_road = max_distance_to_road
+        self.position_tolerance = position_tolerance
+
+        # Per-building-slot cache of the last evaluated layout
+        self._points = np.zeros((0, 2))
+        self._distances = np.zeros(0)
+
+        self.stats = {"calls": 0, "distances_computed": 0}
+
+    def __getstate__(self):
+        # Caches are per process; workers start with an empty cache
+        state = self.__dict__.copy()
+        state["_points"] = np.zeros((0, 2))
+        state["_distances"] = np.zeros(0)
+        return state
+
+    def distances(self, points: np.ndarray) -> np.ndarray:
+        """
+        Nearest-road distance per building, updating only moved buildings.
+
+        Args:
+            points: (N, 2) building centroids, one row per building slot
+
+        Returns:
+            Distances (N,) in meters
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        self.stats["calls"] += 1
+
+        if len(points) != len(self._points):
+            moved = np.arange(len(points))
+            self._distances = np.empty(len(points))
+        else:
+            moved = np.flatnonzero(
+                np.any(np.abs(points - self._points) > self.position_tolerance, axis=1)
+            )
+
+        if len(moved):
+            self._distances[moved] = nearest_road_distances(points[moved], self.segments)
+            self.stats["distances_computed"] += len(moved)
+        self._points = points.copy()
+
+        return self._distances.copy()
+
+    def _centroids(self, buildings: List[Polygon]) -> np.ndarray:
+        geoms = np.empty(len(buildings), dtype=object)
+        geoms[:] = buildings
+        return shapely.get_coordinates(shapely.centroid(geoms))
+
+    def calculate(self, buildings: List[Polygon]) -> float:
+        """
+        Road access score for a layout.
+
+        Args:
+            buildings: Building footprints
+
+        Returns:
+            Score in (0, 1], 1 = every building on a road
+        """
+        if not buildings:
+            return 0.0
+        distances = self.distances(self._centroids(buildings))
+        return float(1.0 / (1.0 + np.mean(distances) / self.max_distance_to_road))
+
+    def disconnected_fraction(self, buildings: List[Polygon]) -> float:
+        """
+        Share of buildings farther than max_distance_to_road from any road.
+
+        Args:
+            buildings: Building footprints
+
+        Returns:
+            Fraction in [0, 1]
+        """
+        if not buildings:
+            return 0.0
+        distances = self.distances(self._centroids(buildings))
+        return float(np.mean(distances > self.max_distance_to_road))
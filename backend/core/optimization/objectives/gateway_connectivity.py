@@ -4,11 +4,13 @@ Gateway Connectivity Objective
 Binaların gateway'lere erişimini optimize eder.
 """
 
-from typing import List
+from typing import List, Optional
+
 import numpy as np
 from shapely.geometry import Point, Polygon
 
 from backend.core.domain.models.campus import Gateway
+from src.algorithms.network_distance import RoadNetworkDistances
 
 
 class GatewayConnectivityObjective:
@@ -28,7 +30,13 @@ class GatewayConnectivityObjective:
     - Consistent scoring across all generations
     """
 
-    def __init__(self, gateways: List[Gateway], boundary: Polygon, weight: float = 1.0):
+    def __init__(
+        self,
+        gateways: List[Gateway],
+        boundary: Polygon,
+        weight: float = 1.0,
+        network: Optional[RoadNetworkDistances] = None,
+    ):
         """
         Initialize gateway connectivity objective.
 
@@ -36,6 +44,8 @@ class GatewayConnectivityObjective:
             gateways: Kampüsteki gateway listesi
             boundary: Kampüs sınırı (normalize için gerekli)
             weight: Objective weight (default: 1.0)
+            network: Yol ağı mesafeleri; verilirse bina-gateway mesafesi
+                kuş uçuşu yerine yol ağı üzerindeki en kısa yoldan ölçülür
 
         Note:
             Boundary is required for consistent normalization across
@@ -45,6 +55,14 @@ class GatewayConnectivityObjective:
         self.gateways = gateways
         self.boundary = boundary
         self.weight = weight
+        self.network = network
+
+        # Gateway positions; the network distance field is computed once here
+        self.gateway_points = np.array(
+            [(gw.location.x, gw.location.y) for gw in gateways], dtype=float
+        ).reshape(-1, 2)
+        if network is not None and gateways:
+            network.distance_field(self.gateway_points)
 
         # Pre-calculate campus dimension (immutable across generations)
         minx, miny, maxx, maxy = boundary.bounds
@@ -80,16 +98,22 @@ class GatewayConnectivityObjective:
         if not buildings or not self.gateways:
             return 0.0
 
+        if self.network is not None:
+            # Snap to the road graph; gateway distance field is precomputed
+            centroids = np.array([(b.centroid.x, b.centroid.y) for b in buildings])
+            distances = self.network.distance_to_nearest(centroids, self.gateway_points)
+            # Buildings on disconnected road fragments count as two campus widths away
+            distances = np.minimum(distances, self.max_dimension * 2)
+            avg_distance = float(np.mean(distances))
+            return self.weight / (1.0 + avg_distance / self.max_dimension)
+
         total_min_distance = 0.0
 
         for building in buildings:
             building_centroid = building.centroid
 
             # En yakın gateway'i bul
-            min_distance = min(
-                building_centroid.distance(gw.location)
-                for gw in self.gateways
-            )
+            min_distance = min(building_centroid.distance(gw.location) for gw in self.gateways)
 
             total_min_distance += min_distance
 
@@ -126,10 +150,7 @@ class GatewayConnectivityObjective:
 
         building_centroid = building.centroid
 
-        closest_gateway = min(
-            self.gateways,
-            key=lambda gw: building_centroid.distance(gw.location)
-        )
+        closest_gateway = min(self.gateways, key=lambda gw: building_centroid.distance(gw.location))
 
         return closest_gateway
 
@@ -158,7 +179,9 @@ class GatewayConnectivityObjective:
         return distribution
 
     def __repr__(self):
-        return (f"GatewayConnectivityObjective("
-                f"gateways={len(self.gateways)}, "
-                f"max_dimension={self.max_dimension:.1f}, "
-                f"weight={self.weight})")
+        return (
+            f"GatewayConnectivityObjective("
+            f"gateways={len(self.gateways)}, "
+            f"max_dimension={self.max_dimension:.1f}, "
+            f"weight={self.weight})"
+        )
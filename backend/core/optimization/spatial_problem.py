@@ -46,6 +46,8 @@ from backend.core.terrain.elevation import DEMSampler, SlopeCalculator
 from backend.core.domain.models.campus import Gateway
 from backend.core.optimization.constraints.gateway_clearance import GatewayClearanceConstraint
 from backend.core.optimization.objectives.gateway_connectivity import GatewayConnectivityObjective
+from backend.core.optimization.objectives.connectivity import RoadAccessObjective
+from backend.core.optimization.instrumentation import ComponentTimers
 
 
 # =============================================================================
@@ -381,7 +383,10 @@ class ObjectiveCalculator:
         latitude: float = 41.38,
         wind_data: WindVector = None,
         gateways: Optional[List[Gateway]] = None,
-        gateway_connectivity_weight: float = 1.0
+        gateway_connectivity_weight: float = 1.0,
+        road_geometries: Optional[List[LineString]] = None,
+        road_connectivity_weight: float = 0.0,
+        max_distance_to_road: float = 100.0,
     ):
         self.boundary = boundary
         self.goals = optimization_goals
@@ -409,6 +414,15 @@ class ObjectiveCalculator:
                 boundary=self.boundary,
                 weight=self.gateway_connectivity_weight
             )
+
+        # Road access against the fixed (existing) road network, in-loop
+        self.road_connectivity_weight = road_connectivity_weight
+        self.road_objective = None
+        if road_connectivity_weight > 0 and road_geometries:
+            self.road_objective = RoadAccessObjective(
+                road_geometries,
+                max_distance_to_road=max_distance_to_road,
+            )
     
     def compactness(self, genes: List[BuildingGene]) -> float:
         """Calculate compactness penalty (spread-out layouts are bad)."""
@@ -510,6 +524,18 @@ class ObjectiveCalculator:
         # Convert to minimization (lower is better)
         return 1.0 - connectivity_score
 
+    def road_connectivity(self, polygons: List[Polygon]) -> float:
+        """
+        Calculate road access penalty against the existing road network.
+
+        Lower is better (buildings close to roads). Only moved buildings
+        are re-measured between calls.
+        """
+        if not self.road_objective:
+            return 0.0
+
+        return self.road_connectivity_weight * (1.0 - self.road_objective.calculate(polygons))
+
 
 # =============================================================================
 # SPATIAL OPTIMIZATION PROBLEM (Phase 8 Updated)
@@ -526,6 +552,7 @@ class SpatialOptimizationProblem(ElementwiseProblem):
         F[1]: Adjacency penalty
         F[2]: Wind blockage penalty (Phase 7)
         F[3]: Solar access penalty (Phase 7)
+        (+ gateway connectivity if gateways, + road access if road_connectivity_weight > 0)
     
     Constraints (satisfied when <= 0):
         G[0]: Boundary violation
@@ -550,6 +577,9 @@ class SpatialOptimizationProblem(ElementwiseProblem):
         gateway_clearance_radius: float = 50.0,
         gateway_clearance_directional: bool = True,
         gateway_connectivity_weight: float = 1.0,
+        road_connectivity_weight: float = 0.0,
+        max_distance_to_road: float = 100.0,
+        instrument: bool = False,
         **kwargs
     ):
         """
@@ -569,6 +599,11 @@ class SpatialOptimizationProblem(ElementwiseProblem):
             gateway_clearance_radius: Clearance radius around gateways (Sprint 3)
             gateway_clearance_directional: Use directional clearance zones (Sprint 3)
             gateway_connectivity_weight: Weight for gateway connectivity objective (Sprint 3)
+            road_connectivity_weight: Weight for the in-loop road access objective
+                against context.existing_roads (0 = disabled)
+            max_distance_to_road: Road access normalization distance (meters)
+            instrument: Record per-component time and call counts of
+                _evaluate in ``self.timers`` (off by default)
         """
         self.context = context
         self.building_counts = building_counts
@@ -580,6 +615,7 @@ class SpatialOptimizationProblem(ElementwiseProblem):
         self.gateway_clearance_radius = gateway_clearance_radius
         self.gateway_clearance_directional = gateway_clearance_directional
         self.gateway_connectivity_weight = gateway_connectivity_weight
+        self.timers = ComponentTimers(enabled=instrument)
         
         # Default goals with physics
         default_goals = {
@@ -634,7 +670,10 @@ class SpatialOptimizationProblem(ElementwiseProblem):
             latitude=lat,
             wind_data=wind_data,
             gateways=self.gateways,
-            gateway_connectivity_weight=self.gateway_connectivity_weight
+            gateway_connectivity_weight=self.gateway_connectivity_weight,
+            road_geometries=road_geoms,
+            road_connectivity_weight=road_connectivity_weight,
+            max_distance_to_road=max_distance_to_road,
         )
         
         # Problem dimensions (Phase 8: 5 constraints, Sprint 3: +1 gateway constraint, +1 gateway objective)
@@ -642,6 +681,8 @@ class SpatialOptimizationProblem(ElementwiseProblem):
         n_obj = 4   # Compactness, Adjacency, Wind, Solar
         if self.gateways:
             n_obj += 1  # Sprint 3: +Gateway connectivity
+        if self.objective_calc.road_objective:
+            n_obj += 1  # +Road access
         n_ieq_constr = 5 if enable_regulatory else 4  # +Slope for Phase 8
         if self.gateways:
             n_ieq_constr += 1  # Sprint 3: +Gateway clearance
@@ -670,6 +711,9 @@ class SpatialOptimizationProblem(ElementwiseProblem):
         
         Phase 8: Evaluates 4 objectives + 5 constraints.
         """
+        timers = self.timers
+        t = timers.clock()
+
         # Decode to genes and polygons
         genes = array_to_genome(x, self.num_buildings)
         
@@ -678,36 +722,53 @@ class SpatialOptimizationProblem(ElementwiseProblem):
             gene.type_id = self.type_sequence[i]
         
         polygons = decode_all_to_polygons(genes)
+        t = timers.lap("decode", t)
         
         # Calculate constraints (Phase 8: regulatory enhanced)
         g_boundary = self.constraint_calc.boundary_violation(polygons)
+        t = timers.lap("constraint.boundary", t)
         g_overlap = self.constraint_calc.overlap_violation(polygons)
+        t = timers.lap("constraint.overlap", t)
         
         if self.enable_regulatory:
             # Phase 8: Use enhanced constraint methods
             g_setback = self.constraint_calc.dynamic_setback_violation(polygons)
+            t = timers.lap("constraint.setback", t)
             g_separation = self.constraint_calc.fire_separation_violation(polygons, genes)
+            t = timers.lap("constraint.fire_separation", t)
             g_slope = self.constraint_calc.slope_violation(polygons)
+            t = timers.lap("constraint.slope", t)
         else:
             # Legacy: Use simple methods
             g_setback = self.constraint_calc.setback_violation(polygons)
+            t = timers.lap("constraint.setback", t)
             g_separation = self.constraint_calc.separation_violation(polygons)
+            t = timers.lap("constraint.separation", t)
             g_slope = 0.0
 
         # Sprint 3: Gateway clearance constraint
         g_gateway = self.constraint_calc.gateway_clearance_violation(polygons)
+        t = timers.lap("constraint.gateway_clearance", t)
 
         # Calculate objectives
         f_compactness = self.objective_calc.compactness(genes)
+        t = timers.lap("objective.compactness", t)
         f_adjacency = self.objective_calc.adjacency(genes)
+        t = timers.lap("objective.adjacency", t)
         f_wind = self.objective_calc.wind_comfort(genes, polygons)
+        t = timers.lap("objective.wind_comfort", t)
         f_solar = self.objective_calc.solar_gain(genes, polygons)
+        t = timers.lap("objective.solar_gain", t)
         f_gateway = self.objective_calc.gateway_connectivity(polygons)
+        t = timers.lap("objective.gateway_connectivity", t)
 
         # Build objective array (Sprint 3: conditionally add gateway)
         objectives = [f_compactness, f_adjacency, f_wind, f_solar]
         if self.gateways:
             objectives.append(f_gateway)
+        if self.objective_calc.road_objective:
+            objectives.append(self.objective_calc.road_connectivity(polygons))
+            timers.lap("objective.road_connectivity", t)
 
         out["F"] = np.array(objectives)
 
@@ -739,6 +800,8 @@ class SpatialOptimizationProblem(ElementwiseProblem):
         names = ["compactness", "adjacency", "wind_comfort", "solar_gain"]
         if self.gateways:
             names.append("gateway_connectivity")
+        if self.objective_calc.road_objective:
+            names.append("road_connectivity")
         return names
     
     def get_constraint_names(self) -> List[str]:
@@ -34,7 +34,10 @@ from backend.core.physics.wind import WindDataFetcher, WindData
 from backend.core.constraints.manual_constraints import ManualConstraintManager
 
 # Sprint 3: Gateway road generation
-from backend.core.domain.geometry.gateway_roads import GatewayRoadNetwork
+from backend.core.domain.geometry.incremental_roads import (
+    IncrementalGatewayRoadNetwork,
+    RoadNetworkDiff,
+)
 from backend.core.domain.geometry.gateway_parser import parse_gateways_from_geojson
 
 # NEW: Phase 6 Engine imports
@@ -110,6 +113,12 @@ class PipelineResult:
     # Export
     geojson: Optional[Dict[str, Any]]
     
+    # Optimizer run statistics (HSAGARunner.stats)
+    optimizer_stats: Optional[Dict[str, Any]] = None
+
+    # Per-component evaluation timings (PipelineConfig.instrument)
+    instrumentation: Optional[Dict[str, Any]] = None
+
     def _sanitize_float(self, value: float) -> Optional[float]:
         """Ensure float is JSON compliant (no NaN/Inf)."""
         if value is None:
@@ -157,6 +166,9 @@ class PipelineResult:
                 "num_suggestions": len(getattr(self.critique, 'suggestions', []))
             }
         
+        if self.instrumentation:
+            result["instrumentation"] = self.instrumentation
+
         return result
     
     def _count_types(self) -> Dict[str, int]:
@@ -217,6 +229,7 @@ class PipelineConfig:
     
     # Performance
     verbose: bool = True
+    instrument: bool = False  # Per-component evaluation timers in the result
 
 
 # =============================================================================
@@ -261,6 +274,7 @@ class OptimizationPipeline:
         # Sprint 3: Gateway roads
         self.gateways: List = []
         self.roads: List[LineString] = []
+        self.road_network: Optional[IncrementalGatewayRoadNetwork] = None
     
     def _sanitize_float(self, value: float) -> Optional[float]:
         """Ensure float is JSON compliant (no NaN/Inf)."""
@@ -413,7 +427,9 @@ class OptimizationPipeline:
                 best_genes=best_genes,
                 best_polygons=best_polygons,
                 critique=critique_result,
-                geojson=geojson
+                geojson=geojson,
+                optimizer_stats=dict(self.runner.stats),
+                instrumentation=self.runner.stats.get("components")
             )
             
         except Exception as e:
@@ -584,7 +600,8 @@ class OptimizationPipeline:
             sa_fraction=self.config.sa_fraction,
             population_size=self.config.population_size,
             verbose=self.config.verbose,
-            seed=42
+            seed=42,
+            instrument=self.config.instrument
         )
         
         # Run NEW engine
@@ -668,21 +685,41 @@ class OptimizationPipeline:
 
         self._log(f"Generating road network for {len(self.gateways)} gateways...")
 
-        network = GatewayRoadNetwork(
-            gateways=self.gateways,
-            min_road_length=10.0
-        )
-
-        self.roads = network.generate(
-            buildings=buildings,
-            use_mst=True,
-            avoid_building_intersections=False
-        )
+        self.update_roads(buildings)
 
         if self.config.verbose:
             total_length = sum(road.length for road in self.roads)
             self._log(f"Generated {len(self.roads)} road segments ({total_length:.1f}m total)")
 
+    def update_roads(
+        self, buildings: List[Polygon], building_ids: Optional[List] = None
+    ) -> RoadNetworkDiff:
+        """
+        Update the gateway road network for a new building layout.
+
+        The network is kept between calls, so re-running it after moving,
+        adding or removing a few buildings only rebuilds the affected road
+        segments (interactive editing).
+
+        Args:
+            buildings: List of building polygons
+            building_ids: Stable id per building (default: list position)
+
+        Returns:
+            RoadNetworkDiff with the added, changed and removed road segments
+        """
+        if self.road_network is None or self.road_network.gateways is not self.gateways:
+            self.road_network = IncrementalGatewayRoadNetwork(
+                gateways=self.gateways,
+                min_road_length=10.0,
+                use_mst=True,
+                avoid_building_intersections=False,
+            )
+
+        diff = self.road_network.update(buildings, building_ids)
+        self.roads = diff.roads
+        return diff
+
     def _export(self, callback: callable) -> Dict[str, Any]:
         """Stage 6: Export results as GeoJSON (WGS84 Converted)."""
         self.current_stage = PipelineStage.EXPORTING
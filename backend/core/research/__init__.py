@@ -7,10 +7,13 @@ Supports Sprint A1+ research integration efforts.
 
 from .benchmark import BenchmarkResult, BenchmarkRunner
 from .experiment_tracker import ExperimentConfig, ExperimentTracker
+from .parallel import BenchmarkTask, run_tasks
 
 __all__ = [
     "ExperimentTracker",
     "ExperimentConfig",
     "BenchmarkRunner",
     "BenchmarkResult",
+    "BenchmarkTask",
+    "run_tasks",
 ]
@@ -23,6 +23,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Callable, Dict, List
 
+from .parallel import BenchmarkTask, run_tasks
+
 logger = logging.getLogger(__name__)
 
 
@@ -38,6 +40,8 @@ class BenchmarkConfig:
         max_evaluations: Budget for each run
         parameters: Algorithm-specific parameters
         metrics: Metrics to track (hypervolume, runtime, etc.)
+        n_workers: Parallel worker processes for the runs (1 = sequential)
+        resume: Continue an interrupted benchmark from its partial results
     """
 
     problem_name: str
@@ -46,6 +50,8 @@ class BenchmarkConfig:
     max_evaluations: int = 10000
     parameters: Dict[str, Any] = field(default_factory=dict)
     metrics: List[str] = field(default_factory=lambda: ["hypervolume", "runtime_s", "convergence"])
+    n_workers: int = 1
+    resume: bool = True
 
 
 @dataclass
@@ -138,46 +144,74 @@ class BenchmarkRunner:
         Args:
             config: Benchmark configuration
             optimization_fn: Function that runs optimization and returns metrics
+                (a module-level function when ``config.n_workers > 1``)
 
         Returns:
             Aggregated benchmark results
         """
         logger.info(
             f"Starting benchmark: {config.algorithm} on {config.problem_name} "
-            f"({config.num_runs} runs)"
+            f"({config.num_runs} runs, {config.n_workers} workers)"
         )
 
-        all_runs = []
-
-        for run_idx in range(config.num_runs):
-            logger.info(f"  Run {run_idx + 1}/{config.num_runs}")
-
-            start_time = time.time()
-
-            try:
-                # Run optimization
-                run_metrics = optimization_fn(config.parameters)
+        # Finished runs are streamed here so an interrupted benchmark can resume
+        partial_path = self._partial_path(config)
+        tasks = [
+            BenchmarkTask(f"run{run_idx}", _run_once, (optimization_fn, config.parameters))
+            for run_idx in range(config.num_runs)
+        ]
 
-                # Add runtime
-                run_metrics["runtime_s"] = time.time() - start_time
+        def log_run(record: Dict[str, Any]) -> None:
+            logger.info(f"  Finished {record['key']} ({record['wall_time_s']:.1f}s)")
 
-                all_runs.append(run_metrics)
+        records = run_tasks(
+            tasks,
+            n_workers=config.n_workers,
+            results_path=partial_path,
+            resume=config.resume,
+            on_record=log_run,
+            config=self._run_settings(config, optimization_fn),
+        )
 
-            except Exception as e:
-                logger.error(f"Run {run_idx + 1} failed: {e}")
+        all_runs = []
+        for task in tasks:
+            record = records[task.key]
+            if record["error"] is not None:
                 # Add failed run with zero metrics
                 all_runs.append({metric: 0.0 for metric in config.metrics})
+                continue
+            run_metrics = dict(record["result"])
+            run_metrics["peak_rss_mb"] = record["peak_rss_mb"]
+            all_runs.append(run_metrics)
 
         # Aggregate results
         result = self._aggregate_results(config, all_runs)
 
         # Save results
         self._save_result(result)
+        partial_path.unlink(missing_ok=True)
 
         logger.info(f"Benchmark complete:\n{result.summary()}")
 
         return result
 
+    def _partial_path(self, config: BenchmarkConfig) -> Path:
+        """JSONL file holding the finished runs of an in-progress benchmark."""
+        return self.output_dir / f"{config.problem_name}_{config.algorithm}.partial.jsonl"
+
+    @staticmethod
+    def _run_settings(config: BenchmarkConfig, optimization_fn: Callable) -> Dict[str, Any]:
+        """Settings a run's results depend on; partial runs resume only if they match."""
+        fn_name = getattr(optimization_fn, "__qualname__", type(optimization_fn).__qualname__)
+        return {
+            "problem_name": config.problem_name,
+            "algorithm": config.algorithm,
+            "max_evaluations": config.max_evaluations,
+            "parameters": config.parameters,
+            "metrics": config.metrics,
+            "optimization_fn": f"{optimization_fn.__module__}.{fn_name}",
+        }
+
     def _aggregate_results(
         self, config: BenchmarkConfig, all_runs: List[Dict[str, Any]]
     ) -> BenchmarkResult:
@@ -227,6 +261,8 @@ class BenchmarkRunner:
                 "max_evaluations": result.config.max_evaluations,
                 "parameters": result.config.parameters,
                 "metrics": result.config.metrics,
+                "n_workers": result.config.n_workers,
+                "resume": result.config.resume,
             },
             "results": {
                 "mean_metrics": result.mean_metrics,
@@ -293,3 +329,11 @@ class BenchmarkRunner:
             }
 
         return comparison
+
+
+def _run_once(optimization_fn: Callable, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """One benchmark run with its runtime (top-level so worker processes can run it)."""
+    start_time = time.time()
+    run_metrics = optimization_fn(parameters)
+    run_metrics["runtime_s"] = time.time() - start_time
+    return run_metrics
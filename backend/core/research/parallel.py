@@ -0,0 +1,321 @@
+"""
+Parallel Benchmark Execution
+
+Runs independent benchmark tasks (seed × test case × algorithm) across a
+process pool and streams every finished task to a JSONL file, so an
+interrupted campaign resumes where it stopped. The file starts with a
+header holding a fingerprint of the run settings; a file written under
+different settings is started over instead of resumed.
+
+- Workers are pinned to distinct CPUs (``os.sched_setaffinity`` where
+  available) so concurrent runs do not migrate between cores.
+- Memory is the peak RSS of the worker from OS counters (``VmHWM`` on
+  Linux, ``ru_maxrss`` elsewhere) instead of ``tracemalloc``, which slows
+  allocation-heavy code several times. On Linux the peak is reset before
+  each task; elsewhere each task gets a fresh worker process.
+
+Example:
+    >>> tasks = [BenchmarkTask(f"seed{s}", run_case, (case, s)) for s in seeds]
+    >>> records = run_tasks(tasks, n_workers=4, results_path="campaign.jsonl")
+    >>> records["seed42"]["result"]
+"""
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+_CLEAR_REFS = Path("/proc/self/clear_refs")
+_STATUS = Path("/proc/self/status")
+
+# Key of the header record holding the run settings fingerprint
+CONFIG_KEY = "__config__"
+
+# Per-worker state (set by _init_worker)
+_CPU_SLOTS = None
+_IN_WORKER = False
+
+
+@dataclass
+class BenchmarkTask:
+    """
+    One independent benchmark run.
+
+    Attributes:
+        key: Unique task id; finished keys are skipped on resume
+        fn: Top-level (picklable) function returning a JSON-serializable dict
+        args: Positional arguments for ``fn``
+        kwargs: Keyword arguments for ``fn``
+    """
+
+    key: str
+    fn: Callable[..., Dict[str, Any]]
+    args: tuple = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+
+# =============================================================================
+# OS MEMORY COUNTERS
+# =============================================================================
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB (None if unavailable)."""
+    try:
+        for line in _STATUS.read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports KiB, macOS bytes
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    return None
+
+
+def peak_rss_resettable() -> bool:
+    """Whether reset_peak_rss can reset the counter (checked without resetting it)."""
+    return _CLEAR_REFS.exists() and os.access(_CLEAR_REFS, os.W_OK)
+
+
+def reset_peak_rss() -> bool:
+    """
+    Reset the peak RSS counter to the current RSS (Linux only).
+
+    Returns:
+        True if the counter was reset
+    """
+    try:
+        _CLEAR_REFS.write_text("5")
+        return True
+    except OSError:
+        return False
+
+
+# =============================================================================
+# RESULT STREAM
+# =============================================================================
+
+
+def config_fingerprint(config: Dict[str, Any]) -> str:
+    """
+    Stable short hash of run settings.
+
+    Args:
+        config: JSON-like settings (values JSON cannot encode are hashed by str)
+
+    Returns:
+        16 hex characters
+    """
+    return hashlib.sha256(_settings_json(config).encode()).hexdigest()[:16]
+
+
+def _settings_json(config: Dict[str, Any]) -> str:
+    return json.dumps(config, sort_keys=True, default=str)
+
+
+class ResultStream:
+    """
+    Append-only JSONL file of finished task records.
+
+    Each record is flushed and fsynced as soon as it arrives, so at most the
+    running tasks are lost when a campaign is interrupted.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Records already on disk by key (later lines win; torn lines are skipped).
+
+        The settings header, if any, is included under CONFIG_KEY.
+        """
+        records: Dict[str, Dict[str, Any]] = {}
+        if not self.path.exists():
+            return records
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Partially written last line of an interrupted run
+                records[record["key"]] = record
+        return records
+
+    def append(self, record: Dict[str, Any]) -> None:
+        with open(self.path, "a+b") as f:
+            # Start a fresh line after a torn record so this one stays parseable
+            torn = False
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                torn = f.read(1) != b"\n"
+            f.write((("\n" if torn else "") + json.dumps(record) + "\n").encode())
+            f.flush()
+            os.fsync(f.fileno())
+
+
+# =============================================================================
+# EXECUTION
+# =============================================================================
+
+
+def available_cpus() -> List[int]:
+    """CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _init_worker(cpu_slots) -> None:
+    global _CPU_SLOTS, _IN_WORKER
+    _CPU_SLOTS = cpu_slots
+    _IN_WORKER = True
+
+
+def _execute(task: BenchmarkTask) -> Dict[str, Any]:
+    """Run one task with CPU pinning and peak RSS measurement."""
+    cpu = _CPU_SLOTS.get() if _CPU_SLOTS is not None else None
+    try:
+        if cpu is not None and hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, {cpu})
+        # Only pool workers own their peak counter; leave the caller's alone
+        if _IN_WORKER:
+            reset_peak_rss()
+
+        start = time.perf_counter()
+        error = None
+        try:
+            result = task.fn(*task.args, **task.kwargs)
+        except Exception as e:
+            result = None
+            error = f"{type(e).__name__}: {e}"
+
+        return {
+            "key": task.key,
+            "result": result,
+            "error": error,
+            "wall_time_s": time.perf_counter() - start,
+            "peak_rss_mb": peak_rss_mb(),
+            "cpu": cpu,
+            "pid": os.getpid(),
+        }
+    finally:
+        if cpu is not None:
+            _CPU_SLOTS.put(cpu)
+
+
+def run_tasks(
+    tasks: List[BenchmarkTask],
+    n_workers: Optional[int] = None,
+    pin_cpus: bool = True,
+    results_path=None,
+    resume: bool = True,
+    on_record: Optional[Callable[[Dict[str, Any]], None]] = None,
+    config: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run benchmark tasks, in parallel when ``n_workers > 1``.
+
+    Args:
+        tasks: Tasks with unique keys
+        n_workers: Worker processes (default: available CPUs; 1 = in-process)
+        pin_cpus: Pin each worker to its own CPU
+        results_path: JSONL file that receives each record as it finishes
+        resume: Skip tasks whose successful record is already in ``results_path``
+            (False starts the file over)
+        on_record: Callback for every newly finished record
+        config: Run settings the results depend on. Their fingerprint is
+            written as the file's header; a file written under different
+            settings (or without them) is started over, not resumed.
+
+    Returns:
+        Records by task key (including resumed ones), each with ``result``,
+        ``error``, ``wall_time_s``, ``peak_rss_mb``, ``cpu`` and ``pid``.
+        In-process runs (``n_workers <= 1``) do not reset the caller's peak
+        RSS counter, so their ``peak_rss_mb`` is the process peak so far.
+    """
+    keys = [task.key for task in tasks]
+    if len(set(keys)) != len(keys):
+        raise ValueError("Benchmark task keys must be unique")
+    if CONFIG_KEY in keys:
+        raise ValueError(f"'{CONFIG_KEY}' is reserved for the settings header")
+
+    fingerprint = config_fingerprint(config) if config is not None else None
+    stream = ResultStream(results_path) if results_path else None
+    records: Dict[str, Dict[str, Any]] = {}
+    if stream and resume:
+        existing = stream.load()
+        header = existing.pop(CONFIG_KEY, None)
+        if stream.path.exists() and (header or {}).get("fingerprint") != fingerprint:
+            logger.warning(f"{stream.path} was written with different run settings; starting over")
+            existing = {}
+            stream.path.unlink()
+        wanted = set(keys)
+        records = {
+            key: record
+            for key, record in existing.items()
+            if key in wanted and record.get("error") is None
+        }
+        if records:
+            logger.info(f"Resuming: {len(records)}/{len(tasks)} tasks already finished")
+    elif stream:
+        stream.path.unlink(missing_ok=True)
+
+    if stream and fingerprint is not None and not stream.path.exists():
+        settings = json.loads(_settings_json(config))
+        stream.append({"key": CONFIG_KEY, "fingerprint": fingerprint, "config": settings})
+
+    pending = [task for task in tasks if task.key not in records]
+    cpus = available_cpus()
+    n_workers = min(n_workers or len(cpus), max(len(pending), 1))
+
+    def collect(record: Dict[str, Any]) -> None:
+        records[record["key"]] = record
+        if stream:
+            stream.append(record)
+        if record["error"]:
+            logger.error(f"Task {record['key']} failed: {record['error']}")
+        if on_record:
+            on_record(record)
+
+    if n_workers <= 1:
+        for task in pending:
+            collect(_execute(task))
+        return {key: records[key] for key in keys if key in records}
+
+    ctx = multiprocessing.get_context("spawn")
+    cpu_slots = None
+    if pin_cpus:
+        cpu_slots = ctx.Queue()
+        for i in range(n_workers):
+            cpu_slots.put(cpus[i % len(cpus)])
+
+    # Without a resettable peak counter, a fresh process per task keeps RSS per task
+    maxtasksperchild = None if peak_rss_resettable() else 1
+
+    with ctx.Pool(
+        n_workers,
+        initializer=_init_worker,
+        initargs=(cpu_slots,),
+        maxtasksperchild=maxtasksperchild,
+    ) as pool:
+        for record in pool.imap_unordered(_execute, pending):
+            collect(record)
+
+    return {key: records[key] for key in keys if key in records}
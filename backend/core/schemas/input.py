@@ -112,6 +112,9 @@ class OptimizationRequest(BaseModel):
     enable_solar: bool = Field(default=False, description="Calculate PV potential")
     enable_wind: bool = Field(default=False, description="Analyze wind corridors")
     enable_walkability: bool = Field(default=False, description="Generate walkability heatmap")
+    instrument: bool = Field(
+        default=False, description="Record per-component evaluation timings in the result"
+    )
     
     class Config:
         extra = "forbid"
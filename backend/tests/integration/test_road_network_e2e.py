@@ -117,6 +117,36 @@ class TestEndToEndRoadGeneration:
         assert stats["total_length_m"] >= 0
 
 
+@pytest.mark.skipif(not WEEK1_AVAILABLE, reason="Week 1 code required")
+def test_even_spacing_keeps_roads_apart():
+    """Occupancy-grid placement leaves no two roads running side by side."""
+    from scipy.spatial import cKDTree
+
+    from backend.core.geospatial.road_network_generator import RoadNetworkConfig as TensorRoadConfig
+    from backend.core.geospatial.road_network_generator import (
+        RoadNetworkGenerator as TensorRoadGenerator,
+    )
+
+    rng = np.random.default_rng(1)
+    types = list(BuildingType)
+    buildings = [
+        Building(f"B-{i}", types[i % len(types)], 1500, 3, position=tuple(rng.uniform(60, 940, 2)))
+        for i in range(30)
+    ]
+
+    config = TensorRoadConfig(batched_tracing=True, even_spacing=True, separation_distance=40.0)
+    major, minor, stats = TensorRoadGenerator((0, 0, 1000, 1000), config).generate(buildings)
+    roads = major + minor
+    assert len(minor) > 0
+    assert stats["config"]["even_spacing"]
+
+    # Interior points of different roads stay about d_test apart
+    points = np.vstack([road[1:-1] for road in roads])
+    labels = np.concatenate([np.full(len(road) - 2, i) for i, road in enumerate(roads)])
+    pairs = cKDTree(points).query_pairs(10.0, output_type="ndarray")
+    assert not np.any(labels[pairs[:, 0]] != labels[pairs[:, 1]])
+
+
 @pytest.mark.skipif(not WEEK1_AVAILABLE, reason="Week 1 code required")
 def test_optimizer_integration():
     """Test road generation integrates with H-SAGA optimizer."""
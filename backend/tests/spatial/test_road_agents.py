@@ -17,6 +17,7 @@ from src.spatial.road_agents import (
     AgentState,
     RoadAgent,
     RoadAgentSystem,
+    RoadPointIndex,
     create_agents_from_buildings,
 )
 from src.spatial.tensor_field import TensorField
@@ -267,6 +268,27 @@ class TestCollisionDetection:
         far_point = np.array([100, 100])
         assert not system._violates_spacing(far_point)
 
+    def test_spacing_ignores_own_path(self):
+        """Test an agent's own points never block it."""
+        config = AgentConfig(min_road_spacing=20.0)
+        system = RoadAgentSystem(config)
+        system._add_point(np.array([50.0, 50.0]), owner="agent_0")
+
+        assert not system._violates_spacing(np.array([55, 50]), exclude_agent_id="agent_0")
+        assert system._violates_spacing(np.array([55, 50]), exclude_agent_id="agent_1")
+
+    def test_point_index_matches_brute_force(self):
+        """Test grid hash radius queries across cell boundaries."""
+        rng = np.random.default_rng(0)
+        points = rng.uniform(0, 200, (300, 2))
+        index = RoadPointIndex(cell_size=15.0)
+        for point in points:
+            index.insert(point)
+
+        for query in rng.uniform(-20, 220, (200, 2)):
+            expected = np.min(np.linalg.norm(points - query, axis=1)) < 15.0
+            assert index.any_within(query, 15.0) == expected
+
 
 @pytest.mark.skip(reason="Requires Building class")
 class TestBuildingIntegration:
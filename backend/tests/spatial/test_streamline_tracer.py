@@ -15,11 +15,13 @@ import pytest
 from src.spatial.streamline_tracer import (
     StopReason,
     StreamlineConfig,
+    StreamlineOccupancy,
     StreamlineResult,
     resample_path,
     smooth_path,
     trace_bidirectional_streamline,
     trace_streamline_rk45,
+    trace_streamlines_batched,
 )
 from src.spatial.tensor_field import TensorField
 
@@ -221,6 +223,181 @@ class TestBidirectionalTracing:
         assert np.abs(closest_idx - middle_idx) < len(result.path) * 0.3
 
 
+class TestBatchedTracing:
+    """Test fixed-step RK4 tracing of many seeds at once."""
+
+    @staticmethod
+    def _curved_field():
+        field = TensorField(bounds=(0, 0, 1000, 1000), resolution=50)
+        field.add_grid_field(30, 1.0)
+        field.add_radial_field(center=(1200, 500), decay_radius=600, strength=1.0)
+        return field
+
+    def test_matches_rk45_in_uniform_field(self):
+        """Straight streamlines land on the same line with the same stop."""
+        field = TensorField(bounds=(0, 0, 1000, 1000), resolution=20)
+        field.add_grid_field(30, 1.0)
+        seeds = np.array([[100, 100], [500, 500], [900, 150]])
+
+        batched = trace_streamlines_batched(field, seeds)
+        direction = np.array([np.cos(np.radians(30)), np.sin(np.radians(30))])
+
+        for seed, result in zip(seeds, batched):
+            reference = trace_streamline_rk45(field, seed)
+            assert result.stop_reason == reference.stop_reason
+            offsets = result.path - seed
+            cross = offsets[:, 0] * direction[1] - offsets[:, 1] * direction[0]
+            assert np.max(np.abs(cross)) < 1e-6
+            assert result.total_length == pytest.approx(reference.total_length, abs=20.0)
+
+    def test_matches_rk45_in_curved_field(self):
+        """Batched points lie on the RK45 curve away from the boundary."""
+        field = self._curved_field()
+        seeds = np.random.default_rng(0).uniform(200, 800, size=(20, 2))
+
+        for field_type in ["major", "minor"]:
+            batched = trace_streamlines_batched(field, seeds, field_type=field_type)
+            for seed, result in zip(seeds, batched):
+                reference = trace_streamline_rk45(
+                    field, seed, StreamlineConfig(rtol=1e-8, atol=1e-8), field_type=field_type
+                )
+                assert result.stop_reason == reference.stop_reason
+
+                curve = resample_path(reference.path, target_spacing=0.25)
+                interior = result.path[:-1]  # last point may overshoot the boundary
+                gaps = np.min(np.linalg.norm(interior[:, None] - curve[None], axis=2), axis=1)
+                assert np.max(gaps) < 0.5
+
+    def test_bidirectional_matches_sequential(self):
+        """Bidirectional batches join halves like trace_bidirectional_streamline."""
+        field = TensorField(bounds=(0, 0, 1000, 1000), resolution=20)
+        field.add_grid_field(0, 1.0)
+        config = StreamlineConfig(max_length=100.0)
+        seeds = np.array([[500, 500], [50, 300]])
+
+        batched = trace_streamlines_batched(field, seeds, config, bidirectional=True)
+
+        for seed, result in zip(seeds, batched):
+            reference = trace_bidirectional_streamline(field, seed, config)
+            np.testing.assert_allclose(result.path[0], reference.path[0], atol=1e-2)
+            np.testing.assert_allclose(result.path[-1], reference.path[-1], atol=1e-2)
+            assert result.total_length == pytest.approx(reference.total_length, abs=1e-2)
+            assert any(np.allclose(point, seed) for point in result.path)
+
+    def test_seeds_retire_individually(self):
+        """Each seed keeps its own stop reason and step count."""
+        field = TensorField(bounds=(0, 0, 100, 100), resolution=20)
+        field.add_grid_field(0, 1.0)
+        config = StreamlineConfig(max_length=50.0, fixed_step_size=5.0)
+        seeds = np.array([[10, 50], [95, 50], [150, 50]])
+
+        inner, edge, outside = trace_streamlines_batched(field, seeds, config)
+
+        assert inner.stop_reason == StopReason.MAX_LENGTH
+        assert inner.n_steps == 10
+        assert inner.total_length == pytest.approx(50.0)
+
+        assert edge.stop_reason == StopReason.BOUNDARY
+        assert edge.n_steps == 1
+
+        assert outside.stop_reason == StopReason.BOUNDARY
+        assert not outside.success
+        assert len(outside.path) == 1
+
+    def test_singularity_stop(self):
+        """Traces stop when they run into an isotropic region."""
+        field = TensorField(bounds=(0, 0, 1000, 1000), resolution=50)
+        field.add_grid_field(0, 0.5)
+        field.add_grid_field(90, 0.5)  # Sum is isotropic everywhere
+        field.add_radial_field(center=(500, 500), decay_radius=100, strength=1.0)
+        config = StreamlineConfig(singularity_anisotropy=0.05)
+
+        (result,) = trace_streamlines_batched(field, [[550, 500]], config)
+
+        assert result.stop_reason == StopReason.SINGULARITY
+        assert result.total_length < config.max_length
+        assert np.linalg.norm(result.path[-1] - 500) > 100
+
+    def test_never_reverses_direction(self):
+        """Eigenvector signs are aligned, so consecutive steps never double back."""
+        field = TensorField(bounds=(0, 0, 1000, 1000), resolution=50)
+        field.add_grid_field(30, 0.5)
+        field.add_radial_field(center=(500, 500), decay_radius=200, strength=1.0)
+        seeds = np.random.default_rng(1).uniform(100, 900, size=(50, 2))
+
+        for result in trace_streamlines_batched(field, seeds, field_type="minor"):
+            steps = np.diff(result.path, axis=0)
+            assert np.all(np.einsum("ij,ij->i", steps[1:], steps[:-1]) > 0)
+
+    def test_empty_and_zero_length(self):
+        """No seeds gives no results; zero max_length returns the seeds."""
+        field = TensorField(bounds=(0, 0, 100, 100), resolution=20)
+        field.add_grid_field(0, 1.0)
+
+        assert trace_streamlines_batched(field, np.zeros((0, 2))) == []
+
+        results = trace_streamlines_batched(
+            field, [[10, 10], [20, 20]], StreamlineConfig(max_length=0)
+        )
+        assert [r.stop_reason for r in results] == [StopReason.MAX_LENGTH] * 2
+        assert all(len(r.path) == 1 for r in results)
+
+
+class TestStreamlineOccupancy:
+    """Test d_sep/d_test occupancy-grid placement."""
+
+    @staticmethod
+    def _occupancy_with_road():
+        occupancy = StreamlineOccupancy((0, 0, 1000, 1000), separation=40.0)
+        occupancy.add_path(np.array([[200.0, 500.0], [800.0, 500.0]]))
+        return occupancy
+
+    def test_seed_separation(self):
+        """Seeds closer than d_sep to a placed road are rejected."""
+        occupancy = self._occupancy_with_road()
+        free = occupancy.can_seed(np.array([[500, 520], [500, 560], [100, 500]]))
+        np.testing.assert_array_equal(free, [False, True, True])
+
+    def test_test_distance(self):
+        """Only points within d_test (= d_sep / 2) block tracing."""
+        occupancy = self._occupancy_with_road()
+        blocked = occupancy.is_blocked(np.array([[500, 510], [500, 530], [-50, 500]]))
+        np.testing.assert_array_equal(blocked, [True, False, False])
+
+    def test_clip_path_both_directions(self):
+        """Clipping keeps the seed and stops at the first blocked point per side."""
+        occupancy = self._occupancy_with_road()
+        path = np.column_stack([np.full(21, 500.0), np.linspace(300, 700, 21)])
+
+        clipped = occupancy.clip_path(path, start_index=5)  # seed at y=400
+
+        assert clipped[0, 1] == pytest.approx(300.0)
+        assert 480.0 <= clipped[-1, 1] < 500.0
+        assert any(np.allclose(point, [500, 400]) for point in clipped)
+
+    def test_batched_trace_stops_near_road(self):
+        """Traces end with PROXIMITY when they reach a placed road."""
+        field = TensorField(bounds=(0, 0, 1000, 1000), resolution=20)
+        field.add_grid_field(0, 1.0)  # Major direction along x
+        occupancy = StreamlineOccupancy((0, 0, 1000, 1000), separation=40.0)
+        occupancy.add_path(np.array([[600.0, 0.0], [600.0, 1000.0]]))
+
+        near, far = trace_streamlines_batched(
+            field, [[400, 500], [650, 500]], StreamlineConfig(max_length=300), occupancy=occupancy
+        )
+
+        assert near.stop_reason == StopReason.PROXIMITY
+        assert near.success
+        assert 575.0 <= near.path[-1, 0] < 600.0
+        assert far.stop_reason == StopReason.MAX_LENGTH
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            StreamlineOccupancy((0, 0, 100, 100), separation=0.0)
+        with pytest.raises(ValueError):
+            StreamlineOccupancy((0, 0, 100, 100), separation=10.0, test_ratio=1.5)
+
+
 class TestPathQuality:
     """Test quality of generated paths."""
 
@@ -12,10 +12,12 @@ import pytest
 
 from src.algorithms.nsga3 import (
     associate_to_reference_points,
+    clear_reference_cache,
     compute_ideal_point,
     compute_nadir_point,
     count_reference_points,
     crowding_distance,
+    das_dennis_lattice,
     dominates_objective,
     fast_nondominated_sort,
     generate_reference_points,
@@ -25,6 +27,9 @@ from src.algorithms.nsga3 import (
     normalize_objectives,
     pareto_front_2d_indices,
     perpendicular_distance,
+    perpendicular_distances,
+    reference_directions,
+    reference_unit_directions,
 )
 
 # =============================================================================
@@ -108,6 +113,55 @@ class TestReferencePoints:
         for point in ref_points:
             assert abs(np.sum(point) - 2.0) < 1e-6
 
+    def test_das_dennis_lattice_order(self):
+        """Lattice enumerates compositions with the first objective ascending."""
+        lattice = das_dennis_lattice(3, 2)
+
+        expected = [[0, 0, 2], [0, 1, 1], [0, 2, 0], [1, 0, 1], [1, 1, 0], [2, 0, 0]]
+        np.testing.assert_array_equal(lattice, expected)
+
+    def test_reference_directions_memoized(self):
+        """Repeated requests share one read-only array."""
+        clear_reference_cache()
+        ref_dirs = reference_directions(3, 12)
+
+        assert reference_directions(3, 12) is ref_dirs
+        assert not ref_dirs.flags.writeable
+        np.testing.assert_array_equal(generate_reference_points(3, 12), ref_dirs)
+
+        # Public generators return writable copies
+        ref_points = generate_reference_points(3, 12)
+        ref_points[0] = 0.0
+        assert reference_directions(3, 12)[0].sum() == pytest.approx(1.0)
+
+    def test_reference_directions_disk_cache(self, tmp_path):
+        """Directions are written once and loaded by later (fresh) lookups."""
+        clear_reference_cache()
+        ref_dirs = reference_directions(4, 5, n_partitions_inner=2, cache_dir=tmp_path)
+
+        cached = list(tmp_path.glob("*.npy"))
+        assert len(cached) == 1
+
+        clear_reference_cache()
+        np.testing.assert_array_equal(
+            reference_directions(4, 5, n_partitions_inner=2, cache_dir=tmp_path), ref_dirs
+        )
+
+        # Corrupt cache files are regenerated
+        cached[0].write_bytes(b"not an array")
+        clear_reference_cache()
+        np.testing.assert_array_equal(
+            reference_directions(4, 5, n_partitions_inner=2, cache_dir=tmp_path), ref_dirs
+        )
+        clear_reference_cache()
+
+    def test_reference_directions_invalid(self):
+        """Invalid sizes raise ValueError."""
+        with pytest.raises(ValueError):
+            reference_directions(1, 12)
+        with pytest.raises(ValueError):
+            reference_directions(3, 0)
+
 
 # =============================================================================
 # NON-DOMINATED SORTING TESTS
@@ -375,6 +429,52 @@ class TestNiching:
         assert 0 in selected  # Closest in niche 0
         assert 3 in selected  # Closest in niche 1
 
+    def test_perpendicular_distances_match_scalar(self):
+        """Matrix distances match perpendicular_distance for every pair."""
+        np.random.seed(0)
+        points = np.random.rand(15, 3)
+        ref_points = np.vstack([generate_two_layer_reference_points(3, 4, 2), np.zeros(3)])
+
+        distances = perpendicular_distances(points, reference_unit_directions(ref_points))
+
+        expected = [[perpendicular_distance(p, r) for r in ref_points] for p in points]
+        np.testing.assert_allclose(distances, expected, atol=1e-7)
+
+    def test_associate_with_cached_directions(self):
+        """Cached unit directions give the same association."""
+        np.random.seed(1)
+        objectives = np.random.rand(30, 3)
+        ref_points = generate_reference_points(n_objectives=3, n_partitions=5)
+
+        associations, distances = associate_to_reference_points(objectives, ref_points)
+        cached = associate_to_reference_points(
+            objectives, ref_points, unit_directions=reference_unit_directions(ref_points)
+        )
+
+        np.testing.assert_array_equal(cached[0], associations)
+        np.testing.assert_array_equal(cached[1], distances)
+        for i, point in enumerate(objectives):
+            assert distances[i] == pytest.approx(
+                min(perpendicular_distance(point, r) for r in ref_points), abs=1e-7
+            )
+
+    def test_niche_selection_prefers_sparse_niches(self):
+        """Sparse niches are filled first, closest member first."""
+        front = [4, 5, 6, 7, 8, 9]
+        associations = np.zeros(10, dtype=int)
+        associations[[4, 5, 6]] = 0  # Crowded niche
+        associations[[7, 8]] = 1
+        associations[9] = 2
+        distances = np.array([0, 0, 0, 0, 0.3, 0.1, 0.2, 0.5, 0.4, 0.9])
+        ref_points = np.eye(3)
+
+        selected = niche_preserving_selection(front, associations, distances, ref_points, 4)
+
+        # Counts start at member counts: niche 2 picks 9 at 1, niche 1 picks 8 at 2,
+        # then niche 0 (5) and niche 1 (7) tie at 3
+        np.testing.assert_array_equal(selected[:2], [9, 8])
+        assert set(selected[2:]) == {5, 7}
+
 
 # =============================================================================
 # INTEGRATION TESTS
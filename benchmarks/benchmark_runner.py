@@ -10,13 +10,17 @@ Metrics Collected:
     - Pareto front size
     - Hypervolume indicator
     - Convergence metrics
-    - Memory usage
+    - Memory usage (peak RSS from OS counters)
+
+Seeds, algorithms and test cases are independent runs; with
+``BenchmarkConfig.n_workers > 1`` they execute across a pinned process pool,
+and with ``results_path`` each finished run is streamed to disk so an
+interrupted campaign with the same run settings resumes where it stopped.
 """
 
 import time
-import tracemalloc
-from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 
@@ -25,10 +29,22 @@ from backend.core.optimization.adaptive_hsaga_runner import (
     AdaptiveHSAGARunnerConfig,
 )
 from backend.core.optimization.nsga3_runner import NSGA3Runner, NSGA3RunnerConfig
+from backend.core.research.parallel import BenchmarkTask, peak_rss_mb, reset_peak_rss, run_tasks
 from src.algorithms.objective_profiles import ProfileType
 
 from .test_cases import BenchmarkTestCase
 
+# BenchmarkConfig fields that do not change a run's results
+_EXECUTION_FIELDS = (
+    "n_runs",
+    "seeds",
+    "verbose",
+    "n_workers",
+    "pin_cpus",
+    "results_path",
+    "resume",
+)
+
 
 @dataclass
 class BenchmarkConfig:
@@ -56,6 +72,19 @@ class BenchmarkConfig:
     # Verbosity
     verbose: bool = False
 
+    # Execution
+    n_workers: int = 1  # Parallel worker processes (1 = sequential, in-process)
+    pin_cpus: bool = True  # Pin each worker to its own CPU
+    results_path: Optional[str] = None  # JSONL stream of finished runs
+    resume: bool = True  # Skip runs already in results_path
+
+    def run_settings(self) -> Dict[str, Any]:
+        """Settings that determine run results; resumed runs must match them."""
+        settings = asdict(self)
+        for name in _EXECUTION_FIELDS:
+            del settings[name]
+        return settings
+
 
 @dataclass
 class BenchmarkResult:
@@ -80,6 +109,20 @@ class BenchmarkResult:
     # Additional data
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    def to_record(self) -> Dict[str, Any]:
+        """JSON-serializable form (for streaming to disk)."""
+        record = asdict(self)
+        record["pareto_objectives"] = np.asarray(self.pareto_objectives).tolist()
+        record["best_objective_values"] = np.asarray(self.best_objective_values).tolist()
+        return record
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "BenchmarkResult":
+        """Inverse of to_record."""
+        record = dict(record)
+        record["pareto_objectives"] = np.asarray(record["pareto_objectives"], dtype=float)
+        return cls(**record)
+
 
 class BenchmarkRunner:
     """
@@ -123,8 +166,8 @@ class BenchmarkRunner:
             verbose=False,
         )
 
-        # Start memory tracking
-        tracemalloc.start()
+        # Peak RSS of this process from here on
+        reset_peak_rss()
         start_time = time.time()
 
         # Run optimization
@@ -133,9 +176,7 @@ class BenchmarkRunner:
 
         # Measure performance
         runtime = time.time() - start_time
-        current, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
-        memory_peak_mb = peak / 1024 / 1024
+        memory_peak_mb = peak_rss_mb() or 0.0
 
         # Extract metrics
         pareto_objectives = result["pareto_objectives"]
@@ -192,8 +233,8 @@ class BenchmarkRunner:
             verbose=False,
         )
 
-        # Start memory tracking
-        tracemalloc.start()
+        # Peak RSS of this process from here on
+        reset_peak_rss()
         start_time = time.time()
 
         # Run optimization
@@ -202,9 +243,7 @@ class BenchmarkRunner:
 
         # Measure performance
         runtime = time.time() - start_time
-        current, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
-        memory_peak_mb = peak / 1024 / 1024
+        memory_peak_mb = peak_rss_mb() or 0.0
 
         # Extract metrics
         pareto_front = result["pareto_front"]
@@ -252,32 +291,7 @@ class BenchmarkRunner:
         print(f"Category: {test_case.category} ({len(test_case.buildings)} buildings)")
         print(f"{'=' * 70}")
 
-        results = []
-
-        # Run NSGA-III
-        print("\n[NSGA-III]")
-        for i, seed in enumerate(self.config.seeds[: self.config.n_runs]):
-            result = self.run_nsga3(test_case, seed, i + 1)
-            results.append(result)
-            if self.config.verbose:
-                print(
-                    f"  Run {i+1}: Runtime={result.runtime:.2f}s, "
-                    f"Pareto={result.pareto_size}, HV={result.hypervolume:.2f}"
-                )
-
-        # Run AdaptiveHSAGA
-        print("\n[AdaptiveHSAGA]")
-        for i, seed in enumerate(self.config.seeds[: self.config.n_runs]):
-            result = self.run_hsaga(test_case, seed, i + 1)
-            results.append(result)
-            if self.config.verbose:
-                print(
-                    f"  Run {i+1}: Runtime={result.runtime:.2f}s, "
-                    f"Pareto={result.pareto_size}, HV={result.hypervolume:.2f}"
-                )
-
-        self.results.extend(results)
-        return results
+        return self._run_campaign([test_case])
 
     def run_all_benchmarks(self, test_cases: List[BenchmarkTestCase]) -> List[BenchmarkResult]:
         """
@@ -296,9 +310,9 @@ class BenchmarkRunner:
         print(f"Runs per test case: {self.config.n_runs}")
         print(f"Total runs: {len(test_cases) * self.config.n_runs * 2}")  # 2 algorithms
         print(f"Objective profile: {self.config.objective_profile.value}")
+        print(f"Workers: {self.config.n_workers}")
 
-        for test_case in test_cases:
-            self.run_benchmark(test_case)
+        self._run_campaign(test_cases)
 
         print("\n" + "#" * 70)
         print("Benchmark Suite Complete!")
@@ -307,6 +321,61 @@ class BenchmarkRunner:
 
         return self.results
 
+    def _run_campaign(self, test_cases: List[BenchmarkTestCase]) -> List[BenchmarkResult]:
+        """
+        Run every (test case, algorithm, seed) combination as an independent task.
+
+        Args:
+            test_cases: Test cases to benchmark
+
+        Returns:
+            Results in test case, algorithm, seed order
+        """
+        seeds = self.config.seeds[: self.config.n_runs]
+        tasks = [
+            BenchmarkTask(
+                f"{test_case.name}/{algorithm}/seed{seed}",
+                _run_benchmark_task,
+                (self.config, algorithm, test_case, seed, i + 1),
+            )
+            for test_case in test_cases
+            for algorithm in ("NSGA-III", "AdaptiveHSAGA")
+            for i, seed in enumerate(seeds)
+        ]
+
+        n_done = 0
+
+        def report(record: Dict[str, Any]) -> None:
+            nonlocal n_done
+            n_done += 1
+            if record["error"]:
+                print(f"  [{n_done}] {record['key']}: FAILED ({record['error']})")
+                return
+            result = record["result"]
+            print(
+                f"  [{n_done}] {record['key']}: Runtime={result['runtime']:.2f}s, "
+                f"Pareto={result['pareto_size']}, HV={result['hypervolume']:.2f}, "
+                f"RSS={result['memory_peak_mb']:.0f}MB"
+            )
+
+        records = run_tasks(
+            tasks,
+            n_workers=self.config.n_workers,
+            pin_cpus=self.config.pin_cpus,
+            results_path=self.config.results_path,
+            resume=self.config.resume,
+            on_record=report,
+            config=self.config.run_settings(),
+        )
+
+        results = [
+            BenchmarkResult.from_record(records[task.key]["result"])
+            for task in tasks
+            if records[task.key]["error"] is None
+        ]
+        self.results.extend(results)
+        return results
+
     def _compute_hypervolume(self, objectives: np.ndarray, reference_point: np.ndarray) -> float:
         """
         Compute hypervolume indicator (simplified approximation).
@@ -378,3 +447,16 @@ class BenchmarkRunner:
             Filtered results
         """
         return [r for r in self.results if r.test_case_name == test_case_name]
+
+
+def _run_benchmark_task(
+    config: BenchmarkConfig,
+    algorithm: str,
+    test_case: BenchmarkTestCase,
+    seed: int,
+    run_number: int,
+) -> Dict[str, Any]:
+    """One benchmark run as a JSON record (top-level so worker processes can run it)."""
+    runner = BenchmarkRunner(config)
+    run = runner.run_nsga3 if algorithm == "NSGA-III" else runner.run_hsaga
+    return run(test_case, seed, run_number).to_record()
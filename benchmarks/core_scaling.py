@@ -0,0 +1,471 @@
+"""
+Core Engine Scaling Benchmark
+=============================
+
+Measures the ``backend/core`` optimization engine across campus sizes and
+feature toggles, and gates changes against a stored baseline.
+
+For every case (building count × regulatory/wind/solar toggles):
+    - ``SpatialOptimizationProblem._evaluate`` throughput (evaluations/s)
+    - Per-component time of each constraint and objective calculator,
+      called in isolation on the same decoded layouts
+    - ``HSAGARunner`` end to end on a small fixed budget (optional)
+    - Peak RSS of the process running the case
+
+Results are plain JSON. ``compare_to_baseline`` reports every metric that
+got worse than the configured thresholds, so CI can fail on a slowdown of
+the hot path.
+
+Usage:
+    >>> config = ScalingConfig(building_counts=[10, 50])
+    >>> results = run_scaling_benchmark(config)
+    >>> save_results(results, "core_scaling.json")
+    >>> regressions = compare_to_baseline(results, load_results("baseline.json"))
+"""
+
+import json
+import math
+import platform
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from shapely.geometry import LineString, Polygon
+
+from backend.core.domain.geometry.osm_service import CampusContext, ExistingRoad
+from backend.core.optimization.hsaga_runner import HSAGARunner, HSAGARunnerConfig
+from backend.core.optimization.spatial_problem import SpatialOptimizationProblem
+from backend.core.research.parallel import peak_rss_mb, reset_peak_rss
+
+RESULTS_VERSION = 1
+
+# Default toggle sets: (regulatory, wind, solar)
+DEFAULT_TOGGLES: List[Tuple[bool, bool, bool]] = [
+    (False, False, False),
+    (True, False, False),
+    (False, True, True),
+    (True, True, True),
+]
+
+# Building mix for synthetic campuses (cycled to the requested count)
+_TYPE_MIX = ["Faculty", "Dormitory", "Dining", "Library", "Research", "Social"]
+
+# Site area per building (m²); ~10% ground coverage for an average footprint
+_AREA_PER_BUILDING = 11250.0
+
+
+@dataclass
+class ScalingCase:
+    """One benchmark case: campus size and feature toggles."""
+
+    n_buildings: int
+    regulatory: bool
+    wind: bool
+    solar: bool
+
+    @property
+    def name(self) -> str:
+        return (
+            f"n{self.n_buildings:03d}"
+            f"_reg{int(self.regulatory)}_wind{int(self.wind)}_solar{int(self.solar)}"
+        )
+
+
+@dataclass
+class ScalingConfig:
+    """Configuration for a scaling benchmark run."""
+
+    building_counts: List[int] = field(default_factory=lambda: [10, 25, 50, 100, 200])
+    toggles: List[Tuple[bool, bool, bool]] = field(default_factory=lambda: list(DEFAULT_TOGGLES))
+
+    # Layouts per case for _evaluate and component timings
+    n_samples: int = 30
+    warmup: int = 3
+
+    # End-to-end HSAGARunner (0 = skip)
+    hsaga_evaluations: int = 300
+    hsaga_max_buildings: int = 200
+
+    # Run each case in a fresh process so peak RSS is per case
+    isolate: bool = False
+
+    seed: int = 42
+
+    def cases(self) -> List[ScalingCase]:
+        return [
+            ScalingCase(n, regulatory, wind, solar)
+            for n in self.building_counts
+            for regulatory, wind, solar in self.toggles
+        ]
+
+
+@dataclass
+class RegressionThresholds:
+    """Allowed slowdown before a metric counts as a regression (fractions)."""
+
+    throughput_drop: float = 0.20  # evaluations/s may fall by 20%
+    time_increase: float = 0.25  # component / end-to-end time may grow by 25%
+    rss_increase: float = 0.25  # peak RSS may grow by 25%
+    min_time_ms: float = 0.05  # ignore components faster than this (timer noise)
+
+
+@dataclass
+class Regression:
+    """A metric that got worse than its threshold."""
+
+    case: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Relative change, positive = worse."""
+        if self.metric.endswith("evaluations_per_second"):
+            return 1.0 - self.current / self.baseline
+        return self.current / self.baseline - 1.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.case} {self.metric}: {self.baseline:.4g} -> {self.current:.4g} "
+            f"({self.change:+.0%} worse)"
+        )
+
+
+# =============================================================================
+# PROBLEM CONSTRUCTION
+# =============================================================================
+
+
+def build_problem(case: ScalingCase) -> SpatialOptimizationProblem:
+    """
+    Synthetic greenfield problem sized for the case's building count.
+
+    The square site grows with the building count to keep ground coverage
+    roughly constant; one existing road crosses it.
+    """
+    side = max(300.0, math.ceil(math.sqrt(case.n_buildings * _AREA_PER_BUILDING)))
+    boundary = Polygon([(0, 0), (side, 0), (side, side), (0, side)])
+    road = ExistingRoad(
+        osm_id=1,
+        geometry=LineString([(0, side / 2), (side, side / 2)]),
+        road_type="service",
+        name=None,
+        width=8.0,
+    )
+    context = CampusContext(
+        boundary=boundary,
+        existing_buildings=[],
+        existing_roads=[road],
+        existing_green_areas=[],
+        center_latlon=(41.0, 29.0),
+        crs_local="EPSG:32635",
+        bounds_meters=(0, 0, side, side),
+    )
+
+    counts: Dict[str, int] = {}
+    for i in range(case.n_buildings):
+        name = _TYPE_MIX[i % len(_TYPE_MIX)]
+        counts[name] = counts.get(name, 0) + 1
+
+    return SpatialOptimizationProblem(
+        context=context,
+        building_counts=counts,
+        enable_wind=case.wind,
+        enable_solar=case.solar,
+        enable_regulatory=case.regulatory,
+    )
+
+
+def component_calls(
+    problem: SpatialOptimizationProblem,
+) -> Dict[str, Callable[[list, list], Any]]:
+    """Each constraint and objective calculator used by _evaluate, by name."""
+    cc = problem.constraint_calc
+    oc = problem.objective_calc
+
+    calls: Dict[str, Callable[[list, list], Any]] = {
+        "constraint.boundary": lambda genes, polys: cc.boundary_violation(polys),
+        "constraint.overlap": lambda genes, polys: cc.overlap_violation(polys),
+    }
+    if problem.enable_regulatory:
+        calls["constraint.setback"] = lambda genes, polys: cc.dynamic_setback_violation(polys)
+        calls["constraint.fire_separation"] = lambda genes, polys: cc.fire_separation_violation(
+            polys, genes
+        )
+        calls["constraint.slope"] = lambda genes, polys: cc.slope_violation(polys)
+    else:
+        calls["constraint.setback"] = lambda genes, polys: cc.setback_violation(polys)
+        calls["constraint.separation"] = lambda genes, polys: cc.separation_violation(polys)
+    if problem.gateways:
+        calls["constraint.gateway_clearance"] = lambda genes, polys: cc.gateway_clearance_violation(
+            polys
+        )
+
+    calls["objective.compactness"] = lambda genes, polys: oc.compactness(genes)
+    calls["objective.adjacency"] = lambda genes, polys: oc.adjacency(genes)
+    calls["objective.wind_comfort"] = lambda genes, polys: oc.wind_comfort(genes, polys)
+    calls["objective.solar_gain"] = lambda genes, polys: oc.solar_gain(genes, polys)
+    if problem.gateways:
+        calls["objective.gateway_connectivity"] = lambda genes, polys: oc.gateway_connectivity(
+            polys
+        )
+    if oc.road_objective:
+        calls["objective.road_connectivity"] = lambda genes, polys: oc.road_connectivity(polys)
+
+    return calls
+
+
+# =============================================================================
+# MEASUREMENT
+# =============================================================================
+
+
+def _time_per_call_ms(fn: Callable[[], Any], repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats * 1000.0
+
+
+def run_case(case: ScalingCase, config: ScalingConfig) -> Dict[str, Any]:
+    """
+    Benchmark one case in the current process.
+
+    ``peak_rss_mb`` is None when the peak counter could not be reset and the
+    case did not run in a fresh process, since it would include earlier cases.
+
+    Returns:
+        JSON-serializable result dict
+    """
+    rss_per_case = reset_peak_rss() or config.isolate
+    setup_start = time.perf_counter()
+    problem = build_problem(case)
+    setup_ms = (time.perf_counter() - setup_start) * 1000.0
+
+    rng = np.random.default_rng(config.seed)
+    samples = rng.uniform(problem.xl, problem.xu, size=(config.n_samples, problem.n_var))
+    for x in samples[: config.warmup]:
+        problem._evaluate(x, {})
+
+    # Full evaluation throughput
+    start = time.perf_counter()
+    for x in samples:
+        problem._evaluate(x, {})
+    evaluate_s = time.perf_counter() - start
+
+    # Decode once, then time each calculator on the same layouts
+    decode_ms = _time_per_call_ms(lambda: [problem.decode_solution(x) for x in samples], 1) / len(
+        samples
+    )
+    decoded = [problem.decode_solution(x) for x in samples]
+
+    components_ms = {"decode": decode_ms}
+    for name, call in component_calls(problem).items():
+        components_ms[name] = _time_per_call_ms(
+            lambda: [call(genes, polys) for genes, polys in decoded], 1
+        ) / len(decoded)
+
+    result: Dict[str, Any] = {
+        "name": case.name,
+        **asdict(case),
+        "n_obj": problem.n_obj,
+        "n_constr": problem.n_ieq_constr,
+        "setup_ms": setup_ms,
+        "evaluate": {
+            "evaluations": len(samples),
+            "mean_ms": evaluate_s / len(samples) * 1000.0,
+            "evaluations_per_second": len(samples) / evaluate_s,
+        },
+        "components_ms": components_ms,
+    }
+
+    if config.hsaga_evaluations > 0 and case.n_buildings <= config.hsaga_max_buildings:
+        runner = HSAGARunner(
+            problem,
+            HSAGARunnerConfig(
+                total_evaluations=config.hsaga_evaluations,
+                population_size=40,  # >= 35 reference directions at n_partitions=4
+                sa_chains=2,
+                n_partitions=4,
+                seed=config.seed,
+                verbose=False,
+                parallel_sa=False,
+            ),
+        )
+        start = time.perf_counter()
+        runner.run()
+        elapsed = time.perf_counter() - start
+        evaluations = runner.stats["sa_evaluations"] + runner.stats["ga_evaluations"]
+        result["hsaga"] = {
+            "time_s": elapsed,
+            "evaluations": int(evaluations),
+            "evaluations_per_second": evaluations / elapsed if elapsed > 0 else 0.0,
+            "sa_time_s": runner.stats["sa_time"],
+            "ga_time_s": runner.stats["ga_time"],
+        }
+
+    result["peak_rss_mb"] = peak_rss_mb() if rss_per_case else None
+    return result
+
+
+def _run_case_worker(args: Tuple[ScalingCase, ScalingConfig]) -> Dict[str, Any]:
+    """Top-level worker for isolated (fresh-process) cases."""
+    return run_case(*args)
+
+
+def run_scaling_benchmark(
+    config: Optional[ScalingConfig] = None,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Run every case of the scaling benchmark.
+
+    Args:
+        config: Benchmark configuration
+        progress: Optional callback receiving each case result
+
+    Returns:
+        Results dict with "meta", "config" and "cases" (keyed by case name)
+    """
+    config = config or ScalingConfig()
+    cases: Dict[str, Any] = {}
+
+    if config.isolate:
+        import multiprocessing
+
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(1, maxtasksperchild=1) as pool:
+            for case in config.cases():
+                result = pool.apply(_run_case_worker, ((case, config),))
+                cases[case.name] = result
+                if progress:
+                    progress(result)
+    else:
+        for case in config.cases():
+            result = run_case(case, config)
+            cases[case.name] = result
+            if progress:
+                progress(result)
+
+    return {
+        "meta": {
+            "version": RESULTS_VERSION,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+        },
+        "config": asdict(config),
+        "cases": cases,
+    }
+
+
+# =============================================================================
+# PERSISTENCE AND BASELINE COMPARISON
+# =============================================================================
+
+
+def save_results(results: Dict[str, Any], path) -> Path:
+    """Write results JSON (creating parent directories)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2))
+    return path
+
+
+def load_results(path) -> Dict[str, Any]:
+    """Read results JSON written by save_results."""
+    return json.loads(Path(path).read_text())
+
+
+def compare_to_baseline(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    thresholds: Optional[RegressionThresholds] = None,
+) -> List[Regression]:
+    """
+    Metrics of ``current`` that regressed beyond the thresholds.
+
+    Only cases and metrics present in both runs are compared.
+
+    Args:
+        current: Results of this run
+        baseline: Stored baseline results
+        thresholds: Allowed slowdowns
+
+    Returns:
+        List of regressions (empty = gate passes)
+    """
+    thresholds = thresholds or RegressionThresholds()
+    regressions: List[Regression] = []
+
+    def check_drop(case, metric, old, new, limit):
+        if old and new is not None and new < old * (1.0 - limit):
+            regressions.append(Regression(case, metric, old, new))
+
+    def check_rise(case, metric, old, new, limit):
+        if old and new is not None and new > old * (1.0 + limit):
+            regressions.append(Regression(case, metric, old, new))
+
+    for name, case in current.get("cases", {}).items():
+        base = baseline.get("cases", {}).get(name)
+        if base is None:
+            continue
+
+        check_drop(
+            name,
+            "evaluate.evaluations_per_second",
+            base["evaluate"]["evaluations_per_second"],
+            case["evaluate"]["evaluations_per_second"],
+            thresholds.throughput_drop,
+        )
+
+        for component, old_ms in base.get("components_ms", {}).items():
+            new_ms = case.get("components_ms", {}).get(component)
+            if max(old_ms, new_ms or 0.0) < thresholds.min_time_ms:
+                continue
+            check_rise(name, f"components_ms.{component}", old_ms, new_ms, thresholds.time_increase)
+
+        if "hsaga" in base and "hsaga" in case:
+            check_rise(
+                name,
+                "hsaga.time_s",
+                base["hsaga"]["time_s"],
+                case["hsaga"]["time_s"],
+                thresholds.time_increase,
+            )
+
+        check_rise(
+            name,
+            "peak_rss_mb",
+            base.get("peak_rss_mb"),
+            case.get("peak_rss_mb"),
+            thresholds.rss_increase,
+        )
+
+    return regressions
+
+
+def format_results_table(results: Dict[str, Any]) -> str:
+    """One line per case: throughput, slowest component, end-to-end time, RSS."""
+    lines = [
+        f"{'case':<26} {'eval/s':>9} {'ms/eval':>8} {'slowest component':<34} "
+        f"{'hsaga s':>8} {'rss MB':>7}"
+    ]
+    for name, case in results["cases"].items():
+        components = {k: v for k, v in case["components_ms"].items() if k != "decode"}
+        slowest = max(components, key=components.get) if components else "-"
+        slowest_text = f"{slowest} ({components.get(slowest, 0.0):.2f} ms)"
+        hsaga = case.get("hsaga", {}).get("time_s")
+        rss = case.get("peak_rss_mb")
+        lines.append(
+            f"{name:<26} {case['evaluate']['evaluations_per_second']:>9.1f} "
+            f"{case['evaluate']['mean_ms']:>8.2f} {slowest_text:<34} "
+            f"{(f'{hsaga:.2f}' if hsaga is not None else '-'):>8} "
+            f"{(f'{rss:.0f}' if rss is not None else '-'):>7}"
+        )
+    return "\n".join(lines)
@@ -16,6 +16,9 @@ Usage:
 
     # Custom configuration
     python benchmarks/run_benchmarks.py --runs 10 --population 100 --generations 100
+
+    # Parallel campaign that resumes after an interruption
+    python benchmarks/run_benchmarks.py --workers 4 --results-path benchmarks/reports/runs.jsonl
 """
 
 import argparse
@@ -73,6 +76,17 @@ def parse_args():
     )
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
 
+    # Execution
+    parser.add_argument(
+        "--workers", type=int, default=1, help="Worker processes (one pinned CPU each)"
+    )
+    parser.add_argument(
+        "--results-path", type=str, help="JSONL file streaming finished runs (enables resume)"
+    )
+    parser.add_argument(
+        "--no-resume", action="store_true", help="Discard runs already in --results-path"
+    )
+
     return parser.parse_args()
 
 
@@ -102,6 +116,9 @@ def main():
         objective_profile=profile,
         n_runs=args.runs,
         verbose=args.verbose,
+        n_workers=args.workers,
+        results_path=args.results_path,
+        resume=not args.no_resume,
     )
 
     print("\nConfiguration:")
@@ -110,6 +127,7 @@ def main():
     print(f"  Runs per Test Case: {args.runs}")
     print(f"  Objective Profile: {args.profile}")
     print(f"  Output Directory: {args.output_dir}")
+    print(f"  Workers: {args.workers}")
 
     # Get test cases
     if args.test_case:
@@ -0,0 +1,153 @@
+"""
+Run Core Scaling Benchmarks
+===========================
+
+Benchmarks the backend optimization core across building counts and
+regulatory/wind/solar toggles, and optionally gates against a baseline.
+
+Usage:
+    # Full suite (10-200 buildings), results to benchmark_results/
+    python benchmarks/run_core_benchmarks.py
+
+    # Quick run without the end-to-end HSAGARunner
+    python benchmarks/run_core_benchmarks.py --buildings 10 50 --no-hsaga
+
+    # Record a baseline, then gate later runs against it (exit code 1 on regression)
+    python benchmarks/run_core_benchmarks.py --save-baseline benchmark_results/core_baseline.json
+    python benchmarks/run_core_benchmarks.py --baseline benchmark_results/core_baseline.json
+"""
+
+import argparse
+import itertools
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.core_scaling import (  # noqa: E402
+    RegressionThresholds,
+    ScalingConfig,
+    compare_to_baseline,
+    format_results_table,
+    load_results,
+    run_scaling_benchmark,
+    save_results,
+)
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Scaling benchmark for the optimization core")
+
+    parser.add_argument(
+        "--buildings",
+        type=int,
+        nargs="+",
+        default=[10, 25, 50, 100, 200],
+        help="Building counts to benchmark",
+    )
+    parser.add_argument(
+        "--all-toggles",
+        action="store_true",
+        help="Run all 8 regulatory/wind/solar combinations (default: 4 representative)",
+    )
+    parser.add_argument("--samples", type=int, default=30, help="Layouts timed per case")
+    parser.add_argument(
+        "--hsaga-evaluations",
+        type=int,
+        default=300,
+        help="Evaluation budget of the end-to-end HSAGARunner run",
+    )
+    parser.add_argument("--no-hsaga", action="store_true", help="Skip the end-to-end run")
+    parser.add_argument(
+        "--isolate",
+        action="store_true",
+        help="Run each case in a fresh process (per-case peak RSS)",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+
+    # Output and baseline gating
+    parser.add_argument(
+        "--output",
+        type=str,
+        default="benchmark_results/core_scaling.json",
+        help="Results JSON path",
+    )
+    parser.add_argument("--baseline", type=str, help="Baseline JSON to compare against")
+    parser.add_argument("--save-baseline", type=str, help="Also write results to this baseline")
+    parser.add_argument(
+        "--max-throughput-drop",
+        type=float,
+        default=0.20,
+        help="Allowed drop in evaluations/s (fraction)",
+    )
+    parser.add_argument(
+        "--max-time-increase",
+        type=float,
+        default=0.25,
+        help="Allowed increase in component and end-to-end time (fraction)",
+    )
+    parser.add_argument(
+        "--max-rss-increase",
+        type=float,
+        default=0.25,
+        help="Allowed increase in peak RSS (fraction)",
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    """Main benchmark execution."""
+    args = parse_args()
+
+    toggles = None
+    if args.all_toggles:
+        toggles = list(itertools.product([False, True], repeat=3))
+
+    config = ScalingConfig(
+        building_counts=args.buildings,
+        n_samples=args.samples,
+        hsaga_evaluations=0 if args.no_hsaga else args.hsaga_evaluations,
+        isolate=args.isolate,
+        seed=args.seed,
+    )
+    if toggles:
+        config.toggles = toggles
+
+    print(f"Running {len(config.cases())} core scaling cases...")
+    results = run_scaling_benchmark(
+        config,
+        progress=lambda case: print(
+            f"  {case['name']}: {case['evaluate']['evaluations_per_second']:.1f} eval/s"
+        ),
+    )
+
+    print()
+    print(format_results_table(results))
+
+    path = save_results(results, args.output)
+    print(f"\nResults saved to {path}")
+    if args.save_baseline:
+        print(f"Baseline saved to {save_results(results, args.save_baseline)}")
+
+    if args.baseline:
+        thresholds = RegressionThresholds(
+            throughput_drop=args.max_throughput_drop,
+            time_increase=args.max_time_increase,
+            rss_increase=args.max_rss_increase,
+        )
+        regressions = compare_to_baseline(results, load_results(args.baseline), thresholds)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against {args.baseline}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"\nNo regressions against {args.baseline}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,8 @@ Classes:
     BuildingType: Building type enumeration
     Building: Building entity
     Solution: Spatial planning solution
+    SolutionBatch: Array-backed population of solutions
+    MultiChainAnnealer: Lock-step multi-chain simulated annealing
     Optimizer: Base class for optimizers
 
 Week 1: Core data structures implemented
@@ -25,17 +27,21 @@ from .objective_profiles import (
     get_profile,
     list_available_profiles,
 )
-from .solution import Solution
+from .sa_chains import MultiChainAnnealer
+from .solution import Solution, SolutionBatch, SolutionView
 
 __all__ = [
     "Building",
     "BuildingType",
     "Solution",
+    "SolutionBatch",
+    "SolutionView",
     "Optimizer",
     "create_sample_campus",
     "FitnessEvaluator",
     "HybridSAGA",
     "AdaptiveHSAGA",
+    "MultiChainAnnealer",
     "ObjectiveProfile",
     "ProfileType",
     "get_profile",
@@ -4,10 +4,12 @@ Fitness Evaluation Module
 Multi-objective fitness evaluation for spatial planning solutions.
 
 Classes:
-    FitnessEvaluator: Main fitness evaluation class
+    FitnessEvaluator: Main fitness evaluation class (per solution or per population)
 
 Functions:
     profile_time: Decorator for performance profiling
+    overlap_penalty: Spacing-violation penalty over all building pairs
+    constraint_penalty: Bounds/overlap/safety-margin penalty over all buildings
 
 Created: 2025-11-03
 """
@@ -15,26 +17,41 @@ Created: 2025-11-03
 import functools
 import logging
 import time
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 from scipy.spatial.distance import cdist
 
 from .building import Building
+from .network_distance import RoadNetworkDistances
 
 # Import research-based objectives
-from .objectives import maximize_adjacency_satisfaction, minimize_cost, minimize_walking_distance
+from .objectives import (
+    AdjacencyParams,
+    maximize_adjacency_satisfaction,
+    minimize_cost,
+    minimize_walking_distance,
+)
 from .objectives_enhanced import (
+    ADJACENCY_MATRIX_CAMPUS,
+    ADJACENCY_TYPE_INDEX,
+    DETOUR_INDEX_TURKEY,
+    LAMBDA_RESIDENTIAL,
     WALKING_SPEED_ELDERLY,
     WALKING_SPEED_HEALTHY,
     calculate_adjacency_score,
     enhanced_diversity_score,
     enhanced_walking_accessibility,
 )
-from .solution import Solution
+from .solution import Solution, SolutionBatch, positions_array
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on pair-distance elements evaluated at once by evaluate_batch
+_BATCH_PAIR_ELEMENTS = 1 << 20
+
 
 def profile_time(func):
     """Decorator to profile function execution time"""
@@ -50,6 +67,102 @@ def profile_time(func):
     return wrapper
 
 
+def _pair_distances(positions: np.ndarray, pairs: Tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+    """Centre distance of every (i, j) pair, over any leading population axes."""
+    i, j = pairs
+    x, y = positions[..., 0], positions[..., 1]
+    dx = x[..., i] - x[..., j]
+    dy = y[..., i] - y[..., j]
+    return np.sqrt(dx * dx + dy * dy)
+
+
+def _mean_violation(distances: np.ndarray, required: np.ndarray) -> np.ndarray:
+    """Mean relative shortfall of pair distances over the violating pairs."""
+    # Each violation lies in (0, 1], so their mean needs no clipping
+    violation = np.maximum(1.0 - distances / required, 0.0)
+    count = np.count_nonzero(violation, axis=-1)
+    return violation.sum(axis=-1) / np.maximum(count, 1)
+
+
+def overlap_penalty(
+    positions: np.ndarray,
+    radii: np.ndarray,
+    min_separation: float,
+    pairs: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+) -> np.ndarray:
+    """
+    Mean relative spacing violation over the violating building pairs.
+
+    A pair violates when its centres are closer than r_i + r_j + min_separation;
+    its violation is the missing distance relative to that requirement.
+
+    Args:
+        positions: Building centres, shape (n, 2) or (pop, n, 2)
+        radii: Footprint radius per building, shape (n,)
+        min_separation: Required clearance between footprints (meters)
+        pairs: Precomputed np.triu_indices(n, k=1) (optional)
+
+    Returns:
+        Penalty in [0, 1], one per layout
+    """
+    if pairs is None:
+        pairs = np.triu_indices(len(radii), k=1)
+    required = radii[pairs[0]] + radii[pairs[1]] + min_separation
+    return _mean_violation(_pair_distances(positions, pairs), required)
+
+
+def constraint_penalty(
+    positions: np.ndarray,
+    radii: np.ndarray,
+    bounds: Tuple[float, float, float, float],
+    safety_margin: float,
+    pairs: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+) -> np.ndarray:
+    """
+    Constraint-violation penalty.
+
+    Penalties:
+    - Out-of-bounds footprint: 1000 per building
+    - Overlapping footprints: 500 per pair
+    - Safety margin violation (no overlap): 100 per pair
+
+    Args:
+        positions: Building centres, shape (n, 2) or (pop, n, 2)
+        radii: Footprint radius per building, shape (n,)
+        bounds: Site boundaries (x_min, y_min, x_max, y_max)
+        safety_margin: Required clearance between footprints (meters)
+        pairs: Precomputed np.triu_indices(n, k=1) (optional)
+
+    Returns:
+        Total penalty (>= 0), one per layout
+    """
+    if pairs is None:
+        pairs = np.triu_indices(len(radii), k=1)
+    x_min, y_min, x_max, y_max = bounds
+    extent = radii[:, np.newaxis]
+    low = positions - extent < (x_min, y_min)
+    high = positions + extent > (x_max, y_max)
+    out_of_bounds = (low | high).any(axis=-1)
+
+    touching = radii[pairs[0]] + radii[pairs[1]]
+    distances = _pair_distances(positions, pairs)
+    overlaps = distances < touching
+    too_close = ~overlaps & (distances < touching + safety_margin)
+
+    return (
+        1000.0 * np.count_nonzero(out_of_bounds, axis=-1)
+        + 500.0 * np.count_nonzero(overlaps, axis=-1)
+        + 100.0 * np.count_nonzero(too_close, axis=-1)
+    )
+
+
+def _evaluate_shard(
+    evaluator: "FitnessEvaluator", positions: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Process-pool worker for FitnessEvaluator.evaluate_batch sharding."""
+    return evaluator.evaluate_batch(positions)
+
+
 class FitnessEvaluator:
     """
     Multi-objective fitness evaluator for spatial planning solutions.
@@ -77,6 +190,8 @@ class FitnessEvaluator:
         safety_margin: Minimum distance between buildings (default: 5m)
         use_enhanced: Use research-based enhanced objectives (default: False)
         walking_speed_kmh: Walking speed for accessibility (default: 5.0 km/h)
+        road_network: Road-network distances for enhanced walking accessibility
+            (default: None = detour-index estimate)
 
     Example:
         >>> # Standard mode
@@ -98,6 +213,7 @@ class FitnessEvaluator:
         safety_margin: float = 5.0,
         use_enhanced: bool = False,
         walking_speed_kmh: float = WALKING_SPEED_HEALTHY,
+        road_network: Optional[RoadNetworkDistances] = None,
     ):
         """
         Initialize fitness evaluator.
@@ -112,6 +228,8 @@ class FitnessEvaluator:
                 (default: False for backward compatibility)
             walking_speed_kmh: Walking speed for accessibility analysis
                 (default: WALKING_SPEED_HEALTHY)
+            road_network: Precomputed road-network distances; enhanced walking
+                accessibility then uses shortest paths on the roads
 
         Raises:
             ValueError: If buildings list is empty, bounds invalid, or weights don't sum to 1.0
@@ -148,9 +266,18 @@ class FitnessEvaluator:
         self.min_distance_between_buildings = 20.0  # Minimum 20m separation
         self.use_enhanced = use_enhanced
         self.walking_speed_kmh = walking_speed_kmh
+        self.road_network = road_network
 
         # Build building dict for legacy methods
         self.building_dict = {b.id: b for b in buildings}
+        # Coordinate row order shared with SolutionBatch populations
+        self.building_ids = tuple(b.id for b in buildings)
+
+        # Footprint radii and building pairs for the penalty kernels
+        self._radii = np.array([b.radius for b in buildings])
+        self._pairs = np.triu_indices(len(buildings), k=1)
+        # Per-pair objective terms for evaluate_batch (built on first use)
+        self._batch_terms: Optional[Dict[str, np.ndarray]] = None
 
         # Set default weights if None (Day 3 research-based)
         if weights is None:
@@ -203,7 +330,10 @@ class FitnessEvaluator:
             objectives = {
                 "cost": minimize_cost(solution, self.buildings),
                 "walking": enhanced_walking_accessibility(
-                    solution, self.buildings, walking_speed_kmh=self.walking_speed_kmh
+                    solution,
+                    self.buildings,
+                    walking_speed_kmh=self.walking_speed_kmh,
+                    network=self.road_network,
                 ),
                 "adjacency": calculate_adjacency_score(solution, self.buildings),
                 "diversity": enhanced_diversity_score(solution, self.buildings),
@@ -265,6 +395,206 @@ class FitnessEvaluator:
         else:
             return ["cost", "walking", "adjacency"]
 
+    def evaluate_batch(
+        self, positions: np.ndarray, n_workers: int = 1
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate a whole population of layouts at once.
+
+        Vectorized counterpart of evaluate(): the same fitness and objective
+        values, computed with NumPy over all layouts instead of per Solution.
+
+        Args:
+            positions: Building centres, shape (pop, n_buildings, 2), columns in
+                ``building_ids`` order (e.g. SolutionBatch.coords)
+            n_workers: Worker processes to shard the population across
+                (default: 1 = in-process). Process start-up and pickling make
+                this worthwhile only for very large populations.
+
+        Returns:
+            Tuple of (fitness, objectives):
+            - fitness: Shape (pop,), each ∈ [0, 1]
+            - objectives: Shape (pop, n_objectives), in get_objective_names() order
+
+        Raises:
+            ValueError: If positions do not have shape (pop, n_buildings, 2)
+        """
+        positions = np.asarray(positions, dtype=float)
+        if positions.ndim != 3 or positions.shape[1:] != (len(self.buildings), 2):
+            raise ValueError(
+                f"positions must have shape (pop, {len(self.buildings)}, 2), "
+                f"got {positions.shape}"
+            )
+        if len(positions) == 0:
+            return np.zeros(0), np.zeros((0, len(self.get_objective_names())))
+
+        if n_workers > 1 and len(positions) > n_workers:
+            shards = np.array_split(positions, n_workers)
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                results = list(executor.map(_evaluate_shard, repeat(self), shards))
+        else:
+            # Bound the (rows, pairs) temporaries for large layouts
+            chunk = max(1, _BATCH_PAIR_ELEMENTS // max(len(self._pairs[0]), 1))
+            results = [
+                self._evaluate_rows(positions[start : start + chunk])
+                for start in range(0, len(positions), chunk)
+            ]
+
+        fitness = np.concatenate([result[0] for result in results])
+        objectives = np.concatenate([result[1] for result in results])
+        return fitness, objectives
+
+    def evaluate_population(self, solutions: Sequence[Solution], n_workers: int = 1) -> np.ndarray:
+        """
+        Evaluate solutions with evaluate_batch and store the results on them.
+
+        Each solution gets ``fitness`` and an ``objectives`` dict, as evaluate() sets.
+
+        Args:
+            solutions: Solutions (or SolutionViews) to evaluate
+            n_workers: Worker processes for sharding (see evaluate_batch)
+
+        Returns:
+            Fitness per solution, shape (len(solutions),)
+        """
+        positions = np.empty((len(solutions), len(self.buildings), 2))
+        for i, solution in enumerate(solutions):
+            positions[i] = positions_array(solution, self.building_ids)
+
+        fitness, objectives = self.evaluate_batch(positions, n_workers)
+
+        names = self.get_objective_names()
+        for solution, value, row in zip(solutions, fitness.tolist(), objectives.tolist()):
+            solution.fitness = value
+            solution.objectives = dict(zip(names, row))
+        return fitness
+
+    def _prepare_batch_terms(self) -> Dict[str, np.ndarray]:
+        """Layout-independent objective terms per building pair."""
+        i, j = self._pairs
+        types = [b.type for b in self.buildings]
+        terms: Dict[str, np.ndarray] = {}
+
+        # Cost and diversity do not depend on positions
+        no_layout = Solution(positions={})
+        terms["cost"] = np.array(minimize_cost(no_layout, self.buildings))
+
+        if self.use_enhanced:
+            terms["diversity"] = np.array(enhanced_diversity_score(no_layout, self.buildings))
+            type_idx = np.array([ADJACENCY_TYPE_INDEX.get(t.name, 0) for t in types])
+            flows = ADJACENCY_MATRIX_CAMPUS[type_idx[i], type_idx[j]].astype(float)
+            terms["flows"] = np.where(flows > 0, flows, 0.0)
+            opportunities = np.array([b.area for b in self.buildings], dtype=float)
+            opportunities = opportunities / np.sum(opportunities)
+            terms["opportunity_total"] = np.sum(opportunities)
+            terms["pair_opportunities"] = opportunities[i] + opportunities[j]
+        else:
+            compatibility = AdjacencyParams.COMPATIBILITY
+            default = AdjacencyParams.DEFAULT_COMPATIBILITY
+            terms["compatibility"] = np.array(
+                [
+                    compatibility.get(
+                        (types[a], types[b]), compatibility.get((types[b], types[a]), default)
+                    )
+                    for a, b in zip(i.tolist(), j.tolist())
+                ]
+            )
+
+        self._batch_terms = terms
+        return terms
+
+    def _evaluate_rows(self, positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Fitness and objectives of layouts (pop, n, 2), mirroring evaluate()."""
+        terms = self._batch_terms or self._prepare_batch_terms()
+        n = len(self.buildings)
+        pop = len(positions)
+        distances = _pair_distances(positions, self._pairs)
+
+        if self.use_enhanced:
+            # calculate_adjacency_score: exponential decay, lambda 0.002 (~500m)
+            adjacency = np.zeros(pop)
+            if n >= 2:
+                decay = np.exp(-0.002 * distances)
+                adjacency = (terms["flows"] * decay).sum(axis=-1) / (n * (n - 1) / 2)
+            columns = {
+                "cost": np.full(pop, terms["cost"]),
+                "walking": self._walking_accessibility_rows(positions, distances, terms),
+                "adjacency": adjacency,
+                "diversity": np.full(pop, terms["diversity"]),
+            }
+        else:
+            columns = {
+                "cost": np.full(pop, terms["cost"]),
+                "walking": self._walking_distance_rows(positions),
+                "adjacency": self._adjacency_satisfaction_rows(distances, terms),
+            }
+
+        # Same weighted cost sum as evaluate() (satisfaction scores become 1 - score)
+        weighted_sum = np.zeros(pop)
+        for name, values in columns.items():
+            score = values if name == "cost" else 1.0 - values
+            weighted_sum = weighted_sum + self.weights.get(name, 0.0) * score
+
+        i, j = self._pairs
+        required = self._radii[i] + self._radii[j] + self.min_distance_between_buildings
+        penalty = _mean_violation(distances, required)
+        weighted_sum = weighted_sum * (1.0 + 0.5 * penalty)
+
+        fitness = np.clip(1.0 - weighted_sum, 0.0, 1.0)
+        objectives = np.column_stack([columns[name] for name in self.get_objective_names()])
+        return fitness, objectives
+
+    @staticmethod
+    def _walking_distance_rows(positions: np.ndarray) -> np.ndarray:
+        """minimize_walking_distance per layout (default 1000m campus size)."""
+        campus_size = 1000.0
+        centroid = positions.mean(axis=1, keepdims=True)
+        distances = np.linalg.norm(positions - centroid, axis=2)
+        normalized_avg = np.clip(distances.mean(axis=1) / campus_size, 0.0, 1.0)
+        normalized_max = np.clip(distances.max(axis=1) / (campus_size * 1.5), 0.0, 1.0)
+        score = 0.7 * (1.0 - normalized_avg) + 0.3 * (1.0 - normalized_max)
+        return np.clip(score, 0.0, 1.0)
+
+    def _adjacency_satisfaction_rows(
+        self, distances: np.ndarray, terms: Dict[str, np.ndarray]
+    ) -> np.ndarray:
+        """maximize_adjacency_satisfaction per layout (ideal distance 100m)."""
+        if len(self.buildings) < 2:
+            return np.ones(len(distances))
+        ideal_distance = 100.0
+        satisfaction = terms["compatibility"] * np.exp(
+            -((distances - ideal_distance) ** 2) / (2 * (ideal_distance * 0.5) ** 2)
+        )
+        return np.clip(satisfaction.mean(axis=-1) / 0.9, 0.0, 1.0)
+
+    def _walking_accessibility_rows(
+        self, positions: np.ndarray, distances: np.ndarray, terms: Dict[str, np.ndarray]
+    ) -> np.ndarray:
+        """enhanced_walking_accessibility per layout."""
+        n = len(self.buildings)
+        if n < 2:
+            return np.ones(len(positions))
+        if self.road_network is not None:
+            # Shortest paths on the roads are not vectorized over layouts
+            batch = SolutionBatch(self.building_ids, positions)
+            return np.array(
+                [
+                    enhanced_walking_accessibility(
+                        view,
+                        self.buildings,
+                        walking_speed_kmh=self.walking_speed_kmh,
+                        network=self.road_network,
+                    )
+                    for view in batch
+                ]
+            )
+
+        # Gravity model over all ordered pairs: each building reaches itself at
+        # distance 0, and every unordered pair contributes w_ij * (O_i + O_j)
+        weights = np.exp(-LAMBDA_RESIDENTIAL * DETOUR_INDEX_TURKEY * distances)
+        reach = terms["opportunity_total"] + (weights * terms["pair_opportunities"]).sum(axis=-1)
+        return reach / n
+
     def evaluate_detailed(self, solution: Solution) -> Dict[str, float]:
         """
         Evaluate solution and return detailed objective breakdown.
@@ -286,7 +616,10 @@ class FitnessEvaluator:
             objectives = {
                 "cost": minimize_cost(solution, self.buildings),
                 "walking": enhanced_walking_accessibility(
-                    solution, self.buildings, walking_speed_kmh=self.walking_speed_kmh
+                    solution,
+                    self.buildings,
+                    walking_speed_kmh=self.walking_speed_kmh,
+                    network=self.road_network,
                 ),
                 "adjacency": calculate_adjacency_score(solution, self.buildings),
                 "diversity": enhanced_diversity_score(solution, self.buildings),
@@ -341,7 +674,10 @@ class FitnessEvaluator:
         healthy_objectives = {
             "cost": minimize_cost(solution, self.buildings),
             "walking": enhanced_walking_accessibility(
-                solution, self.buildings, walking_speed_kmh=WALKING_SPEED_HEALTHY
+                solution,
+                self.buildings,
+                walking_speed_kmh=WALKING_SPEED_HEALTHY,
+                network=self.road_network,
             ),
             "adjacency": calculate_adjacency_score(solution, self.buildings),
             "diversity": enhanced_diversity_score(solution, self.buildings),
@@ -351,7 +687,10 @@ class FitnessEvaluator:
         elderly_objectives = {
             "cost": minimize_cost(solution, self.buildings),
             "walking": enhanced_walking_accessibility(
-                solution, self.buildings, walking_speed_kmh=WALKING_SPEED_ELDERLY
+                solution,
+                self.buildings,
+                walking_speed_kmh=WALKING_SPEED_ELDERLY,
+                network=self.road_network,
             ),
             "adjacency": calculate_adjacency_score(solution, self.buildings),
             "diversity": enhanced_diversity_score(solution, self.buildings),
@@ -373,35 +712,14 @@ class FitnessEvaluator:
         Returns:
             Penalty from 0.0 (no overlap) to 1.0 (complete overlap)
         """
-        if len(self.buildings) < 2:
-            return 0.0
-
-        penalty = 0.0
-        pair_count = 0
-
-        for i, b1 in enumerate(self.buildings):
-            for b2 in self.buildings[i + 1 :]:
-                pos1 = np.array(solution.positions[b1.id])
-                pos2 = np.array(solution.positions[b2.id])
-                distance = np.linalg.norm(pos1 - pos2)
-
-                # Calculate building radii (approximate as circles)
-                radius1 = np.sqrt(b1.footprint / np.pi)
-                radius2 = np.sqrt(b2.footprint / np.pi)
-                min_required_distance = radius1 + radius2 + self.min_distance_between_buildings
-
-                if distance < min_required_distance:
-                    # Penalty increases as buildings get closer
-                    violation = (min_required_distance - distance) / min_required_distance
-                    penalty += violation
-                    pair_count += 1
-
-        if pair_count == 0:
-            return 0.0
-
-        # Average penalty across all overlapping pairs
-        avg_penalty = penalty / pair_count
-        return float(np.clip(avg_penalty, 0.0, 1.0))
+        return float(
+            overlap_penalty(
+                positions_array(solution, self.building_ids),
+                self._radii,
+                self.min_distance_between_buildings,
+                self._pairs,
+            )
+        )
 
     def _compactness_score(self, solution: Solution) -> float:
         """
@@ -419,7 +737,7 @@ class FitnessEvaluator:
             Score in [0,1] range (1.0 = ideal, 0.0 = very poor)
         """
         # Extract all positions as numpy array
-        positions = np.array(list(solution.positions.values()))
+        positions = positions_array(solution)
 
         # Handle edge case: single building
         if len(positions) < 2:
@@ -465,11 +783,7 @@ class FitnessEvaluator:
         centroid = np.array([(x_min + x_max) / 2, (y_min + y_max) / 2])
 
         # For each building, calculate distance to centroid
-        distances = []
-        for building in self.buildings:
-            position = np.array(solution.positions[building.id])
-            dist = np.linalg.norm(position - centroid)
-            distances.append(dist)
+        distances = np.linalg.norm(positions_array(solution, self.building_ids) - centroid, axis=1)
 
         # Calculate average distance
         avg_distance = np.mean(distances)
@@ -500,29 +814,12 @@ class FitnessEvaluator:
         Returns:
             Total penalty (always >= 0)
         """
-        x_min, y_min, x_max, y_max = self.bounds
-        total_penalty = 0.0
-
-        # Check bounds violations (1000 each)
-        for building in self.buildings:
-            x, y = solution.positions[building.id]
-            margin = building.radius
-
-            if x - margin < x_min or x + margin > x_max or y - margin < y_min or y + margin > y_max:
-                total_penalty += 1000.0
-
-        # Check overlaps and safety margin violations
-        for i, b1 in enumerate(self.buildings):
-            b1.position = solution.positions[b1.id]
-            for b2 in self.buildings[i + 1 :]:
-                b2.position = solution.positions[b2.id]
-
-                # Check if buildings overlap
-                if b1.overlaps_with(b2, safety_margin=0.0):
-                    total_penalty += 500.0
-
-                # Check safety margin violation
-                elif b1.overlaps_with(b2, safety_margin=self.safety_margin):
-                    total_penalty += 100.0
-
-        return total_penalty
+        return float(
+            constraint_penalty(
+                positions_array(solution, self.building_ids),
+                self._radii,
+                self.bounds,
+                self.safety_margin,
+                self._pairs,
+            )
+        )
@@ -0,0 +1,240 @@
+"""
+Array Graph Core
+================
+
+Compact undirected graph shared by road generation, connectivity metrics
+and network distances.
+
+A graph is an (E, 2) edge array plus an (E,) weight array; the symmetric
+CSR adjacency is built lazily and cached. Minimum spanning trees,
+connected components and shortest paths run in ``scipy.sparse.csgraph``,
+so building and traversing a graph costs a few array operations instead
+of one Python object per node and edge.
+
+Helpers turn raw geometry into graphs:
+    - ``delaunay_edges``: unique Delaunay edges of a point set
+    - ``merge_points``: greedy merge of nearby polyline points into nodes
+
+Created: 2026-10-18
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+from scipy.sparse import coo_matrix, csr_matrix
+from scipy.sparse.csgraph import connected_components, dijkstra, minimum_spanning_tree
+from scipy.spatial import Delaunay, cKDTree
+
+# Explicit zeros are not edges in csgraph; coincident nodes keep a tiny length
+MIN_EDGE_LENGTH = 1e-9
+
+
+class EdgeGraph:
+    """
+    Undirected weighted graph on edge arrays.
+
+    Self-loops are dropped and parallel edges keep the shortest; surviving
+    edges stay in their input order, stored as (i, j) with i < j.
+
+    Usage:
+        >>> graph = EdgeGraph(len(points), delaunay_edges(points), nodes=points)
+        >>> tree = graph.minimum_spanning_tree()
+        >>> n_parts, labels = graph.connected_components()
+    """
+
+    def __init__(
+        self,
+        n_nodes: int,
+        edges: np.ndarray,
+        weights: Optional[np.ndarray] = None,
+        nodes: Optional[np.ndarray] = None,
+    ):
+        """
+        Initialize from an edge list.
+
+        Args:
+            n_nodes: Number of nodes (V)
+            edges: (i, j) node index pairs (E, 2)
+            weights: Edge weights (E,) (default: Euclidean node distance if
+                ``nodes`` is given, else 1)
+            nodes: Optional (x, y) node coordinates (V, 2)
+        """
+        self.n_nodes = int(n_nodes)
+        self.nodes = None if nodes is None else np.asarray(nodes, dtype=float).reshape(-1, 2)
+
+        edges = np.asarray(edges, dtype=np.intp).reshape(-1, 2)
+        if weights is not None:
+            weights = np.asarray(weights, dtype=float).reshape(-1)
+        elif self.nodes is not None:
+            diff = self.nodes[edges[:, 0]] - self.nodes[edges[:, 1]]
+            weights = np.hypot(diff[:, 0], diff[:, 1])
+        else:
+            weights = np.ones(len(edges))
+
+        self.edges, self.weights = self._canonical(edges, weights)
+        self._csr: Optional[csr_matrix] = None
+
+    @staticmethod
+    def _canonical(edges: np.ndarray, weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Sorted (i < j) edges without self-loops or parallels, in input order."""
+        lo = np.minimum(edges[:, 0], edges[:, 1])
+        hi = np.maximum(edges[:, 0], edges[:, 1])
+        keep = np.flatnonzero(lo != hi)
+
+        # Shortest of each parallel group (ties: first in input order)
+        order = keep[np.lexsort((keep, weights[keep], hi[keep], lo[keep]))]
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = (lo[order[1:]] != lo[order[:-1]]) | (hi[order[1:]] != hi[order[:-1]])
+        kept = np.sort(order[first])
+
+        return np.column_stack([lo[kept], hi[kept]]), weights[kept]
+
+    @property
+    def n_edges(self) -> int:
+        return len(self.edges)
+
+    @property
+    def total_weight(self) -> float:
+        return float(self.weights.sum())
+
+    @property
+    def csr(self) -> csr_matrix:
+        """Symmetric CSR adjacency (built on first use)."""
+        if self._csr is None:
+            w = np.maximum(self.weights, MIN_EDGE_LENGTH)
+            rows = np.concatenate([self.edges[:, 0], self.edges[:, 1]])
+            cols = np.concatenate([self.edges[:, 1], self.edges[:, 0]])
+            self._csr = csr_matrix(
+                (np.concatenate([w, w]), (rows, cols)), shape=(self.n_nodes, self.n_nodes)
+            )
+        return self._csr
+
+    def degree(self) -> np.ndarray:
+        """Number of incident edges per node (V,)."""
+        return np.bincount(self.edges.ravel(), minlength=self.n_nodes)
+
+    def minimum_spanning_tree(self) -> "EdgeGraph":
+        """
+        Minimum spanning tree (forest, if the graph is disconnected).
+
+        Returns:
+            EdgeGraph on the same nodes with the tree edges
+        """
+        w = np.maximum(self.weights, MIN_EDGE_LENGTH)
+        upper = coo_matrix(
+            (w, (self.edges[:, 0], self.edges[:, 1])), shape=(self.n_nodes, self.n_nodes)
+        ).tocsr()
+        tree = minimum_spanning_tree(upper).tocoo()
+
+        # Map tree entries back to edge indices to keep the original weights
+        n = max(self.n_nodes, 1)
+        edge_ids = self.edges[:, 0] * n + self.edges[:, 1]
+        order = np.argsort(edge_ids)
+        tree_ids = np.minimum(tree.row, tree.col) * n + np.maximum(tree.row, tree.col)
+        idx = np.sort(order[np.searchsorted(edge_ids[order], tree_ids)])
+
+        return EdgeGraph(self.n_nodes, self.edges[idx], self.weights[idx], nodes=self.nodes)
+
+    def connected_components(self) -> Tuple[int, np.ndarray]:
+        """
+        Connected components.
+
+        Returns:
+            Tuple of (number of components, component label per node (V,))
+        """
+        return connected_components(self.csr, directed=False)
+
+    def is_connected(self) -> bool:
+        """True if the graph has nodes and forms a single component."""
+        return self.n_nodes > 0 and self.connected_components()[0] == 1
+
+    def shortest_paths(self, sources: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Shortest-path distances from the given source nodes.
+
+        Args:
+            sources: Source node indices (S,) (default: all nodes)
+
+        Returns:
+            Distance rows (S, V), inf for unreachable nodes
+        """
+        return np.atleast_2d(dijkstra(self.csr, directed=False, indices=sources))
+
+
+def delaunay_edges(points: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Unique Delaunay edges of a 2D point set.
+
+    Falls back to a joggled triangulation (qhull ``QJ``) for nearly
+    collinear points.
+
+    Args:
+        points: (N, 2) coordinates
+
+    Returns:
+        (E, 2) node index pairs with i < j, or None if fewer than 3 points
+        or qhull cannot triangulate them
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    if len(points) < 3:
+        return None
+
+    try:
+        tri = Delaunay(points)
+    except Exception:
+        try:
+            tri = Delaunay(points, qhull_options="QJ")
+        except Exception:
+            return None
+
+    simplices = tri.simplices
+    pairs = np.vstack([simplices[:, [0, 1]], simplices[:, [1, 2]], simplices[:, [2, 0]]])
+    pairs.sort(axis=1)
+    return np.unique(pairs, axis=0)
+
+
+def merge_points(points: np.ndarray, threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Greedily merge points closer than ``threshold`` into shared nodes.
+
+    Points are visited in order; each joins the earliest existing node
+    strictly within ``threshold`` or starts a new node at its own position.
+    Candidate neighbours come from a KD-tree, and exact duplicates are
+    resolved once.
+
+    Args:
+        points: (P, 2) coordinates
+        threshold: Merge distance in meters
+
+    Returns:
+        Tuple of (node coordinates (V, 2), node index per point (P,))
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    if len(points) == 0:
+        return np.zeros((0, 2)), np.zeros(0, dtype=np.intp)
+
+    # Duplicates always land on the same node as their first occurrence
+    unique, first, inverse = np.unique(points, axis=0, return_index=True, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    visit = np.argsort(first)
+
+    radius = np.nextafter(threshold, 0.0)  # ball queries are inclusive, merging is strict
+    neighbours = cKDTree(unique).query_ball_point(unique, radius) if threshold > 0 else None
+
+    node_of = [-1] * len(unique)
+    leader_node = [-1] * len(unique)  # node index of points that started a node
+    leaders = []
+    for u in visit.tolist():
+        best = -1
+        if neighbours is not None:
+            for v in neighbours[u]:
+                node = leader_node[v]
+                if node >= 0 and (best < 0 or node < best):
+                    best = node
+        if best < 0:
+            best = len(leaders)
+            leaders.append(u)
+            leader_node[u] = best
+        node_of[u] = best
+
+    return unique[leaders], np.asarray(node_of, dtype=np.intp)[inverse]
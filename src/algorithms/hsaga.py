@@ -9,6 +9,7 @@ GA Phase (Day 3): Local refinement
 Created: 2025-11-03
 """
 import logging
+import os
 import time
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
@@ -24,7 +25,8 @@ from .adaptive_cooling import (
 from .base import Optimizer
 from .building import Building
 from .fitness import FitnessEvaluator
-from .solution import Solution
+from .sa_chains import MultiChainAnnealer
+from .solution import Solution, SolutionBatch, positions_array
 
 if TYPE_CHECKING:
     from ..constraints.spatial_constraints import ConstraintManager
@@ -319,7 +321,7 @@ class HybridSAGA(Optimizer):
 
         # Cache building properties for faster access (Day 5 optimization)
         self._building_dict = {b.id: b for b in buildings}
-        self._building_ids = [b.id for b in buildings]
+        self._building_ids = tuple(b.id for b in buildings)
         self._building_types = np.array([b.type.value for b in buildings])
         self._building_areas = np.array([b.area for b in buildings])
         self._building_floors = np.array([b.floors for b in buildings])
@@ -341,6 +343,7 @@ class HybridSAGA(Optimizer):
             "stagnation_threshold": 50,  # Iterations before reheating
             "max_reheats": 3,  # Maximum reheats per chain
             "markov_chain_length": 20,  # Base iterations per temperature
+            "vectorized_chains": False,  # Lock-step chains in one process (MultiChainAnnealer)
         }
 
         # GA configuration (Day 4)
@@ -592,18 +595,22 @@ class HybridSAGA(Optimizer):
         self,
         solutions: List[Solution],
         max_workers: Optional[int] = None,
-        parallel_threshold: int = 50,
+        batch_threshold: int = 8,
+        shard_threshold: int = 5000,
     ) -> List[Solution]:
         """
-        Evaluate multiple solutions with smart parallelization.
+        Evaluate the solutions that have no fitness yet.
 
-        Uses ThreadPoolExecutor for GA (shared memory) to avoid pickling overhead.
-        Only parallelizes when batch size justifies overhead.
+        Batches of at least ``batch_threshold`` solutions are evaluated together
+        with FitnessEvaluator.evaluate_population (vectorized NumPy); evaluation
+        holds the GIL, so threads gave no speedup. Batches of at least
+        ``shard_threshold`` are also split across worker processes.
 
         Args:
             solutions: List of solutions to evaluate
-            max_workers: Maximum parallel workers (None = auto)
-            parallel_threshold: Minimum batch size for parallel (default 50)
+            max_workers: Worker processes for sharding (None = auto, up to 4)
+            batch_threshold: Minimum batch size for vectorized evaluation (default 8)
+            shard_threshold: Minimum batch size for process sharding (default 5000)
 
         Returns:
             Solutions with fitness values updated
@@ -614,45 +621,18 @@ class HybridSAGA(Optimizer):
         if not to_evaluate:
             return solutions
 
-        # Sequential for small batches (overhead not worth it)
-        if len(to_evaluate) < parallel_threshold:
+        # Sequential for small batches and evaluators without a batch API
+        if len(to_evaluate) < batch_threshold or not hasattr(self.evaluator, "evaluate_population"):
             for solution in to_evaluate:
                 solution.fitness = self.evaluator.evaluate(solution)
                 self.stats["evaluations"] = self.stats.get("evaluations", 0) + 1
             return solutions
 
-        # Parallel evaluation with ThreadPoolExecutor (no pickling!)
-        try:
-            from concurrent.futures import ThreadPoolExecutor, as_completed
-
-            if max_workers is None:
-                max_workers = min(len(to_evaluate) // 10, 4)  # Conservative
-
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Submit evaluation tasks
-                future_to_solution = {
-                    executor.submit(self.evaluator.evaluate, sol): sol for sol in to_evaluate
-                }
-
-                # Collect results
-                for future in as_completed(future_to_solution):
-                    solution = future_to_solution[future]
-                    try:
-                        fitness = future.result()
-                        solution.fitness = fitness
-                        self.stats["evaluations"] = self.stats.get("evaluations", 0) + 1
-                    except Exception as e:
-                        # Fallback for this solution
-                        logger.warning(f"Thread evaluation failed: {e}")
-                        solution.fitness = self.evaluator.evaluate(solution)
-                        self.stats["evaluations"] = self.stats.get("evaluations", 0) + 1
-
-        except Exception as e:
-            # Complete fallback to sequential
-            logger.warning(f"Parallel evaluation failed: {e}. Using sequential.")
-            for solution in to_evaluate:
-                solution.fitness = self.evaluator.evaluate(solution)
-                self.stats["evaluations"] = self.stats.get("evaluations", 0) + 1
+        n_workers = 1
+        if len(to_evaluate) >= shard_threshold:
+            n_workers = max_workers or min(os.cpu_count() or 1, 4)
+        self.evaluator.evaluate_population(to_evaluate, n_workers=n_workers)
+        self.stats["evaluations"] = self.stats.get("evaluations", 0) + len(to_evaluate)
 
         return solutions
 
@@ -668,6 +648,9 @@ class HybridSAGA(Optimizer):
         """
         num_chains = self.sa_config.get("num_chains", 4)
 
+        if self.sa_config.get("vectorized_chains", False):
+            return self._simulated_annealing_vectorized(num_chains)
+
         if num_chains == 1:
             # Sequential fallback for debugging
             logger.info("Running single SA chain (sequential)")
@@ -736,6 +719,40 @@ class HybridSAGA(Optimizer):
         logger.info(f"SA chains completed. Best fitness: {solutions[0].fitness:.4f}")
         return solutions
 
+    def _simulated_annealing_vectorized(self, num_chains: int) -> List[Solution]:
+        """
+        Run all SA chains in lock step in this process.
+
+        Chains are held as one coordinate array and evaluated together with
+        FitnessEvaluator.evaluate_batch; each chain has its own RNG stream
+        spawned from sa_config["seed"] (default 0).
+
+        Args:
+            num_chains: Number of SA chains
+
+        Returns:
+            List of best Solution from each SA chain (sorted by fitness)
+        """
+        logger.info(f"Running {num_chains} lock-step SA chains")
+        annealer = MultiChainAnnealer(
+            self.evaluator,
+            self.buildings,
+            self.bounds,
+            self.sa_config,
+            num_chains,
+            seed=self.sa_config.get("seed", 0),
+        )
+        best, chain_stats = annealer.run()
+
+        self.stats["evaluations"] = self.stats.get("evaluations", 0) + annealer.evaluations
+        self.stats["iterations"] = self.stats.get("iterations", 0) + annealer.iterations
+        self.stats["sa_chain_stats"] = chain_stats
+        self._chain_histories = [stats["history"] for stats in chain_stats]
+
+        solutions = best.to_solutions()
+        solutions.sort(key=lambda s: s.fitness, reverse=True)
+        return solutions
+
     def _run_sa_chain(self, seed: int, config: Dict) -> Solution:
         """
         Run a single SA chain with adaptive cooling.
@@ -975,9 +992,9 @@ class HybridSAGA(Optimizer):
         Returns:
             New Solution (neighbor)
         """
-        # Create copy
+        # Create copy (positions are copied along with the solution)
         new_solution = solution.copy()
-        new_positions = new_solution.positions.copy()
+        new_positions = new_solution.positions
 
         # Select perturbation operator based on probability
         rand = np.random.random()
@@ -1024,7 +1041,6 @@ class HybridSAGA(Optimizer):
             y = np.random.uniform(y_min + margin, y_max - margin)
             new_positions[building_id] = (x, y)
 
-        new_solution.positions = new_positions
         return new_solution
 
     def _initialize_ga_population(self, sa_solutions: List[Solution]) -> List[Solution]:
@@ -1047,19 +1063,19 @@ class HybridSAGA(Optimizer):
             Initial GA population of size self.ga_config['population_size']
         """
         pop_size = self.ga_config["population_size"]
-        population = []
+        # Population rows live in one coordinate array
+        batch = SolutionBatch.empty(self._building_ids, pop_size)
+        row = 0
 
         # 1. Add best SA solutions (50%)
         n_sa = min(pop_size // 2, len(sa_solutions))
         for i in range(n_sa):
-            # Deep copy to avoid reference issues
-            solution = Solution(
-                positions={bid: pos for bid, pos in sa_solutions[i].positions.items()}
-            )
-            solution.fitness = sa_solutions[i].fitness
-            if hasattr(sa_solutions[i], "objectives"):
-                solution.objectives = sa_solutions[i].objectives.copy()
-            population.append(solution)
+            source = sa_solutions[i]
+            batch.coords[row] = positions_array(source, self._building_ids)
+            batch.fitness[row] = np.nan if source.fitness is None else source.fitness
+            if source.objectives is not None:
+                batch.objectives[row] = source.objectives.copy()
+            row += 1
 
         logger.info(f"GA init: Added {n_sa} SA solutions")
 
@@ -1068,29 +1084,25 @@ class HybridSAGA(Optimizer):
         for i in range(n_perturb):
             # Select random SA solution (biased toward best)
             idx = np.random.randint(0, min(5, len(sa_solutions)))
-            base = sa_solutions[idx]
-
-            # Create copy
-            solution = Solution(positions={bid: pos for bid, pos in base.positions.items()})
 
-            # Perturb with moderate temperature
-            solution = self._perturb_solution(solution, temperature=50.0)
-            solution.fitness = None  # Invalidate fitness
-            population.append(solution)
+            # Perturb with moderate temperature (returns a new solution)
+            neighbor = self._perturb_solution(sa_solutions[idx], temperature=50.0)
+            batch.coords[row] = positions_array(neighbor, self._building_ids)
+            row += 1
 
         logger.info(f"GA init: Added {n_perturb} perturbed solutions")
 
         # 3. Add random solutions (20%)
-        n_random = pop_size - len(population)
+        n_random = pop_size - row
         for i in range(n_random):
             solution = self._generate_random_solution()
-            solution.fitness = None
-            population.append(solution)
+            batch.coords[row] = positions_array(solution, self._building_ids)
+            row += 1
 
         logger.info(f"GA init: Added {n_random} random solutions")
-        logger.info(f"GA init: Total population size = {len(population)}")
+        logger.info(f"GA init: Total population size = {len(batch)}")
 
-        return population
+        return list(batch)
 
     def _tournament_selection(
         self, population: List[Solution], tournament_size: Optional[int] = None
@@ -1112,6 +1124,12 @@ class HybridSAGA(Optimizer):
         Raises:
             ValueError: If tournament_size > population size
         """
+        return self._tournament_winner(population, tournament_size).copy()
+
+    def _tournament_winner(
+        self, population: List[Solution], tournament_size: Optional[int] = None
+    ) -> Solution:
+        """Tournament winner itself (not copied)."""
         if tournament_size is None:
             tournament_size = self.ga_config["tournament_size"]
 
@@ -1130,17 +1148,8 @@ class HybridSAGA(Optimizer):
         valid_candidates = [s for s in candidates if s.fitness is not None]
         if not valid_candidates:
             # If all have None fitness, just return first
-            winner = candidates[0]
-        else:
-            winner = max(valid_candidates, key=lambda s: s.fitness)
-
-        # Return deep copy
-        selected = Solution(positions={bid: pos for bid, pos in winner.positions.items()})
-        selected.fitness = winner.fitness
-        if hasattr(winner, "objectives"):
-            selected.objectives = winner.objectives.copy()
-
-        return selected
+            return candidates[0]
+        return max(valid_candidates, key=lambda s: s.fitness)
 
     def _selection(
         self, population: List[Solution], n_parents: Optional[int] = None
@@ -1162,10 +1171,9 @@ class HybridSAGA(Optimizer):
         if n_parents is None:
             n_parents = len(population) // 2
 
-        parents = []
-        for _ in range(n_parents):
-            parent = self._tournament_selection(population)
-            parents.append(parent)
+        # Copy all winners into one batch instead of one dict per parent
+        winners = [self._tournament_winner(population) for _ in range(n_parents)]
+        parents = list(SolutionBatch.from_solutions(winners, self._building_ids))
 
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Selected {len(parents)} parents via tournament selection")
@@ -1224,40 +1232,27 @@ class HybridSAGA(Optimizer):
         Returns:
             Offspring solutions (approximately same size as parents)
         """
-        offspring = []
-        crossover_rate = self.ga_config["crossover_rate"]
-
-        # Pair up parents (iterate by 2)
-        for i in range(0, len(parents) - 1, 2):
-            parent1 = parents[i]
-            parent2 = parents[i + 1]
+        if not parents:
+            return []
 
-            if np.random.random() < crossover_rate:
-                # Apply crossover
-                child1, child2 = self._uniform_crossover(parent1, parent2)
-                offspring.extend([child1, child2])
-            else:
-                # No crossover - copy parents
-                child1 = Solution(positions={bid: pos for bid, pos in parent1.positions.items()})
-                child2 = Solution(positions={bid: pos for bid, pos in parent2.positions.items()})
-                child1.fitness = parent1.fitness
-                child2.fitness = parent2.fitness
-
-                if hasattr(parent1, "objectives"):
-                    child1.objectives = parent1.objectives.copy()
-                if hasattr(parent2, "objectives"):
-                    child2.objectives = parent2.objectives.copy()
-
-                offspring.extend([child1, child2])
-
-        # Handle odd number of parents (last one just gets copied)
-        if len(parents) % 2 == 1:
-            last_parent = parents[-1]
-            child = Solution(positions={bid: pos for bid, pos in last_parent.positions.items()})
-            child.fitness = last_parent.fitness
-            if hasattr(last_parent, "objectives"):
-                child.objectives = last_parent.objectives.copy()
-            offspring.append(child)
+        crossover_rate = self.ga_config["crossover_rate"]
+        # Offspring start as copies of the parents (fitness included); an odd
+        # last parent and pairs without crossover stay that way
+        batch = SolutionBatch.from_solutions(parents, self._building_ids)
+        n_pairs = len(batch) // 2
+
+        # Uniform crossover of pairs (2i, 2i+1): child 2i keeps each gene of
+        # parent 2i with probability 0.5, otherwise the genes are swapped
+        crossed = np.random.random(n_pairs) < crossover_rate
+        keep = np.random.random((n_pairs, len(self._building_ids))) < 0.5
+        rows = 2 * np.flatnonzero(crossed)
+        keep = keep[crossed, :, np.newaxis]
+        first, second = batch.coords[rows], batch.coords[rows + 1]
+        batch.coords[rows] = np.where(keep, first, second)
+        batch.coords[rows + 1] = np.where(keep, second, first)
+        batch.invalidate(np.concatenate([rows, rows + 1]))
+
+        offspring = list(batch)
 
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
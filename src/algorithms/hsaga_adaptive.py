@@ -16,6 +16,7 @@ Created: 2026-01-02 (Week 4 Day 3)
 """
 
 import logging
+import os
 import time
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
@@ -709,49 +710,28 @@ class AdaptiveHSAGA(Optimizer):
         self,
         solutions: List[Solution],
         max_workers: Optional[int] = None,
-        parallel_threshold: int = 50,
+        batch_threshold: int = 8,
+        shard_threshold: int = 5000,
     ) -> List[Solution]:
-        """Evaluate multiple solutions with smart parallelization."""
+        """Evaluate unevaluated solutions, vectorized for larger batches."""
         to_evaluate = [s for s in solutions if s.fitness is None]
 
         if not to_evaluate:
             return solutions
 
-        # Sequential for small batches
-        if len(to_evaluate) < parallel_threshold:
+        # Sequential for small batches and evaluators without a batch API
+        if len(to_evaluate) < batch_threshold or not hasattr(self.evaluator, "evaluate_population"):
             for solution in to_evaluate:
                 solution.fitness = self.evaluator.evaluate(solution)
                 self.stats["evaluations"] = self.stats.get("evaluations", 0) + 1
             return solutions
 
-        # Parallel evaluation
-        try:
-            from concurrent.futures import ThreadPoolExecutor, as_completed
-
-            if max_workers is None:
-                max_workers = min(len(to_evaluate) // 10, 4)
-
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_solution = {
-                    executor.submit(self.evaluator.evaluate, sol): sol for sol in to_evaluate
-                }
-
-                for future in as_completed(future_to_solution):
-                    solution = future_to_solution[future]
-                    try:
-                        fitness = future.result()
-                        solution.fitness = fitness
-                        self.stats["evaluations"] = self.stats.get("evaluations", 0) + 1
-                    except Exception as e:
-                        logger.warning(f"Thread evaluation failed: {e}")
-                        solution.fitness = self.evaluator.evaluate(solution)
-                        self.stats["evaluations"] = self.stats.get("evaluations", 0) + 1
-
-        except Exception as e:
-            logger.warning(f"Parallel evaluation failed: {e}. Using sequential.")
-            for solution in to_evaluate:
-                solution.fitness = self.evaluator.evaluate(solution)
-                self.stats["evaluations"] = self.stats.get("evaluations", 0) + 1
+        # Vectorized batch; sharded across processes for very large batches
+        n_workers = 1
+        if len(to_evaluate) >= shard_threshold:
+            n_workers = max_workers or min(os.cpu_count() or 1, 4)
+        self.evaluator.evaluate_population(to_evaluate, n_workers=n_workers)
+        self.stats["evaluations"] = self.stats.get("evaluations", 0) + len(to_evaluate)
 
         return solutions
 
@@ -0,0 +1,260 @@
+"""
+Road-Network Distance Fields
+============================
+
+True walking distances on the campus road graph, replacing the constant
+detour-index estimate (``network_distance_estimate``) where a road network
+is available.
+
+Points (buildings, gateways) are snapped to their nearest road-graph node
+with a KD-tree. Shortest-path distances between nodes come from
+``scipy.sparse.csgraph.dijkstra`` and are cached per source node, so once a
+node has been seen every later lookup is plain array indexing:
+
+    d(p, q) = |p - snap(p)| + D[snap(p), snap(q)] + |snap(q) - q|
+
+Multi-source distance fields (e.g. distance from every node to the nearest
+gateway) are reduced from the cached rows and cached per source set.
+
+The road graph itself comes from ``road_network_graph`` in
+``backend/core/metrics/connectivity.py``; ``road_network_distances`` there
+caches one instance per road network.
+
+Created: 2026-10-18
+"""
+
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy.sparse.csgraph import dijkstra
+from scipy.spatial import cKDTree
+
+from .catchment import CatchmentPairs, build_catchment_pairs
+from .graph_core import EdgeGraph
+
+
+class RoadNetworkDistances:
+    """
+    Cached shortest-path distances on an undirected road graph.
+
+    Usage:
+        >>> graph = road_network_graph(major, minor)
+        >>> network = RoadNetworkDistances(graph.nodes, graph.edges, graph.weights)
+        >>> D = network.distance_matrix(dorm_positions, library_positions)
+    """
+
+    def __init__(
+        self,
+        nodes: Sequence[Tuple[float, float]],
+        edges: Sequence[Tuple[int, int]],
+        edge_lengths: Optional[Sequence[float]] = None,
+        precompute: bool = False,
+    ):
+        """
+        Initialize from a node/edge graph.
+
+        Args:
+            nodes: (x, y) node coordinates (V,)
+            edges: (i, j) node index pairs (E,)
+            edge_lengths: Edge lengths in meters (default: Euclidean node distance)
+            precompute: Run all-pairs Dijkstra up front (small networks only)
+
+        Raises:
+            ValueError: If the graph has no nodes
+        """
+        self.nodes = np.asarray(nodes, dtype=float).reshape(-1, 2)
+        self.n_nodes = len(self.nodes)
+        if self.n_nodes == 0:
+            raise ValueError("Road network has no nodes")
+
+        # Symmetric CSR adjacency keeping the shortest of parallel edges
+        self.graph = EdgeGraph(self.n_nodes, edges, edge_lengths, nodes=self.nodes).csr
+        self._tree = cKDTree(self.nodes)
+
+        # Lazily filled shortest-path rows: _rows[_row_of_node[v]] = D[v, :]
+        self._row_of_node = np.full(self.n_nodes, -1, dtype=np.intp)
+        self._rows = np.empty((0, self.n_nodes))
+        self._fields: Dict[Tuple[Tuple[int, ...], Tuple[float, ...]], np.ndarray] = {}
+
+        self.stats = {"dijkstra_calls": 0, "rows_computed": 0}
+
+        if precompute:
+            self._ensure_rows(np.arange(self.n_nodes))
+
+    # -------------------------------------------------------------------------
+    # Snapping and shortest-path rows
+    # -------------------------------------------------------------------------
+
+    def snap(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Snap points to their nearest road-graph node.
+
+        Args:
+            points: Locations (N, 2)
+
+        Returns:
+            Tuple of (node index (N,), snap distance in meters (N,))
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        if len(points) == 0:
+            return np.zeros(0, dtype=np.intp), np.zeros(0)
+        snap_dist, node_idx = self._tree.query(points)
+        return np.asarray(node_idx, dtype=np.intp), np.asarray(snap_dist, dtype=float)
+
+    def _ensure_rows(self, sources: np.ndarray) -> None:
+        """Run one multi-row Dijkstra for every source node not yet cached."""
+        sources = np.unique(sources)
+        missing = sources[self._row_of_node[sources] < 0]
+        if len(missing) == 0:
+            return
+
+        rows = dijkstra(self.graph, directed=False, indices=missing)
+        self._row_of_node[missing] = len(self._rows) + np.arange(len(missing))
+        self._rows = np.vstack([self._rows, np.atleast_2d(rows)])
+
+        self.stats["dijkstra_calls"] += 1
+        self.stats["rows_computed"] += len(missing)
+
+    def node_distances(self, source_nodes: np.ndarray, target_nodes: np.ndarray) -> np.ndarray:
+        """
+        Shortest-path distances between node pairs (elementwise).
+
+        Args:
+            source_nodes: Source node indices (P,)
+            target_nodes: Target node indices (P,)
+
+        Returns:
+            Distances in meters (P,), inf for disconnected pairs
+        """
+        source_nodes = np.asarray(source_nodes, dtype=np.intp)
+        target_nodes = np.asarray(target_nodes, dtype=np.intp)
+        if len(source_nodes) == 0:
+            return np.zeros(0)
+
+        # The graph is undirected: compute rows for the side with fewer nodes
+        if len(np.unique(target_nodes)) < len(np.unique(source_nodes)):
+            source_nodes, target_nodes = target_nodes, source_nodes
+
+        self._ensure_rows(source_nodes)
+        return self._rows[self._row_of_node[source_nodes], target_nodes]
+
+    # -------------------------------------------------------------------------
+    # Point-to-point distances
+    # -------------------------------------------------------------------------
+
+    def distance_matrix(
+        self, origin_points: np.ndarray, destination_points: np.ndarray
+    ) -> np.ndarray:
+        """
+        Network distances between all origin/destination pairs.
+
+        Args:
+            origin_points: Origin locations (N, 2)
+            destination_points: Destination locations (M, 2)
+
+        Returns:
+            Distance matrix (N, M) in meters, inf for disconnected pairs
+        """
+        o_node, o_snap = self.snap(origin_points)
+        d_node, d_snap = self.snap(destination_points)
+        n, m = len(o_node), len(d_node)
+
+        origin_idx = np.repeat(np.arange(n), m)
+        dest_idx = np.tile(np.arange(m), n)
+        core = self.node_distances(o_node[origin_idx], d_node[dest_idx])
+        return (o_snap[origin_idx] + core + d_snap[dest_idx]).reshape(n, m)
+
+    def catchment_pairs(
+        self,
+        origin_points: np.ndarray,
+        destination_points: np.ndarray,
+        catchment_distance: Optional[float] = None,
+    ) -> CatchmentPairs:
+        """
+        Origin/destination pairs within a network-distance catchment.
+
+        Candidate pairs come from a Euclidean KD-tree query with the same
+        radius, since network distance is normally no shorter than Euclidean
+        distance; the network distances are then checked against the radius.
+
+        Args:
+            origin_points: Origin locations (N, 2)
+            destination_points: Destination locations (M, 2)
+            catchment_distance: Maximum network distance in meters (None = all
+                connected pairs)
+
+        Returns:
+            CatchmentPairs with network distances
+        """
+        candidates = build_catchment_pairs(
+            origin_points, destination_points, catchment_distance=catchment_distance
+        )
+        o_node, o_snap = self.snap(origin_points)
+        d_node, d_snap = self.snap(destination_points)
+
+        distance = (
+            o_snap[candidates.origin_idx]
+            + self.node_distances(o_node[candidates.origin_idx], d_node[candidates.dest_idx])
+            + d_snap[candidates.dest_idx]
+        )
+
+        keep = np.isfinite(distance)
+        if catchment_distance is not None:
+            keep &= distance <= catchment_distance
+
+        return CatchmentPairs(
+            origin_idx=candidates.origin_idx[keep],
+            dest_idx=candidates.dest_idx[keep],
+            distance=distance[keep],
+            n_origins=candidates.n_origins,
+            n_destinations=candidates.n_destinations,
+        )
+
+    # -------------------------------------------------------------------------
+    # Multi-source distance fields
+    # -------------------------------------------------------------------------
+
+    def distance_field(self, source_points: np.ndarray) -> np.ndarray:
+        """
+        Distance from every node to the nearest source (e.g. gateways).
+
+        Cached per set of snapped source nodes and their snap legs, so source
+        sets snapping to the same nodes from different distances get their
+        own field.
+
+        Args:
+            source_points: Source locations (K, 2)
+
+        Returns:
+            Per-node distance in meters (V,), including the sources' snap legs
+        """
+        s_node, s_snap = self.snap(source_points)
+        # Offset per source node: shortest snap leg onto that node
+        nodes, inverse = np.unique(s_node, return_inverse=True)
+        offsets = np.full(len(nodes), np.inf)
+        np.minimum.at(offsets, inverse, s_snap)
+
+        key = (tuple(nodes.tolist()), tuple(offsets.tolist()))
+        if key not in self._fields:
+            field = np.full(self.n_nodes, np.inf)
+            if len(nodes):
+                self._ensure_rows(nodes)
+                rows = self._rows[self._row_of_node[nodes]]
+                field = np.min(rows + offsets[:, None], axis=0)
+            self._fields[key] = field
+        return self._fields[key]
+
+    def distance_to_nearest(self, points: np.ndarray, source_points: np.ndarray) -> np.ndarray:
+        """
+        Network distance from each point to its nearest source.
+
+        Args:
+            points: Query locations (N, 2)
+            source_points: Source locations (K, 2)
+
+        Returns:
+            Distances in meters (N,), inf if no source is reachable
+        """
+        field = self.distance_field(source_points)
+        node, snap = self.snap(points)
+        return snap + field[node]
@@ -21,6 +21,8 @@ from .niching import (
     niche_preserving_selection,
     normalize_objectives,
     perpendicular_distance,
+    perpendicular_distances,
+    reference_unit_directions,
 )
 from .nondominated_sort import (
     crowding_distance,
@@ -31,16 +33,24 @@ from .nondominated_sort import (
 )
 from .nsga3 import NSGA3
 from .reference_points import (
+    clear_reference_cache,
     count_reference_points,
+    das_dennis_lattice,
     generate_reference_points,
     generate_two_layer_reference_points,
     get_recommended_partitions,
+    reference_directions,
+    set_reference_cache_dir,
 )
 
 __all__ = [
     # Main optimizer
     "NSGA3",
     # Reference points
+    "reference_directions",
+    "das_dennis_lattice",
+    "set_reference_cache_dir",
+    "clear_reference_cache",
     "generate_reference_points",
     "generate_two_layer_reference_points",
     "count_reference_points",
@@ -55,6 +65,8 @@ __all__ = [
     "normalize_objectives",
     "associate_to_reference_points",
     "perpendicular_distance",
+    "perpendicular_distances",
+    "reference_unit_directions",
     "niche_preserving_selection",
     "compute_ideal_point",
     "compute_nadir_point",
@@ -15,7 +15,7 @@ Algorithm Using Reference-Point-Based Nondominated Sorting Approach."
 Created: 2026-01-02 (Week 4 Day 4)
 """
 
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import numpy as np
 
@@ -54,9 +54,52 @@ def normalize_objectives(
     return normalized
 
 
+def reference_unit_directions(reference_points: np.ndarray, epsilon: float = 1e-10) -> np.ndarray:
+    """
+    Unit vectors along the reference directions.
+
+    Reference points are fixed for a run, so callers compute this once and
+    pass it to associate_to_reference_points every generation.
+
+    Args:
+        reference_points: Array of shape (n_ref_points, n_objectives)
+        epsilon: Directions shorter than this become zero vectors
+
+    Returns:
+        Array of same shape; zero rows for degenerate directions
+    """
+    reference_points = np.asarray(reference_points, dtype=float)
+    norms = np.linalg.norm(reference_points, axis=1, keepdims=True)
+    return np.divide(
+        reference_points,
+        norms,
+        out=np.zeros_like(reference_points),
+        where=norms >= epsilon,
+    )
+
+
+def perpendicular_distances(points: np.ndarray, unit_directions: np.ndarray) -> np.ndarray:
+    """
+    Perpendicular distance of every point to every reference line.
+
+    One projection matrix product: d² = |p|² - (p · u)².
+
+    Args:
+        points: Array of shape (n_solutions, n_objectives)
+        unit_directions: Output of reference_unit_directions, (n_ref_points, n_objectives)
+
+    Returns:
+        Distances of shape (n_solutions, n_ref_points)
+    """
+    projections = points @ unit_directions.T
+    squared_norms = np.einsum("ij,ij->i", points, points)[:, np.newaxis]
+    return np.sqrt(np.maximum(squared_norms - projections * projections, 0.0))
+
+
 def associate_to_reference_points(
     normalized_objectives: np.ndarray,
     reference_points: np.ndarray,
+    unit_directions: Optional[np.ndarray] = None,
 ) -> Tuple[np.ndarray, np.ndarray]:
     """
     Associate each solution to its closest reference point.
@@ -66,6 +109,7 @@ def associate_to_reference_points(
     Args:
         normalized_objectives: Array of shape (n_solutions, n_objectives)
         reference_points: Array of shape (n_ref_points, n_objectives)
+        unit_directions: Cached reference_unit_directions(reference_points) (optional)
 
     Returns:
         Tuple of (associations, distances) where:
@@ -77,29 +121,16 @@ def associate_to_reference_points(
         >>> ref_points = np.array([[1, 0], [0, 1], [0.5, 0.5]])
         >>> associations, distances = associate_to_reference_points(objectives, ref_points)
     """
-    n_solutions = len(normalized_objectives)
-    n_ref_points = len(reference_points)
-
-    associations = np.zeros(n_solutions, dtype=int)
-    distances = np.zeros(n_solutions)
-
-    for i in range(n_solutions):
-        min_dist = np.inf
-        min_ref = 0
-
-        for j in range(n_ref_points):
-            # Calculate perpendicular distance from solution to reference line
-            dist = perpendicular_distance(
-                normalized_objectives[i],
-                reference_points[j],
-            )
+    if unit_directions is None:
+        unit_directions = reference_unit_directions(reference_points)
 
-            if dist < min_dist:
-                min_dist = dist
-                min_ref = j
+    points = np.asarray(normalized_objectives, dtype=float)
+    if len(points) == 0:
+        return np.zeros(0, dtype=int), np.zeros(0)
 
-        associations[i] = min_ref
-        distances[i] = min_dist
+    all_distances = perpendicular_distances(points, unit_directions)
+    associations = np.argmin(all_distances, axis=1)
+    distances = all_distances[np.arange(len(points)), associations]
 
     return associations, distances
 
@@ -155,6 +186,9 @@ def niche_preserving_selection(
     2. Select from under-represented niches first
     3. Within each niche, select solution closest to reference point
 
+    Runs in O(K log K) for K front members: every member's pick order is
+    known up front, so one sort replaces the pick-by-pick loop.
+
     Args:
         front: List of solution indices in the front
         associations: Array mapping solution index to reference point index
@@ -177,45 +211,24 @@ def niche_preserving_selection(
     if n_select >= len(front):
         return np.array(front, dtype=int)
 
-    n_ref_points = len(reference_points)
-
-    # Count solutions associated with each reference point
-    # Use float dtype to allow np.inf
-    niche_counts = np.zeros(n_ref_points, dtype=float)
-    for idx in front:
-        niche_counts[associations[idx]] += 1
-
-    selected = []
-
-    while len(selected) < n_select:
-        # Find niche with minimum count
-        min_count = np.min(niche_counts)
-        min_niches = np.where(niche_counts == min_count)[0]
-
-        # If multiple niches have same minimum count, choose randomly
-        if len(min_niches) > 1:
-            chosen_niche = np.random.choice(min_niches)
-        else:
-            chosen_niche = min_niches[0]
-
-        # Find solutions in this niche that haven't been selected yet
-        niche_solutions = [
-            idx for idx in front if associations[idx] == chosen_niche and idx not in selected
-        ]
-
-        if len(niche_solutions) == 0:
-            # This niche is exhausted, set count to infinity
-            niche_counts[chosen_niche] = np.inf
-            continue
+    front = np.asarray(front, dtype=int)
+    niches = associations[front]
 
-        # Select solution closest to reference point
-        best_sol = min(niche_solutions, key=lambda idx: distances[idx])
-        selected.append(best_sol)
+    # Members of each niche, closest to the reference line first (stable for ties)
+    order = np.lexsort((distances[front], niches))
+    sorted_niches = niches[order]
+    starts = np.flatnonzero(np.r_[True, sorted_niches[1:] != sorted_niches[:-1]])
+    sizes = np.diff(np.r_[starts, len(order)])
+    rank_in_niche = np.arange(len(order)) - np.repeat(starts, sizes)
 
-        # Increment niche count
-        niche_counts[chosen_niche] += 1
+    # A niche's count starts at its member count and grows by one per pick,
+    # so its j-th closest member is picked at count (members + j). Picks are
+    # made in count order, ties between niches broken at random.
+    count_at_pick = np.repeat(sizes, sizes) + rank_in_niche
+    tie_break = np.random.random(len(order))
+    picks = np.lexsort((tie_break, count_at_pick))[:n_select]
 
-    return np.array(selected, dtype=int)
+    return front[order[picks]]
 
 
 def compute_ideal_point(objectives: np.ndarray) -> np.ndarray:
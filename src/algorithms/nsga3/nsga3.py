@@ -29,13 +29,14 @@ from ..base import Optimizer
 from ..building import Building
 from ..fitness import FitnessEvaluator
 from ..operators.registry import OperatorRegistry, create_default_registry
-from ..solution import Solution
+from ..solution import Solution, SolutionBatch
 from .niching import (
     adaptive_nadir_estimation,
     associate_to_reference_points,
     compute_ideal_point,
     niche_preserving_selection,
     normalize_objectives,
+    reference_unit_directions,
 )
 from .nondominated_sort import fast_nondominated_sort
 from .reference_points import generate_reference_points
@@ -115,6 +116,9 @@ class NSGA3(Optimizer):
         # Initialize evaluator (use custom if provided)
         self.evaluator = evaluator or FitnessEvaluator(buildings=buildings, bounds=bounds)
 
+        # Coordinate column order of population batches
+        self.building_ids = tuple(b.id for b in buildings)
+
         # Get number of objectives from evaluator
         self.n_objectives = len(self.evaluator.get_objective_names())
 
@@ -135,6 +139,9 @@ class NSGA3(Optimizer):
                 n_partitions=n_partitions,
             )
 
+        # (reference_points, unit directions) reused by every generation's niching
+        self._reference_cache: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
         logger.info(
             f"Generated {len(self.reference_points)} reference points "
             f"for {self.n_objectives} objectives"
@@ -210,6 +217,7 @@ class NSGA3(Optimizer):
             associations, distances = associate_to_reference_points(
                 normalized_objectives,
                 self.reference_points,
+                unit_directions=self._reference_directions(),
             )
 
             # Environmental selection
@@ -255,33 +263,18 @@ class NSGA3(Optimizer):
             "convergence": convergence_history,
         }
 
-    def _initialize_population(self) -> List[Solution]:
-        """Initialize random population."""
-        population = []
-
-        for _ in range(self.population_size):
-            solution = self._generate_random_solution()
-            population.append(solution)
-
-        return population
-
-    def _generate_random_solution(self) -> Solution:
-        """Generate random valid solution."""
-        x_min, y_min, x_max, y_max = self.bounds
-        max_attempts = 100
-
-        for _ in range(max_attempts):
-            positions = {}
-            for building in self.buildings:
-                x = np.random.uniform(x_min, x_max)
-                y = np.random.uniform(y_min, y_max)
-                positions[building.id] = (x, y)
-
-            solution = Solution(positions=positions)
-            solution.fitness = None
-            return solution
+    def _reference_directions(self) -> np.ndarray:
+        """Unit reference directions, recomputed only when reference_points changes."""
+        if self._reference_cache is None or self._reference_cache[0] is not self.reference_points:
+            self._reference_cache = (
+                self.reference_points,
+                reference_unit_directions(self.reference_points),
+            )
+        return self._reference_cache[1]
 
-        raise RuntimeError(f"Failed to generate valid solution after {max_attempts} attempts")
+    def _initialize_population(self) -> List[Solution]:
+        """Initialize random population (views of one SolutionBatch)."""
+        return list(SolutionBatch.random(self.building_ids, self.population_size, self.bounds))
 
     def _evaluate_population(self, population: List[Solution]) -> List[Solution]:
         """Evaluate all solutions that don't have fitness yet."""
@@ -322,42 +315,48 @@ class NSGA3(Optimizer):
         return np.array([sol.objectives for sol in population])
 
     def _generate_offspring(self, population: List[Solution]) -> List[Solution]:
-        """Generate offspring using genetic operators."""
-        offspring = []
-
-        while len(offspring) < self.population_size:
-            # Tournament selection
-            parent1 = self._tournament_selection(population)
-            parent2 = self._tournament_selection(population)
-
-            # Crossover
-            if np.random.random() < self.crossover_rate:
-                crossover_op = self.registry.get_crossover("uniform")
-                child1, child2 = crossover_op.crossover(parent1, parent2)
-            else:
-                child1, child2 = parent1.copy(), parent2.copy()
-
-            # Mutation
-            for child in [child1, child2]:
-                if np.random.random() < self.mutation_rate:
-                    mutation_op = self.registry.get_mutation("gaussian", sigma=30.0)
-                    mutation_op.mutate(child, self.buildings, self.bounds)
-
-                child.fitness = None
-                child.objectives = None
+        """
+        Generate offspring using genetic operators.
 
-            offspring.extend([child1, child2])
+        The population is packed into one SolutionBatch so selection, crossover
+        and mutation run as array operations over all pairs at once.
+        """
+        parents = SolutionBatch.from_solutions(population, self.building_ids)
+        n_pairs = (self.population_size + 1) // 2
+
+        # Tournament selection
+        winners = self._tournament_rows(parents.fitness, 2 * n_pairs)
+        parents1 = parents.take(winners[0::2])
+        parents2 = parents.take(winners[1::2])
+
+        # Crossover (pairs that skip it keep their parents' genes)
+        crossover_op = self.registry.get_crossover("uniform")
+        children1, children2 = crossover_op.crossover_batch(parents1, parents2)
+        no_crossover = np.random.random(n_pairs) >= self.crossover_rate
+        children1.coords[no_crossover] = parents1.coords[no_crossover]
+        children2.coords[no_crossover] = parents2.coords[no_crossover]
+
+        # Interleave children as (child1, child2) per pair
+        coords = np.stack([children1.coords, children2.coords], axis=1)
+        offspring = SolutionBatch(
+            self.building_ids,
+            coords.reshape(-1, len(self.building_ids), 2)[: self.population_size],
+        )
 
-        return offspring[: self.population_size]
+        # Mutation
+        mutated = np.flatnonzero(np.random.random(len(offspring)) < self.mutation_rate)
+        mutation_op = self.registry.get_mutation("gaussian", sigma=30.0)
+        mutation_op.mutate_batch(offspring, mutated, self.buildings, self.bounds)
 
-    def _tournament_selection(self, population: List[Solution]) -> Solution:
-        """Binary tournament selection."""
-        indices = np.random.choice(len(population), self.tournament_size, replace=False)
-        tournament = [population[i] for i in indices]
+        return list(offspring)
 
-        # Compare using fitness (weighted sum)
-        best = max(tournament, key=lambda s: s.fitness if s.fitness is not None else -np.inf)
-        return best
+    def _tournament_rows(self, fitness: np.ndarray, n_select: int) -> np.ndarray:
+        """Rows of the winners of n_select tournaments (NaN fitness loses)."""
+        candidates = np.argpartition(
+            np.random.random((n_select, len(fitness))), self.tournament_size - 1, axis=1
+        )[:, : self.tournament_size]
+        scores = np.where(np.isnan(fitness), -np.inf, fitness)[candidates]
+        return candidates[np.arange(n_select), scores.argmax(axis=1)]
 
     def _environmental_selection(
         self,
@@ -13,89 +13,202 @@ problems." SIAM Journal on Optimization, 8(3), 631-657.
 Created: 2026-01-02 (Week 4 Day 4)
 """
 
-from typing import List
+import logging
+import os
+import tempfile
+import threading
+from itertools import combinations
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
 
 import numpy as np
 
+logger = logging.getLogger(__name__)
 
-def generate_reference_points(
+# Process-wide memo of reference directions by (n_objectives, n_partitions, n_partitions_inner)
+_MEMO: Dict[Tuple[int, int, Optional[int]], np.ndarray] = {}
+_MEMO_LOCK = threading.Lock()
+
+# Directory of the optional on-disk .npy cache (None = memory only)
+_CACHE_DIR: Optional[Path] = None
+
+
+def set_reference_cache_dir(path: Optional[Union[str, Path]]) -> None:
+    """
+    Set the default directory of the on-disk reference direction cache.
+
+    Args:
+        path: Directory for .npy files (created on first write); None disables it
+    """
+    global _CACHE_DIR
+    _CACHE_DIR = Path(path) if path is not None else None
+
+
+def clear_reference_cache() -> None:
+    """Drop the in-memory reference direction memo (disk files are kept)."""
+    with _MEMO_LOCK:
+        _MEMO.clear()
+
+
+def das_dennis_lattice(n_objectives: int, n_partitions: int) -> np.ndarray:
+    """
+    Integer Das-Dennis lattice: all compositions of n_partitions into n_objectives parts.
+
+    Non-recursive stars-and-bars enumeration: each choice of n_objectives - 1
+    bar positions among n_partitions + n_objectives - 1 slots is one point.
+    Lexicographic bar order yields the points in the same order as the
+    classic recursive generator (first objective ascending, then the next).
+
+    Args:
+        n_objectives: Number of objectives
+        n_partitions: Number of divisions along each objective axis
+
+    Returns:
+        Integer array of shape (n_points, n_objectives); rows sum to n_partitions
+    """
+    slots = n_partitions + n_objectives - 1
+    bars = np.fromiter(
+        (bar for choice in combinations(range(slots), n_objectives - 1) for bar in choice),
+        dtype=np.int64,
+    ).reshape(-1, n_objectives - 1)
+    edges = np.hstack([np.full((len(bars), 1), -1), bars, np.full((len(bars), 1), slots)])
+    return np.diff(edges, axis=1) - 1
+
+
+def _build_reference_directions(
+    n_objectives: int, n_partitions: int, n_partitions_inner: Optional[int]
+) -> np.ndarray:
+    """Single-layer simplex lattice, or outer lattice plus inner layer shrunk to the centre."""
+    points = das_dennis_lattice(n_objectives, n_partitions) / n_partitions
+    if n_partitions_inner is None:
+        return points
+
+    # Inner layer scaled towards center (1/n_objectives, 1/n_objectives, ...)
+    inner = das_dennis_lattice(n_objectives, n_partitions_inner) / n_partitions_inner * 0.5
+    center = np.ones(n_objectives) / n_objectives
+    inner = inner * 0.5 + center * 0.5
+    return np.vstack([points, inner])
+
+
+def _cache_file(cache_dir: Path, key: Tuple[int, int, Optional[int]]) -> Path:
+    n_objectives, n_partitions, n_partitions_inner = key
+    name = f"das_dennis_{n_objectives}obj_{n_partitions}p"
+    if n_partitions_inner is not None:
+        name += f"_{n_partitions_inner}i"
+    return cache_dir / f"{name}.npy"
+
+
+def _load_cached(path: Path, n_points: int, n_objectives: int) -> Optional[np.ndarray]:
+    """Directions from a cache file, or None if missing or unusable."""
+    try:
+        points = np.load(path, allow_pickle=False)
+    except (OSError, ValueError):
+        return None
+    if points.shape != (n_points, n_objectives):
+        logger.warning(f"Ignoring reference direction cache {path}: shape {points.shape}")
+        return None
+    return points
+
+
+def _save_cached(path: Path, points: np.ndarray) -> None:
+    """Write a cache file atomically (concurrent processes never see a partial file)."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".npy.tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, points, allow_pickle=False)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning(f"Could not write reference direction cache {path}: {e}")
+
+
+def reference_directions(
     n_objectives: int,
     n_partitions: int = 12,
-    scaling: float = 1.0,
+    n_partitions_inner: Optional[int] = None,
+    cache_dir: Optional[Union[str, Path]] = None,
 ) -> np.ndarray:
     """
-    Generate uniformly distributed reference points using Das-Dennis method.
+    Memoized Das-Dennis reference directions.
 
-    Creates points on a unit simplex (sum of coordinates = scaling).
+    Each (n_objectives, n_partitions, n_partitions_inner) set is generated
+    once per process and shared; with a cache directory (argument or
+    set_reference_cache_dir) it is also stored as .npy and loaded by later
+    processes instead of being regenerated.
 
     Args:
         n_objectives: Number of objectives
-        n_partitions: Number of divisions along each objective axis
-        scaling: Scale factor for reference points (default 1.0)
+        n_partitions: Partitions of the (outer) layer
+        n_partitions_inner: Partitions of the inner layer (None = single layer)
+        cache_dir: On-disk cache directory (default: set_reference_cache_dir value)
 
     Returns:
-        Array of shape (n_points, n_objectives) containing reference points
+        Read-only array of shape (n_points, n_objectives); copy before modifying
 
     Example:
-        >>> # 3 objectives, 12 partitions
-        >>> ref_points = generate_reference_points(3, 12)
-        >>> print(ref_points.shape)  # (91, 3)
-        >>> print(np.sum(ref_points[0]))  # 1.0
+        >>> ref_dirs = reference_directions(3, 12)
+        >>> ref_dirs is reference_directions(3, 12)
+        True
     """
     if n_objectives < 2:
         raise ValueError("n_objectives must be >= 2")
-    if n_partitions < 1:
+    if n_partitions < 1 or (n_partitions_inner is not None and n_partitions_inner < 1):
         raise ValueError("n_partitions must be >= 1")
 
-    # Generate points recursively
-    ref_points = _recursive_generate(n_objectives, n_partitions, 0, [])
+    key = (n_objectives, n_partitions, n_partitions_inner)
+    points = _MEMO.get(key)
+    if points is not None:
+        return points
+
+    with _MEMO_LOCK:
+        points = _MEMO.get(key)
+        if points is not None:
+            return points
 
-    # Convert to numpy array and scale
-    ref_points = np.array(ref_points) * scaling
+        n_points = count_reference_points(n_objectives, n_partitions)
+        if n_partitions_inner is not None:
+            n_points += count_reference_points(n_objectives, n_partitions_inner)
 
-    return ref_points
+        cache_dir = Path(cache_dir) if cache_dir is not None else _CACHE_DIR
+        path = _cache_file(cache_dir, key) if cache_dir is not None else None
+        if path is not None:
+            points = _load_cached(path, n_points, n_objectives)
+        if points is None:
+            points = _build_reference_directions(n_objectives, n_partitions, n_partitions_inner)
+            if path is not None:
+                _save_cached(path, points)
 
+        points.flags.writeable = False
+        _MEMO[key] = points
+        return points
 
-def _recursive_generate(
+
+def generate_reference_points(
     n_objectives: int,
-    n_partitions: int,
-    current_sum: int,
-    current_point: List[int],
-) -> List[List[float]]:
+    n_partitions: int = 12,
+    scaling: float = 1.0,
+) -> np.ndarray:
     """
-    Recursively generate reference points.
+    Generate uniformly distributed reference points using Das-Dennis method.
+
+    Creates points on a unit simplex (sum of coordinates = scaling).
+    The lattice comes from the memoized reference_directions().
 
     Args:
-        n_objectives: Number of objectives remaining
-        n_partitions: Number of partitions
-        current_sum: Current sum of allocated partitions
-        current_point: Current partial point being built
+        n_objectives: Number of objectives
+        n_partitions: Number of divisions along each objective axis
+        scaling: Scale factor for reference points (default 1.0)
 
     Returns:
-        List of reference points
-    """
-    if n_objectives == 1:
-        # Last objective - assign remaining partitions
-        point = current_point + [(n_partitions - current_sum) / n_partitions]
-        return [point]
-
-    points = []
-
-    # Try all possible allocations for current objective
-    for i in range(n_partitions - current_sum + 1):
-        value = i / n_partitions
-        new_point = current_point + [value]
-
-        # Recursively generate for remaining objectives
-        sub_points = _recursive_generate(
-            n_objectives - 1,
-            n_partitions,
-            current_sum + i,
-            new_point,
-        )
-        points.extend(sub_points)
+        Array of shape (n_points, n_objectives) containing reference points
 
-    return points
+    Example:
+        >>> # 3 objectives, 12 partitions
+        >>> ref_points = generate_reference_points(3, 12)
+        >>> print(ref_points.shape)  # (91, 3)
+        >>> print(np.sum(ref_points[0]))  # 1.0
+    """
+    return reference_directions(n_objectives, n_partitions) * scaling
 
 
 def generate_two_layer_reference_points(
@@ -126,25 +239,7 @@ def generate_two_layer_reference_points(
         ... )
         >>> print(ref_points.shape)  # (210, 5) - more coverage than single layer
     """
-    # Outer layer on boundary
-    outer_points = generate_reference_points(n_objectives, n_partitions_outer, scaling=1.0)
-
-    # Inner layer scaled towards center
-    inner_points = generate_reference_points(n_objectives, n_partitions_inner, scaling=0.5)
-
-    # Shift inner points towards center
-    # Center point is (1/n_objectives, 1/n_objectives, ...)
-    center = np.ones(n_objectives) / n_objectives
-    inner_points = inner_points * 0.5 + center * 0.5
-
-    # Combine layers
-    all_points = np.vstack([outer_points, inner_points])
-
-    # Scale if requested
-    if scaling != 1.0:
-        all_points *= scaling
-
-    return all_points
+    return reference_directions(n_objectives, n_partitions_outer, n_partitions_inner) * scaling
 
 
 def count_reference_points(n_objectives: int, n_partitions: int) -> int:
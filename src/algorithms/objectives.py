@@ -23,7 +23,7 @@ from typing import Dict, List, Optional
 import numpy as np
 
 from .building import Building, BuildingType
-from .solution import Solution
+from .solution import Solution, positions_array
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +76,19 @@ class AdjacencyParams:
         (BuildingType.DINING, BuildingType.EDUCATIONAL): 3.0,
     }
 
+    # Pair compatibility for adjacency satisfaction (symmetric, others 0.3)
+    COMPATIBILITY = {
+        (BuildingType.RESIDENTIAL, BuildingType.EDUCATIONAL): 0.8,
+        (BuildingType.RESIDENTIAL, BuildingType.SPORTS): 0.7,
+        (BuildingType.RESIDENTIAL, BuildingType.HEALTH): 0.6,
+        (BuildingType.RESIDENTIAL, BuildingType.LIBRARY): 0.7,
+        (BuildingType.EDUCATIONAL, BuildingType.LIBRARY): 0.9,
+        (BuildingType.EDUCATIONAL, BuildingType.ADMINISTRATIVE): 0.7,
+        (BuildingType.SPORTS, BuildingType.HEALTH): 0.6,
+        (BuildingType.LIBRARY, BuildingType.ADMINISTRATIVE): 0.5,
+    }
+    DEFAULT_COMPATIBILITY = 0.3
+
 
 # ============================================================================
 # OBJECTIVE FUNCTIONS
@@ -157,7 +170,7 @@ def minimize_walking_distance(
         return 0.0
 
     # Calculate campus centroid
-    positions = np.array(list(solution.positions.values()))
+    positions = positions_array(solution)
     centroid = positions.mean(axis=0)
 
     # Calculate distances to centroid
@@ -213,31 +226,23 @@ def maximize_adjacency_satisfaction(
     if len(buildings) < 2:
         return 1.0
 
-    # Compatibility matrix (symmetric)
-    compatibility = {
-        (BuildingType.RESIDENTIAL, BuildingType.EDUCATIONAL): 0.8,
-        (BuildingType.RESIDENTIAL, BuildingType.SPORTS): 0.7,
-        (BuildingType.RESIDENTIAL, BuildingType.HEALTH): 0.6,
-        (BuildingType.RESIDENTIAL, BuildingType.LIBRARY): 0.7,
-        (BuildingType.EDUCATIONAL, BuildingType.LIBRARY): 0.9,
-        (BuildingType.EDUCATIONAL, BuildingType.ADMINISTRATIVE): 0.7,
-        (BuildingType.SPORTS, BuildingType.HEALTH): 0.6,
-        (BuildingType.LIBRARY, BuildingType.ADMINISTRATIVE): 0.5,
-    }
+    compatibility = AdjacencyParams.COMPATIBILITY
 
     total_satisfaction = 0.0
     pair_count = 0
+    positions = positions_array(solution, [b.id for b in buildings])
 
     # Calculate satisfaction for each building pair
     for i, b1 in enumerate(buildings):
-        for b2 in buildings[i + 1 :]:
-            # Get positions
-            pos1 = np.array(solution.positions[b1.id])
-            pos2 = np.array(solution.positions[b2.id])
-            distance = np.linalg.norm(pos1 - pos2)
+        for j in range(i + 1, len(buildings)):
+            b2 = buildings[j]
+            distance = np.linalg.norm(positions[i] - positions[j])
 
             # Get compatibility (check both directions)
-            comp = compatibility.get((b1.type, b2.type), compatibility.get((b2.type, b1.type), 0.3))
+            comp = compatibility.get(
+                (b1.type, b2.type),
+                compatibility.get((b2.type, b1.type), AdjacencyParams.DEFAULT_COMPATIBILITY),
+            )
 
             # Distance satisfaction (Gaussian decay)
             # Ideal distance = 100m, compatible buildings should be close
@@ -19,13 +19,21 @@ Key Features:
 Created: 2026-01-02 (Week 4 Day 4 - Research Integration)
 """
 
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import numpy as np
 from scipy.spatial.distance import cdist
 
 from .building import Building
-from .solution import Solution
+from .catchment import (
+    CatchmentPairs,
+    build_catchment_pairs,
+    decay_weights,
+    sparse_gravity_accessibility,
+    sparse_two_step_fca,
+)
+from .network_distance import RoadNetworkDistances
+from .solution import Solution, positions_array
 
 # =============================================================================
 # CONSTANTS (From Research)
@@ -91,6 +99,8 @@ def network_distance_estimate(
     Estimate network distance from Euclidean distance.
 
     Research shows Turkish cities have average detour index of 1.324.
+    When the road network is known, use RoadNetworkDistances
+    (network_distance.py) for true shortest-path distances instead.
 
     Args:
         euclidean_dist: Straight-line distance (meters)
@@ -213,11 +223,32 @@ def power_law_decay(
 # =============================================================================
 
 
+def _network_catchment_pairs(
+    origin_points: np.ndarray,
+    destination_points: np.ndarray,
+    catchment_distance: Optional[float],
+    network: Optional[RoadNetworkDistances],
+) -> CatchmentPairs:
+    """Catchment pairs on road-network distances, or detour-adjusted Euclidean."""
+    if network is not None:
+        return network.catchment_pairs(
+            origin_points, destination_points, catchment_distance=catchment_distance
+        )
+    return build_catchment_pairs(
+        origin_points,
+        destination_points,
+        catchment_distance=catchment_distance,
+        distance_scale=DETOUR_INDEX_TURKEY,
+    )
+
+
 def gravity_model_accessibility(
     origin_points: np.ndarray,
     destination_points: np.ndarray,
     opportunities: np.ndarray,
     decay_function: str = "gaussian",
+    catchment_distance: Optional[float] = None,
+    network: Optional[RoadNetworkDistances] = None,
     **decay_params,
 ) -> np.ndarray:
     """
@@ -230,6 +261,11 @@ def gravity_model_accessibility(
         destination_points: Destination locations (M, 2) array
         opportunities: Opportunity values at each destination (M,) array
         decay_function: "gaussian", "exponential", or "power_law"
+        catchment_distance: Optional network-distance cutoff (meters). When set,
+            only pairs within the cutoff are considered (KD-tree radius query),
+            keeping memory O(pairs) for large origin grids.
+        network: Road-network distances; when given, shortest-path distances
+            on the roads replace the detour-index estimate
         **decay_params: Parameters for decay function
             - For gaussian: sigma
             - For exponential: lambda_param
@@ -240,32 +276,21 @@ def gravity_model_accessibility(
 
     Research: 15-Minute City Optimization Analysis.docx Section 1.2.B
     """
-    # Calculate pairwise distances (N, M)
-    distances = cdist(origin_points, destination_points, metric="euclidean")
-
-    # Apply network adjustment
-    distances = network_distance_estimate(distances)
-
-    # Apply decay function
-    if decay_function == "gaussian":
-        sigma = decay_params.get("sigma", SIGMA_DAILY_SERVICES)
-        decay = gaussian_decay(distances, sigma)
-    elif decay_function == "exponential":
-        lambda_param = decay_params.get("lambda_param", LAMBDA_RESIDENTIAL)
-        decay = exponential_decay(distances, lambda_param)
-    elif decay_function == "power_law":
-        alpha = decay_params.get("alpha", ALPHA_GROCERY)
-        decay = power_law_decay(distances, alpha)
-    else:
+    if decay_function not in ("gaussian", "exponential", "power_law"):
         raise ValueError(f"Unknown decay function: {decay_function}")
 
-    # Weight by opportunities
-    weighted_decay = decay * opportunities[np.newaxis, :]  # (N, M)
+    # Catchment pairs with network-adjusted distances
+    pairs = _network_catchment_pairs(origin_points, destination_points, catchment_distance, network)
 
-    # Sum across destinations
-    accessibility = np.sum(weighted_decay, axis=1)  # (N,)
+    weights = decay_weights(
+        pairs.distance,
+        decay_function,
+        sigma=decay_params.get("sigma", SIGMA_DAILY_SERVICES),
+        lambda_param=decay_params.get("lambda_param", LAMBDA_RESIDENTIAL),
+        alpha=decay_params.get("alpha", ALPHA_GROCERY),
+    )
 
-    return accessibility
+    return sparse_gravity_accessibility(pairs, weights, opportunities)
 
 
 def two_step_floating_catchment_area(
@@ -275,6 +300,7 @@ def two_step_floating_catchment_area(
     destination_supply: np.ndarray,
     catchment_distance: float = 800,
     sigma: float = 500,
+    network: Optional[RoadNetworkDistances] = None,
 ) -> Tuple[np.ndarray, np.ndarray]:
     """
     Calculate 2SFCA accessibility index.
@@ -285,6 +311,9 @@ def two_step_floating_catchment_area(
     Step 1: Calculate supply-to-demand ratio R_j for each facility
     Step 2: Sum ratios R_j for all facilities accessible to each origin
 
+    Only origin/facility pairs within the catchment are materialized
+    (see ``catchment.py``), so both steps are sparse matrix-vector products.
+
     Args:
         origin_points: Origin locations (N, 2) - e.g., residential areas
         destination_points: Service locations (M, 2) - e.g., schools
@@ -292,6 +321,7 @@ def two_step_floating_catchment_area(
         destination_supply: Supply at each destination (M,) - e.g., capacity
         catchment_distance: Maximum distance for catchment (meters)
         sigma: Gaussian bandwidth for decay
+        network: Road-network distances (default: detour-index estimate)
 
     Returns:
         Tuple of:
@@ -300,50 +330,10 @@ def two_step_floating_catchment_area(
 
     Research: 15-Minute City Optimization Analysis.docx Section 1.2.B.2
     """
-    # Calculate all pairwise distances
-    distances = cdist(origin_points, destination_points, metric="euclidean")
-    distances = network_distance_estimate(distances)  # (N, M)
-
-    # Gaussian decay
-    decay = gaussian_decay(distances, sigma)  # (N, M)
-
-    # Step 1: Calculate R_j (supply-to-demand ratio)
-    supply_ratios = np.zeros(len(destination_points))
+    pairs = _network_catchment_pairs(origin_points, destination_points, catchment_distance, network)
+    weights = decay_weights(pairs.distance, "gaussian", sigma=sigma)
 
-    for j in range(len(destination_points)):
-        # Find origins within catchment
-        within_catchment = distances[:, j] <= catchment_distance
-
-        if not np.any(within_catchment):
-            supply_ratios[j] = 0
-            continue
-
-        # Sum weighted demand
-        total_demand = np.sum(origin_demand[within_catchment] * decay[within_catchment, j])
-
-        # Calculate ratio
-        if total_demand > 0:
-            supply_ratios[j] = destination_supply[j] / total_demand
-        else:
-            supply_ratios[j] = 0
-
-    # Step 2: Calculate A_i (accessibility for each origin)
-    accessibility_scores = np.zeros(len(origin_points))
-
-    for i in range(len(origin_points)):
-        # Find destinations within catchment
-        within_catchment = distances[i, :] <= catchment_distance
-
-        if not np.any(within_catchment):
-            accessibility_scores[i] = 0
-            continue
-
-        # Sum weighted ratios
-        accessibility_scores[i] = np.sum(
-            supply_ratios[within_catchment] * decay[i, within_catchment]
-        )
-
-    return supply_ratios, accessibility_scores
+    return sparse_two_step_fca(pairs, weights, origin_demand, destination_supply)
 
 
 # =============================================================================
@@ -451,6 +441,16 @@ ADJACENCY_MATRIX_CAMPUS = np.array(
     ]
 )
 
+# Row/column of each building type in ADJACENCY_MATRIX_CAMPUS (others use 0)
+ADJACENCY_TYPE_INDEX = {
+    "RESIDENTIAL": 0,
+    "EDUCATIONAL": 1,
+    "COMMERCIAL": 2,
+    "HEALTHCARE": 3,
+    "SOCIAL": 4,  # Recreation
+    "ADMINISTRATIVE": 5,
+}
+
 
 def calculate_adjacency_score(
     solution: Solution,
@@ -480,19 +480,10 @@ def calculate_adjacency_score(
         return 0.0
 
     # Build position matrix
-    positions = np.array([solution.positions[b.id] for b in buildings])
+    positions = positions_array(solution, [b.id for b in buildings])
 
     # Build type indices
-    type_to_idx = {
-        "RESIDENTIAL": 0,
-        "EDUCATIONAL": 1,
-        "COMMERCIAL": 2,
-        "HEALTHCARE": 3,
-        "SOCIAL": 4,  # Recreation
-        "ADMINISTRATIVE": 5,
-    }
-
-    type_indices = [type_to_idx.get(b.type.name, 0) for b in buildings]
+    type_indices = [ADJACENCY_TYPE_INDEX.get(b.type.name, 0) for b in buildings]
 
     # Calculate distances
     distances = cdist(positions, positions, metric="euclidean")
@@ -528,12 +519,13 @@ def enhanced_walking_accessibility(
     solution: Solution,
     buildings: List[Building],
     walking_speed_kmh: float = WALKING_SPEED_HEALTHY,
+    network: Optional[RoadNetworkDistances] = None,
 ) -> float:
     """
     Calculate walking accessibility with research-based metrics.
 
     Uses:
-    - Network distance adjustment (detour index)
+    - Network distance (road shortest paths, or detour index if no network)
     - Gravity model with exponential decay
     - 15-minute city threshold
 
@@ -541,6 +533,7 @@ def enhanced_walking_accessibility(
         solution: Campus layout
         buildings: List of buildings
         walking_speed_kmh: Walking speed for equity analysis
+        network: Road-network distances (default: detour-index estimate)
 
     Returns:
         Accessibility score [0, 1] (higher = better)
@@ -549,7 +542,7 @@ def enhanced_walking_accessibility(
         return 1.0
 
     # Get positions
-    positions = np.array([solution.positions[b.id] for b in buildings])
+    positions = positions_array(solution, [b.id for b in buildings])
 
     # Calculate building "attractiveness" (by area)
     opportunities = np.array([b.area for b in buildings])
@@ -563,6 +556,7 @@ def enhanced_walking_accessibility(
         destination_points=positions,
         opportunities=opportunities,
         decay_function="exponential",
+        network=network,
         lambda_param=LAMBDA_RESIDENTIAL,
     )
 
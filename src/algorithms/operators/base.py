@@ -12,10 +12,10 @@ Created: 2026-01-02 (Week 4 Day 3)
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Tuple, Type
+from typing import Dict, List, Sequence, Tuple, Type
 
 from ..building import Building
-from ..solution import Solution
+from ..solution import Solution, SolutionBatch
 
 
 class PerturbationOperator(ABC):
@@ -80,6 +80,29 @@ class MutationOperator(ABC):
         """
         pass
 
+    def mutate_batch(
+        self,
+        batch: SolutionBatch,
+        rows: Sequence[int],
+        buildings: List[Building],
+        bounds: Tuple[float, float, float, float],
+    ) -> None:
+        """
+        Mutate rows of a batch in-place and mark them unevaluated.
+
+        The default applies mutate() to each row view; override with an
+        array implementation where one exists.
+
+        Args:
+            batch: Population batch
+            rows: Rows to mutate
+            buildings: List of buildings
+            bounds: Site boundaries
+        """
+        for row in rows:
+            self.mutate(batch[row], buildings, bounds)
+        batch.invalidate(rows)
+
     @property
     def name(self) -> str:
         """Operator name for logging/registry."""
@@ -111,6 +134,32 @@ class CrossoverOperator(ABC):
         """
         pass
 
+    def crossover_batch(
+        self,
+        parents1: SolutionBatch,
+        parents2: SolutionBatch,
+    ) -> Tuple[SolutionBatch, SolutionBatch]:
+        """
+        Cross row i of parents1 with row i of parents2 for every row.
+
+        The default applies crossover() to each pair of row views; override
+        with an array implementation where one exists.
+
+        Args:
+            parents1: First parents
+            parents2: Second parents (same size and buildings)
+
+        Returns:
+            Tuple of two unevaluated offspring batches
+        """
+        pairs = [self.crossover(p1, p2) for p1, p2 in zip(parents1, parents2)]
+        building_ids = parents1.building_ids
+        children1 = SolutionBatch.from_solutions([c1 for c1, _ in pairs], building_ids)
+        children2 = SolutionBatch.from_solutions([c2 for _, c2 in pairs], building_ids)
+        children1.invalidate()
+        children2.invalidate()
+        return children1, children2
+
     @property
     def name(self) -> str:
         """Operator name for logging/registry."""
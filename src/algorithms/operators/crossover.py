@@ -11,7 +11,7 @@ from typing import Tuple
 
 import numpy as np
 
-from ..solution import Solution
+from ..solution import Solution, SolutionBatch
 from .base import CrossoverOperator
 
 
@@ -62,6 +62,26 @@ class UniformCrossover(CrossoverOperator):
 
         return child1, child2
 
+    def crossover_batch(
+        self,
+        parents1: SolutionBatch,
+        parents2: SolutionBatch,
+    ) -> Tuple[SolutionBatch, SolutionBatch]:
+        """
+        Uniform crossover of all parent pairs at once.
+
+        Draws the same random numbers, in the same order, as calling
+        crossover() pair by pair.
+        """
+        keep = np.random.random(parents1.coords.shape[:2]) < self.swap_probability
+        keep = keep[..., np.newaxis]
+        child1 = np.where(keep, parents1.coords, parents2.coords)
+        child2 = np.where(keep, parents2.coords, parents1.coords)
+        return (
+            SolutionBatch(parents1.building_ids, child1),
+            SolutionBatch(parents1.building_ids, child2),
+        )
+
 
 class PartiallyMatchedCrossover(CrossoverOperator):
     """
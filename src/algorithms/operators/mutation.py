@@ -7,12 +7,12 @@ Operators for mutating solutions in Genetic Algorithms.
 Created: 2026-01-02 (Week 4 Day 3)
 """
 
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
 
 import numpy as np
 
 from ..building import Building
-from ..solution import Solution
+from ..solution import Solution, SolutionBatch
 from .base import MutationOperator
 
 
@@ -59,6 +59,28 @@ class GaussianMutation(MutationOperator):
 
         return solution
 
+    def mutate_batch(
+        self,
+        batch: SolutionBatch,
+        rows: Sequence[int],
+        buildings: List[Building],
+        bounds: Tuple[float, float, float, float],
+    ) -> None:
+        """Gaussian perturbation of one random building in each row, in-place."""
+        rows = np.asarray(rows, dtype=int)
+        if len(rows) == 0:
+            return
+        columns = np.random.randint(len(batch.building_ids), size=len(rows))
+        noise = np.random.normal(0, self.sigma, size=(len(rows), 2))
+
+        x_min, y_min, x_max, y_max = bounds
+        batch.coords[rows, columns] = np.clip(
+            batch.coords[rows, columns] + noise,
+            (x_min + self.margin, y_min + self.margin),
+            (x_max - self.margin, y_max - self.margin),
+        )
+        batch.invalidate(rows)
+
 
 class SwapMutation(MutationOperator):
     """
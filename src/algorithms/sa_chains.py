@@ -0,0 +1,321 @@
+"""
+Lock-step Multi-chain Simulated Annealing
+==========================================
+
+Runs many simulated annealing chains as one (chains, buildings, 2) array in
+a single process. Every step perturbs all active chains together, evaluates
+the neighbours with FitnessEvaluator.evaluate_batch and applies a vectorized
+Metropolis test, so adding chains costs little more than the batch rows.
+
+Each chain keeps its own temperature, Markov chain length, stagnation counter,
+reheats and phase-transition statistics (same rules as HybridSAGA._run_sa_chain),
+and draws from its own RNG stream spawned from one seed. A chain's trajectory
+therefore depends only on the seed and its index, not on the number of chains,
+and no global NumPy random state is touched.
+
+Classes:
+    MultiChainAnnealer: Lock-step SA engine
+
+Created: 2026-10-18
+"""
+
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .adaptive_cooling import (
+    adaptive_cooling_specific_heat,
+    adaptive_markov_length,
+    calculate_reheat_temperature,
+    should_reheat,
+    track_phase_transition,
+)
+from .building import Building
+from .fitness import FitnessEvaluator
+from .solution import SolutionBatch
+
+logger = logging.getLogger(__name__)
+
+# Random numbers per chain and step: operator, building, swap partner,
+# reset x, reset y, Metropolis test
+_UNIFORMS_PER_STEP = 6
+
+
+class MultiChainAnnealer:
+    """
+    Simulated annealing over many chains in lock step.
+
+    Perturbation operators match HybridSAGA._perturb_solution:
+    - Gaussian move (80%): σ = T/10 (min 0.1m), clipped to the building margin
+    - Swap buildings (15%): Exchange positions of two buildings
+    - Random reset (5%): Uniform position within the building margin
+
+    Attributes:
+        evaluator: Fitness evaluator (evaluate_batch is used)
+        num_chains: Number of chains
+        evaluations: Fitness evaluations of the last run
+        iterations: Iterations per chain of the last run
+
+    Example:
+        >>> annealer = MultiChainAnnealer(evaluator, buildings, bounds, sa_config, 32)
+        >>> best, chain_stats = annealer.run()
+        >>> print(f"Best fitness: {best.fitness.max():.4f}")
+    """
+
+    def __init__(
+        self,
+        evaluator: FitnessEvaluator,
+        buildings: List[Building],
+        bounds: Tuple[float, float, float, float],
+        config: Dict,
+        num_chains: int,
+        seed: Optional[int] = 0,
+        block_size: int = 64,
+    ):
+        """
+        Initialize annealer.
+
+        Args:
+            evaluator: Fitness evaluator for the buildings
+            buildings: Buildings to place (order of the coordinate arrays)
+            bounds: Site boundaries (x_min, y_min, x_max, y_max)
+            config: HybridSAGA SA configuration dict
+            num_chains: Number of chains to run together
+            seed: Root seed of the per-chain RNG streams (None = fresh entropy)
+            block_size: Steps of random numbers drawn per chain at once
+        """
+        if num_chains < 1:
+            raise ValueError(f"num_chains must be >= 1, got {num_chains}")
+
+        self.evaluator = evaluator
+        self.buildings = buildings
+        self.bounds = bounds
+        self.config = config
+        self.num_chains = num_chains
+        self.seed = seed
+        self.block_size = block_size
+        self.building_ids = tuple(b.id for b in buildings)
+
+        # Per-building placement box (centre stays radius + 5m inside the site)
+        x_min, y_min, x_max, y_max = bounds
+        margin = np.array([b.radius + 5.0 for b in buildings])[:, np.newaxis]
+        self._low = np.array([x_min, y_min]) + margin
+        self._high = np.array([x_max, y_max]) - margin
+
+        # Minimum centre distance for the initial layouts (Building.overlaps_with)
+        radii = np.array([b.radius for b in buildings])
+        self._pairs = np.triu_indices(len(buildings), k=1)
+        self._min_distance = radii[self._pairs[0]] + radii[self._pairs[1]] + 5.0
+
+        self.evaluations = 0
+        self.iterations = 0
+
+    def run(self) -> Tuple[SolutionBatch, List[Dict]]:
+        """
+        Run all chains until each reaches chain_iterations or final_temp.
+
+        Returns:
+            Tuple of (best, chain_stats):
+            - best: Best layout of every chain, with fitness and objectives
+            - chain_stats: Per-chain dicts with fitness, iterations, reheats,
+              final_temperature, phase_transition_temp and history
+        """
+        config = self.config
+        initial_temp = config["initial_temp"]
+        final_temp = config["final_temp"]
+        base_cooling_rate = config["cooling_rate"]
+        max_iter = config["chain_iterations"]
+        enable_adaptive = config.get("enable_adaptive_cooling", True)
+        enable_reheating = config.get("enable_reheating", True)
+        stagnation_threshold = config.get("stagnation_threshold", 50)
+        max_reheats = config.get("max_reheats", 3)
+        base_markov_length = config.get("markov_chain_length", 20)
+
+        n_chains = self.num_chains
+        streams = np.random.SeedSequence(self.seed).spawn(n_chains)
+        rngs = [np.random.default_rng(stream) for stream in streams]
+
+        # Chain state
+        current = np.stack([self._random_layout(rng) for rng in rngs])
+        current_fitness, current_objectives = self.evaluator.evaluate_batch(current)
+        best = current.copy()
+        best_fitness = current_fitness.copy()
+        best_objectives = current_objectives.copy()
+        self.evaluations = n_chains
+
+        temperature = np.full(n_chains, float(initial_temp))
+        markov_length = np.full(n_chains, base_markov_length)
+        segment_step = np.zeros(n_chains, dtype=int)
+        stagnation = np.zeros(n_chains, dtype=int)
+        reheats = np.zeros(n_chains, dtype=int)
+        max_variance = np.zeros(n_chains)
+        phase_transition_temp = temperature.copy()
+        iterations = np.zeros(n_chains, dtype=int)
+        histories: List[List[float]] = [[] for _ in range(n_chains)]
+
+        # Neighbour fitness per chain and iteration; a chain's costs at the
+        # current temperature are trace[c, costs_start[c]:iteration]
+        trace = np.empty((n_chains, max(max_iter, 0)))
+        costs_start = np.zeros(n_chains, dtype=int)
+
+        active = np.full(n_chains, max_iter > 0 and initial_temp > final_temp)
+        iteration = 0
+
+        while active.any():
+            step = iteration % self.block_size
+            if step == 0:
+                uniforms, normals = self._draw_block(rngs)
+
+            rows = np.flatnonzero(active)
+            u = uniforms[step, rows]
+            neighbours = self._perturb(current[rows], u, normals[step, rows], temperature[rows])
+            fitness, objectives = self.evaluator.evaluate_batch(neighbours)
+            self.evaluations += len(rows)
+            trace[rows, iteration] = fitness
+
+            # Metropolis criterion
+            delta = fitness - current_fitness[rows]
+            with np.errstate(over="ignore"):
+                accepted = (delta > 0) | (u[:, 5] < np.exp(delta / temperature[rows]))
+            moved = rows[accepted]
+            current[moved] = neighbours[accepted]
+            current_fitness[moved] = fitness[accepted]
+
+            improved = accepted & (fitness > best_fitness[rows])
+            better = rows[improved]
+            best[better] = neighbours[improved]
+            best_fitness[better] = fitness[improved]
+            best_objectives[better] = objectives[improved]
+            stagnation[rows] += 1
+            stagnation[better] = 0
+
+            iteration += 1
+            iterations[rows] = iteration
+            segment_step[rows] += 1
+
+            # Temperature updates for chains that finished their Markov chain
+            ending = rows[(segment_step[rows] >= markov_length[rows]) | (iteration >= max_iter)]
+            for c in ending.tolist():
+                costs = trace[c, costs_start[c] : iteration]
+
+                # Track phase transition (max variance point)
+                if enable_adaptive and len(costs) >= 10:
+                    max_variance[c], phase_transition_temp[c] = track_phase_transition(
+                        costs, temperature[c], max_variance[c], phase_transition_temp[c]
+                    )
+
+                if enable_reheating and should_reheat(
+                    stagnation[c], stagnation_threshold, reheats[c], max_reheats
+                ):
+                    temperature[c] = calculate_reheat_temperature(
+                        best_fitness[c], phase_transition_temp[c], initial_temp, final_temp, K=0.5
+                    )
+                    reheats[c] += 1
+                    stagnation[c] = 0
+                    costs_start[c] = iteration
+                elif enable_adaptive and len(costs) >= 20:
+                    temperature[c] = adaptive_cooling_specific_heat(
+                        temperature[c], costs, alpha_nought=base_cooling_rate
+                    )
+                    costs_start[c] = iteration
+                else:
+                    temperature[c] *= base_cooling_rate
+
+                if iteration % 50 == 0:
+                    histories[c].append(float(best_fitness[c]))
+
+                # Adaptive Markov chain length for the next temperature
+                costs = trace[c, costs_start[c] : iteration]
+                if enable_adaptive and len(costs) >= 10:
+                    markov_length[c] = adaptive_markov_length(
+                        base_markov_length, costs, min_length=10, max_length=100
+                    )
+                else:
+                    markov_length[c] = base_markov_length
+                segment_step[c] = 0
+                active[c] = iteration < max_iter and temperature[c] > final_temp
+
+        self.iterations = iteration
+
+        names = self.evaluator.get_objective_names()
+        result = SolutionBatch(
+            self.building_ids,
+            best,
+            fitness=best_fitness,
+            objectives=[dict(zip(names, row)) for row in best_objectives.tolist()],
+        )
+        chain_stats = [
+            {
+                "chain": c,
+                "fitness": float(best_fitness[c]),
+                "iterations": int(iterations[c]),
+                "reheats": int(reheats[c]),
+                "final_temperature": float(temperature[c]),
+                "phase_transition_temp": float(phase_transition_temp[c]),
+                "history": histories[c],
+            }
+            for c in range(n_chains)
+        ]
+        logger.info(
+            f"{n_chains} lock-step SA chains complete: best fitness={best_fitness.max():.4f}, "
+            f"iterations={iteration}, evaluations={self.evaluations}"
+        )
+        return result, chain_stats
+
+    def _random_layout(self, rng: np.random.Generator, max_attempts: int = 100) -> np.ndarray:
+        """Random layout without overlaps (incl. 5m safety margin) within the margins."""
+        for _ in range(max_attempts):
+            layout = self._low + rng.random(self._low.shape) * (self._high - self._low)
+            i, j = self._pairs
+            distances = np.hypot(*(layout[i] - layout[j]).T)
+            if not np.any(distances < self._min_distance):
+                return layout
+        raise RuntimeError(f"Failed to generate valid solution after {max_attempts} attempts")
+
+    def _draw_block(self, rngs: List[np.random.Generator]) -> Tuple[np.ndarray, np.ndarray]:
+        """Random numbers for the next block of steps, shape (steps, chains, k)."""
+        uniforms = np.stack(
+            [rng.random((self.block_size, _UNIFORMS_PER_STEP)) for rng in rngs], axis=1
+        )
+        normals = np.stack([rng.standard_normal((self.block_size, 2)) for rng in rngs], axis=1)
+        return uniforms, normals
+
+    def _perturb(
+        self,
+        layouts: np.ndarray,
+        uniforms: np.ndarray,
+        normals: np.ndarray,
+        temperature: np.ndarray,
+    ) -> np.ndarray:
+        """One neighbour per layout from pre-drawn random numbers (see class docstring)."""
+        neighbours = layouts.copy()
+        n = neighbours.shape[1]
+        rows = np.arange(len(neighbours))
+        operator = uniforms[:, 0]
+        building = np.minimum((uniforms[:, 1] * n).astype(int), n - 1)
+
+        # Gaussian move (80%)
+        move = operator < 0.80
+        r, b = rows[move], building[move]
+        sigma = np.maximum(temperature[move] / 10.0, 0.1)[:, np.newaxis]
+        neighbours[r, b] = np.clip(
+            neighbours[r, b] + sigma * normals[move], self._low[b], self._high[b]
+        )
+
+        # Swap buildings (15%)
+        if n >= 2:
+            swap = (operator >= 0.80) & (operator < 0.95)
+            r, b = rows[swap], building[swap]
+            partner = np.minimum((uniforms[swap, 2] * (n - 1)).astype(int), n - 2)
+            partner += partner >= b
+            first = neighbours[r, b]
+            neighbours[r, b] = neighbours[r, partner]
+            neighbours[r, partner] = first
+
+        # Random reset (5%)
+        reset = operator >= 0.95
+        r, b = rows[reset], building[reset]
+        neighbours[r, b] = self._low[b] + uniforms[reset, 3:5] * (self._high[b] - self._low[b])
+
+        return neighbours
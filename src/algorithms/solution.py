@@ -4,10 +4,16 @@ Solution Data Structure
 
 Represents a spatial planning solution (layout).
 
+Populations can be stored compactly as a SolutionBatch: one
+(pop, n_buildings, 2) coordinate array with a shared building-id index.
+Indexing a batch yields SolutionView objects, which behave like Solution
+but read and write the batch arrays instead of per-solution dicts.
+
 Created: 2025-11-03
 """
 
-from typing import Dict, List, Optional, Tuple
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 import numpy as np
 
@@ -27,6 +33,8 @@ class Solution:
         metadata: Additional solution metadata
     """
 
+    __slots__ = ("positions", "fitness", "objectives", "metadata")
+
     def __init__(
         self,
         positions: Dict[str, Tuple[float, float]],
@@ -54,19 +62,11 @@ class Solution:
         Returns:
             New Solution instance with copied data
         """
-        # Handle objectives - can be dict or numpy array
-        objectives_copy = None
-        if self.objectives is not None:
-            if isinstance(self.objectives, dict):
-                objectives_copy = self.objectives.copy()
-            else:
-                # numpy array or other array-like
-                objectives_copy = self.objectives.copy()
-
+        # Objectives can be dict or numpy array; both provide .copy()
         new_sol = Solution(
             positions=self.positions.copy(),
             fitness=self.fitness,
-            objectives=objectives_copy,
+            objectives=_copy_objectives(self.objectives),
         )
         new_sol.metadata = self.metadata.copy()
         return new_sol
@@ -153,3 +153,343 @@ class Solution:
     def __repr__(self) -> str:
         fitness_str = f"{self.fitness:.4f}" if self.fitness else "unscored"
         return f"Solution({len(self.positions)} buildings, fitness={fitness_str})"
+
+
+def _copy_objectives(objectives: Any) -> Any:
+    return None if objectives is None else objectives.copy()
+
+
+def positions_array(solution: Solution, building_ids: Optional[Sequence[str]] = None) -> np.ndarray:
+    """
+    Building coordinates of a solution as an array.
+
+    For a SolutionView whose batch uses the same building order this is the
+    batch row itself (no copy); treat the result as read-only.
+
+    Args:
+        solution: Solution or SolutionView
+        building_ids: Building IDs in the wanted row order
+            (default: every position, in the solution's own order)
+
+    Returns:
+        Array of shape (n_buildings, 2)
+
+    Raises:
+        KeyError: If the solution has no position for one of the buildings
+    """
+    if isinstance(solution, SolutionView):
+        batch = solution.batch
+        ids = batch.building_ids
+        if building_ids is None or building_ids is ids or tuple(building_ids) == ids:
+            return batch.coords[solution.row]
+    positions = solution.positions
+    if building_ids is None:
+        return np.array(list(positions.values()), dtype=float)
+    return np.array([positions[bid] for bid in building_ids], dtype=float)
+
+
+class SolutionBatch:
+    """
+    Population of layouts stored as arrays.
+
+    Attributes:
+        building_ids: Building IDs, in coordinate column order (shared by all rows)
+        index: Building ID -> column mapping
+        coords: Positions, shape (pop, n_buildings, 2)
+        fitness: Fitness per row, NaN = not evaluated
+        objectives: Objective scores per row (dict or array, as in Solution.objectives)
+
+    Example:
+        >>> batch = SolutionBatch.random(("B1", "B2"), size=50, bounds=(0, 0, 500, 500))
+        >>> batch.coords.shape
+        (50, 2, 2)
+        >>> batch[0].positions["B1"]  # SolutionView with the Solution interface
+        (211.3, 47.9)
+    """
+
+    __slots__ = ("building_ids", "index", "coords", "fitness", "objectives", "_metadata")
+
+    def __init__(
+        self,
+        building_ids: Sequence[str],
+        coords: np.ndarray,
+        fitness: Optional[np.ndarray] = None,
+        objectives: Optional[List[Any]] = None,
+    ):
+        """
+        Initialize batch
+
+        Args:
+            building_ids: Building IDs matching the second axis of coords
+            coords: Array of shape (pop, n_buildings, 2) (used without copying)
+            fitness: Optional fitness per row (NaN = not evaluated)
+            objectives: Optional objective scores per row
+        """
+        self.building_ids = tuple(building_ids)
+        self.index = {bid: i for i, bid in enumerate(self.building_ids)}
+        self.coords = np.asarray(coords, dtype=float)
+        if self.coords.shape[1:] != (len(self.building_ids), 2):
+            raise ValueError(
+                f"coords must have shape (pop, {len(self.building_ids)}, 2), "
+                f"got {self.coords.shape}"
+            )
+        size = len(self.coords)
+        self.fitness = np.full(size, np.nan) if fitness is None else np.asarray(fitness, float)
+        self.objectives = [{} for _ in range(size)] if objectives is None else list(objectives)
+        self._metadata: Optional[List[Dict]] = None
+
+    @classmethod
+    def empty(cls, building_ids: Sequence[str], size: int) -> "SolutionBatch":
+        """Batch of `size` unevaluated layouts with zeroed coordinates."""
+        return cls(building_ids, np.zeros((size, len(building_ids), 2)))
+
+    @classmethod
+    def random(
+        cls,
+        building_ids: Sequence[str],
+        size: int,
+        bounds: Tuple[float, float, float, float],
+        margin: float = 0.0,
+    ) -> "SolutionBatch":
+        """
+        Batch of uniformly random layouts within bounds.
+
+        Draws from the global NumPy RNG in the same order as generating the
+        layouts one building (x, then y) at a time.
+        """
+        x_min, y_min, x_max, y_max = bounds
+        coords = np.random.uniform(
+            (x_min + margin, y_min + margin),
+            (x_max - margin, y_max - margin),
+            size=(size, len(building_ids), 2),
+        )
+        return cls(building_ids, coords)
+
+    @classmethod
+    def from_solutions(
+        cls, solutions: Iterable[Solution], building_ids: Optional[Sequence[str]] = None
+    ) -> "SolutionBatch":
+        """
+        Pack solutions into a new batch (positions, fitness and objectives are copied).
+
+        Args:
+            solutions: Solutions or views (non-empty if building_ids is None)
+            building_ids: Column order (default: position order of the first solution)
+        """
+        solutions = list(solutions)
+        if building_ids is None:
+            if not solutions:
+                raise ValueError("building_ids required for an empty batch")
+            first = solutions[0]
+            building_ids = (
+                first.batch.building_ids
+                if isinstance(first, SolutionView)
+                else tuple(first.positions.keys())
+            )
+        building_ids = tuple(building_ids)
+
+        # Fast path: views of one batch with the same columns
+        if solutions and all(isinstance(s, SolutionView) for s in solutions):
+            source = solutions[0].batch
+            if source.building_ids == building_ids and all(s.batch is source for s in solutions):
+                return source.take([s.row for s in solutions])
+
+        coords = np.empty((len(solutions), len(building_ids), 2))
+        for i, solution in enumerate(solutions):
+            coords[i] = positions_array(solution, building_ids)
+        fitness = [np.nan if s.fitness is None else s.fitness for s in solutions]
+        objectives = [_copy_objectives(s.objectives) for s in solutions]
+        return cls(building_ids, coords, fitness, objectives)
+
+    @classmethod
+    def concatenate(cls, batches: Sequence["SolutionBatch"]) -> "SolutionBatch":
+        """Join batches that share the same building columns."""
+        building_ids = batches[0].building_ids
+        if any(b.building_ids != building_ids for b in batches):
+            raise ValueError("Batches must share the same building_ids")
+        return cls(
+            building_ids,
+            np.concatenate([b.coords for b in batches]),
+            np.concatenate([b.fitness for b in batches]),
+            [_copy_objectives(o) for b in batches for o in b.objectives],
+        )
+
+    def take(self, rows: Sequence[int]) -> "SolutionBatch":
+        """New batch holding copies of the given rows (in that order)."""
+        rows = np.asarray(rows, dtype=int)
+        batch = SolutionBatch(
+            self.building_ids,
+            self.coords[rows],
+            self.fitness[rows],
+            [_copy_objectives(self.objectives[r]) for r in rows],
+        )
+        if self._metadata is not None:
+            batch._metadata = [self._metadata[r].copy() for r in rows]
+        return batch
+
+    def copy(self) -> "SolutionBatch":
+        """Deep copy of the batch."""
+        return self.take(np.arange(len(self)))
+
+    def invalidate(self, rows: Optional[Sequence[int]] = None) -> None:
+        """Mark rows (default: all) as needing re-evaluation."""
+        if rows is None:
+            rows = range(len(self))
+        for row in rows:
+            self.fitness[row] = np.nan
+            self.objectives[row] = {}
+
+    def to_solutions(self) -> List[Solution]:
+        """Standalone dict-backed copies of every row."""
+        return [view.to_solution() for view in self]
+
+    def __len__(self) -> int:
+        return len(self.coords)
+
+    def __getitem__(self, row: int) -> "SolutionView":
+        size = len(self.coords)
+        if not -size <= row < size:
+            raise IndexError(f"row {row} out of range for batch of {size}")
+        return SolutionView(self, row % size)
+
+    def __iter__(self) -> Iterator["SolutionView"]:
+        return (SolutionView(self, row) for row in range(len(self.coords)))
+
+    def __repr__(self) -> str:
+        evaluated = int(np.count_nonzero(~np.isnan(self.fitness)))
+        return (
+            f"SolutionBatch({len(self)} solutions, {len(self.building_ids)} buildings, "
+            f"{evaluated} evaluated)"
+        )
+
+
+class _RowPositions(MutableMapping):
+    """Building ID -> (x, y) mapping over one batch row (writes go to the array)."""
+
+    __slots__ = ("batch", "row")
+
+    def __init__(self, batch: SolutionBatch, row: int):
+        self.batch = batch
+        self.row = row
+
+    def __getitem__(self, building_id: str) -> Tuple[float, float]:
+        x, y = self.batch.coords[self.row, self.batch.index[building_id]]
+        return (float(x), float(y))
+
+    def __setitem__(self, building_id: str, position: Tuple[float, float]) -> None:
+        if building_id not in self.batch.index:
+            raise KeyError(f"Building {building_id} is not part of this batch")
+        self.batch.coords[self.row, self.batch.index[building_id]] = position
+
+    def __delitem__(self, building_id: str) -> None:
+        raise TypeError("Buildings cannot be removed from a SolutionBatch row")
+
+    def __contains__(self, building_id: object) -> bool:
+        return building_id in self.batch.index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.batch.building_ids)
+
+    def __len__(self) -> int:
+        return len(self.batch.building_ids)
+
+    def copy(self) -> Dict[str, Tuple[float, float]]:
+        """Plain dict copy (as for Solution.positions)."""
+        return dict(zip(self.batch.building_ids, map(tuple, self.batch.coords[self.row].tolist())))
+
+    def __repr__(self) -> str:
+        return repr(self.copy())
+
+
+class SolutionView(Solution):
+    """
+    One row of a SolutionBatch with the Solution interface.
+
+    Reads and writes go straight to the batch arrays; `copy()` returns a
+    standalone Solution. Pickling also produces a standalone Solution, so
+    views can be sent to worker processes without the whole batch.
+    """
+
+    __slots__ = ("batch", "row")
+
+    def __init__(self, batch: SolutionBatch, row: int):
+        self.batch = batch
+        self.row = row
+
+    @property
+    def positions(self) -> _RowPositions:
+        return _RowPositions(self.batch, self.row)
+
+    @positions.setter
+    def positions(self, positions: Dict[str, Tuple[float, float]]) -> None:
+        if len(positions) != len(self.batch.index):
+            raise ValueError("positions must cover exactly the batch buildings")
+        self.batch.coords[self.row] = [positions[bid] for bid in self.batch.building_ids]
+
+    @property
+    def fitness(self) -> Optional[float]:
+        value = self.batch.fitness[self.row]
+        return None if np.isnan(value) else value
+
+    @fitness.setter
+    def fitness(self, value: Optional[float]) -> None:
+        self.batch.fitness[self.row] = np.nan if value is None else value
+
+    @property
+    def objectives(self) -> Any:
+        return self.batch.objectives[self.row]
+
+    @objectives.setter
+    def objectives(self, value: Any) -> None:
+        self.batch.objectives[self.row] = value
+
+    @property
+    def metadata(self) -> Dict:
+        if self.batch._metadata is None:
+            self.batch._metadata = [{} for _ in range(len(self.batch))]
+        return self.batch._metadata[self.row]
+
+    def get_position(self, building_id: str) -> Tuple[float, float]:
+        return self.positions[building_id]
+
+    def set_position(self, building_id: str, position: Tuple[float, float]):
+        self.positions[building_id] = position
+        self.fitness = None
+
+    def get_all_coordinates(self) -> np.ndarray:
+        """Coordinates of shape (n_buildings, 2) as a copy of the batch row."""
+        return self.batch.coords[self.row].copy()
+
+    def to_solution(self) -> Solution:
+        """Standalone dict-backed copy."""
+        objectives = self.batch.objectives[self.row]
+        solution = Solution(
+            positions=self.positions.copy(),
+            fitness=self.fitness,
+            objectives=_copy_objectives(objectives),
+        )
+        if self.batch._metadata is not None:
+            solution.metadata = self.metadata.copy()
+        return solution
+
+    copy = to_solution
+
+    def __reduce__(self):
+        solution = self.to_solution()
+        return (
+            _rebuild_solution,
+            (solution.positions, solution.fitness, solution.objectives, solution.metadata),
+        )
+
+    def __repr__(self) -> str:
+        fitness_str = f"{self.fitness:.4f}" if self.fitness else "unscored"
+        return (
+            f"SolutionView(row {self.row}, {len(self.batch.building_ids)} buildings, "
+            f"fitness={fitness_str})"
+        )
+
+
+def _rebuild_solution(positions, fitness, objectives, metadata) -> Solution:
+    solution = Solution(positions, fitness=fitness, objectives=objectives)
+    solution.metadata = metadata
+    return solution
@@ -0,0 +1,170 @@
+"""
+Integration tests for the island-model H-SAGA runner.
+
+Covers the shared-directory migration transport, island diversification
+and a small sequential archipelago run on a real SpatialOptimizationProblem.
+"""
+
+import os
+
+import numpy as np
+import pytest
+from shapely.geometry import Polygon
+
+from backend.core.domain.geometry.osm_service import CampusContext
+from backend.core.optimization import island_runner
+from backend.core.optimization.hsaga_runner import HSAGARunnerConfig
+from backend.core.optimization.island_runner import (
+    DirectoryMigrationTransport,
+    IslandHSAGARunner,
+    IslandModelConfig,
+    apply_objective_weights,
+    make_island_configs,
+)
+from backend.core.optimization.spatial_problem import SpatialOptimizationProblem
+from backend.core.schemas.input import OptimizationGoal
+
+
+@pytest.fixture
+def spatial_problem():
+    """Small 300x300m greenfield problem without physics objectives."""
+    boundary = Polygon([(0, 0), (300, 0), (300, 300), (0, 300)])
+    context = CampusContext(
+        boundary=boundary,
+        existing_buildings=[],
+        existing_roads=[],
+        existing_green_areas=[],
+        center_latlon=(41.0, 29.0),
+        crs_local="EPSG:32635",
+        bounds_meters=(0, 0, 300, 300),
+    )
+    return SpatialOptimizationProblem(
+        context=context,
+        building_counts={"Faculty": 2, "Dormitory": 2},
+        enable_wind=False,
+        enable_solar=False,
+    )
+
+
+@pytest.fixture
+def small_hsaga_config():
+    """Tiny per-island budget for fast tests."""
+    return HSAGARunnerConfig(
+        total_evaluations=200,
+        population_size=20,
+        sa_chains=2,
+        n_partitions=4,
+        verbose=False,
+        parallel_sa=False,
+    )
+
+
+class TestDirectoryMigrationTransport:
+    """Tests for the shared-directory transport."""
+
+    def test_collect_returns_none_when_nothing_published(self, tmp_path):
+        transport = DirectoryMigrationTransport(str(tmp_path))
+        assert transport.collect(source_id=1, epoch=1) is None
+
+    def test_collect_newest_unseen_epoch(self, tmp_path):
+        sender = DirectoryMigrationTransport(str(tmp_path))
+        receiver = DirectoryMigrationTransport(str(tmp_path))
+
+        sender.publish(0, 1, np.zeros((2, 3)))
+        sender.publish(0, 2, np.ones((2, 3)))
+
+        migrants = receiver.collect(source_id=0, epoch=2)
+        np.testing.assert_array_equal(migrants, np.ones((2, 3)))
+
+        # Already consumed: nothing new until the sender publishes again
+        assert receiver.collect(source_id=0, epoch=2) is None
+
+    def test_collect_ignores_future_epochs(self, tmp_path):
+        transport = DirectoryMigrationTransport(str(tmp_path))
+        transport.publish(0, 5, np.ones((1, 3)))
+        assert transport.collect(source_id=0, epoch=3) is None
+
+    def test_front_roundtrip_and_clear(self, tmp_path):
+        transport = DirectoryMigrationTransport(str(tmp_path))
+        X, F, G = np.ones((3, 4)), np.zeros((3, 2)), np.zeros((3, 1))
+        transport.publish_front(2, X, F, G)
+
+        fronts = transport.load_fronts()
+        assert list(fronts) == [2]
+        np.testing.assert_array_equal(fronts[2][0], X)
+
+        transport.clear()
+        assert transport.load_fronts() == {}
+
+
+class TestIslandConfigs:
+    """Tests for island diversification."""
+
+    def test_islands_have_distinct_seeds_and_operators(self, small_hsaga_config):
+        goals = {OptimizationGoal.COMPACTNESS: 0.5, OptimizationGoal.ADJACENCY: 0.5}
+        islands = make_island_configs(4, small_hsaga_config, goals, seed=7)
+
+        assert len({i.seed for i in islands}) == 4
+        assert len({i.crossover_eta for i in islands}) > 1
+        assert islands[0].objective_weights is None
+        assert all(i.objective_weights is not None for i in islands[1:])
+
+    def test_apply_objective_weights_copies_problem(self, spatial_problem):
+        original_goals = dict(spatial_problem.goals)
+        weighted = apply_objective_weights(spatial_problem, {OptimizationGoal.COMPACTNESS: 2.0})
+
+        assert weighted is not spatial_problem
+        assert weighted.objective_calc.goals[OptimizationGoal.COMPACTNESS] == 2.0
+        assert spatial_problem.goals == original_goals
+
+
+class TestIslandHSAGARunner:
+    """Tests for the full island-model run."""
+
+    def test_sequential_run_merges_archive(self, spatial_problem, small_hsaga_config, tmp_path):
+        config = IslandModelConfig(
+            n_islands=2,
+            migration_interval=2,
+            n_migrants=2,
+            migration_dir=str(tmp_path),
+            hsaga=small_hsaga_config,
+            parallel=False,
+            verbose=False,
+        )
+        runner = IslandHSAGARunner(spatial_problem, config)
+        result = runner.run()
+
+        assert result["success"]
+        assert len(result["islands"]) == 2
+        assert result["stats"]["archive_size"] == len(result["pareto_front"]["X"])
+        assert result["pareto_front"]["F"].shape[1] == spatial_problem.n_obj
+        # Island 1 runs after island 0 has published all its migrants
+        assert result["islands"][1]["migrants_received"] > 0
+        assert runner.get_best_solution()["island"] in (0, 1)
+
+    def test_failed_island_is_recorded_and_temp_dir_removed(
+        self, spatial_problem, small_hsaga_config, monkeypatch
+    ):
+        run_island = island_runner.run_island_worker
+        migration_dirs = []
+
+        def fail_island_one(problem, island, config, migration_dir):
+            migration_dirs.append(migration_dir)
+            if island.island_id == 1:
+                raise RuntimeError("island crashed")
+            return run_island(problem, island, config, migration_dir)
+
+        monkeypatch.setattr(island_runner, "run_island_worker", fail_island_one)
+        config = IslandModelConfig(
+            n_islands=2, hsaga=small_hsaga_config, parallel=False, verbose=False
+        )
+        result = IslandHSAGARunner(spatial_problem, config).run()
+
+        assert result["success"]
+        assert [r["island_id"] for r in result["islands"]] == [0]
+        assert result["stats"]["failed_islands"] == [
+            {"island_id": 1, "error": "RuntimeError: island crashed"}
+        ]
+        assert not os.path.exists(migration_dirs[0])
+        # The caller's config is left untouched
+        assert config.islands is None
@@ -12,7 +12,11 @@ Tests verify:
 import numpy as np
 import pytest
 
-from src.spatial.tensor_field import TensorField, create_campus_tensor_field
+from src.spatial.tensor_field import (
+    TensorField,
+    create_campus_tensor_field,
+    symmetric_eigenvectors_2x2,
+)
 
 
 class TestTensorFieldConstruction:
@@ -165,6 +169,85 @@ class TestEigenvectorComputation:
         assert np.allclose(np.abs(major_vec[0]), np.abs(expected_east), atol=0.1)
 
 
+class TestClosedFormEigenvectors:
+    """Test the vectorized 2x2 eigen-solver against np.linalg.eigh."""
+
+    def test_matches_eigh_including_sign(self):
+        """Test closed form reproduces eigh vectors exactly."""
+        rng = np.random.default_rng(0)
+        t_xx, t_xy, t_yy = rng.normal(size=(3, 5000))
+        t_xy[:500] = 0.0  # Diagonal tensors
+        t_xx[500:1000] = t_yy[500:1000]  # Equal diagonal
+        t_xx[1000:1100] = t_xy[1000:1100] = t_yy[1000:1100] = 0.0  # Zero tensors
+
+        tensors = np.stack([np.stack([t_xx, t_xy], -1), np.stack([t_xy, t_yy], -1)], -2)
+        _, vectors = np.linalg.eigh(tensors)
+        major, minor = symmetric_eigenvectors_2x2(t_xx, t_xy, t_yy)
+
+        np.testing.assert_allclose(major, vectors[:, :, 1], atol=1e-12)
+        np.testing.assert_allclose(minor, vectors[:, :, 0], atol=1e-12)
+
+    def test_single_point_matches_batch(self):
+        """Test the single-point fast path agrees with batched queries."""
+        field = TensorField(bounds=(0, 0, 100, 100), resolution=20)
+        field.add_grid_field(angle_degrees=30, strength=1.0)
+        field.add_radial_field(center=(40, 60), decay_radius=25, strength=1.5)
+
+        points = np.random.default_rng(1).uniform(-10, 110, (50, 2))
+        batch = field.get_eigenvectors(points, field_type="minor")
+        single = np.vstack([field.get_eigenvectors(p[None], field_type="minor") for p in points])
+
+        np.testing.assert_allclose(batch, single, atol=1e-12)
+
+
+class TestDirectionGrids:
+    """Test precomputed direction grid lookups."""
+
+    def test_grid_lookup_close_to_exact(self):
+        """Test bilinear grid lookup follows the exact eigenvectors."""
+        field = TensorField(bounds=(0, 0, 100, 100), resolution=30)
+        field.add_grid_field(angle_degrees=20, strength=1.0)
+        field.add_radial_field(center=(50, 50), decay_radius=30, strength=0.5)
+
+        points = np.random.default_rng(2).uniform(0, 100, (200, 2))
+        exact = field.get_eigenvectors(points, field_type="major")
+
+        field.enable_direction_grids()
+        approx = field.get_eigenvectors(points, field_type="major")
+
+        assert np.allclose(np.linalg.norm(approx, axis=1), 1.0)
+        assert np.all(np.abs(np.sum(exact * approx, axis=1)) > 0.95)
+
+    def test_sign_flips_do_not_cancel(self):
+        """Test opposite-signed corner vectors are aligned before blending."""
+        field = TensorField(bounds=(0, 0, 100, 100), resolution=10)
+        field.add_grid_field(angle_degrees=30, strength=1.0)
+        field.add_radial_field(center=(45, 55), decay_radius=30, strength=2.0)
+        field.enable_direction_grids()
+
+        points = np.random.default_rng(3).uniform(0, 100, (100, 2))
+        reference = field.get_eigenvectors(points)
+
+        # Same directions with alternating signs between neighbouring nodes
+        field._direction_grids["major"][::2] *= -1
+        field._direction_grids["major"][:, ::2] *= -1
+        flipped = field.get_eigenvectors(points)
+
+        np.testing.assert_allclose(np.abs(np.sum(reference * flipped, axis=1)), 1.0, atol=1e-9)
+
+    def test_grids_rebuilt_after_adding_field(self):
+        """Test adding a basis field invalidates the direction grids."""
+        field = TensorField(bounds=(0, 0, 100, 100), resolution=20)
+        field.add_grid_field(angle_degrees=0, strength=1.0)
+        field.enable_direction_grids()
+        before = field.get_eigenvectors(np.array([[50, 50]]))
+
+        field.add_grid_field(angle_degrees=90, strength=3.0)
+        after = field.get_eigenvectors(np.array([[50, 50]]))
+
+        assert abs(np.dot(before[0], after[0])) < 0.01
+
+
 class TestBoundaryChecking:
     """Test boundary detection."""
 
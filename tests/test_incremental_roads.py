@@ -0,0 +1,160 @@
+"""
+Tests for the Incremental Gateway Road Network
+"""
+
+import time
+
+import numpy as np
+import pytest
+from shapely.affinity import translate
+from shapely.geometry import Point, Polygon
+
+from backend.core.domain.geometry.gateway_roads import GatewayRoadNetwork
+from backend.core.domain.geometry.incremental_roads import IncrementalGatewayRoadNetwork
+from backend.core.domain.models.campus import Gateway
+
+
+def _segments(roads):
+    """Order-independent road set, rounded to avoid float noise."""
+    return {tuple(sorted(tuple(np.round(c, 6)) for c in road.coords)) for road in roads}
+
+
+@pytest.fixture
+def gateways():
+    return [
+        Gateway(id="g1", location=Point(0, 0), bearing=0, type="main"),
+        Gateway(id="g2", location=Point(1000, 0), bearing=180, type="main"),
+        Gateway(id="g3", location=Point(500, 1000), bearing=270, type="service"),
+    ]
+
+
+@pytest.fixture
+def buildings():
+    rng = np.random.default_rng(7)
+    corners = rng.uniform(50, 900, (40, 2))
+    return [Polygon([(x, y), (x + 30, y), (x + 30, y + 20), (x, y + 20)]) for x, y in corners]
+
+
+def test_first_update_matches_full_generation(gateways, buildings):
+    """A fresh network produces the same roads as GatewayRoadNetwork."""
+    expected = GatewayRoadNetwork(gateways, min_road_length=10.0).generate(buildings, use_mst=True)
+
+    network = IncrementalGatewayRoadNetwork(gateways, min_road_length=10.0)
+    diff = network.update(buildings)
+
+    assert _segments(diff.roads) == _segments(expected)
+    assert len(diff.added) == len(diff.roads)
+    assert not diff.changed and not diff.removed
+
+
+def test_unchanged_layout_gives_empty_diff(gateways, buildings):
+    network = IncrementalGatewayRoadNetwork(gateways)
+    first = network.update(buildings)
+    diff = network.update(list(buildings))
+
+    assert diff.is_empty
+    assert diff.moved_nodes == 0
+    assert all(a is b for a, b in zip(first.roads, diff.roads))
+
+
+def test_roads_keep_full_generation_order(gateways, buildings):
+    """Roads come out in GatewayRoadNetwork's MST edge order, before and after a move."""
+    full = GatewayRoadNetwork(gateways, min_road_length=10.0)
+    network = IncrementalGatewayRoadNetwork(gateways, min_road_length=10.0)
+
+    def ordered(roads):
+        return [sorted(tuple(np.round(c, 6)) for c in road.coords) for road in roads]
+
+    diff = network.update(buildings)
+    assert ordered(diff.roads) == ordered(full.generate(buildings, use_mst=True))
+    assert ordered(network.roads) == ordered(diff.roads)
+
+    buildings[5] = translate(buildings[5], 40, -25)
+    diff = network.update(buildings)
+    assert ordered(diff.roads) == ordered(full.generate(buildings, use_mst=True))
+    assert ordered(network.roads) == ordered(diff.roads)
+
+
+def test_moved_building_updates_only_affected_roads(gateways, buildings):
+    network = IncrementalGatewayRoadNetwork(gateways)
+    before = {id(road) for road in network.update(buildings).roads}
+
+    buildings = list(buildings)
+    buildings[5] = translate(buildings[5], 40, -25)
+    diff = network.update(buildings)
+
+    expected = GatewayRoadNetwork(gateways, min_road_length=10.0).generate(buildings, use_mst=True)
+    assert _segments(diff.roads) == _segments(expected)
+
+    assert diff.moved_nodes == 1
+    assert not diff.is_empty
+    # Every road not reported in the diff is the same object as before
+    touched = {id(g) for g in diff.added.values()} | {id(g) for g in diff.changed.values()}
+    untouched = [road for road in diff.roads if id(road) not in touched]
+    assert untouched and all(id(road) in before for road in untouched)
+    assert len(touched) < len(diff.roads) / 2
+    # Changed roads are the ones attached to the moved building
+    assert all("building:5" in key for key in diff.changed)
+
+
+def test_added_and_removed_buildings_with_ids(gateways, buildings):
+    ids = [f"b{i}" for i in range(len(buildings))]
+    network = IncrementalGatewayRoadNetwork(gateways)
+    network.update(buildings, building_ids=ids)
+
+    # Remove b3, add a new building far from the rest
+    new_building = Polygon([(950, 950), (980, 950), (980, 980), (950, 980)])
+    layout = buildings[:3] + buildings[4:] + [new_building]
+    layout_ids = ids[:3] + ids[4:] + ["new"]
+    diff = network.update(layout, building_ids=layout_ids)
+
+    expected = GatewayRoadNetwork(gateways, min_road_length=10.0).generate(layout, use_mst=True)
+    assert _segments(diff.roads) == _segments(expected)
+    assert diff.moved_nodes == 2
+    assert any("building:new" in key for key in diff.added)
+    assert any("building:b3" in key for key in diff.removed)
+
+
+def test_intersection_filter_matches_full_generation(gateways, buildings):
+    network = IncrementalGatewayRoadNetwork(gateways, avoid_building_intersections=True)
+    network.update(buildings)
+
+    # Rotate-like reshape that keeps the centroid: taller, narrower footprint
+    c = buildings[10].centroid
+    layout = list(buildings)
+    layout[10] = Polygon(
+        [(c.x - 5, c.y - 60), (c.x + 5, c.y - 60), (c.x + 5, c.y + 60), (c.x - 5, c.y + 60)]
+    )
+    diff = network.update(layout)
+
+    expected = GatewayRoadNetwork(gateways, min_road_length=10.0).generate(
+        layout, use_mst=True, avoid_building_intersections=True
+    )
+    assert _segments(diff.roads) == _segments(expected)
+
+
+def test_invalid_building_ids(gateways, buildings):
+    network = IncrementalGatewayRoadNetwork(gateways)
+    with pytest.raises(ValueError):
+        network.update(buildings[:2], building_ids=["a", "a"])
+    with pytest.raises(ValueError):
+        network.update(buildings[:2], building_ids=["a"])
+
+
+def test_interactive_update_is_fast(gateways):
+    """Moving one building in a 200-building layout stays well under 100 ms."""
+    rng = np.random.default_rng(11)
+    corners = rng.uniform(0, 2000, (200, 2))
+    layout = [Polygon([(x, y), (x + 20, y), (x + 20, y + 20), (x, y + 20)]) for x, y in corners]
+
+    network = IncrementalGatewayRoadNetwork(gateways)
+    network.update(layout)
+
+    timings = []
+    for step in range(5):
+        layout[step] = translate(layout[step], 15, 10)
+        start = time.perf_counter()
+        network.update(layout)
+        timings.append(time.perf_counter() - start)
+
+    assert np.median(timings) < 0.1
@@ -0,0 +1,118 @@
+"""
+Unit tests for the Prometheus-style API metrics.
+"""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from backend.api.utils.metrics import (
+    REGISTRY,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    TimedJobStore,
+    record_pipeline_result,
+)
+
+
+class TestMetricTypes:
+    def test_counter_sums_thread_shards(self):
+        counter = Counter("c_total", "Test counter.", ["kind"])
+
+        def work():
+            for _ in range(1000):
+                counter.inc(kind="a")
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        counter.inc(2.5, kind="b")
+
+        assert counter.values() == {("a",): 8000.0, ("b",): 2.5}
+        assert counter.samples() == ['c_total{kind="a"} 8000', 'c_total{kind="b"} 2.5']
+
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = Histogram("h_seconds", "Test histogram.", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+
+        assert histogram.samples() == [
+            'h_seconds_bucket{le="0.1"} 2',
+            'h_seconds_bucket{le="1"} 3',
+            'h_seconds_bucket{le="+Inf"} 4',
+            "h_seconds_sum 3.65",
+            "h_seconds_count 4",
+        ]
+
+    def test_gauge_and_label_validation(self):
+        gauge = Gauge("g", "Test gauge.")
+        assert gauge.samples() == ["g 0"]
+        gauge.inc()
+        gauge.inc()
+        gauge.dec()
+        assert gauge.samples() == ["g 1"]
+        with pytest.raises(ValueError):
+            gauge.inc(router="x")
+
+    def test_render_and_escaping(self):
+        registry = MetricsRegistry()
+        registry.counter("x_total", "Things.", ["path"]).inc(path='a"b')
+        text = registry.render()
+        assert text.startswith("# HELP x_total Things.\n# TYPE x_total counter\n")
+        assert 'x_total{path="a\\"b"} 1' in text
+        with pytest.raises(ValueError):
+            registry.counter("x_total", "Again.")
+
+
+def test_timed_job_store_records_writes():
+    class Store:
+        def update(self, job_id, data):
+            return True
+
+        def get(self, job_id):
+            return {"job_id": job_id}
+
+    store = TimedJobStore(Store())
+    histogram = REGISTRY._metrics["planify_job_store_write_seconds"]
+    before = histogram.values().get(("update",), ([0], 0.0))[0]
+
+    assert store.update("j", {}) is True
+    assert store.get("j") == {"job_id": "j"}
+    assert sum(histogram.values()[("update",)][0]) == sum(before) + 1
+
+
+def test_record_pipeline_result():
+    stage = SimpleNamespace(stage=SimpleNamespace(value="optimizing"), duration_seconds=2.0)
+    result = SimpleNamespace(
+        stages=[stage],
+        optimizer_stats={"sa_evaluations": 300, "ga_evaluations": 700, "total_time": 4.0},
+    )
+    record_pipeline_result(result)
+
+    throughput = REGISTRY._metrics["planify_optimizer_evaluations_per_second"]
+    assert throughput.values()[()] == pytest.approx(250.0)
+    stages = REGISTRY._metrics["planify_pipeline_stage_duration_seconds"].values()
+    assert ("optimizing",) in stages
+
+
+def test_metrics_endpoint_reports_request_latency():
+    from fastapi.testclient import TestClient
+
+    from backend.api.main import app
+
+    client = TestClient(app)
+    client.get("/api/optimize/metrics")
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert (
+        'planify_http_request_duration_seconds_count{router="optimize",method="GET",status="200"}'
+        in response.text
+    )
+    assert "planify_jobs_in_flight 0" in response.text
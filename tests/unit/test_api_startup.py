@@ -0,0 +1,122 @@
+"""
+Unit tests for lazy router loading and API cold-start import cost.
+"""
+
+import os
+import subprocess
+import sys
+import textwrap
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.api.utils.lazy_routers import LazyRouters
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+
+# Heavy dependencies that must not be imported by ``import backend.api.main``
+HEAVY_MODULES = ("osmnx", "geopandas", "pymoo", "scipy", "matplotlib", "sklearn", "shapely")
+
+# Cold import budget of backend.api.main in seconds (FastAPI itself is ~0.5s)
+IMPORT_BUDGET_S = 2.0
+
+
+def test_main_import_stays_light():
+    code = textwrap.dedent(
+        """
+        import sys, time
+        start = time.perf_counter()
+        import backend.api.main
+        elapsed = time.perf_counter() - start
+        heavy = [m for m in sys.argv[1:] if m in sys.modules]
+        print(elapsed, ",".join(heavy), sep="|")
+        """
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code, *HEAVY_MODULES],
+        cwd=PROJECT_ROOT,
+        env={**os.environ, "PYTHONPATH": PROJECT_ROOT},
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+
+    elapsed, heavy = result.stdout.strip().splitlines()[-1].split("|")
+    assert heavy == "", f"backend.api.main imports heavy modules at startup: {heavy}"
+    assert float(elapsed) < IMPORT_BUDGET_S
+
+
+def test_router_loaded_on_first_request():
+    app = FastAPI()
+    routers = LazyRouters(app, {"/api/constraints/": "backend.api.routers.constraints"})
+
+    assert routers.module_for("/api/constraints/list/s1") == "backend.api.routers.constraints"
+    assert routers.module_for("/api/constraintsx") is None
+    assert routers.module_for("/health") is None
+
+    assert routers.load("backend.api.routers.constraints")
+    assert routers.load("backend.api.routers.constraints")
+    assert routers.loaded == ["backend.api.routers.constraints"]
+    assert routers.pending == []
+    assert routers.module_for("/api/constraints/list/s1") is None
+
+    response = TestClient(app).get("/api/constraints/list/s1")
+    assert response.status_code == 200
+    assert response.json()["constraints"] == []
+
+
+def test_failed_router_is_not_retried():
+    app = FastAPI()
+    routers = LazyRouters(app, {"/api/missing": "backend.api.routers.does_not_exist"})
+
+    result = routers.load_all(["json", "no_such_module_xyz"])
+
+    assert result["loaded"] == []
+    assert set(result["failed"]) == {"backend.api.routers.does_not_exist", "no_such_module_xyz"}
+    assert routers.module_for("/api/missing/x") is None
+    assert not routers.load("backend.api.routers.does_not_exist")
+
+
+def test_router_error_other_than_import_is_recorded():
+    app = FastAPI()
+    routers = LazyRouters(app, {"/api/json": "json"})  # Imports, but has no ``router``
+
+    assert not routers.load("json")
+
+    assert routers.failed["json"].startswith("AttributeError")
+    assert routers.module_for("/api/json/x") is None
+    assert not routers.load("json")
+
+
+def test_app_loads_routers_on_demand():
+    from backend.api.main import app, routers
+
+    client = TestClient(app)
+    assert client.get("/health").status_code == 200
+
+    response = client.get("/api/constraints/list/startup-test")
+    assert response.status_code == 200
+    assert "backend.api.routers.constraints" in routers.loaded
+
+    response = client.get("/warmup")
+    assert response.status_code == 200
+    body = response.json()
+    assert routers.pending == []
+    assert set(body) == {"loaded", "failed", "seconds"}
+    assert "backend.api.routers.constraints" in body["loaded"]
+
+
+def test_app_shutdown_stops_plot_renderer(monkeypatch):
+    from backend.api.main import app
+    from backend.api.routers import visualization
+    from backend.api.utils.rendering import PlotRenderer
+
+    stopped = []
+    renderer = PlotRenderer(max_workers=0)
+    monkeypatch.setattr(renderer, "shutdown", lambda: stopped.append(True))
+    monkeypatch.setattr(visualization, "renderer", renderer)
+
+    with TestClient(app):
+        assert not stopped
+    assert stopped == [True]
@@ -0,0 +1,144 @@
+"""
+Unit tests for the asynchronous steady-state NSGA-III engine.
+"""
+
+import numpy as np
+import pytest
+from pymoo.core.problem import ElementwiseProblem
+from pymoo.util.nds.non_dominated_sorting import NonDominatedSorting
+from shapely.geometry import Polygon
+
+from backend.core.domain.geometry.osm_service import CampusContext
+from backend.core.optimization.async_nsga3 import AsyncNSGA3Config, AsyncSteadyStateNSGA3
+from backend.core.optimization.hsaga_runner import HSAGARunner, HSAGARunnerConfig
+from backend.core.optimization.nsga3_runner import NSGA3Runner, NSGA3RunnerConfig
+from backend.core.optimization.spatial_problem import SpatialOptimizationProblem
+from src.algorithms.building import Building, BuildingType
+
+
+class BiObjectiveProblem(ElementwiseProblem):
+    """Simple convex bi-objective problem with one inequality constraint."""
+
+    def __init__(self):
+        super().__init__(n_var=3, n_obj=2, n_ieq_constr=1, xl=np.zeros(3), xu=np.ones(3))
+
+    def _evaluate(self, x, out, *args, **kwargs):
+        out["F"] = np.array([np.sum(x**2), np.sum((x - 1) ** 2)])
+        out["G"] = np.array([x[0] - 0.9])
+
+
+@pytest.fixture
+def serial_config():
+    return AsyncNSGA3Config(
+        pop_size=20, max_evaluations=200, n_workers=1, n_partitions=6, seed=1, verbose=False
+    )
+
+
+class TestAsyncSteadyStateNSGA3:
+    """Tests for the steady-state engine."""
+
+    def test_consumes_exact_budget(self, serial_config):
+        result = AsyncSteadyStateNSGA3(BiObjectiveProblem(), serial_config).run()
+
+        assert result.n_eval == serial_config.max_evaluations
+        assert result.stats["insertions"] == serial_config.max_evaluations
+        assert len(result.pop_X) == serial_config.pop_size
+
+    def test_front_is_feasible_and_non_dominated(self, serial_config):
+        result = AsyncSteadyStateNSGA3(BiObjectiveProblem(), serial_config).run()
+
+        assert len(result.X) > 0
+        assert np.all(result.G <= 0)
+        front = NonDominatedSorting().do(result.F, only_non_dominated_front=True)
+        assert len(front) == len(result.F)
+
+    def test_serial_run_is_reproducible(self, serial_config):
+        r1 = AsyncSteadyStateNSGA3(BiObjectiveProblem(), serial_config).run()
+        r2 = AsyncSteadyStateNSGA3(BiObjectiveProblem(), serial_config).run()
+        np.testing.assert_allclose(r1.F, r2.F)
+
+    def test_initial_population_is_evaluated_first(self, serial_config):
+        initial = np.full((5, 3), 0.5)
+        engine = AsyncSteadyStateNSGA3(BiObjectiveProblem(), serial_config)
+        result = engine.run(initial_X=initial)
+        assert result.n_eval == serial_config.max_evaluations
+
+    def test_process_pool_run(self):
+        config = AsyncNSGA3Config(
+            pop_size=12, max_evaluations=60, n_workers=2, n_partitions=4, verbose=False
+        )
+        result = AsyncSteadyStateNSGA3(BiObjectiveProblem(), config).run()
+
+        assert result.n_eval == 60
+        assert result.stats["n_workers"] == 2
+        assert 0.0 <= result.stats["worker_utilisation"] <= 1.0
+
+
+class TestNSGA3RunnerSteadyState:
+    """Tests for the NSGA3Runner steady-state mode."""
+
+    def test_result_matches_generational_schema(self):
+        buildings = [
+            Building("B1", BuildingType.RESIDENTIAL, 2000, 5),
+            Building("B2", BuildingType.COMMERCIAL, 1500, 3),
+            Building("B3", BuildingType.EDUCATIONAL, 3000, 4),
+        ]
+        config = NSGA3RunnerConfig(
+            population_size=12,
+            n_generations=3,
+            n_partitions=4,
+            steady_state=True,
+            n_workers=1,
+            verbose=False,
+        )
+        result = NSGA3Runner(buildings, (0, 0, 500, 500), config).run()
+
+        assert result["statistics"]["evaluations"] == 12 * 4
+        assert len(result["pareto_front"]) == len(result["pareto_objectives"])
+        assert set(result["pareto_front"][0].positions) == {"B1", "B2", "B3"}
+        assert result["best_compromise"] is not None
+
+
+class TestHSAGARunnerSteadyState:
+    """Tests for the H-SAGA runner's async GA phase."""
+
+    @pytest.fixture
+    def spatial_problem(self):
+        boundary = Polygon([(0, 0), (300, 0), (300, 300), (0, 300)])
+        context = CampusContext(
+            boundary=boundary,
+            existing_buildings=[],
+            existing_roads=[],
+            existing_green_areas=[],
+            center_latlon=(41.0, 29.0),
+            crs_local="EPSG:32635",
+            bounds_meters=(0, 0, 300, 300),
+        )
+        return SpatialOptimizationProblem(
+            context=context,
+            building_counts={"Faculty": 2, "Dormitory": 2},
+            enable_wind=False,
+            enable_solar=False,
+        )
+
+    def test_async_mode_returns_pareto_front(self, spatial_problem):
+        config = HSAGARunnerConfig(
+            total_evaluations=120,
+            population_size=12,
+            sa_chains=2,
+            n_partitions=4,
+            ga_mode="async",
+            async_workers=2,
+            verbose=False,
+            parallel_sa=False,
+        )
+        result = HSAGARunner(spatial_problem, config).run()
+
+        assert result["success"]
+        assert len(result["pareto_front"]["F"]) > 0
+        assert result["stats"]["ga_workers"] == 2
+        assert result["stats"]["ga_evaluations"] == 120 - int(120 * config.sa_fraction)
+
+    def test_unknown_ga_mode_raises(self, spatial_problem):
+        with pytest.raises(ValueError, match="ga_mode"):
+            HSAGARunner(spatial_problem, HSAGARunnerConfig(ga_mode="steady"))
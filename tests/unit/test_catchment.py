@@ -0,0 +1,162 @@
+"""
+Unit tests for the sparse catchment accessibility engine.
+
+Compares the sparse KD-tree implementation against dense brute-force
+reference computations.
+"""
+
+import numpy as np
+import pytest
+from scipy.spatial.distance import cdist
+
+from backend.core.metrics.accessibility import DemandPoint, ServicePoint, TwoStepFCA
+from src.algorithms.catchment import (
+    build_catchment_pairs,
+    decay_weights,
+    sparse_gravity_accessibility,
+    sparse_two_step_fca,
+)
+from src.algorithms.objectives_enhanced import DETOUR_INDEX_TURKEY, two_step_floating_catchment_area
+
+
+@pytest.fixture
+def points():
+    rng = np.random.default_rng(0)
+    origins = rng.uniform(0, 1000, (300, 2))
+    destinations = rng.uniform(0, 1000, (25, 2))
+    destinations[0] = origins[0]  # Co-located pair (zero distance)
+    return origins, destinations
+
+
+def dense_two_step_fca(origins, destinations, demand, supply, radius, sigma, scale=1.0):
+    """Reference 2SFCA on a dense distance matrix."""
+    d = cdist(origins, destinations) * scale
+    w = np.exp(-((d / sigma) ** 2)) * (d <= radius)
+    weighted_demand = w.T @ demand
+    safe_demand = np.where(weighted_demand > 0, weighted_demand, 1)
+    ratios = np.where(weighted_demand > 0, supply / safe_demand, 0)
+    return ratios, w @ ratios
+
+
+class TestBuildCatchmentPairs:
+    def test_pairs_match_dense_mask(self, points):
+        origins, destinations = points
+        pairs = build_catchment_pairs(origins, destinations, catchment_distance=150.0)
+
+        dense = cdist(origins, destinations)
+        assert len(pairs) == np.count_nonzero(dense <= 150.0)
+        np.testing.assert_allclose(pairs.distance, dense[pairs.origin_idx, pairs.dest_idx])
+
+    def test_includes_zero_distance_pairs(self, points):
+        origins, destinations = points
+        pairs = build_catchment_pairs(origins, destinations, catchment_distance=10.0)
+        mask = (pairs.origin_idx == 0) & (pairs.dest_idx == 0)
+        assert np.any(mask)
+        assert pairs.distance[mask][0] == 0.0
+
+    def test_distance_scale_applies_to_catchment(self, points):
+        origins, destinations = points
+        pairs = build_catchment_pairs(
+            origins, destinations, catchment_distance=200.0, distance_scale=2.0
+        )
+        assert np.all(pairs.distance <= 200.0 + 1e-9)
+        assert len(pairs) == np.count_nonzero(cdist(origins, destinations) * 2.0 <= 200.0)
+
+    def test_unbounded_catchment_has_all_pairs(self, points):
+        origins, destinations = points
+        pairs = build_catchment_pairs(origins[:10], destinations[:4])
+        assert len(pairs) == 40
+
+    def test_empty_inputs(self):
+        pairs = build_catchment_pairs(np.zeros((0, 2)), np.ones((3, 2)), 100.0)
+        assert len(pairs) == 0
+        ratios, access = sparse_two_step_fca(pairs, pairs.distance, np.zeros(0), np.ones(3))
+        assert ratios.shape == (3,) and access.shape == (0,)
+
+
+class TestSparseKernels:
+    def test_two_step_fca_matches_dense(self, points):
+        origins, destinations = points
+        rng = np.random.default_rng(1)
+        demand = rng.uniform(1, 50, len(origins))
+        supply = rng.uniform(10, 500, len(destinations))
+
+        pairs = build_catchment_pairs(origins, destinations, catchment_distance=250.0)
+        weights = decay_weights(pairs.distance, "gaussian", sigma=200.0)
+        ratios, access = sparse_two_step_fca(pairs, weights, demand, supply)
+
+        ref_ratios, ref_access = dense_two_step_fca(
+            origins, destinations, demand, supply, radius=250.0, sigma=200.0
+        )
+        np.testing.assert_allclose(ratios, ref_ratios, rtol=1e-10)
+        np.testing.assert_allclose(access, ref_access, rtol=1e-10)
+
+    def test_gravity_matches_dense(self, points):
+        origins, destinations = points
+        opportunities = np.arange(len(destinations), dtype=float)
+
+        pairs = build_catchment_pairs(origins, destinations)
+        weights = decay_weights(pairs.distance, "exponential", lambda_param=0.01)
+        access = sparse_gravity_accessibility(pairs, weights, opportunities)
+
+        ref = np.exp(-0.01 * cdist(origins, destinations)) @ opportunities
+        np.testing.assert_allclose(access, ref, rtol=1e-10)
+
+    def test_unknown_decay_raises(self):
+        with pytest.raises(ValueError):
+            decay_weights(np.ones(3), "cubic")
+
+
+class TestObjectivesEnhanced2SFCA:
+    def test_network_adjusted_2sfca_matches_dense(self, points):
+        origins, destinations = points
+        demand = np.ones(len(origins))
+        supply = np.full(len(destinations), 100.0)
+
+        ratios, access = two_step_floating_catchment_area(
+            origins, destinations, demand, supply, catchment_distance=300, sigma=250
+        )
+        ref_ratios, ref_access = dense_two_step_fca(
+            origins, destinations, demand, supply, 300, 250, scale=DETOUR_INDEX_TURKEY
+        )
+        np.testing.assert_allclose(ratios, ref_ratios, rtol=1e-10)
+        np.testing.assert_allclose(access, ref_access, rtol=1e-10)
+
+
+class TestTwoStepFCA:
+    def test_calculate_arrays_matches_object_api(self, points):
+        origins, destinations = points
+        services = [
+            ServicePoint(f"S{j}", tuple(p), capacity=100.0 + j, type="library")
+            for j, p in enumerate(destinations)
+        ]
+        demands = [
+            DemandPoint(f"D{i}", tuple(p), population=20.0, type="dormitory")
+            for i, p in enumerate(origins)
+        ]
+        fca = TwoStepFCA(catchment_radius=200.0, distance_decay_function="linear")
+
+        scores = fca.calculate(services, demands)
+        capacity = np.array([s.capacity for s in services])
+        _, access = fca.calculate_arrays(
+            destinations, capacity, origins, np.full(len(origins), 20.0)
+        )
+        np.testing.assert_allclose([scores[d.id] for d in demands], access)
+
+    def test_single_pair_ratio(self):
+        fca = TwoStepFCA(catchment_radius=200, distance_decay_function="step")
+        scores = fca.calculate(
+            [ServicePoint("LIB", (0, 0), 200, "library")],
+            [DemandPoint("DORM", (100, 0), 400, "dorm")],
+        )
+        assert scores["DORM"] == pytest.approx(0.5)
+
+    @pytest.mark.parametrize("decay", ["exponential", "power_law"])
+    def test_decay_outside_catchment_model_raises(self, decay):
+        fca = TwoStepFCA(catchment_radius=200, distance_decay_function=decay)
+
+        with pytest.raises(ValueError, match="Unknown decay function"):
+            fca.calculate(
+                [ServicePoint("LIB", (0, 0), 200, "library")],
+                [DemandPoint("DORM", (100, 0), 400, "dorm")],
+            )
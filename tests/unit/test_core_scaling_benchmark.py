@@ -0,0 +1,104 @@
+"""
+Unit tests for the core scaling benchmark and its baseline gate.
+"""
+
+import copy
+
+import pytest
+
+from benchmarks import core_scaling
+from benchmarks.core_scaling import (
+    RegressionThresholds,
+    ScalingCase,
+    ScalingConfig,
+    build_problem,
+    compare_to_baseline,
+    load_results,
+    run_case,
+    run_scaling_benchmark,
+    save_results,
+)
+
+
+@pytest.fixture(scope="module")
+def results():
+    config = ScalingConfig(
+        building_counts=[4],
+        toggles=[(False, False, False), (True, True, True)],
+        n_samples=2,
+        warmup=1,
+        hsaga_evaluations=0,
+    )
+    return run_scaling_benchmark(config)
+
+
+def test_problem_scales_with_building_count():
+    small = build_problem(ScalingCase(10, False, False, False))
+    large = build_problem(ScalingCase(200, True, True, True))
+    assert small.num_buildings == 10 and large.num_buildings == 200
+    assert large.context.boundary.area > small.context.boundary.area
+    assert large.n_ieq_constr == small.n_ieq_constr + 1
+
+
+def test_results_record_every_component(results):
+    assert set(results["cases"]) == {"n004_reg0_wind0_solar0", "n004_reg1_wind1_solar1"}
+    case = results["cases"]["n004_reg1_wind1_solar1"]
+    assert case["evaluate"]["evaluations_per_second"] > 0
+    assert {
+        "decode",
+        "constraint.setback",
+        "constraint.fire_separation",
+        "constraint.slope",
+        "objective.solar_gain",
+    } <= set(case["components_ms"])
+    assert "hsaga" not in case
+
+
+def test_results_round_trip(results, tmp_path):
+    path = save_results(results, tmp_path / "out" / "core.json")
+    assert load_results(path)["cases"].keys() == results["cases"].keys()
+
+
+def test_identical_run_passes_gate(results):
+    assert compare_to_baseline(results, results) == []
+
+
+def test_slowdowns_are_reported(results):
+    name = "n004_reg0_wind0_solar0"
+    baseline = copy.deepcopy(results)
+    case = baseline["cases"][name]
+    case["evaluate"]["evaluations_per_second"] *= 2.0
+    case["components_ms"]["constraint.overlap"] = 10.0
+    results = copy.deepcopy(results)
+    results["cases"][name]["components_ms"]["constraint.overlap"] = 20.0
+
+    regressions = compare_to_baseline(results, baseline)
+    metrics = {r.metric for r in regressions if r.case == name}
+    assert metrics == {"evaluate.evaluations_per_second", "components_ms.constraint.overlap"}
+    assert all(r.change > 0 for r in regressions)
+
+    loose = RegressionThresholds(throughput_drop=0.6, time_increase=1.5)
+    assert compare_to_baseline(results, baseline, loose) == []
+
+
+def test_components_below_noise_floor_are_ignored(results):
+    baseline = copy.deepcopy(results)
+    for case in baseline["cases"].values():
+        case["components_ms"] = {k: 1e-4 for k in case["components_ms"]}
+    current = copy.deepcopy(baseline)
+    for case in current["cases"].values():
+        case["components_ms"] = {k: 1e-2 for k in case["components_ms"]}
+    assert compare_to_baseline(current, baseline) == []
+
+
+def test_cumulative_peak_rss_is_not_reported(monkeypatch):
+    config = ScalingConfig(n_samples=2, warmup=1, hsaga_evaluations=0)
+    case = ScalingCase(4, False, False, False)
+
+    monkeypatch.setattr(core_scaling, "reset_peak_rss", lambda: False)
+    assert run_case(case, config)["peak_rss_mb"] is None
+    isolated = ScalingConfig(n_samples=2, warmup=1, hsaga_evaluations=0, isolate=True)
+    assert run_case(case, isolated)["peak_rss_mb"] > 0
+
+    monkeypatch.setattr(core_scaling, "reset_peak_rss", lambda: True)
+    assert run_case(case, config)["peak_rss_mb"] > 0
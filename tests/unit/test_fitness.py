@@ -1,11 +1,14 @@
 """
 Unit tests for Fitness Evaluator
 """
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pytest
 
 from src.algorithms.building import Building, BuildingType
-from src.algorithms.fitness import FitnessEvaluator
-from src.algorithms.solution import Solution
+from src.algorithms.fitness import FitnessEvaluator, constraint_penalty, overlap_penalty
+from src.algorithms.solution import Solution, SolutionBatch
 
 
 class TestFitnessEvaluator:
@@ -219,3 +222,118 @@ class TestFitnessEvaluator:
             f"Overlapping buildings should have lower fitness "
             f"({fitness_with_overlap}) than non-overlapping ({fitness_no_overlap})"
         )
+
+    def test_penalties_do_not_mutate_buildings(self, sample_buildings, bounds):
+        """Penalty kernels read positions from the solution, not the shared buildings"""
+        evaluator = FitnessEvaluator(sample_buildings, bounds)
+        solution = Solution({b.id: (250.0, 250.0) for b in sample_buildings})
+
+        evaluator._calculate_penalties(solution)
+        evaluator.evaluate(solution)
+        assert all(b.position is None for b in sample_buildings)
+
+    def test_concurrent_evaluation_matches_sequential(self, sample_buildings, bounds):
+        """The evaluator can be shared between threads"""
+        evaluator = FitnessEvaluator(sample_buildings, bounds)
+        rng = np.random.default_rng(0)
+        solutions = [
+            Solution({b.id: tuple(rng.uniform(0, 500, 2)) for b in sample_buildings})
+            for _ in range(40)
+        ]
+        expected = [evaluator._calculate_penalties(s) for s in solutions]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            assert list(executor.map(evaluator._calculate_penalties, solutions)) == expected
+
+
+class TestPenaltyKernels:
+    """Test the broadcasted penalty functions"""
+
+    radii = np.array([10.0, 10.0, 5.0])
+    bounds = (0, 0, 100, 100)
+
+    def test_overlap_penalty_values(self):
+        positions = np.array([[20.0, 20.0], [35.0, 20.0], [80.0, 80.0]])
+        # Only pair (0, 1) violates: needs 10 + 10 + 5 = 25, has 15
+        assert overlap_penalty(positions, self.radii, 5.0) == pytest.approx(10 / 25)
+        assert overlap_penalty(positions[:1], self.radii[:1], 5.0) == 0.0
+
+    def test_constraint_penalty_values(self):
+        positions = np.array([[5.0, 50.0], [25.0, 50.0], [50.0, 50.0]])
+        # B1 crosses x_min, (B1, B2) touch at 20 < 20 + 5, B2/B3 are 25 apart (needs 15)
+        assert constraint_penalty(positions, self.radii, self.bounds, 5.0) == 1100.0
+        positions[1, 0] = 15.0
+        assert constraint_penalty(positions, self.radii, self.bounds, 5.0) == 1500.0
+
+    def test_batched_positions_match_single_layouts(self):
+        rng = np.random.default_rng(1)
+        batch = rng.uniform(-10, 110, size=(8, 3, 2))
+
+        np.testing.assert_allclose(
+            overlap_penalty(batch, self.radii, 5.0),
+            [overlap_penalty(p, self.radii, 5.0) for p in batch],
+        )
+        np.testing.assert_array_equal(
+            constraint_penalty(batch, self.radii, self.bounds, 5.0),
+            [constraint_penalty(p, self.radii, self.bounds, 5.0) for p in batch],
+        )
+
+
+class TestBatchEvaluation:
+    """Test population-level evaluation"""
+
+    @pytest.fixture
+    def buildings(self):
+        types = [
+            BuildingType.RESIDENTIAL,
+            BuildingType.EDUCATIONAL,
+            BuildingType.HEALTH,
+            BuildingType.SOCIAL,
+            BuildingType.COMMERCIAL,
+            BuildingType.LIBRARY,
+        ]
+        return [Building(f"B{i}", types[i % len(types)], 800 + 150 * i, 2) for i in range(12)]
+
+    @pytest.mark.parametrize("use_enhanced", [False, True])
+    def test_matches_per_solution_evaluate(self, buildings, use_enhanced):
+        np.random.seed(3)
+        evaluator = FitnessEvaluator(buildings, (0, 0, 1000, 1000), use_enhanced=use_enhanced)
+        batch = SolutionBatch.random(evaluator.building_ids, 20, (0, 0, 1000, 1000))
+        batch.coords[:5] *= 0.1  # Crowded layouts carry an overlap penalty
+
+        fitness, objectives = evaluator.evaluate_batch(batch.coords)
+
+        names = evaluator.get_objective_names()
+        assert objectives.shape == (20, len(names))
+        for row, view in enumerate(batch):
+            assert fitness[row] == pytest.approx(evaluator.evaluate(view), abs=1e-12)
+            expected = [view.objectives[name] for name in names]
+            np.testing.assert_allclose(objectives[row], expected, atol=1e-12)
+
+    def test_evaluate_population_stores_results(self, buildings):
+        evaluator = FitnessEvaluator(buildings, (0, 0, 1000, 1000))
+        batch = SolutionBatch.random(evaluator.building_ids, 4, (0, 0, 1000, 1000))
+        solutions = batch.to_solutions()
+
+        fitness = evaluator.evaluate_population(solutions)
+
+        for solution, value in zip(solutions, fitness):
+            assert solution.fitness == value
+            assert set(solution.objectives) == {"cost", "walking", "adjacency"}
+
+    def test_process_shards_match_in_process(self, buildings):
+        evaluator = FitnessEvaluator(buildings, (0, 0, 1000, 1000), use_enhanced=True)
+        batch = SolutionBatch.random(evaluator.building_ids, 9, (0, 0, 1000, 1000))
+
+        fitness, objectives = evaluator.evaluate_batch(batch.coords)
+        sharded = evaluator.evaluate_batch(batch.coords, n_workers=2)
+
+        np.testing.assert_array_equal(sharded[0], fitness)
+        np.testing.assert_array_equal(sharded[1], objectives)
+
+    def test_invalid_shape(self, buildings):
+        evaluator = FitnessEvaluator(buildings, (0, 0, 1000, 1000))
+        with pytest.raises(ValueError, match="positions must have shape"):
+            evaluator.evaluate_batch(np.zeros((3, 5, 2)))
+        fitness, objectives = evaluator.evaluate_batch(np.zeros((0, 12, 2)))
+        assert fitness.shape == (0,) and objectives.shape == (0, 3)
@@ -0,0 +1,107 @@
+"""
+Unit tests for the array graph core.
+
+Graph algorithms are checked against hand-built graphs and against networkx
+where available; road graph conversion against the greedy merge it replaces.
+"""
+
+import numpy as np
+import pytest
+
+from backend.core.metrics.connectivity import calculate_network_connectivity, road_network_graph
+from src.algorithms.graph_core import EdgeGraph, delaunay_edges, merge_points
+
+
+def _greedy_merge(points, threshold):
+    """Reference: visit points in order, join the first node within threshold."""
+    nodes, labels = [], []
+    for p in points:
+        for k, q in enumerate(nodes):
+            if np.hypot(p[0] - q[0], p[1] - q[1]) < threshold:
+                labels.append(k)
+                break
+        else:
+            labels.append(len(nodes))
+            nodes.append(p)
+    return np.array(nodes).reshape(-1, 2), np.array(labels)
+
+
+class TestEdgeGraph:
+    def test_parallel_edges_and_self_loops(self):
+        graph = EdgeGraph(3, [(1, 0), (0, 1), (2, 2), (1, 2)], [5.0, 3.0, 1.0, 4.0])
+        np.testing.assert_array_equal(graph.edges, [[0, 1], [1, 2]])
+        np.testing.assert_allclose(graph.weights, [3.0, 4.0])
+
+    def test_weights_default_to_node_distance(self):
+        graph = EdgeGraph(2, [(0, 1)], nodes=[(0, 0), (3, 4)])
+        assert graph.weights[0] == pytest.approx(5.0)
+
+    def test_minimum_spanning_tree_of_square(self):
+        nodes = [(0, 0), (10, 0), (10, 10), (0, 10)]
+        edges = [(0, 1), (1, 2), (2, 3), (3, 0), (0, 2)]
+        tree = EdgeGraph(4, edges, nodes=nodes).minimum_spanning_tree()
+        assert tree.n_edges == 3
+        assert tree.total_weight == pytest.approx(30.0)
+        assert tree.is_connected()
+
+    def test_mst_matches_networkx(self):
+        nx = pytest.importorskip("networkx")
+        points = np.random.default_rng(5).uniform(0, 1000, (80, 2))
+        graph = EdgeGraph(len(points), delaunay_edges(points), nodes=points)
+
+        G = nx.Graph()
+        for (i, j), w in zip(graph.edges, graph.weights):
+            G.add_edge(int(i), int(j), weight=float(w))
+        expected = nx.minimum_spanning_tree(G).size(weight="weight")
+        assert graph.minimum_spanning_tree().total_weight == pytest.approx(expected)
+
+    def test_coincident_nodes_stay_connected(self):
+        graph = EdgeGraph(3, [(0, 1), (1, 2)], nodes=[(0, 0), (0, 0), (5, 0)])
+        assert graph.is_connected()
+        assert graph.minimum_spanning_tree().n_edges == 2
+
+    def test_connected_components(self):
+        graph = EdgeGraph(5, [(0, 1), (2, 3)])
+        n_parts, labels = graph.connected_components()
+        assert n_parts == 3
+        assert labels[0] == labels[1] != labels[2] == labels[3] != labels[4]
+        assert not graph.is_connected()
+
+    def test_shortest_paths(self):
+        graph = EdgeGraph(3, [(0, 1), (1, 2)], [2.0, 3.0])
+        np.testing.assert_allclose(graph.shortest_paths([0]), [[0.0, 2.0, 5.0]])
+        np.testing.assert_array_equal(graph.degree(), [1, 2, 1])
+
+
+class TestGeometryHelpers:
+    def test_delaunay_triangle(self):
+        edges = delaunay_edges([(0, 0), (100, 0), (50, 86.6)])
+        np.testing.assert_array_equal(edges, [[0, 1], [0, 2], [1, 2]])
+
+    def test_delaunay_needs_three_points(self):
+        assert delaunay_edges([(0, 0), (1, 1)]) is None
+
+    def test_merge_points_matches_greedy(self):
+        rng = np.random.default_rng(2)
+        points = np.round(rng.uniform(0, 200, (300, 2)) / 4) * 4  # many duplicates
+        nodes, labels = merge_points(points, 10.0)
+        expected_nodes, expected_labels = _greedy_merge(points, 10.0)
+        np.testing.assert_allclose(nodes, expected_nodes)
+        np.testing.assert_array_equal(labels, expected_labels)
+
+    def test_merge_threshold_is_strict(self):
+        _, labels = merge_points([(0, 0), (10, 0)], 10.0)
+        np.testing.assert_array_equal(labels, [0, 1])
+
+
+class TestRoadGraph:
+    def test_crossing_roads_share_nodes(self):
+        major = [np.array([[0, 0], [50, 0], [100, 0]]), np.array([[50, -50], [50, 2], [50, 50]])]
+        graph = road_network_graph(major, [])
+        assert graph.n_nodes == 5  # (50, 2) merges into (50, 0)
+        assert graph.is_connected()
+
+    def test_empty_network(self):
+        graph = road_network_graph([], [])
+        assert graph.n_nodes == 0 and graph.n_edges == 0
+        assert calculate_network_connectivity([], []).n_edges == 0
@@ -476,3 +476,33 @@ class TestReplacement:
         assert "ga_best_history" in optimizer.stats
         assert "ga_avg_history" in optimizer.stats
         assert len(optimizer.stats["ga_best_history"]) == 10
+
+
+class TestPopulationEvaluation:
+    """Test batched population evaluation"""
+
+    def test_large_batches_use_vectorized_evaluation(self, optimizer, monkeypatch):
+        population = [optimizer._generate_random_solution() for _ in range(10)]
+        expected = [optimizer.evaluator.evaluate(s.copy()) for s in population]
+
+        def fail(solution):
+            raise AssertionError("per-solution evaluate used for a large batch")
+
+        monkeypatch.setattr(optimizer.evaluator, "evaluate", fail)
+        optimizer.stats["evaluations"] = 0
+        optimizer._evaluate_population_parallel(population, batch_threshold=8)
+
+        assert optimizer.stats["evaluations"] == 10
+        for solution, fitness in zip(population, expected):
+            assert solution.fitness == pytest.approx(fitness, abs=1e-12)
+            assert set(solution.objectives) == {"cost", "walking", "adjacency"}
+
+    def test_small_batches_evaluate_sequentially(self, optimizer):
+        population = [optimizer._generate_random_solution() for _ in range(3)]
+        population[0].fitness = 0.5
+
+        optimizer.stats["evaluations"] = 0
+        optimizer._evaluate_population_parallel(population, batch_threshold=8)
+
+        assert optimizer.stats["evaluations"] == 2
+        assert population[0].fitness == 0.5
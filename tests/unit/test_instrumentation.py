@@ -0,0 +1,125 @@
+"""
+Unit tests for per-component evaluation instrumentation.
+
+Covers the timer primitives, the components recorded by
+SpatialOptimizationProblem._evaluate, and aggregation of worker-process
+counts into HSAGARunner.stats.
+"""
+
+import pickle
+
+import numpy as np
+import pytest
+from shapely.geometry import Polygon
+
+from backend.core.domain.geometry.osm_service import CampusContext
+from backend.core.optimization.hsaga_runner import HSAGARunner, HSAGARunnerConfig
+from backend.core.optimization.instrumentation import ComponentTimers
+from backend.core.optimization.spatial_problem import SpatialOptimizationProblem
+
+
+def _problem(**kwargs):
+    boundary = Polygon([(0, 0), (300, 0), (300, 300), (0, 300)])
+    context = CampusContext(
+        boundary=boundary,
+        existing_buildings=[],
+        existing_roads=[],
+        existing_green_areas=[],
+        center_latlon=(41.0, 29.0),
+        crs_local="EPSG:32635",
+        bounds_meters=(0, 0, 300, 300),
+    )
+    return SpatialOptimizationProblem(
+        context=context,
+        building_counts={"Faculty": 2, "Dormitory": 2},
+        enable_wind=False,
+        enable_solar=False,
+        **kwargs,
+    )
+
+
+class TestComponentTimers:
+    def test_disabled_records_nothing(self):
+        timers = ComponentTimers()
+        t = timers.clock()
+        assert t is None
+        assert timers.lap("decode", t) is None
+        timers.record("decode", 1.0)
+        assert timers.summary() == {}
+
+    def test_laps_accumulate(self):
+        timers = ComponentTimers(enabled=True)
+        for _ in range(3):
+            t = timers.clock()
+            t = timers.lap("a", t)
+            timers.lap("b", t)
+        summary = timers.summary()
+        assert summary["a"]["calls"] == summary["b"]["calls"] == 3
+        assert sum(entry["share"] for entry in summary.values()) == pytest.approx(1.0, abs=1e-3)
+
+    def test_drain_and_merge(self):
+        worker = ComponentTimers(enabled=True)
+        worker.record("decode", 0.5, calls=2)
+        parent = ComponentTimers(enabled=True)
+        parent.record("decode", 0.25)
+
+        parent.merge(worker.drain())
+        assert worker.snapshot() == {}
+        assert parent.snapshot() == {"decode": {"calls": 3, "total_s": 0.75}}
+
+    def test_pickled_copy_starts_empty(self):
+        timers = ComponentTimers(enabled=True)
+        timers.record("decode", 1.0)
+        copy = pickle.loads(pickle.dumps(timers))
+        assert copy.enabled and copy.snapshot() == {}
+
+
+def test_evaluate_records_each_component():
+    problem = _problem(instrument=True)
+    x = np.random.default_rng(0).uniform(problem.xl, problem.xu)
+    for _ in range(2):
+        problem._evaluate(x, {})
+
+    summary = problem.timers.summary()
+    assert set(summary) == {
+        "decode",
+        "constraint.boundary",
+        "constraint.overlap",
+        "constraint.setback",
+        "constraint.fire_separation",
+        "constraint.slope",
+        "constraint.gateway_clearance",
+        "objective.compactness",
+        "objective.adjacency",
+        "objective.wind_comfort",
+        "objective.solar_gain",
+        "objective.gateway_connectivity",
+    }
+    assert all(entry["calls"] == 2 for entry in summary.values())
+
+
+def test_evaluate_is_uninstrumented_by_default():
+    problem = _problem()
+    problem._evaluate(np.random.default_rng(0).uniform(problem.xl, problem.xu), {})
+    assert problem.timers.summary() == {}
+
+
+@pytest.mark.parametrize("parallel_sa", [False, True])
+def test_runner_stats_include_worker_components(parallel_sa):
+    problem = _problem()
+    config = HSAGARunnerConfig(
+        total_evaluations=100,
+        population_size=20,
+        sa_chains=2,
+        n_partitions=4,
+        verbose=False,
+        parallel_sa=parallel_sa,
+        instrument=True,
+    )
+    runner = HSAGARunner(problem, config)
+    runner.run()
+
+    decode_calls = runner.stats["components"]["decode"]["calls"]
+    # Each SA chain also evaluates its starting point
+    expected = runner.stats["sa_evaluations"] + config.sa_chains + runner.stats["ga_evaluations"]
+    assert decode_calls == expected
@@ -0,0 +1,145 @@
+"""
+Unit tests for road-network distance fields.
+
+Shortest paths are checked against hand-computed distances on small road
+layouts and against networkx where available.
+"""
+
+import numpy as np
+import pytest
+
+from backend.core.metrics.accessibility import TwoStepFCA
+from backend.core.metrics.connectivity import road_network_distances, road_network_to_graph
+from src.algorithms.network_distance import RoadNetworkDistances
+from src.algorithms.objectives_enhanced import (
+    gravity_model_accessibility,
+    two_step_floating_catchment_area,
+)
+
+
+@pytest.fixture
+def u_network():
+    """U-shaped road: (0,0) -> (0,100) -> (100,100) -> (100,0)."""
+    nodes = [(0, 0), (0, 100), (100, 100), (100, 0)]
+    edges = [(0, 1), (1, 2), (2, 3)]
+    return RoadNetworkDistances(nodes, edges)
+
+
+class TestRoadNetworkDistances:
+    def test_path_follows_roads(self, u_network):
+        D = u_network.distance_matrix([(0, 0)], [(100, 0)])
+        assert D[0, 0] == pytest.approx(300.0)
+
+    def test_snap_legs_are_added(self, u_network):
+        D = u_network.distance_matrix([(-10, 0)], [(100, -20)])
+        assert D[0, 0] == pytest.approx(10.0 + 300.0 + 20.0)
+
+    def test_parallel_edges_keep_shortest(self):
+        network = RoadNetworkDistances([(0, 0), (100, 0)], [(0, 1), (1, 0)], [250.0, 120.0])
+        assert network.distance_matrix([(0, 0)], [(100, 0)])[0, 0] == pytest.approx(120.0)
+
+    def test_disconnected_components_are_infinite(self):
+        network = RoadNetworkDistances([(0, 0), (10, 0), (500, 0), (510, 0)], [(0, 1), (2, 3)])
+        D = network.distance_matrix([(0, 0)], [(510, 0)])
+        assert np.isinf(D[0, 0])
+
+    def test_rows_are_cached(self, u_network):
+        u_network.distance_matrix([(0, 0)], [(100, 0), (100, 100)])
+        calls = u_network.stats["dijkstra_calls"]
+        u_network.distance_matrix([(1, 1)], [(99, 1)])
+        assert u_network.stats["dijkstra_calls"] == calls
+
+    def test_matches_networkx(self):
+        nx = pytest.importorskip("networkx")
+        rng = np.random.default_rng(3)
+        nodes = rng.uniform(0, 1000, (60, 2))
+        edges = [(i, j) for i in range(60) for j in range(i + 1, 60) if rng.random() < 0.08]
+        network = RoadNetworkDistances(nodes, edges, precompute=True)
+
+        G = nx.Graph()
+        for i, j in edges:
+            G.add_edge(i, j, weight=float(np.linalg.norm(nodes[i] - nodes[j])))
+        expected = nx.single_source_dijkstra_path_length(G, 0)
+        for target, dist in expected.items():
+            assert network.node_distances([0], [target])[0] == pytest.approx(dist)
+
+    def test_distance_to_nearest_gateway(self, u_network):
+        gateways = np.array([(0, -5), (100, -5)])
+        d = u_network.distance_to_nearest([(0, 100), (100, 90)], gateways)
+        np.testing.assert_allclose(d, [105.0, 5.0 + 10.0 + 100.0])
+
+    def test_distance_field_cache_keeps_snap_legs(self):
+        network = RoadNetworkDistances([(0, 0), (100, 0), (200, 0)], [(0, 1), (1, 2)])
+
+        near = network.distance_to_nearest([(200, 0)], [(0, 5)])
+        far = network.distance_to_nearest([(200, 0)], [(0, 80)])
+
+        np.testing.assert_allclose(near, [205.0])
+        np.testing.assert_allclose(far, [280.0])
+        np.testing.assert_allclose(network.distance_to_nearest([(200, 0)], [(0, 5)]), [205.0])
+
+    def test_empty_network_raises(self):
+        with pytest.raises(ValueError):
+            RoadNetworkDistances([], [])
+
+
+class TestCatchmentPairs:
+    def test_network_catchment_is_exact(self, u_network):
+        origins = np.array([(0, 0), (0, 50)])
+        destinations = np.array([(100, 0), (0, 100)])
+        pairs = u_network.catchment_pairs(origins, destinations, catchment_distance=200.0)
+
+        D = u_network.distance_matrix(origins, destinations)
+        assert len(pairs) == np.count_nonzero(D <= 200.0)
+        np.testing.assert_allclose(pairs.distance, D[pairs.origin_idx, pairs.dest_idx])
+
+    def test_road_detour_reduces_accessibility(self, u_network):
+        origins = np.array([(0, 0)])
+        destinations = np.array([(100, 0)])
+        _, euclidean = two_step_floating_catchment_area(
+            origins, destinations, np.ones(1), np.ones(1), catchment_distance=250
+        )
+        _, network = two_step_floating_catchment_area(
+            origins, destinations, np.ones(1), np.ones(1), catchment_distance=250, network=u_network
+        )
+        assert euclidean[0] > 0.0
+        assert network[0] == 0.0
+
+    def test_gravity_uses_network_distance(self, u_network):
+        access = gravity_model_accessibility(
+            np.array([(0, 0)]),
+            np.array([(100, 0)]),
+            np.ones(1),
+            decay_function="exponential",
+            lambda_param=0.01,
+            network=u_network,
+        )
+        assert access[0] == pytest.approx(np.exp(-3.0))
+
+
+class TestBackendIntegration:
+    def test_road_network_to_graph_keeps_roads_separate(self):
+        roads = [
+            np.array([[0, 0], [50, 0], [100, 0]]),
+            np.array([[0, 100], [50, 100], [100, 100]]),
+        ]
+        nodes, edges, lengths = road_network_to_graph(roads, [])
+        assert len(edges) == 4
+        for (i, j), length in zip(edges, lengths):
+            assert np.hypot(nodes[i][0] - nodes[j][0], nodes[i][1] - nodes[j][1]) == pytest.approx(
+                length
+            )
+
+    def test_network_is_cached_per_road_set(self):
+        roads = [np.array([[0.0, 0.0], [0.0, 100.0], [100.0, 100.0], [100.0, 0.0]])]
+        first = road_network_distances(roads, [])
+        assert road_network_distances([r.copy() for r in roads], []) is first
+        assert road_network_distances(roads, [np.array([[0.0, 0.0], [100.0, 0.0]])]) is not first
+
+    def test_two_step_fca_with_network(self, u_network):
+        fca = TwoStepFCA(catchment_radius=250.0, distance_decay_function="step", network=u_network)
+        demand_positions = np.array([(0, 0), (100, 100)])
+        _, access = fca.calculate_arrays(
+            np.array([(100, 0)]), np.array([100.0]), demand_positions, np.array([50.0, 50.0])
+        )
+        np.testing.assert_allclose(access, [0.0, 2.0])
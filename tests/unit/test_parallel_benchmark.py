@@ -0,0 +1,189 @@
+"""
+Unit tests for parallel, resumable benchmark execution.
+"""
+
+import json
+import os
+
+import pytest
+
+from backend.core.research.benchmark import BenchmarkConfig, BenchmarkRunner
+from backend.core.research.parallel import (
+    CONFIG_KEY,
+    BenchmarkTask,
+    ResultStream,
+    peak_rss_mb,
+    peak_rss_resettable,
+    run_tasks,
+)
+
+
+def _square(x):
+    return {"value": x * x, "pid": os.getpid()}
+
+
+def _fail(x):
+    raise RuntimeError(f"bad input {x}")
+
+
+def _optimize(parameters):
+    return {"hypervolume": float(parameters["scale"]), "convergence": 1.0}
+
+
+def _tasks(n):
+    return [BenchmarkTask(f"t{i}", _square, (i,)) for i in range(n)]
+
+
+def test_peak_rss_is_reported():
+    assert peak_rss_mb() > 0
+
+
+def test_resettable_check_keeps_peak():
+    if not peak_rss_resettable():
+        pytest.skip("peak RSS counter cannot be reset here")
+    block = bytearray(64 * 1024 * 1024)  # Raise the peak, then release it
+    del block
+    before = peak_rss_mb()
+
+    assert peak_rss_resettable()
+    assert peak_rss_mb() == before
+
+
+def test_run_tasks_in_process():
+    records = run_tasks(_tasks(3), n_workers=1)
+
+    assert list(records) == ["t0", "t1", "t2"]
+    assert [r["result"]["value"] for r in records.values()] == [0, 1, 4]
+    assert all(r["error"] is None and r["peak_rss_mb"] > 0 for r in records.values())
+
+
+def test_in_process_run_keeps_caller_peak():
+    if not peak_rss_resettable():
+        pytest.skip("peak RSS counter cannot be reset here")
+    block = bytearray(64 * 1024 * 1024)  # Raise the peak, then release it
+    del block
+    before = peak_rss_mb()
+
+    records = run_tasks(_tasks(1), n_workers=1)
+
+    assert records["t0"]["peak_rss_mb"] >= before
+    assert peak_rss_mb() >= before
+
+
+def test_run_tasks_in_worker_pool():
+    records = run_tasks(_tasks(4), n_workers=2)
+
+    assert [r["result"]["value"] for r in records.values()] == [0, 1, 4, 9]
+    assert all(r["pid"] != os.getpid() for r in records.values())
+
+
+def test_failures_are_recorded_not_raised():
+    tasks = _tasks(1) + [BenchmarkTask("bad", _fail, (1,))]
+    records = run_tasks(tasks, n_workers=1)
+
+    assert records["t0"]["error"] is None
+    assert records["bad"]["error"] == "RuntimeError: bad input 1"
+
+
+def test_duplicate_keys_rejected():
+    with pytest.raises(ValueError):
+        run_tasks(_tasks(1) + _tasks(1), n_workers=1)
+
+
+def test_resume_skips_finished_tasks(tmp_path):
+    path = tmp_path / "runs.jsonl"
+    run_tasks(_tasks(2), n_workers=1, results_path=path)
+    # Simulate a run killed while writing its record
+    with open(path, "a") as f:
+        f.write('{"key": "t2", "res')
+
+    finished = []
+    records = run_tasks(
+        _tasks(3), n_workers=1, results_path=path, on_record=lambda r: finished.append(r["key"])
+    )
+
+    assert finished == ["t2"]
+    assert [r["result"]["value"] for r in records.values()] == [0, 1, 4]
+    assert set(ResultStream(path).load()) == {"t0", "t1", "t2"}
+
+
+def test_resume_disabled_starts_over(tmp_path):
+    path = tmp_path / "runs.jsonl"
+    run_tasks(_tasks(2), n_workers=1, results_path=path)
+
+    finished = []
+    run_tasks(
+        _tasks(2),
+        n_workers=1,
+        results_path=path,
+        resume=False,
+        on_record=lambda r: finished.append(r["key"]),
+    )
+
+    assert finished == ["t0", "t1"]
+    assert len(path.read_text().splitlines()) == 2
+
+
+def test_changed_settings_start_over(tmp_path):
+    path = tmp_path / "runs.jsonl"
+    run_tasks(_tasks(2), n_workers=1, results_path=path, config={"generations": 10})
+
+    finished = []
+    run_tasks(
+        _tasks(3),
+        n_workers=1,
+        results_path=path,
+        config={"generations": 20},
+        on_record=lambda r: finished.append(r["key"]),
+    )
+    assert finished == ["t0", "t1", "t2"]
+
+    finished.clear()
+    run_tasks(
+        _tasks(3),
+        n_workers=1,
+        results_path=path,
+        config={"generations": 20},
+        on_record=lambda r: finished.append(r["key"]),
+    )
+    assert finished == []
+    assert ResultStream(path).load()[CONFIG_KEY]["config"] == {"generations": 20}
+
+
+def test_research_benchmark_runs_in_parallel(tmp_path):
+    runner = BenchmarkRunner(output_dir=str(tmp_path))
+    config = BenchmarkConfig(
+        problem_name="toy",
+        algorithm="test",
+        num_runs=3,
+        parameters={"scale": 2},
+        n_workers=2,
+    )
+    result = runner.run(config, _optimize)
+
+    assert len(result.all_runs) == 3
+    assert result.mean_metrics["hypervolume"] == pytest.approx(2.0)
+    assert all(run["peak_rss_mb"] > 0 for run in result.all_runs)
+    # Partial results are removed once the benchmark is saved
+    assert not list(tmp_path.glob("*.partial.jsonl"))
+    saved = json.loads(next(tmp_path.glob("*.json")).read_text())
+    assert saved["config"]["n_workers"] == 2
+
+
+def test_research_benchmark_ignores_partial_runs_of_other_settings(tmp_path):
+    runner = BenchmarkRunner(output_dir=str(tmp_path))
+    old = BenchmarkConfig(problem_name="toy", algorithm="test", num_runs=2, parameters={"scale": 5})
+    # Leftover partial file of a crashed benchmark with other parameters
+    run_tasks(
+        [BenchmarkTask("run0", _optimize, (old.parameters,))],
+        n_workers=1,
+        results_path=runner._partial_path(old),
+        config=runner._run_settings(old, _optimize),
+    )
+
+    config = BenchmarkConfig(
+        problem_name="toy", algorithm="test", num_runs=2, parameters={"scale": 2}
+    )
+    result = runner.run(config, _optimize)
+
+    assert [run["hypervolume"] for run in result.all_runs] == [2.0, 2.0]
@@ -0,0 +1,194 @@
+"""
+Unit tests for the columnar Pareto-front payloads.
+"""
+
+import io
+import json
+
+import numpy as np
+import pytest
+
+from backend.api.utils.pareto_format import (
+    NPY_MEDIA_TYPE,
+    NPZ_MEDIA_TYPE,
+    PYARROW_AVAILABLE,
+    ParetoColumns,
+    ParetoResultCache,
+    parse_fields,
+)
+from src.algorithms.building import Building, BuildingType
+from src.algorithms.solution import Solution, SolutionBatch
+
+
+@pytest.fixture
+def buildings():
+    return [
+        Building("Library", BuildingType.EDUCATIONAL, 2000, 3),
+        Building("Dorm", BuildingType.RESIDENTIAL, 3000, 5),
+    ]
+
+
+@pytest.fixture
+def result():
+    batch = SolutionBatch(
+        ("Library", "Dorm"),
+        np.array([[[10.0, 20.0], [30.0, 40.0]], [[11.0, 21.0], [31.0, 41.0]]]),
+    )
+    front = list(batch) + [Solution(positions={"Library": (12.0, 22.0)})]
+    objectives = np.array([[1.0, 5.0], [2.0, 4.0], [3.0, 3.0]])
+    return {
+        "pareto_front": front,
+        "pareto_objectives": objectives,
+        "best_compromise": {
+            "solution": front[1],
+            "objectives": objectives[1],
+            "normalized_objectives": np.array([0.5, 0.5]),
+            "index": 1,
+        },
+    }
+
+
+def test_parse_fields():
+    assert parse_fields(None) == (
+        "summary",
+        "best_compromise",
+        "buildings",
+        "positions",
+        "objectives",
+    )
+    assert parse_fields("objectives, summary") == ("summary", "objectives")
+    with pytest.raises(ValueError, match="Unknown fields: bogus"):
+        parse_fields("summary,bogus")
+
+
+def test_from_result_is_columnar(result, buildings):
+    columns = ParetoColumns.from_result(result, buildings, summary={"runtime": 1.5})
+
+    assert columns.positions.shape == (3, 2, 2)
+    np.testing.assert_array_equal(columns.positions[1], [[11.0, 21.0], [31.0, 41.0]])
+    assert np.isnan(columns.positions[2, 1]).all()  # Dorm not placed
+
+    payload = columns.to_json()
+    assert payload["buildings"] == {
+        "name": ["Library", "Dorm"],
+        "building_type": ["EDUCATIONAL", "RESIDENTIAL"],
+        "area": [2000.0, 3000.0],
+        "floors": [3, 5],
+    }
+    assert payload["positions"][2] == [[12.0, 22.0], [None, None]]
+    assert payload["objectives"] == [[1.0, 5.0], [2.0, 4.0], [3.0, 3.0]]
+    assert payload["summary"] == {
+        "runtime": 1.5,
+        "pareto_size": 3,
+        "n_buildings": 2,
+        "n_objectives": 2,
+    }
+    assert payload["best_compromise"]["index"] == 1
+    assert payload["best_compromise"]["positions"] == [[11.0, 21.0], [31.0, 41.0]]
+    json.dumps(payload)
+
+
+def test_page_and_field_selection(result, buildings):
+    columns = ParetoColumns.from_result(result, buildings)
+
+    payload = columns.page(offset=1, limit=1).to_json(("best_compromise", "objectives"))
+
+    assert set(payload) == {
+        "result_id",
+        "offset",
+        "count",
+        "total",
+        "best_compromise",
+        "objectives",
+    }
+    assert (payload["offset"], payload["count"], payload["total"]) == (1, 1, 3)
+    assert payload["objectives"] == [[2.0, 4.0]]
+
+    assert columns.page(offset=5).to_json(("objectives",))["objectives"] == []
+
+
+def test_numpy_payloads(result, buildings):
+    page = ParetoColumns.from_result(result, buildings).page(0, 2)
+
+    payload, media_type = page.to_numpy(("objectives",))
+    assert media_type == NPY_MEDIA_TYPE
+    np.testing.assert_array_equal(np.load(io.BytesIO(payload)), [[1.0, 5.0], [2.0, 4.0]])
+
+    payload, media_type = page.to_numpy(("summary", "positions", "objectives"))
+    assert media_type == NPZ_MEDIA_TYPE
+    arrays = np.load(io.BytesIO(payload))
+    assert arrays["positions"].shape == (2, 2, 2)
+
+    with pytest.raises(ValueError):
+        page.to_numpy(("summary",))
+
+
+@pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow not installed")
+def test_arrow_payload(result, buildings):
+    import pyarrow as pa
+
+    columns = ParetoColumns.from_result(result, buildings)
+
+    table = pa.ipc.open_stream(columns.to_arrow()).read_all()
+
+    assert table.num_rows == 3
+    assert table.column("objective_1").to_pylist() == [5.0, 4.0, 3.0]
+    assert table.column("positions").to_pylist()[0] == [10.0, 20.0, 30.0, 40.0]
+    metadata = json.loads(table.schema.metadata[b"planifyai"])
+    assert metadata["buildings"]["name"] == ["Library", "Dorm"]
+
+
+def test_result_cache_evicts_oldest(result, buildings):
+    cache = ParetoResultCache(max_entries=2)
+    columns = ParetoColumns.from_result(result, buildings)
+
+    first = cache.put(columns)
+    second = cache.put(columns)
+    assert cache.get(first) is columns  # first becomes most recent
+    cache.put(columns)
+
+    assert cache.get(second) is None
+    assert cache.get(first) is columns
+    assert len(cache) == 2
+
+
+def test_optimize_columnar_pagination():
+    nsga3 = pytest.importorskip("backend.api.routers.nsga3")
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    app = FastAPI()
+    app.include_router(nsga3.router)
+    client = TestClient(app)
+    request = {
+        "buildings": [
+            {"name": "Library", "building_type": "EDUCATIONAL", "area": 2000, "floors": 3},
+            {"name": "Dorm", "building_type": "RESIDENTIAL", "area": 3000, "floors": 5},
+        ],
+        "bounds": [0, 0, 500, 500],
+        "population_size": 12,
+        "n_generations": 10,
+        "n_partitions": 4,
+    }
+
+    response = client.post(
+        "/api/nsga3/optimize",
+        params={"layout": "columnar", "fields": "summary", "limit": 1},
+        json=request,
+    )
+    assert response.status_code == 200
+    payload = response.json()
+    summary = payload["summary"]
+    assert payload["result_id"]
+    assert response.headers["x-result-id"] == payload["result_id"]
+
+    response = client.get(
+        f"/api/nsga3/results/{payload['result_id']}",
+        params={"fields": "objectives", "format": "npy", "offset": 0, "limit": 2},
+    )
+    assert response.status_code == 200
+    assert response.headers["x-total"] == str(summary["pareto_size"])
+    objectives = np.load(io.BytesIO(response.content))
+    assert objectives.shape == (min(2, summary["pareto_size"]), summary["n_objectives"])
+
+    assert client.get("/api/nsga3/results/unknown").status_code == 404
@@ -0,0 +1,143 @@
+"""
+Unit tests for the in-loop road access objective.
+
+Vectorized point-to-segment distances are checked against a scalar
+reference; the objective's per-building cache and its use as an extra
+objective in SpatialOptimizationProblem are covered at the end.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from shapely.geometry import LineString, Polygon
+
+from backend.core.domain.geometry.osm_service import CampusContext, ExistingRoad
+from backend.core.optimization.objectives.connectivity import (
+    RoadAccessObjective,
+    nearest_road_distances,
+    penalize_disconnected_buildings,
+    point_to_segment_distances,
+    road_segment_array,
+)
+from backend.core.optimization.spatial_problem import SpatialOptimizationProblem
+
+
+def _scalar_distance(p, a, b):
+    """Reference point-to-segment distance."""
+    p, a, b = map(np.asarray, (p, a, b))
+    d = b - a
+    if d @ d < 1e-10:
+        return float(np.linalg.norm(p - a))
+    t = np.clip((p - a) @ d / (d @ d), 0.0, 1.0)
+    return float(np.linalg.norm(p - (a + t * d)))
+
+
+def _square(cx, cy, size=10.0):
+    h = size / 2
+    return Polygon([(cx - h, cy - h), (cx + h, cy - h), (cx + h, cy + h), (cx - h, cy + h)])
+
+
+class TestSegmentDistances:
+    def test_matches_scalar_reference(self):
+        rng = np.random.default_rng(4)
+        points = rng.uniform(0, 100, (20, 2))
+        segments = rng.uniform(0, 100, (15, 4))
+        segments[3, 2:] = segments[3, :2]  # zero-length segment
+
+        D = point_to_segment_distances(points, segments)
+        for i, p in enumerate(points):
+            for j, s in enumerate(segments):
+                assert D[i, j] == pytest.approx(_scalar_distance(p, s[:2], s[2:]))
+
+    def test_segments_from_polylines_and_linestrings(self):
+        roads = [
+            np.array([[0, 0], [10, 0], [10, 10]]),
+            LineString([(0, 20), (5, 20)]),
+            np.array([[1, 1]]),
+        ]
+        segments = road_segment_array(roads)
+        np.testing.assert_allclose(segments, [[0, 0, 10, 0], [10, 0, 10, 10], [0, 20, 5, 20]])
+
+    def test_blocked_nearest_matches_full(self):
+        rng = np.random.default_rng(8)
+        points = rng.uniform(0, 500, (300, 2))
+        segments = rng.uniform(0, 500, (40, 4))
+        full = point_to_segment_distances(points, segments).min(axis=1)
+        np.testing.assert_allclose(nearest_road_distances(points, segments, max_pairs=100), full)
+
+    def test_no_segments_is_infinite(self):
+        assert np.isinf(nearest_road_distances([(0, 0)], np.zeros((0, 4)))).all()
+
+
+class TestRoadAccessObjective:
+    @pytest.fixture
+    def objective(self):
+        return RoadAccessObjective([LineString([(0, 0), (200, 0)])], max_distance_to_road=50.0)
+
+    def test_score_and_disconnected_fraction(self, objective):
+        buildings = [_square(50, 0), _square(100, 100)]
+        assert objective.calculate(buildings) == pytest.approx(1.0 / (1.0 + 50.0 / 50.0))
+        assert objective.disconnected_fraction(buildings) == pytest.approx(0.5)
+
+    def test_only_moved_buildings_are_remeasured(self, objective):
+        buildings = [_square(20 * i, 30) for i in range(6)]
+        objective.calculate(buildings)
+        assert objective.stats["distances_computed"] == 6
+
+        buildings[2] = _square(40, 5)
+        objective.calculate(buildings)
+        assert objective.stats["distances_computed"] == 7
+        np.testing.assert_allclose(
+            objective.distances(np.array([(20 * i, 30 if i != 2 else 5) for i in range(6)])),
+            [30, 30, 5, 30, 30, 30],
+        )
+
+    def test_requires_roads(self):
+        with pytest.raises(ValueError):
+            RoadAccessObjective([])
+
+
+def test_penalize_disconnected_buildings():
+    solution = SimpleNamespace(
+        positions={"a": (10, 5), "b": (10, 150)},
+        major_roads=[np.array([[0, 0], [100, 0]])],
+        minor_roads=[],
+    )
+    buildings = [SimpleNamespace(id="a"), SimpleNamespace(id="b")]
+    assert penalize_disconnected_buildings(solution, buildings, max_distance_to_road=100.0) == 0.5
+
+
+def test_problem_adds_road_access_objective():
+    boundary = Polygon([(0, 0), (300, 0), (300, 300), (0, 300)])
+    road = ExistingRoad(
+        osm_id=1,
+        geometry=LineString([(0, 150), (300, 150)]),
+        road_type="service",
+        name=None,
+        width=6.0,
+    )
+    context = CampusContext(
+        boundary=boundary,
+        existing_buildings=[],
+        existing_roads=[road],
+        existing_green_areas=[],
+        center_latlon=(41.0, 29.0),
+        crs_local="EPSG:32635",
+        bounds_meters=(0, 0, 300, 300),
+    )
+    problem = SpatialOptimizationProblem(
+        context=context,
+        building_counts={"Faculty": 2, "Dormitory": 2},
+        enable_wind=False,
+        enable_solar=False,
+        road_connectivity_weight=1.0,
+    )
+    assert problem.n_obj == 5
+    assert problem.get_objective_names()[-1] == "road_connectivity"
+
+    x = np.random.default_rng(0).uniform(problem.xl, problem.xu)
+    out = {}
+    problem._evaluate(x, out)
+    assert out["F"].shape == (5,)
+    assert 0.0 <= out["F"][-1] < 1.0
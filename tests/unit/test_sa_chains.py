@@ -0,0 +1,104 @@
+"""
+Unit tests for the lock-step multi-chain SA engine
+"""
+import numpy as np
+import pytest
+
+from src.algorithms.fitness import FitnessEvaluator
+from src.algorithms.hsaga import HybridSAGA
+from src.algorithms.sa_chains import MultiChainAnnealer
+
+SA_CONFIG = {
+    "initial_temp": 100.0,
+    "final_temp": 0.1,
+    "cooling_rate": 0.9,
+    "chain_iterations": 120,
+    "enable_adaptive_cooling": True,
+    "enable_reheating": True,
+    "stagnation_threshold": 30,
+    "max_reheats": 2,
+    "markov_chain_length": 20,
+}
+
+
+@pytest.fixture
+def annealer_factory(sample_buildings, bounds):
+    evaluator = FitnessEvaluator(sample_buildings, bounds)
+
+    def make(num_chains, seed=7, **config):
+        return MultiChainAnnealer(
+            evaluator, sample_buildings, bounds, {**SA_CONFIG, **config}, num_chains, seed=seed
+        )
+
+    return make
+
+
+class TestMultiChainAnnealer:
+    """Test MultiChainAnnealer"""
+
+    def test_best_layouts_are_evaluated_and_in_bounds(self, annealer_factory, sample_buildings):
+        annealer = annealer_factory(6)
+        best, chain_stats = annealer.run()
+
+        assert len(best) == len(chain_stats) == 6
+        evaluator = annealer.evaluator
+        for view, stats in zip(best, chain_stats):
+            assert view.fitness == pytest.approx(evaluator.evaluate(view.copy()), abs=1e-12)
+            assert set(view.objectives) == {"cost", "walking", "adjacency"}
+            assert stats["fitness"] == view.fitness
+            assert 0 < stats["iterations"] <= SA_CONFIG["chain_iterations"]
+
+        margins = np.array([b.radius + 5.0 for b in sample_buildings])[:, np.newaxis]
+        assert np.all(best.coords >= margins - 1e-9)
+        assert np.all(best.coords <= 500.0 - margins + 1e-9)
+        assert annealer.evaluations == 6 + sum(s["iterations"] for s in chain_stats)
+
+    def test_chain_streams_do_not_depend_on_chain_count(self, annealer_factory):
+        state = np.random.get_state()
+
+        small, _ = annealer_factory(3).run()
+        large, _ = annealer_factory(8).run()
+
+        np.testing.assert_array_equal(large.coords[:3], small.coords)
+        np.testing.assert_array_equal(large.fitness[:3], small.fitness)
+        # The global NumPy RNG is left alone
+        assert np.array_equal(np.random.get_state()[1], state[1])
+
+    def test_seed_changes_trajectories(self, annealer_factory):
+        first, _ = annealer_factory(2, seed=1).run()
+        second, _ = annealer_factory(2, seed=2).run()
+        assert not np.array_equal(first.coords, second.coords)
+
+    def test_geometric_cooling_stops_at_final_temperature(self, annealer_factory):
+        annealer = annealer_factory(
+            2,
+            enable_adaptive_cooling=False,
+            enable_reheating=False,
+            cooling_rate=0.5,
+            chain_iterations=400,
+        )
+        _, chain_stats = annealer.run()
+
+        # 100 * 0.5**10 < 0.1: ten Markov chains of 20 steps
+        for stats in chain_stats:
+            assert stats["iterations"] == 200
+            assert stats["final_temperature"] < 0.1
+            assert stats["reheats"] == 0
+
+    def test_invalid_chain_count(self, annealer_factory):
+        with pytest.raises(ValueError, match="num_chains"):
+            annealer_factory(0)
+
+
+def test_hsaga_vectorized_chains(sample_buildings, bounds):
+    sa_config = {**SA_CONFIG, "num_chains": 5, "vectorized_chains": True}
+    optimizer = HybridSAGA(sample_buildings, bounds, sa_config=sa_config)
+    optimizer.stats["evaluations"] = 0
+
+    solutions = optimizer._simulated_annealing()
+
+    assert len(solutions) == 5
+    fitnesses = [s.fitness for s in solutions]
+    assert fitnesses == sorted(fitnesses, reverse=True)
+    assert optimizer.stats["evaluations"] > 5
+    assert len(optimizer.stats["sa_chain_stats"]) == 5
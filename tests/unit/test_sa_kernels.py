@@ -0,0 +1,125 @@
+"""
+Unit tests for the SA hot-loop kernels: every backend must reproduce the
+original NumPy chain exactly for a fixed seed.
+"""
+
+import numpy as np
+import pytest
+
+from backend.core.optimization.hsaga_runner import HSAGARunnerConfig, run_sa_chain_worker
+from backend.core.optimization.sa_kernels import (
+    NUMBA_AVAILABLE,
+    NUMBA_KERNELS,
+    NUMPY_KERNELS,
+    _pairwise_sum,
+    get_sa_kernels,
+    metropolis_accept,
+)
+
+KERNELS = [NUMPY_KERNELS, NUMBA_KERNELS]
+
+
+class QuadraticProblem:
+    """Bi-objective test problem with constraints (pymoo-style _evaluate)."""
+
+    n_var = 40
+
+    def __init__(self):
+        self.xl = np.full(self.n_var, -1.0)
+        self.xu = np.full(self.n_var, 2.0)
+
+    def _evaluate(self, x, out, *args, **kwargs):
+        out["F"] = np.array([np.sum(x**2), np.sum((x - 1) ** 2)])
+        out["G"] = np.array([x[0] - 0.5, x[1] + x[2] - 1.0, -x[3], np.sum(x[:10]) - 2.0])
+
+
+def reference_chain(problem, config, iterations, seed_offset):
+    """The original run_sa_chain_worker loop (pure NumPy)."""
+    rng = np.random.default_rng(config.seed + seed_offset)
+    x = rng.uniform(problem.xl, problem.xu)
+    out = {}
+    problem._evaluate(x, out)
+    F, G = out["F"], out["G"]
+    cost = np.sum(F) + config.constraint_penalty * np.sum(np.maximum(0, G))
+    best = (x.copy(), F.copy(), G.copy(), cost)
+    temperature = config.initial_temperature
+    for iteration in range(iterations):
+        step = 0.1 * (temperature / config.initial_temperature) + 0.01
+        y = np.clip(x + rng.normal(0, step, size=x.shape), problem.xl, problem.xu)
+        out_new = {}
+        problem._evaluate(y, out_new)
+        F_new, G_new = out_new["F"], out_new["G"]
+        cost_new = np.sum(F_new) + config.constraint_penalty * np.sum(np.maximum(0, G_new))
+        if cost_new < cost:
+            accepted = True
+        else:
+            accepted = rng.random() < np.exp(-(cost_new - cost) / max(temperature, 1e-10))
+        if accepted:
+            x, F, G, cost = y, F_new, G_new, cost_new
+            if cost < best[3]:
+                best = (x.copy(), F.copy(), G.copy(), cost)
+        ratio = config.final_temperature / config.initial_temperature
+        temperature = config.initial_temperature * (ratio ** (iteration / iterations))
+    return best
+
+
+def test_pairwise_sum_matches_numpy():
+    rng = np.random.default_rng(3)
+    for n in list(range(0, 140)) + [255, 256, 257, 1000]:
+        values = rng.standard_normal(n) * rng.exponential(100.0)
+        assert _pairwise_sum(values, 0, n) == np.sum(values)
+
+
+@pytest.mark.parametrize("kernels", KERNELS, ids=lambda k: k.name)
+def test_scalarize_matches_numpy(kernels):
+    rng = np.random.default_rng(4)
+    for n in (1, 4, 5, 9, 33, 200):
+        F = rng.standard_normal(n) * 1e3
+        G = rng.standard_normal(n)
+        expected = np.sum(F) + 1e6 * np.sum(np.maximum(0, G))
+        assert kernels.scalarize(F, G, 1e6) == expected
+
+    assert np.isnan(kernels.scalarize(np.ones(2), np.array([np.nan, 1.0]), 1e6))
+
+
+@pytest.mark.parametrize("kernels", KERNELS, ids=lambda k: k.name)
+def test_propose_matches_clip(kernels):
+    x = np.random.default_rng(5).uniform(-1, 1, 300)
+    xl, xu = np.full(300, -0.9), np.full(300, 0.9)
+
+    expected = np.clip(x + np.random.default_rng(6).normal(0, 0.07, size=x.shape), xl, xu)
+    delta = np.random.default_rng(6).normal(0, 0.07, size=x.shape)
+    proposal = kernels.propose(x, delta, xl, xu)
+
+    np.testing.assert_array_equal(proposal, expected)
+
+
+def test_metropolis_draws_only_for_uphill_moves():
+    rng = np.random.default_rng(7)
+    assert metropolis_accept(2.0, 1.0, 10.0, rng)
+    assert rng.random() == np.random.default_rng(7).random()
+
+    assert not metropolis_accept(1.0, 1e9, 1.0, np.random.default_rng(7))
+
+
+def test_kernel_selection():
+    assert get_sa_kernels("numpy") is NUMPY_KERNELS
+    assert get_sa_kernels("auto") is (NUMBA_KERNELS if NUMBA_AVAILABLE else NUMPY_KERNELS)
+    if not NUMBA_AVAILABLE:
+        assert get_sa_kernels("numba") is NUMPY_KERNELS
+    with pytest.raises(ValueError):
+        get_sa_kernels("cuda")
+
+
+@pytest.mark.parametrize("backend", ["numpy", "numba"])
+def test_worker_matches_reference_chain(backend):
+    problem = QuadraticProblem()
+    config = HSAGARunnerConfig(seed=11, initial_temperature=50.0, sa_kernel=backend)
+
+    best_x, best_F, best_G, best_cost = run_sa_chain_worker(problem, config, 0, 400, 2)
+    ref_x, ref_F, ref_G, ref_cost = reference_chain(problem, config, 400, 2)
+
+    np.testing.assert_array_equal(best_x, ref_x)
+    np.testing.assert_array_equal(best_F, ref_F)
+    np.testing.assert_array_equal(best_G, ref_G)
+    assert best_cost == ref_cost
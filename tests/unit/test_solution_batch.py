@@ -0,0 +1,147 @@
+"""
+Unit tests for the array-backed SolutionBatch and its row views.
+"""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from src.algorithms.building import Building, BuildingType
+from src.algorithms.fitness import FitnessEvaluator
+from src.algorithms.operators.crossover import UniformCrossover
+from src.algorithms.operators.mutation import GaussianMutation, SwapMutation
+from src.algorithms.solution import Solution, SolutionBatch, SolutionView, positions_array
+
+IDS = ("B1", "B2", "B3")
+BOUNDS = (0, 0, 500, 500)
+
+
+@pytest.fixture
+def batch():
+    np.random.seed(0)
+    return SolutionBatch.random(IDS, size=4, bounds=BOUNDS)
+
+
+class TestSolutionBatch:
+    def test_random_matches_per_building_draws(self):
+        np.random.seed(1)
+        batch = SolutionBatch.random(IDS, size=2, bounds=BOUNDS, margin=10.0)
+
+        np.random.seed(1)
+        expected = [
+            [(np.random.uniform(10, 490), np.random.uniform(10, 490)) for _ in IDS]
+            for _ in range(2)
+        ]
+        np.testing.assert_allclose(batch.coords, expected)
+        assert np.isnan(batch.fitness).all()
+
+    def test_rejects_mismatched_coords(self):
+        with pytest.raises(ValueError):
+            SolutionBatch(IDS, np.zeros((2, 2, 2)))
+
+    def test_from_solutions_round_trip(self):
+        solutions = [
+            Solution({"B2": (2.0, 2.0), "B1": (1.0, 1.0), "B3": (3.0, 3.0)}, fitness=0.5),
+            Solution({"B1": (4.0, 4.0), "B2": (5.0, 5.0), "B3": (6.0, 6.0)}),
+        ]
+        batch = SolutionBatch.from_solutions(solutions, IDS)
+
+        np.testing.assert_array_equal(batch.coords[0], [[1, 1], [2, 2], [3, 3]])
+        assert batch[0].fitness == 0.5 and batch[1].fitness is None
+        restored = batch.to_solutions()
+        assert restored[0].positions == solutions[0].positions
+        assert type(restored[0]) is Solution
+
+    def test_take_copies_rows(self, batch):
+        batch[2].fitness = 0.7
+        batch[2].objectives = {"cost": 0.1}
+        taken = batch.take([2, 2])
+
+        taken.coords[0] = 0.0
+        taken[1].objectives["cost"] = 0.9
+        assert batch.coords[2].any()
+        assert batch[2].objectives == {"cost": 0.1}
+        assert taken[1].fitness == 0.7
+
+    def test_from_views_of_one_batch_uses_take(self, batch):
+        packed = SolutionBatch.from_solutions([batch[3], batch[1]])
+        np.testing.assert_array_equal(packed.coords, batch.coords[[3, 1]])
+
+
+class TestSolutionView:
+    def test_view_is_a_solution(self, batch):
+        view = batch[1]
+        assert isinstance(view, Solution)
+        assert list(view.positions) == list(IDS)
+        assert view.positions["B2"] == tuple(batch.coords[1, 1])
+        assert view.objectives == {}
+
+    def test_writes_go_to_the_batch(self, batch):
+        view = batch[0]
+        view.fitness = 0.4
+        view.set_position("B3", (7.0, 8.0))
+
+        np.testing.assert_array_equal(batch.coords[0, 2], [7.0, 8.0])
+        assert np.isnan(batch.fitness[0])
+
+        view.positions = {"B1": (1, 1), "B2": (2, 2), "B3": (3, 3)}
+        np.testing.assert_array_equal(batch.coords[0], [[1, 1], [2, 2], [3, 3]])
+
+    def test_copy_and_pickle_detach_from_batch(self, batch):
+        view = batch[0]
+        copied = view.copy()
+        restored = pickle.loads(pickle.dumps(view))
+        view.positions["B1"] = (0.0, 0.0)
+
+        for detached in (copied, restored):
+            assert type(detached) is Solution
+            assert detached.positions["B1"] != (0.0, 0.0)
+
+    def test_positions_array_is_zero_copy_for_matching_order(self, batch):
+        view = batch[2]
+        assert np.shares_memory(positions_array(view, IDS), batch.coords)
+        reordered = positions_array(view, ("B3", "B1"))
+        np.testing.assert_array_equal(reordered, batch.coords[2, [2, 0]])
+
+
+class TestBatchOperators:
+    def test_uniform_crossover_batch_matches_pairwise(self, batch):
+        parents1, parents2 = batch.take([0, 1]), batch.take([2, 3])
+        operator = UniformCrossover()
+
+        np.random.seed(5)
+        children1, children2 = operator.crossover_batch(parents1, parents2)
+        np.random.seed(5)
+        pairs = [operator.crossover(p1, p2) for p1, p2 in zip(parents1, parents2)]
+
+        for row, (child1, child2) in enumerate(pairs):
+            assert children1[row].positions.copy() == child1.positions
+            assert children2[row].positions.copy() == child2.positions
+
+    def test_mutate_batch(self, batch):
+        buildings = [Building(bid, BuildingType.RESIDENTIAL, 1000, 2) for bid in IDS]
+        for operator in (GaussianMutation(sigma=20.0), SwapMutation()):
+            batch.fitness[:] = 0.5
+            before = batch.coords.copy()
+            operator.mutate_batch(batch, [1, 3], buildings, BOUNDS)
+
+            changed = (batch.coords != before).any(axis=(1, 2))
+            assert not changed[[0, 2]].any() and changed[[1, 3]].all()
+            assert np.isnan(batch.fitness[[1, 3]]).all() and (batch.fitness[[0, 2]] == 0.5).all()
+
+
+def test_evaluator_scores_views_like_solutions(batch):
+    buildings = [
+        Building("B1", BuildingType.RESIDENTIAL, 2000, 3),
+        Building("B2", BuildingType.EDUCATIONAL, 3000, 4),
+        Building("B3", BuildingType.LIBRARY, 1500, 2),
+    ]
+    evaluator = FitnessEvaluator(buildings, BOUNDS)
+
+    for view in batch:
+        assert evaluator.evaluate(view) == pytest.approx(evaluator.evaluate(view.copy()))
+        assert evaluator._accessibility_score(view) == pytest.approx(
+            evaluator._accessibility_score(view.copy())
+        )
+    assert isinstance(batch[0], SolutionView) and "cost" in batch[0].objectives
@@ -0,0 +1,143 @@
+"""
+Unit tests for pooled plot rendering, the figure cache and the visualization router.
+"""
+
+import asyncio
+import base64
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.api.routers import visualization
+from backend.api.utils.rendering import FigureCache, PlotRenderer
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+OBJECTIVES = [[1.0, 4.0], [2.0, 3.0], [3.0, 1.5], [4.0, 1.0]]
+
+
+class TestFigureCache:
+    def test_key_depends_on_values_and_options(self):
+        objectives = np.array(OBJECTIVES)
+        key = FigureCache.key("pareto-2d", objectives, {"title": "A"})
+
+        assert key == FigureCache.key("pareto-2d", objectives.tolist(), {"title": "A"})
+        assert key != FigureCache.key("pareto-2d", objectives, {"title": "B"})
+        assert key != FigureCache.key("pareto-3d", objectives, {"title": "A"})
+        assert key != FigureCache.key("pareto-2d", objectives + 1e-9, {"title": "A"})
+
+    def test_lru_eviction_by_entries_and_bytes(self):
+        cache = FigureCache(max_entries=2, max_bytes=10)
+        cache.put("a", b"1234")
+        cache.put("b", b"1234")
+        assert cache.get("a") == b"1234"  # "a" becomes most recent
+
+        cache.put("c", b"1234")
+        assert cache.get("b") is None
+        assert len(cache) == 2
+
+        cache.put("d", b"12345678")  # exceeds 10 bytes together with anything else
+        assert cache.get("a") is None and cache.get("c") is None
+        assert cache.size_bytes == 8
+
+        cache.put("huge", b"x" * 11)  # larger than the cache is never stored
+        assert cache.get("huge") is None
+        assert cache.hits == 1
+
+
+class TestPlotRenderer:
+    @pytest.mark.parametrize("max_workers", [0, 1])
+    def test_render_and_cache(self, max_workers):
+        renderer = PlotRenderer(max_workers=max_workers)
+        objectives = np.array(OBJECTIVES)
+        try:
+            png = asyncio.run(renderer.render("pareto-2d", objectives, {"title": "Front"}))
+            again = asyncio.run(renderer.render("pareto-2d", objectives, {"title": "Front"}))
+        finally:
+            renderer.shutdown()
+
+        assert png.startswith(PNG_SIGNATURE)
+        assert again is png
+        assert renderer.cache.hits == 1
+
+    def test_concurrent_identical_requests_share_render(self):
+        renderer = PlotRenderer(max_workers=0)
+        objectives = np.array(OBJECTIVES)
+
+        async def render_twice():
+            return await asyncio.gather(
+                renderer.render("parallel-coordinates", objectives, {}),
+                renderer.render("parallel-coordinates", objectives, {}),
+            )
+
+        first, second = asyncio.run(render_twice())
+
+        assert first is second
+        assert len(renderer.cache) == 1
+
+    def test_unknown_kind(self):
+        with pytest.raises(ValueError):
+            asyncio.run(PlotRenderer(max_workers=0).render("pie", np.array(OBJECTIVES), {}))
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(visualization, "renderer", PlotRenderer(max_workers=0))
+    app = FastAPI()
+    app.include_router(visualization.router)
+    return TestClient(app)
+
+
+class TestVisualizationRouter:
+    def test_base64_and_png_formats(self, client):
+        response = client.post("/api/visualize/pareto-2d", json={"objectives": OBJECTIVES})
+        assert response.status_code == 200
+        body = response.json()
+        assert (body["width"], body["height"]) == (1000, 800)
+        assert base64.b64decode(body["image_base64"]).startswith(PNG_SIGNATURE)
+
+        response = client.post(
+            "/api/visualize/pareto-2d", params={"format": "png"}, json={"objectives": OBJECTIVES}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/png"
+        assert response.headers["x-image-width"] == "1000"
+        assert response.content == base64.b64decode(body["image_base64"])
+        assert visualization.renderer.cache.hits == 1
+
+    def test_wrong_objective_count(self, client):
+        response = client.post("/api/visualize/pareto-3d", json={"objectives": OBJECTIVES})
+
+        assert response.status_code == 400
+        assert "Expected 3 objectives" in response.json()["detail"]
+
+    def test_plot_data_is_columnar(self, client):
+        response = client.post(
+            "/api/visualize/plot-data",
+            json={"objectives": OBJECTIVES, "objective_names": ["Cost", "Walk"], "best_index": 2},
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["objective_names"] == ["Cost", "Walk"]
+        assert body["columns"] == [[1.0, 2.0, 3.0, 4.0], [4.0, 3.0, 1.5, 1.0]]
+        assert body["minimums"] == [1.0, 1.0]
+        assert body["maximums"] == [4.0, 4.0]
+        assert body["best_index"] == 2
+
+    def test_plot_data_arrow(self, client):
+        response = client.post(
+            "/api/visualize/plot-data", params={"format": "arrow"}, json={"objectives": OBJECTIVES}
+        )
+
+        if not visualization.PYARROW_AVAILABLE:
+            assert response.status_code == 501
+            return
+
+        import pyarrow as pa
+
+        table = pa.ipc.open_stream(response.content).read_all()
+        assert table.column_names == ["Objective 1", "Objective 2"]
+        assert table.column("Objective 2").to_pylist() == [4.0, 3.0, 1.5, 1.0]